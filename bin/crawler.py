@@ -4,23 +4,46 @@
 import sys
 import os
 import re
+import ssl
 import time
+import random
 import getopt
 import json
+import asyncio
+import atexit
 import tempfile
+import hashlib
+import functools
+import threading
 import logging.config
+import http.cookies
+import http.cookiejar
+import email.utils
 from enum import Enum
 from pathlib import Path
 from html.parser import HTMLParser
-from typing import Any, Optional
-from urllib.parse import urljoin, quote
+from typing import Any, Callable, Optional
+from urllib.parse import urljoin, quote, urlparse, urlsplit, urlunsplit
 
 import urllib3
 import requests
-from requests.cookies import RequestsCookieJar
+from requests.adapters import BaseAdapter, HTTPAdapter
+from requests.cookies import RequestsCookieJar, cookiejar_from_dict
+from requests.structures import CaseInsensitiveDict
+from requests.utils import get_encoding_from_headers
+
+try:
+    import httpx
+except ImportError:  # httpx가 없으면 AsyncRequestsClient는 스레드로 동작
+    httpx = None  # type: ignore[assignment]
 
 from bin.feed_maker_util import PathUtil, Env, URLSafety, redact_headers
 from bin.headless_browser import HeadlessBrowser
+from bin.response_cache import ResponseCache
+from bin.rate_limiter import RateLimiter
+from bin.host_health import HostHealth
+from bin.site_session_store import SiteSessionStore
+from bin.fetch_strategy import FetchStrategy
 
 logging.config.fileConfig(Path(__file__).parent.parent / "logging.conf")
 LOGGER = logging.getLogger()
@@ -41,6 +64,72 @@ def to_latin1_safe_url(url: str) -> str:
         return quote(url, safe="%/:=&?~#+!$,;'@()*[]")
 
 
+_original_create_connection = urllib3.util.connection.create_connection
+
+
+def _create_pinned_connection(address: tuple[str, int], *args: Any, **kwargs: Any) -> Any:
+    """URLSafety.check_url이 검사한 주소로만 연결해서 검사와 연결 사이의 DNS 재조회(rebinding)를 막는다."""
+    host, port = address
+    pinned_addresses = URLSafety.get_pinned_addresses(host)
+    if not pinned_addresses:
+        return _original_create_connection(address, *args, **kwargs)
+
+    # 앞의 주소로 연결하지 못하면 다음 주소를 시도하고, 마지막 주소의 오류는 그대로 전달
+    for addr in pinned_addresses[:-1]:
+        try:
+            return _original_create_connection((addr, port), *args, **kwargs)
+        except OSError as e:
+            LOGGER.debug("can't connect to %s (%s), trying next address: %r", addr, host, e)
+    return _original_create_connection((pinned_addresses[-1], port), *args, **kwargs)
+
+
+urllib3.util.connection.create_connection = _create_pinned_connection
+
+
+def _get_pinned_requests(url: str, headers: Headers) -> list[tuple[str, Headers, dict[str, Any]]]:
+    """urllib3를 거치지 않는 httpx 요청도 URLSafety.check_url이 검사한 주소로 직접 연결하고 Host 헤더와 SNI는 원래 호스트로 유지한다."""
+    parts = urlsplit(url)
+    host = (parts.hostname or "").lower()
+    pinned_requests: list[tuple[str, Headers, dict[str, Any]]] = []
+    for addr in URLSafety.get_pinned_addresses(host):
+        netloc = (f"[{addr}]" if ":" in addr else addr) + (f":{parts.port}" if parts.port else "")
+        pinned_url = urlunsplit((parts.scheme, netloc, parts.path, parts.query, ""))
+        pinned_requests.append((pinned_url, {**headers, "Host": parts.netloc.rpartition("@")[2]}, {"sni_hostname": host}))
+    return pinned_requests or [(url, headers, {})]
+
+
+def _get_response_cookies(response: Any) -> Cookies:
+    """httpx 응답의 Set-Cookie를 직접 읽는다 (검사한 IP로 연결하므로 쿠키 도메인 검사를 하는 cookie jar는 사용하지 않음)."""
+    cookies: Cookies = {}
+    for set_cookie in response.headers.get_list("set-cookie"):
+        jar: http.cookies.SimpleCookie = http.cookies.SimpleCookie()
+        try:
+            jar.load(set_cookie)
+        except http.cookies.CookieError:
+            continue
+        for name, morsel in jar.items():
+            if morsel.value:
+                cookies[name] = morsel.value
+    return cookies
+
+
+@functools.lru_cache(maxsize=None)
+def _is_h2_available() -> bool:
+    if httpx is None:
+        return False
+    try:
+        import h2  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+
+def _match_host(host: str, hosts: frozenset[str]) -> bool:
+    # "img.example.com"은 정확히 일치, ".example.com"은 하위 도메인까지 포함
+    host = host.lower()
+    return host in hosts or any(h.startswith(".") and (host.endswith(h) or host == h[1:]) for h in hosts)
+
+
 class _LoginFormParser(HTMLParser):
     """login_url 페이지의 HTML에서 <form> 내 hidden 필드, action URL, 입력 필드명을 추출한다."""
 
@@ -140,6 +229,347 @@ class Method(Enum):
     POST = 3
 
 
+class _NoPersistCookiePolicy(http.cookiejar.CookiePolicy):
+    # 쿠키는 RequestsClient가 파일로 직접 관리하므로 세션 쿠키 저장소에는 아무것도 남기지 않음
+    netscape = True
+    rfc2965 = False
+    hide_cookie2 = False
+
+    def set_ok(self, cookie: http.cookiejar.Cookie, request: Any) -> bool:
+        return False
+
+    def return_ok(self, cookie: http.cookiejar.Cookie, request: Any) -> bool:
+        return False
+
+    def domain_return_ok(self, domain: str, request: Any) -> bool:
+        return False
+
+    def path_return_ok(self, path: str, request: Any) -> bool:
+        return False
+
+
+class _Http2ResponseBody:
+    """httpx 스트리밍 응답을 requests.Response.raw처럼 읽을 수 있게 감싼 객체"""
+
+    def __init__(self, response: Any) -> None:
+        self.response = response
+
+    def stream(self, chunk_size: Optional[int] = None, decode_content: bool = True) -> Any:
+        # 본문을 읽다가 난 오류도 requests 예외로 바꿔서 RequestsClient의 기존 처리를 그대로 따르게 함
+        try:
+            yield from self.response.iter_bytes(chunk_size=chunk_size)
+        except httpx.TimeoutException as e:
+            raise requests.exceptions.ReadTimeout(e) from e
+        except httpx.TransportError as e:
+            raise requests.exceptions.ConnectionError(e) from e
+
+    def read(self, amt: Optional[int] = None, decode_content: bool = True) -> bytes:
+        return b"".join(self.stream())
+
+    def close(self) -> None:
+        self.response.close()
+
+
+class Http2Adapter(BaseAdapter):
+    """HTTP/2로 요청하는 requests 어댑터 (httpx + h2)
+
+    site_config.json의 "http2_hosts"에 지정한 호스트의 세션에만 연결되고, h2가 설치되어 있지 않거나
+    서버가 HTTP/2를 제대로 처리하지 못하면 그 호스트는 기존 HTTP/1.1 어댑터로 요청함
+    """
+
+    def __init__(self, pool_connections: int = 10, pool_maxsize: int = 10) -> None:
+        super().__init__()
+        self.fallback_adapter = HTTPAdapter(pool_connections=pool_connections, pool_maxsize=pool_maxsize)
+        self.pool_maxsize = pool_maxsize
+        self.clients: dict[Any, Any] = {}
+        self.http1_hosts: set[str] = set()
+        self.lock = threading.Lock()
+
+    def _create_client(self, verify: Any) -> Any:
+        if isinstance(verify, str):
+            # requests는 REQUESTS_CA_BUNDLE 등의 CA 경로를 verify로 넘김
+            verify = ssl.create_default_context(capath=verify) if os.path.isdir(verify) else ssl.create_default_context(cafile=verify)
+        return httpx.Client(http2=True, verify=verify, follow_redirects=False, limits=httpx.Limits(max_connections=self.pool_maxsize, max_keepalive_connections=self.pool_maxsize))
+
+    def _get_client(self, verify: Any) -> Any:
+        with self.lock:
+            client = self.clients.get(verify)
+            if client is None:
+                client = self._create_client(verify)
+                self.clients[verify] = client
+            return client
+
+    @staticmethod
+    def _get_timeout(timeout: Any) -> Any:
+        if isinstance(timeout, tuple):
+            connect_timeout, read_timeout = timeout
+            return httpx.Timeout(read_timeout, connect=connect_timeout)
+        return httpx.Timeout(timeout)
+
+    def send(self, request: requests.PreparedRequest, stream: bool = False, timeout: Any = None, verify: Any = True, cert: Any = None, proxies: Any = None) -> requests.Response:
+        host = (urlsplit(request.url or "").hostname or "").lower()
+        if not _is_h2_available() or host in self.http1_hosts or proxies:
+            return self.fallback_adapter.send(request, stream=stream, timeout=timeout, verify=verify, cert=cert, proxies=proxies)
+
+        client = self._get_client(verify)
+        url = str(request.url)
+        pinned_requests = _get_pinned_requests(url, dict(request.headers))
+        try:
+            for i, (request_url, request_headers, extensions) in enumerate(pinned_requests):
+                try:
+                    h2_request = client.build_request(request.method or "GET", request_url, headers=request_headers, content=request.body, timeout=Http2Adapter._get_timeout(timeout), extensions=extensions)
+                    h2_response = client.send(h2_request, stream=True)
+                    break
+                except httpx.ConnectError:
+                    if i == len(pinned_requests) - 1:
+                        raise
+        except (httpx.RemoteProtocolError, httpx.LocalProtocolError) as e:
+            # HTTP/2를 제대로 지원하지 않는 서버는 이후로 HTTP/1.1로만 요청
+            LOGGER.warning("Warning: HTTP/2 request to '%s' failed, falling back to HTTP/1.1, %r", host, e)
+            with self.lock:
+                self.http1_hosts.add(host)
+            return self.fallback_adapter.send(request, stream=stream, timeout=timeout, verify=verify, cert=cert, proxies=proxies)
+        except httpx.ConnectTimeout as e:
+            raise requests.exceptions.ConnectTimeout(e, request=request) from e
+        except httpx.TimeoutException as e:
+            raise requests.exceptions.ReadTimeout(e, request=request) from e
+        except httpx.TransportError as e:
+            raise requests.exceptions.ConnectionError(e, request=request) from e
+
+        LOGGER.debug("%s %s -> %d (%s)", request.method, url, h2_response.status_code, h2_response.http_version)
+        return self._build_response(request, h2_response)
+
+    def _build_response(self, request: requests.PreparedRequest, h2_response: Any) -> requests.Response:
+        # stream=False이면 Session.send가 본문을 바로 읽고, 다 읽은 httpx 응답은 연결을 풀로 돌려줌
+        response = requests.Response()
+        response.status_code = h2_response.status_code
+        response.reason = h2_response.reason_phrase
+        response.headers = CaseInsensitiveDict(h2_response.headers.items())
+        response.encoding = get_encoding_from_headers(response.headers)
+        response.raw = _Http2ResponseBody(h2_response)
+        response.url = str(request.url)
+        response.request = request
+        response.connection = self
+        response.cookies = cookiejar_from_dict(_get_response_cookies(h2_response))
+        return response
+
+    def close(self) -> None:
+        with self.lock:
+            for client in self.clients.values():
+                client.close()
+            self.clients.clear()
+        self.fallback_adapter.close()
+
+
+class SessionPool:
+    # 요청마다 바뀌는 헤더는 세션 구분 키에서 제외
+    VOLATILE_HEADERS = frozenset(("cookie", "referer", "content-length", "content-type"))
+    DEFAULT_POOL_CONNECTIONS = 10
+    DEFAULT_POOL_MAXSIZE = 10
+
+    _sessions: dict[tuple[str, bool, str, bool], requests.Session] = {}
+    _lock = threading.Lock()
+
+    @staticmethod
+    def _get_headers_profile(headers: Optional[Headers]) -> str:
+        if not headers:
+            return ""
+        items = sorted((k.lower(), str(v)) for k, v in headers.items() if k.lower() not in SessionPool.VOLATILE_HEADERS)
+        return hashlib.md5(repr(items).encode("utf-8"), usedforsecurity=False).hexdigest()
+
+    @staticmethod
+    def _get_pool_size(env_name: str, default: int) -> int:
+        try:
+            return max(1, int(Env.get(env_name, str(default)) or default))
+        except ValueError:
+            LOGGER.warning("Invalid value of %s, using default %d", env_name, default)
+            return default
+
+    @staticmethod
+    def _create_session(http2: bool = False) -> requests.Session:
+        pool_connections = SessionPool._get_pool_size("FM_CRAWLER_POOL_CONNECTIONS", SessionPool.DEFAULT_POOL_CONNECTIONS)
+        pool_maxsize = SessionPool._get_pool_size("FM_CRAWLER_POOL_MAXSIZE", SessionPool.DEFAULT_POOL_MAXSIZE)
+        session = requests.Session()
+        session.cookies.set_policy(_NoPersistCookiePolicy())
+        adapter: BaseAdapter = Http2Adapter(pool_connections=pool_connections, pool_maxsize=pool_maxsize) if http2 else HTTPAdapter(pool_connections=pool_connections, pool_maxsize=pool_maxsize)
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+        return session
+
+    @classmethod
+    def get_session(cls, url: str, *, verify_ssl: bool = True, headers: Optional[Headers] = None, http2: bool = False) -> requests.Session:
+        key = ((urlparse(url).hostname or "").lower(), verify_ssl, cls._get_headers_profile(headers), http2)
+        with cls._lock:
+            session = cls._sessions.get(key)
+            if session is None:
+                LOGGER.debug("# SessionPool.get_session(): new session for host=%s, verify_ssl=%s, http2=%s", key[0], verify_ssl, http2)
+                session = cls._create_session(http2)
+                cls._sessions[key] = session
+            return session
+
+    @classmethod
+    def close_all(cls) -> None:
+        with cls._lock:
+            for session in cls._sessions.values():
+                session.close()
+            cls._sessions.clear()
+
+    @classmethod
+    def _reset_after_fork(cls) -> None:
+        # fork된 자식은 부모의 소켓을 공유하지 않도록 닫지 않고 버림
+        cls._sessions = {}
+        cls._lock = threading.Lock()
+
+
+os.register_at_fork(after_in_child=SessionPool._reset_after_fork)
+atexit.register(SessionPool.close_all)
+
+
+class CookieStore:
+    # 쿠키 디렉토리별로 한 번만 읽어 메모리에 두고, 변경분은 최대 FLUSH_INTERVAL_SEC마다 원자적으로 기록
+    DEFAULT_FLUSH_INTERVAL_SEC = 5.0
+
+    _stores: dict[Path, "CookieStore"] = {}
+    _lock = threading.Lock()
+
+    def __init__(self, cookie_file_path: Path) -> None:
+        self.cookie_file_path: Path = cookie_file_path
+        self.cookies: Cookies = {}
+        # 아직 파일에 기록하지 않은 변경분
+        self.dirty_cookies: Cookies = {}
+        self.file_stat: Optional[tuple[int, int]] = None
+        self.last_flush_ts: float = 0.0
+        # 이미 방문한 Referer 페이지: URL -> (방문 시각, 방문 직후 가지고 있던 쿠키 이름들)
+        self.referer_visit_map: dict[str, tuple[float, frozenset[str]]] = {}
+        self.lock = threading.RLock()
+        try:
+            self.flush_interval = float(Env.get("FM_CRAWLER_COOKIE_FLUSH_INTERVAL", str(CookieStore.DEFAULT_FLUSH_INTERVAL_SEC)) or CookieStore.DEFAULT_FLUSH_INTERVAL_SEC)
+        except ValueError:
+            self.flush_interval = CookieStore.DEFAULT_FLUSH_INTERVAL_SEC
+
+    @classmethod
+    def get_store(cls, cookie_file_path: Path) -> "CookieStore":
+        with cls._lock:
+            store = cls._stores.get(cookie_file_path)
+            if store is None:
+                store = CookieStore(cookie_file_path)
+                cls._stores[cookie_file_path] = store
+            return store
+
+    @staticmethod
+    def trim(cookies: Cookies, max_size: int) -> Cookies:
+        # Keep cookies in insertion order until the joined "name=value; ..."
+        # Cookie header would exceed max_size, then drop the rest.
+        # Session/login cookies are normally set first, so they survive.
+        total = 0
+        kept: Cookies = {}
+        for i, (name, value) in enumerate(cookies.items()):
+            piece = f"{name}={value}"
+            extra = len(piece.encode("utf-8")) + (2 if i > 0 else 0)
+            if total + extra > max_size:
+                LOGGER.debug("Trimming cookies: kept %d of %d (Cookie header capped at %d bytes)", len(kept), len(cookies), max_size)
+                break
+            total += extra
+            kept[name] = value
+        return kept
+
+    def _get_file_stat(self) -> Optional[tuple[int, int]]:
+        try:
+            st = self.cookie_file_path.stat()
+        except OSError:
+            return None
+        return st.st_mtime_ns, st.st_size
+
+    def _load(self) -> None:
+        # 다른 프로세스(예: 후처리 스크립트의 crawler)가 파일을 바꾼 경우에만 다시 읽고, 아직 기록하지 않은 변경분을 덮어씀
+        file_stat = self._get_file_stat()
+        if file_stat == self.file_stat:
+            return
+        self.file_stat = file_stat
+        file_cookies: Cookies = {}
+        if file_stat is not None:
+            try:
+                with self.cookie_file_path.open("r", encoding="utf-8") as f:
+                    for cookie in json.load(f):
+                        c_name = cookie.get("name", "")
+                        c_value = cookie.get("value", "")
+                        if c_name and c_value:
+                            file_cookies[c_name] = c_value
+            except (IOError, json.JSONDecodeError, AttributeError) as e:
+                LOGGER.warning("Warning: can't read cookie file '%s', %r", PathUtil.short_path(self.cookie_file_path), e)
+        file_cookies.update(self.dirty_cookies)
+        self.cookies = file_cookies
+
+    def get_cookies(self) -> Cookies:
+        with self.lock:
+            self._load()
+            return dict(self.cookies)
+
+    def update(self, cookies: Cookies, max_size: int) -> None:
+        with self.lock:
+            self._load()
+            self.cookies.update(cookies)
+            self.cookies = CookieStore.trim(self.cookies, max_size)
+            self.dirty_cookies.update(cookies)
+            self.dirty_cookies = {k: v for k, v in self.dirty_cookies.items() if k in self.cookies}
+            if time.time() - self.last_flush_ts >= self.flush_interval:
+                self.flush()
+
+    def is_referer_fresh(self, referer: str, ttl: float) -> bool:
+        # ttl 안에 방문했고, 그때 받은 쿠키가 아직 남아 있으면 다시 방문할 필요가 없음
+        with self.lock:
+            visit = self.referer_visit_map.get(referer)
+            if visit is None or time.time() - visit[0] >= ttl:
+                return False
+            self._load()
+            return visit[1].issubset(self.cookies.keys())
+
+    def mark_referer_visited(self, referer: str) -> None:
+        with self.lock:
+            self._load()
+            self.referer_visit_map[referer] = (time.time(), frozenset(self.cookies.keys()))
+
+    def forget_referer(self, referer: str) -> None:
+        with self.lock:
+            self.referer_visit_map.pop(referer, None)
+
+    def flush(self) -> None:
+        with self.lock:
+            if not self.dirty_cookies:
+                return
+            self._load()
+            cookie_data = [{"name": k, "value": v} for k, v in self.cookies.items()]
+            temp_file_path = self.cookie_file_path.with_name(self.cookie_file_path.name + f".{os.getpid()}.tmp")
+            try:
+                with temp_file_path.open("w", encoding="utf-8") as f:
+                    json.dump(cookie_data, f, indent=2, ensure_ascii=False)
+                temp_file_path.replace(self.cookie_file_path)
+            except IOError as e:
+                LOGGER.warning("Warning: can't write cookie file '%s', %r", PathUtil.short_path(self.cookie_file_path), e)
+                temp_file_path.unlink(missing_ok=True)
+                return
+            self.file_stat = self._get_file_stat()
+            self.dirty_cookies.clear()
+            self.last_flush_ts = time.time()
+
+    @classmethod
+    def flush_all(cls) -> None:
+        with cls._lock:
+            stores = list(cls._stores.values())
+        for store in stores:
+            store.flush()
+
+    @classmethod
+    def _reset_after_fork(cls) -> None:
+        # 기록하지 않은 변경분은 부모 프로세스가 기록하므로 자식은 새로 시작
+        cls._stores = {}
+        cls._lock = threading.Lock()
+
+
+os.register_at_fork(after_in_child=CookieStore._reset_after_fork)
+atexit.register(CookieStore.flush_all)
+
+
 class RequestsClient:
     COOKIE_FILE = "cookies.requestsclient.json"
     # Cap the persisted/sent Cookie header so per-item tracking cookies (e.g.
@@ -148,8 +578,16 @@ class RequestsClient:
     # server rejects with 400. Oldest cookies (typically session/login ones,
     # set first) are kept; newest excess is dropped to fit the cap.
     MAX_COOKIE_HEADER_SIZE = 4096
-
-    def __init__(self, *, dir_path: Path = Path.cwd(), render_js: bool = False, method: Method = Method.GET, headers: Optional[Headers] = None, timeout: int = 60, encoding: str = "utf-8", verify_ssl: bool = True) -> None:
+    # 같은 Referer 페이지를 다시 방문하지 않는 시간
+    DEFAULT_REFERER_VISIT_TTL = 600
+    # 파일 다운로드 시 한 번에 읽는 크기와 최대 크기
+    DEFAULT_DOWNLOAD_CHUNK_SIZE = 1024 * 1024
+    DEFAULT_MAX_DOWNLOAD_SIZE_MB = 100
+    # 연결 타임아웃 (죽은 호스트는 읽기 타임아웃까지 기다리지 않고 빨리 실패)
+    DEFAULT_CONNECT_TIMEOUT = 10
+    SITE_CONF_FILE = "site_config.json"
+
+    def __init__(self, *, dir_path: Path = Path.cwd(), render_js: bool = False, method: Method = Method.GET, headers: Optional[Headers] = None, timeout: int = 60, encoding: str = "utf-8", verify_ssl: bool = True, host_health: Optional[HostHealth] = None, site_session_store: Optional[SiteSessionStore] = None) -> None:
         LOGGER.debug("# RequestsClient(dir_path=%s, render_js=%s, method=%s, headers=%r, timeout=%d, encoding=%s, verify_ssl=%s)", PathUtil.short_path(dir_path), render_js, method, redact_headers(headers), timeout, encoding, verify_ssl)
         self.dir_path: Path = dir_path
         self.method: Method = method
@@ -161,20 +599,75 @@ class RequestsClient:
         self._cookie_dir: Optional[Path] = None
         self.allow_private_ips = Env.get("FM_CRAWLER_ALLOW_PRIVATE_IPS", "false").strip().lower() in ("1", "true", "yes", "on")
         self.allowed_hosts_raw = Env.get("FM_CRAWLER_ALLOWED_HOSTS", "")
+        try:
+            self.referer_visit_ttl = float(Env.get("FM_CRAWLER_REFERER_VISIT_TTL", str(RequestsClient.DEFAULT_REFERER_VISIT_TTL)) or RequestsClient.DEFAULT_REFERER_VISIT_TTL)
+        except ValueError:
+            self.referer_visit_ttl = RequestsClient.DEFAULT_REFERER_VISIT_TTL
+        try:
+            self.download_chunk_size = max(1, int(Env.get("FM_CRAWLER_DOWNLOAD_CHUNK_SIZE", str(RequestsClient.DEFAULT_DOWNLOAD_CHUNK_SIZE)) or RequestsClient.DEFAULT_DOWNLOAD_CHUNK_SIZE))
+        except ValueError:
+            self.download_chunk_size = RequestsClient.DEFAULT_DOWNLOAD_CHUNK_SIZE
+        try:
+            self.max_download_size = int(float(Env.get("FM_CRAWLER_MAX_DOWNLOAD_SIZE_MB", str(RequestsClient.DEFAULT_MAX_DOWNLOAD_SIZE_MB)) or RequestsClient.DEFAULT_MAX_DOWNLOAD_SIZE_MB) * 1024 * 1024)
+        except ValueError:
+            self.max_download_size = RequestsClient.DEFAULT_MAX_DOWNLOAD_SIZE_MB * 1024 * 1024
+        try:
+            self.connect_timeout = float(Env.get("FM_CRAWLER_CONNECT_TIMEOUT", str(RequestsClient.DEFAULT_CONNECT_TIMEOUT)) or RequestsClient.DEFAULT_CONNECT_TIMEOUT)
+        except ValueError:
+            self.connect_timeout = RequestsClient.DEFAULT_CONNECT_TIMEOUT
+        # 연결 실패와 타임아웃을 호스트별로 기록하는 서킷 브레이커 (Crawler가 공유 인스턴스를 넘겨줌)
+        self.host_health: Optional[HostHealth] = host_health
+        # 같은 사이트의 피드들이 로그인 쿠키와 통과 토큰을 나눠 쓰는 저장소 (Crawler가 공유 인스턴스를 넘겨줌)
+        self.site_session_store: Optional[SiteSessionStore] = site_session_store
+        # HTTP/2로 요청할 호스트 (피드 그룹의 site_config.json "http2_hosts")
+        self.http2_hosts: frozenset[str] = RequestsClient.load_http2_hosts(dir_path)
         if not self.verify_ssl:
             urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
 
     def __del__(self) -> None:
         del self.headers
 
+    @staticmethod
+    def load_http2_hosts(dir_path: Path) -> frozenset[str]:
+        # 피드 디렉토리 또는 피드 그룹 디렉토리의 site_config.json에서 읽음
+        for site_conf_file_path in (dir_path / RequestsClient.SITE_CONF_FILE, dir_path.parent / RequestsClient.SITE_CONF_FILE):
+            if not site_conf_file_path.is_file():
+                continue
+            try:
+                with site_conf_file_path.open("r", encoding="utf-8") as infile:
+                    site_conf = json.load(infile)
+                http2_hosts = site_conf.get("http2_hosts", []) if isinstance(site_conf, dict) else []
+                if isinstance(http2_hosts, str):
+                    http2_hosts = http2_hosts.split(",")
+                return frozenset(str(host).strip().lower() for host in http2_hosts if str(host).strip())
+            except (json.JSONDecodeError, TypeError, OSError) as e:
+                LOGGER.warning("Warning: can't read 'http2_hosts' from '%s', %s", PathUtil.short_path(site_conf_file_path), e)
+        return frozenset()
+
+    def is_http2_host(self, url: str) -> bool:
+        return bool(self.http2_hosts) and _match_host(urlsplit(url).hostname or "", self.http2_hosts)
+
+    def _get_session(self, url: str) -> requests.Session:
+        return SessionPool.get_session(url, verify_ssl=self.verify_ssl, headers=self.headers, http2=self.is_http2_host(url))
+
+    def _get_timeouts(self) -> tuple[float, float]:
+        # (연결 타임아웃, 읽기 타임아웃)
+        return min(self.connect_timeout, self.timeout), self.timeout
+
+    def _record_failure(self, url: str) -> None:
+        if self.host_health:
+            self.host_health.record_failure(url)
+
+    def _record_success(self, url: str) -> None:
+        if self.host_health:
+            self.host_health.record_success(url)
+
     def _get_cookie_dir(self) -> Path:
         if self._cookie_dir is not None:
             return self._cookie_dir
         if os.access(self.dir_path, os.W_OK):
             self._cookie_dir = self.dir_path
         else:
-            import hashlib
-
             dir_hash = hashlib.md5(str(self.dir_path).encode(), usedforsecurity=False).hexdigest()[:12]
             fallback = Path(tempfile.gettempdir()) / "fm_cookies" / dir_hash
             fallback.mkdir(parents=True, exist_ok=True)
@@ -182,57 +675,60 @@ class RequestsClient:
             self._cookie_dir = fallback
         return self._cookie_dir
 
-    def write_cookies_to_file(self, cookies: RequestsCookieJar) -> None:
-        self.read_cookies_from_file()
-        for k, v in cookies.items():
-            self.cookies[k] = v
-        self._trim_cookies()
-        cookie_data = [{"name": k, "value": v} for k, v in self.cookies.items()]
-        cookie_file = self._get_cookie_dir() / RequestsClient.COOKIE_FILE
-        with cookie_file.open("w", encoding="utf-8") as f:
-            json.dump(cookie_data, f, indent=2, ensure_ascii=False)
+    def _get_cookie_store(self) -> CookieStore:
+        return CookieStore.get_store(self._get_cookie_dir() / RequestsClient.COOKIE_FILE)
 
-    def _trim_cookies(self) -> None:
-        # Keep cookies in insertion order until the joined "name=value; ..."
-        # Cookie header would exceed MAX_COOKIE_HEADER_SIZE, then drop the rest.
-        # Session/login cookies are normally set first, so they survive.
-        total = 0
-        kept: Cookies = {}
-        for i, (name, value) in enumerate(self.cookies.items()):
-            piece = f"{name}={value}"
-            extra = len(piece.encode("utf-8")) + (2 if i > 0 else 0)
-            if total + extra > RequestsClient.MAX_COOKIE_HEADER_SIZE:
-                LOGGER.debug("Trimming cookies: kept %d of %d (Cookie header capped at %d bytes)", len(kept), len(self.cookies), RequestsClient.MAX_COOKIE_HEADER_SIZE)
-                break
-            total += extra
-            kept[name] = value
-        self.cookies = kept
+    def _share_cookies(self, url: str, cookies: list[dict[str, Any]]) -> None:
+        # 사이트 세션 저장소에도 기록해서 같은 사이트의 다른 피드가 사용하게 함
+        if self.site_session_store is not None and url and cookies:
+            self.site_session_store.save_cookies(url, cookies)
 
-    def read_cookies_from_file(self) -> None:
-        cookie_file = self._get_cookie_dir() / RequestsClient.COOKIE_FILE
-        if cookie_file.is_file():
-            with cookie_file.open("r", encoding="utf-8") as f:
-                cookies = json.load(f)
-                for cookie in cookies:
-                    if "expiry" in cookie:
-                        del cookie["expiry"]
-                    c_name = cookie.get("name", "")
-                    c_value = cookie.get("value", "")
-                    if c_name and c_value:
-                        self.cookies.update({c_name: c_value})
-            # LOGGER.debug(f"self.cookies={self.cookies}")
+    def write_cookies_to_file(self, cookies: RequestsCookieJar, url: str = "") -> None:
+        store = self._get_cookie_store()
+        store.update(dict(cookies.items()), RequestsClient.MAX_COOKIE_HEADER_SIZE)
+        self.cookies = store.get_cookies()
+        if isinstance(cookies, RequestsCookieJar):
+            self._share_cookies(url, [{"name": c.name, "value": c.value, "domain": c.domain, "path": c.path, "expires": c.expires or -1, "secure": c.secure} for c in cookies])
+        else:
+            self._share_cookies(url, [{"name": k, "value": v} for k, v in cookies.items()])
+
+    def _trim_cookies(self) -> None:
+        self.cookies = CookieStore.trim(self.cookies, RequestsClient.MAX_COOKIE_HEADER_SIZE)
+
+    def _get_shared_cookies(self, url: str, own_cookies: Cookies) -> Cookies:
+        if self.site_session_store is None or not url:
+            return {}
+        shared_cookies = self.site_session_store.get_cookies_for_url(url)
+        if self.site_session_store.keeps_own_cookies:
+            # 자체 로그인 설정이 있는 피드는 자기 로그인 쿠키를 유지하고 없는 쿠키만 채움 (다른 계정의 세션이 섞이지 않게)
+            return {name: value for name, value in shared_cookies.items() if name not in own_cookies}
+        return shared_cookies
+
+    def get_cookie_header(self, url: str = "") -> str:
+        """url로 요청할 때 보낼 Cookie 헤더 값"""
+        self.read_cookies_from_file(url)
+        return "; ".join([f"{name}={value}" for name, value in self.cookies.items()])
+
+    def read_cookies_from_file(self, url: str = "") -> None:
+        own_cookies = self._get_cookie_store().get_cookies()
+        self.cookies.update(own_cookies)
+        shared_cookies = self._get_shared_cookies(url, own_cookies)
+        if shared_cookies:
+            # 같은 사이트의 다른 피드가 받은 로그인 쿠키와 통과 토큰이 더 최신이므로 덮어씀
+            self.cookies.update(shared_cookies)
+            self._trim_cookies()
 
     def login(self, config: dict[str, str]) -> bool:
         LOGGER.debug("# RequestsClient.login(login_url=%s)", config["login_url"])
         login_url = config["login_url"]
         try:
-            login_page_response = requests.get(login_url, headers=self.headers, timeout=self.timeout, verify=self.verify_ssl)
+            login_page_response = self._get_session(login_url).get(login_url, headers=self.headers, timeout=self._get_timeouts(), verify=self.verify_ssl)
         except (requests.exceptions.ConnectionError, requests.exceptions.ReadTimeout) as e:
             LOGGER.warning("Failed to access login page '%s': %s", login_url, e)
             return False
 
         if login_page_response.cookies:
-            self.write_cookies_to_file(login_page_response.cookies)
+            self.write_cookies_to_file(login_page_response.cookies, login_url)
 
         post_url, hidden_fields, detected_id_field, detected_pw_field = LoginManager.parse_login_form(login_page_response.text, login_url)
         id_field = config.get("id_field") or detected_id_field
@@ -243,20 +739,20 @@ class RequestsClient:
         post_data = {id_field: config["id"], pw_field: config["password"]}
         post_data.update(hidden_fields)
 
-        self.read_cookies_from_file()
+        self.read_cookies_from_file(post_url)
         cookie_str = "; ".join([f"{name}={value}" for name, value in self.cookies.items()])
         login_headers = dict(self.headers)
         if cookie_str:
             login_headers["Cookie"] = cookie_str
 
         try:
-            login_response = requests.post(post_url, headers=login_headers, data=post_data, timeout=self.timeout, verify=self.verify_ssl, allow_redirects=True)
+            login_response = self._get_session(post_url).post(post_url, headers=login_headers, data=post_data, timeout=self._get_timeouts(), verify=self.verify_ssl, allow_redirects=True)
         except (requests.exceptions.ConnectionError, requests.exceptions.ReadTimeout) as e:
             LOGGER.warning("Login POST failed for '%s': %s", post_url, e)
             return False
 
         if login_response.cookies:
-            self.write_cookies_to_file(login_response.cookies)
+            self.write_cookies_to_file(login_response.cookies, post_url)
 
         success = LoginManager.check_login_success(login_response)
         if success:
@@ -265,8 +761,8 @@ class RequestsClient:
             LOGGER.warning("Login failed for '%s' (status=%d)", login_url, login_response.status_code)
         return success
 
-    def make_request(self, url: str, data: Any = None, download_file: Optional[Path] = None, allow_redirects: bool = True) -> tuple[str, str, Headers, Optional[int]]:
-        LOGGER.debug(f"# make_request(url='{url}', allow_redirects={allow_redirects})")
+    def make_request(self, url: str, data: Any = None, download_file: Optional[Path] = None, allow_redirects: bool = True, extra_headers: Optional[Headers] = None) -> tuple[str, str, Headers, Optional[int]]:
+        LOGGER.debug(f"# make_request(url='{url}', allow_redirects={allow_redirects}, extra_headers={extra_headers!r})")
         is_ok, reason = URLSafety.check_url(url, allow_private=self.allow_private_ips, allowed_hosts_raw=self.allowed_hosts_raw)
         if not is_ok:
             LOGGER.warning("Blocked URL: %s (%s)", url, reason)
@@ -281,22 +777,29 @@ class RequestsClient:
             if not is_ok:
                 LOGGER.warning("Blocked referer URL: %s (%s)", referer, reason)
                 return "", f"blocked url: {reason}", {}, None
-            LOGGER.debug("visiting referer page '%s'", referer)
-            self.read_cookies_from_file()
-            try:
-                referer_response = requests.get(referer, headers=self.headers, timeout=self.timeout, verify=self.verify_ssl, allow_redirects=allow_redirects)
-            except requests.exceptions.ConnectionError as e:
-                LOGGER.warning(f"<!-- Warning: can't connect to '{url}' for temporary network error -->")
-                LOGGER.warning("<!-- %r -->", e)
-                return "", f"can't connect to '{url}' for temporary network error", {}, None
-            except requests.exceptions.ReadTimeout as e:
-                LOGGER.warning(f"<!-- Warning: can't read data from '{url}' for timeout -->")
-                LOGGER.warning("<!-- %r -->", e)
-                return "", f"Warning: can't read data from '{url}' for timeout", {}, None
-            if referer_response.cookies:
-                self.write_cookies_to_file(referer_response.cookies)
-
-        self.read_cookies_from_file()
+            if self.referer_visit_ttl > 0 and self._get_cookie_store().is_referer_fresh(referer, self.referer_visit_ttl):
+                LOGGER.debug("skipping recently visited referer page '%s'", referer)
+            else:
+                LOGGER.debug("visiting referer page '%s'", referer)
+                self.read_cookies_from_file(referer)
+                try:
+                    referer_response = self._get_session(referer).get(referer, headers=self.headers, timeout=self._get_timeouts(), verify=self.verify_ssl, allow_redirects=allow_redirects)
+                except requests.exceptions.ConnectionError as e:
+                    self._record_failure(referer)
+                    LOGGER.warning(f"<!-- Warning: can't connect to '{url}' for temporary network error -->")
+                    LOGGER.warning("<!-- %r -->", e)
+                    return "", f"can't connect to '{url}' for temporary network error", {}, None
+                except requests.exceptions.ReadTimeout as e:
+                    self._record_failure(referer)
+                    LOGGER.warning(f"<!-- Warning: can't read data from '{url}' for timeout -->")
+                    LOGGER.warning("<!-- %r -->", e)
+                    return "", f"Warning: can't read data from '{url}' for timeout", {}, None
+                if referer_response.cookies:
+                    self.write_cookies_to_file(referer_response.cookies, referer)
+                if referer_response.ok:
+                    self._get_cookie_store().mark_referer_visited(referer)
+
+        self.read_cookies_from_file(url)
         response = None
         try:
             match self.method:
@@ -304,17 +807,23 @@ class RequestsClient:
                     cookie_str = "; ".join([f"{name}={value}" for name, value in self.cookies.items()])
                     self.headers["Cookie"] = cookie_str
                     # LOGGER.debug(f"self.headers={self.headers}")
-                    response = requests.get(url, headers=self.headers, timeout=self.timeout, verify=self.verify_ssl, allow_redirects=allow_redirects)
+                    # If-None-Match 등 이번 요청에만 필요한 헤더는 공유되는 self.headers에 남기지 않음
+                    request_headers = {**self.headers, **extra_headers} if extra_headers else self.headers
+                    # 파일로 받을 때는 본문을 메모리에 모두 올리지 않고 스트리밍으로 받음
+                    response = self._get_session(url).get(url, headers=request_headers, timeout=self._get_timeouts(), verify=self.verify_ssl, allow_redirects=allow_redirects, stream=bool(download_file))
                 case Method.POST:
-                    response = requests.post(url, headers=self.headers, timeout=self.timeout, verify=self.verify_ssl, data=data)
+                    response = self._get_session(url).post(url, headers=self.headers, timeout=self._get_timeouts(), verify=self.verify_ssl, data=data)
                 case Method.HEAD:
-                    response = requests.head(url, headers=self.headers, timeout=self.timeout, verify=self.verify_ssl)
+                    response = self._get_session(url).head(url, headers=self.headers, timeout=self._get_timeouts(), verify=self.verify_ssl)
+                    self._record_success(url)
                     return str(response.status_code), "", dict(response.headers), response.status_code
         except requests.exceptions.ConnectionError as e:
+            self._record_failure(url)
             LOGGER.warning(f"<!-- Warning: can't connect to '{url}' for temporary network error -->")
             LOGGER.warning("<!-- %r -->", e)
             return "", f"can't connect to '{url}' for temporary network error", {}, None
         except requests.exceptions.ReadTimeout as e:
+            self._record_failure(url)
             LOGGER.warning(f"<!-- Warning: can't read data from '{url}' for timeout -->")
             LOGGER.warning("<!-- %r -->", e)
             return "", f"Warning: can't read data from '{url}' for timeout", {}, None
@@ -322,17 +831,28 @@ class RequestsClient:
         # explicit null check required
         if response is None:
             return "", f"can't get response from '{url}'", {}, None
+        # 응답을 받았으면 상태 코드와 관계없이 호스트는 살아 있음
+        self._record_success(url)
         if response.cookies:
-            self.write_cookies_to_file(response.cookies)
+            self.write_cookies_to_file(response.cookies, url)
         if response.status_code != 200:
             LOGGER.debug(f"response.status_code={response.status_code}")
+            if referer and response.status_code in (401, 403):
+                # 세션이 만료되었을 수 있으므로 다음 요청에서는 Referer 페이지를 다시 방문
+                self._get_cookie_store().forget_referer(referer)
+            if download_file:
+                # 읽지 않은 스트리밍 응답은 닫아야 연결이 풀로 돌아감
+                response.close()
             return "", f"can't get response from '{url}' with status code '{response.status_code}'", dict(response.headers), response.status_code
 
         if download_file:
-            response.raw.decode_content = True
-            with download_file.open("wb") as f:
-                f.writelines(response)
-            os.utime(download_file, (time.time(), time.time()))
+            try:
+                error = self._download_to_file(response, download_file)
+            finally:
+                response.close()
+            if error:
+                LOGGER.warning("Warning: can't download '%s', %s", url, error)
+                return "", error, dict(response.headers), response.status_code
             return "200", "", {}, response.status_code
 
         if self.encoding:
@@ -340,10 +860,309 @@ class RequestsClient:
         else:
             response.encoding = "utf-8"
 
-        if not re.search(r'<meta\s+property="og:url"\s+content="[^"]+"\s*/?>', response.text):
-            result = response.text.replace("</head>", f'<meta property="og:url" content="{response.request.url}"/>\n</head>')
-            return result, "", dict(response.headers), response.status_code
-        return response.text, "", dict(response.headers), response.status_code
+        return RequestsClient._inject_og_url(response.text, str(response.request.url)), "", dict(response.headers), response.status_code
+
+    @staticmethod
+    def _inject_og_url(text: str, url: str) -> str:
+        if not re.search(r'<meta\s+property="og:url"\s+content="[^"]+"\s*/?>', text):
+            return text.replace("</head>", f'<meta property="og:url" content="{url}"/>\n</head>')
+        return text
+
+    def _download_to_file(self, response: requests.Response, download_file: Path) -> str:
+        # 임시 파일에 청크 단위로 기록한 뒤 원자적으로 이름을 바꾸고, 최대 크기를 넘으면 바로 중단함
+        error = self._check_content_length(response.headers.get("Content-Length"))
+        if error:
+            return error
+
+        total_size = 0
+        fd, temp_file_name = tempfile.mkstemp(dir=download_file.parent, prefix="." + download_file.name + ".", suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                for chunk in response.iter_content(chunk_size=self.download_chunk_size):
+                    total_size += len(chunk)
+                    if total_size > self.max_download_size:
+                        Path(temp_file_name).unlink(missing_ok=True)
+                        return f"downloaded data exceeds the maximum download size {self.max_download_size}"
+                    f.write(chunk)
+            os.replace(temp_file_name, download_file)
+        except (OSError, requests.exceptions.RequestException) as e:
+            Path(temp_file_name).unlink(missing_ok=True)
+            return f"can't write downloaded data to '{PathUtil.short_path(download_file)}', {e!r}"
+        return ""
+
+    def _check_content_length(self, content_length_str: Any) -> str:
+        try:
+            content_length = int(content_length_str or 0)
+        except (TypeError, ValueError):
+            content_length = 0
+        if content_length > self.max_download_size:
+            return f"content length {content_length} exceeds the maximum download size {self.max_download_size}"
+        return ""
+
+
+FetchResult = tuple[str, str, Headers, Optional[int]]
+
+
+class AsyncRequestsClient(RequestsClient):
+    """여러 URL을 asyncio로 적은 수의 연결에서 동시에 받는 클라이언트 (헤더, 쿠키, 인코딩, URL 안전성 처리는 RequestsClient와 같음)
+
+    httpx가 설치되어 있지 않으면 같은 동시성 제한 안에서 RequestsClient.make_request를 스레드로 실행함
+    """
+
+    DEFAULT_MAX_CONCURRENCY = 8
+    MAX_REDIRECTS = 10
+    # httpx가 없어서 스레드로 받는다는 안내를 프로세스마다 한 번만 남기기 위한 표시
+    _is_thread_fallback_logged = False
+
+    def __init__(self, *, max_concurrency: Optional[int] = None, **kwargs: Any) -> None:
+        super().__init__(**kwargs)
+        if max_concurrency is None:
+            max_concurrency = SessionPool._get_pool_size("FM_CRAWLER_ASYNC_MAX_CONCURRENCY", AsyncRequestsClient.DEFAULT_MAX_CONCURRENCY)
+        self.max_concurrency: int = max(1, max_concurrency)
+        self.rate_limiter = RateLimiter()
+
+    def fetch_many(self, urls: list[str], download_files: Optional[list[Optional[Path]]] = None) -> list[FetchResult]:
+        LOGGER.debug("# fetch_many(num_urls=%d, max_concurrency=%d)", len(urls), self.max_concurrency)
+        if not urls:
+            return []
+        return asyncio.run(self.fetch_many_async(urls, download_files))
+
+    async def fetch_many_async(self, urls: list[str], download_files: Optional[list[Optional[Path]]] = None) -> list[FetchResult]:
+        if download_files is None:
+            download_files = [None] * len(urls)
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+
+        if httpx is None:
+            if not AsyncRequestsClient._is_thread_fallback_logged:
+                AsyncRequestsClient._is_thread_fallback_logged = True
+                LOGGER.info("httpx is not installed, fetching with up to %d threads instead of asyncio (install the 'async' extra to enable it)", self.max_concurrency)
+
+            async def fetch_in_thread(url: str, download_file: Optional[Path]) -> FetchResult:
+                async with semaphore:
+                    circuit_error = self.host_health.check(url, self.timeout) if self.host_health else ""
+                    if circuit_error:
+                        return "", circuit_error, {}, None
+                    await asyncio.sleep(self.rate_limiter.reserve(url))
+                    return await asyncio.to_thread(self.make_request, url, download_file=download_file)
+
+            return list(await asyncio.gather(*(fetch_in_thread(url, download_file) for url, download_file in zip(urls, download_files))))
+
+        limits = httpx.Limits(max_connections=self.max_concurrency, max_keepalive_connections=self.max_concurrency)
+        # 모든 URL이 HTTP/2 지정 호스트일 때만 HTTP/2로 다중화함 (서버가 지원하지 않으면 ALPN으로 HTTP/1.1 사용)
+        http2 = _is_h2_available() and all(self.is_http2_host(url) for url in urls)
+        timeout = httpx.Timeout(self.timeout, connect=min(self.connect_timeout, self.timeout))
+        async with httpx.AsyncClient(http2=http2, verify=self.verify_ssl, timeout=timeout, limits=limits, follow_redirects=False) as client:
+            referer = self.headers.get("Referer", "")
+            if referer:
+                error = await self._visit_referer_async(client, referer)
+                if error:
+                    return [("", error, {}, None) for _ in urls]
+
+            async def fetch(url: str, download_file: Optional[Path]) -> FetchResult:
+                async with semaphore:
+                    circuit_error = self.host_health.check(url, self.timeout) if self.host_health else ""
+                    if circuit_error:
+                        return "", circuit_error, {}, None
+                    await asyncio.sleep(self.rate_limiter.reserve(url))
+                    return await self._make_request_async(client, url, download_file)
+
+            return list(await asyncio.gather(*(fetch(url, download_file) for url, download_file in zip(urls, download_files))))
+
+    def _get_request_headers(self, url: str = "") -> Headers:
+        headers = dict(self.headers)
+        cookies = self._get_cookie_store().get_cookies()
+        shared_cookies = self._get_shared_cookies(url, cookies)
+        if shared_cookies:
+            cookies = CookieStore.trim({**cookies, **shared_cookies}, RequestsClient.MAX_COOKIE_HEADER_SIZE)
+        if cookies:
+            headers["Cookie"] = "; ".join(f"{name}={value}" for name, value in cookies.items())
+        return headers
+
+    async def _send_async(self, client: Any, url: str, headers: Headers) -> tuple[Any, str, str]:
+        # 리다이렉트를 직접 따라가면서 매번 URL 안전성을 검사함 -> (스트리밍 응답, 최종 URL, 오류)
+        for _ in range(AsyncRequestsClient.MAX_REDIRECTS + 1):
+            is_ok, reason = await asyncio.to_thread(URLSafety.check_url, url, allow_private=self.allow_private_ips, allowed_hosts_raw=self.allowed_hosts_raw)
+            if not is_ok:
+                LOGGER.warning("Blocked URL: %s (%s)", url, reason)
+                return None, url, f"blocked url: {reason}"
+
+            response = None
+            pinned_requests = _get_pinned_requests(url, headers)
+            for i, (request_url, request_headers, extensions) in enumerate(pinned_requests):
+                try:
+                    response = await client.send(client.build_request("GET", request_url, headers=request_headers, extensions=extensions), stream=True)
+                    break
+                except httpx.ConnectError:
+                    if i == len(pinned_requests) - 1:
+                        raise
+            if response is None:
+                return None, url, f"can't get response from '{url}'"
+
+            location = response.headers.get("location")
+            if not response.is_redirect or not location:
+                return response, url, ""
+            cookies = _get_response_cookies(response)
+            if cookies:
+                self._get_cookie_store().update(cookies, RequestsClient.MAX_COOKIE_HEADER_SIZE)
+                self._share_cookies(url, [{"name": k, "value": v} for k, v in cookies.items()])
+            await response.aclose()
+            url = urljoin(url, location)
+        return None, url, f"too many redirects for '{url}'"
+
+    async def _visit_referer_async(self, client: Any, referer: str) -> str:
+        referer = to_latin1_safe_url(referer)
+        self.headers["Referer"] = referer
+        store = self._get_cookie_store()
+        if self.referer_visit_ttl > 0 and store.is_referer_fresh(referer, self.referer_visit_ttl):
+            LOGGER.debug("skipping recently visited referer page '%s'", referer)
+            return ""
+        LOGGER.debug("visiting referer page '%s'", referer)
+        try:
+            response, _, error = await self._send_async(client, referer, self._get_request_headers(referer))
+        except httpx.TransportError as e:
+            self._record_failure(referer)
+            LOGGER.warning("<!-- Warning: can't visit referer page '%s', %r -->", referer, e)
+            return f"can't connect to '{referer}' for temporary network error"
+        if response is None:
+            return error
+        try:
+            cookies = _get_response_cookies(response)
+            if cookies:
+                store.update(cookies, RequestsClient.MAX_COOKIE_HEADER_SIZE)
+                self._share_cookies(referer, [{"name": k, "value": v} for k, v in cookies.items()])
+            if response.is_success or response.is_redirect:
+                store.mark_referer_visited(referer)
+        finally:
+            await response.aclose()
+        return ""
+
+    async def _make_request_async(self, client: Any, url: str, download_file: Optional[Path] = None) -> FetchResult:
+        LOGGER.debug("# _make_request_async(url='%s', download_file=%s)", url, download_file)
+        try:
+            response, final_url, error = await self._send_async(client, url, self._get_request_headers(url))
+            if response is None:
+                return "", error, {}, None
+            self._record_success(url)
+            try:
+                cookies = _get_response_cookies(response)
+                if cookies:
+                    self._get_cookie_store().update(cookies, RequestsClient.MAX_COOKIE_HEADER_SIZE)
+                    self._share_cookies(final_url, [{"name": k, "value": v} for k, v in cookies.items()])
+                if response.status_code != 200:
+                    LOGGER.debug("response.status_code=%d", response.status_code)
+                    referer = self.headers.get("Referer", "")
+                    if referer and response.status_code in (401, 403):
+                        self._get_cookie_store().forget_referer(referer)
+                    return "", f"can't get response from '{url}' with status code '{response.status_code}'", dict(response.headers), response.status_code
+
+                if download_file:
+                    error = await self._download_to_file_async(response, download_file)
+                    if error:
+                        LOGGER.warning("Warning: can't download '%s', %s", url, error)
+                        return "", error, dict(response.headers), response.status_code
+                    return "200", "", {}, response.status_code
+
+                text = (await response.aread()).decode(self.encoding or "utf-8", errors="replace")
+                return RequestsClient._inject_og_url(text, final_url), "", dict(response.headers), response.status_code
+            finally:
+                await response.aclose()
+        except httpx.TimeoutException as e:
+            self._record_failure(url)
+            LOGGER.warning(f"<!-- Warning: can't read data from '{url}' for timeout -->")
+            LOGGER.warning("<!-- %r -->", e)
+            return "", f"Warning: can't read data from '{url}' for timeout", {}, None
+        except httpx.TransportError as e:
+            self._record_failure(url)
+            LOGGER.warning(f"<!-- Warning: can't connect to '{url}' for temporary network error -->")
+            LOGGER.warning("<!-- %r -->", e)
+            return "", f"can't connect to '{url}' for temporary network error", {}, None
+
+    async def _download_to_file_async(self, response: Any, download_file: Path) -> str:
+        error = self._check_content_length(response.headers.get("content-length"))
+        if error:
+            return error
+
+        total_size = 0
+        fd, temp_file_name = tempfile.mkstemp(dir=download_file.parent, prefix="." + download_file.name + ".", suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                async for chunk in response.aiter_bytes(chunk_size=self.download_chunk_size):
+                    total_size += len(chunk)
+                    if total_size > self.max_download_size:
+                        Path(temp_file_name).unlink(missing_ok=True)
+                        return f"downloaded data exceeds the maximum download size {self.max_download_size}"
+                    f.write(chunk)
+            os.replace(temp_file_name, download_file)
+        except (OSError, httpx.HTTPError) as e:
+            Path(temp_file_name).unlink(missing_ok=True)
+            return f"can't write downloaded data to '{PathUtil.short_path(download_file)}', {e!r}"
+        return ""
+
+
+class RetryPolicy:
+    """실패한 요청의 재시도 여부와 대기 시간을 결정 (지수 백오프 + jitter, Retry-After, 요청별 전체 마감 시간)"""
+
+    # 다시 시도하면 성공할 수 있는 4xx (나머지 3xx/4xx는 영구 오류로 보고 재시도하지 않음)
+    RETRYABLE_CLIENT_ERROR_CODES = frozenset((408, 425, 429))
+    # 서버가 지정한 Retry-After를 따르는 상태 코드
+    RETRY_AFTER_STATUS_CODES = frozenset((429, 503))
+    DEFAULT_MAX_DELAY_SEC = 60.0
+    DEFAULT_DEADLINE_SEC = 300.0
+
+    def __init__(self, num_retries: int, base_delay: float, max_delay: Optional[float] = None, deadline: Optional[float] = None) -> None:
+        self.num_retries = num_retries
+        self.base_delay = base_delay
+        self.max_delay = max_delay if max_delay is not None else RetryPolicy._get_env_float("FM_CRAWLER_RETRY_MAX_DELAY", RetryPolicy.DEFAULT_MAX_DELAY_SEC)
+        self.deadline = deadline if deadline is not None else RetryPolicy._get_env_float("FM_CRAWLER_RETRY_DEADLINE", RetryPolicy.DEFAULT_DEADLINE_SEC)
+
+    @staticmethod
+    def _get_env_float(env_name: str, default: float) -> float:
+        try:
+            return float(Env.get(env_name, str(default)) or default)
+        except ValueError:
+            return default
+
+    @staticmethod
+    def is_retryable(status_code: Optional[int]) -> bool:
+        # 상태 코드가 없으면 네트워크 오류나 빈 응답이므로 재시도
+        if status_code is None:
+            return True
+        if 300 <= status_code < 500:
+            return status_code in RetryPolicy.RETRYABLE_CLIENT_ERROR_CODES
+        return True
+
+    @staticmethod
+    def parse_retry_after(value: str) -> Optional[float]:
+        # 초 단위 숫자 또는 HTTP 날짜
+        value = value.strip()
+        if value.isdigit():
+            return float(value)
+        try:
+            retry_dt = email.utils.parsedate_to_datetime(value)
+        except (TypeError, ValueError):
+            return None
+        return max(0.0, retry_dt.timestamp() - time.time())
+
+    def get_delay(self, attempt: int, status_code: Optional[int] = None, response_headers: Optional[Headers] = None) -> float:
+        if status_code in RetryPolicy.RETRY_AFTER_STATUS_CODES and response_headers:
+            for k, v in response_headers.items():
+                if k.lower() == "retry-after":
+                    retry_after = RetryPolicy.parse_retry_after(v)
+                    if retry_after is not None:
+                        return retry_after
+        # 절반은 고정, 나머지 절반은 무작위로 대기해서 여러 프로세스가 동시에 재시도하지 않게 함
+        delay = min(self.max_delay, self.base_delay * 2**attempt)
+        return delay / 2 + random.uniform(0, delay / 2)
+
+    def get_next_delay(self, attempt: int, started_at: float, status_code: Optional[int] = None, response_headers: Optional[Headers] = None) -> Optional[float]:
+        """attempt번째(0부터) 시도가 실패한 뒤 다시 시도하기 전까지 대기할 시간, 재시도하지 않으면 None"""
+        if attempt + 1 >= self.num_retries or not RetryPolicy.is_retryable(status_code):
+            return None
+        delay = self.get_delay(attempt, status_code, response_headers)
+        if time.monotonic() - started_at + delay > self.deadline:
+            LOGGER.debug("retry deadline of %.0f seconds would be exceeded (delay=%.1f)", self.deadline, delay)
+            return None
+        return delay
 
 
 class Crawler:
@@ -368,9 +1187,13 @@ class Crawler:
         disable_headless: bool = False,
         blob_to_dataurl: bool = False,
         wait_until: str = "domcontentloaded",
+        cache_ttl: int = 0,
+        blocked_resource_types: Optional[list[str]] = None,
+        blocked_domains: Optional[list[str]] = None,
+        scroll_timeout: int = 0,
     ) -> None:
         LOGGER.debug(
-            "# Crawler(dir_path=%s, render_js=%s, method=%s, headers=%r, timeout=%d, num_retries=%d, retry_sleep=%d, encoding=%s, verify_ssl=%s, copy_images_from_canvas=%s, simulate_scrolling=%s, disable_headless=%s, blob_to_dataurl=%s, wait_until=%s)",
+            "# Crawler(dir_path=%s, render_js=%s, method=%s, headers=%r, timeout=%d, num_retries=%d, retry_sleep=%d, encoding=%s, verify_ssl=%s, copy_images_from_canvas=%s, simulate_scrolling=%s, disable_headless=%s, blob_to_dataurl=%s, wait_until=%s, cache_ttl=%d, blocked_resource_types=%r, blocked_domains=%r, scroll_timeout=%d)",
             PathUtil.short_path(dir_path),
             render_js,
             method,
@@ -385,6 +1208,10 @@ class Crawler:
             disable_headless,
             blob_to_dataurl,
             wait_until,
+            cache_ttl,
+            blocked_resource_types,
+            blocked_domains,
+            scroll_timeout,
         )
         self.dir_path = dir_path
         self.render_js = render_js
@@ -394,6 +1221,7 @@ class Crawler:
         self.timeout = timeout
         self.num_retries = num_retries
         self.retry_sleep = retry_sleep
+        self.retry_policy = RetryPolicy(num_retries, retry_sleep)
         self.encoding = encoding
         self.verify_ssl = verify_ssl
         self.copy_images_from_canvas = copy_images_from_canvas
@@ -401,11 +1229,35 @@ class Crawler:
         self.disable_headless = disable_headless
         self.blob_to_dataurl = blob_to_dataurl
         self.wait_until = wait_until
+        # headless browser에서 받지 않을 리소스 종류와 도메인
+        self.blocked_resource_types: list[str] = blocked_resource_types or []
+        self.blocked_domains: list[str] = blocked_domains or []
+        # simulate_scrolling에서 스크롤에 쓰는 최대 시간 (0이면 기본값)
+        self.scroll_timeout = scroll_timeout
+        # requests 기반 GET 응답을 피드 간에 공유하는 디스크 캐시 (0이면 사용 안 함)
+        self.cache_ttl = cache_ttl
+        self.response_cache: Optional[ResponseCache] = ResponseCache() if cache_ttl > 0 and not render_js else None
+        # 마지막 requests 기반 요청의 상태 코드와 응답 헤더 (conditional GET 등에서 참조)
+        self.last_status_code: Optional[int] = None
+        self.last_response_headers: Headers = {}
+        # 모든 프로세스가 공유하는 호스트별 요청 제한 (FM_RATE_LIMITS, FM_RATE_LIMIT_DEFAULT)
+        self.rate_limiter = RateLimiter()
+        # 모든 프로세스가 공유하는 호스트별 서킷 브레이커 (죽은 호스트는 대기 시간 동안 바로 실패)
+        self.host_health = HostHealth()
+        # site_config.json "shared_session_sites"에 지정한 사이트의 피드들이 공유하는 쿠키와 Cloudflare 통과 토큰
+        self.site_session_store = SiteSessionStore(sites=SiteSessionStore.load_sites(self.dir_path), keeps_own_cookies=(self.dir_path / LoginManager.LOGIN_CONFIG_FILE).is_file())
+        # render_js 피드가 렌더링 없이 받아도 되는지(피드와 호스트별)와 호스트별로 성공한 headless browser 엔진의 기록
+        self.fetch_strategy = FetchStrategy(scope=str(self.dir_path))
+        # (url, html) -> 추출한 내용, 렌더링 없이 받은 결과를 검사할 때 사용 (FeedMaker가 기사 추출 설정으로 지정, 없으면 항상 렌더링)
+        self.content_extractor: Optional[Callable[[str, str], Optional[str]]] = None
+        self._plain_client: Optional[RequestsClient] = None
+        # 렌더링한 결과와 다시 비교할, 렌더링 없이 추출한 내용 (url -> 추출 내용)
+        self._plain_content_to_verify: dict[str, str] = {}
         if self.render_js:
             # headless browser
-            self.headless_browser = HeadlessBrowser(dir_path=self.dir_path, headers=self.headers, copy_images_from_canvas=copy_images_from_canvas, simulate_scrolling=simulate_scrolling, disable_headless=disable_headless, blob_to_dataurl=blob_to_dataurl, timeout=timeout, wait_until=wait_until)
+            self.headless_browser = HeadlessBrowser(dir_path=self.dir_path, headers=self.headers, copy_images_from_canvas=copy_images_from_canvas, simulate_scrolling=simulate_scrolling, disable_headless=disable_headless, blob_to_dataurl=blob_to_dataurl, timeout=timeout, wait_until=wait_until, blocked_resource_types=self.blocked_resource_types, blocked_domains=self.blocked_domains, scroll_timeout=scroll_timeout, site_session_store=self.site_session_store, fetch_strategy=self.fetch_strategy)
         else:
-            self.requests_client = RequestsClient(dir_path=self.dir_path, method=method, headers=self.headers, timeout=timeout, encoding=encoding, verify_ssl=verify_ssl)
+            self.requests_client = RequestsClient(dir_path=self.dir_path, method=method, headers=self.headers, timeout=timeout, encoding=encoding, verify_ssl=verify_ssl, host_health=self.host_health, site_session_store=self.site_session_store)
 
     def __del__(self) -> None:
         if self.headers:
@@ -440,6 +1292,12 @@ class Crawler:
             option_str += f" --disable-headless={disable_headless}"
         if "wait_until" in options and options["wait_until"]:
             option_str += f" --wait-until={options['wait_until']}"
+        if "blocked_resource_types" in options and options["blocked_resource_types"]:
+            option_str += f" --blocked-resource-types={','.join(options['blocked_resource_types'])}"
+        if "blocked_domains" in options and options["blocked_domains"]:
+            option_str += f" --blocked-domains={','.join(options['blocked_domains'])}"
+        if "scroll_timeout" in options and options["scroll_timeout"]:
+            option_str += f" --scroll-timeout={options['scroll_timeout']}"
         if "user_agent" in options and options["user_agent"]:
             user_agent = options["user_agent"]
             option_str += f" --user-agent='{user_agent}'"
@@ -464,6 +1322,8 @@ class Crawler:
             option_str += f" --retry={options['num_retries']}"
         if "retry_sleep" in options and options["retry_sleep"]:
             option_str += f" --retry-sleep={options['retry_sleep']}"
+        if "cache_ttl" in options and options["cache_ttl"]:
+            option_str += f" --cache-ttl={options['cache_ttl']}"
 
         return option_str
 
@@ -487,37 +1347,174 @@ class Crawler:
         if not success:
             LOGGER.warning("Login failed, proceeding without login")
 
-    def run(self, url: str, data: Any = None, download_file: Optional[Path] = None, allow_redirects: bool = True) -> tuple[str, str, Optional[Headers]]:
-        LOGGER.debug(f"# run(url={url}, data={data!r}, download_file={download_file}, allow_redirects={allow_redirects})")
+    def fetch_many(self, urls: list[str], download_files: Optional[list[Optional[Path]]] = None, max_concurrency: Optional[int] = None) -> list[tuple[str, str, Optional[Headers]]]:
+        """여러 URL을 동시에 받아 run()과 같은 형식의 결과를 순서대로 돌려줌 (재시도할 만한 실패는 run()으로 다시 시도)"""
+        LOGGER.debug("# fetch_many(num_urls=%d, max_concurrency=%s)", len(urls), max_concurrency)
+        if download_files is None:
+            download_files = [None] * len(urls)
+        if self.render_js and self.method == Method.GET and not any(download_files):
+            # 한 브라우저의 페이지 풀에서 동시에 렌더링하고, 빈 결과는 run()으로 다시 시도 (다른 엔진으로의 fallback 포함)
+            self._try_login()
+            # 렌더링 없이 받아도 된다고 기록된 호스트의 URL은 run()에서 먼저 HTTP로 받아 봄
+            plain_urls = {url for url in urls if self._can_skip_rendering() and self.fetch_strategy.is_plain_preferred(url)}
+            # 서킷이 열린 호스트의 URL은 렌더링하지 않고 바로 실패시킴
+            circuit_error_map: dict[str, str] = {}
+            for url in urls:
+                if url not in plain_urls and url not in circuit_error_map:
+                    circuit_error = self.host_health.check(url, probe_timeout=self.timeout)
+                    if circuit_error:
+                        LOGGER.warning("Warning: %s", circuit_error)
+                        circuit_error_map[url] = circuit_error
+            render_urls = [url for url in urls if url not in plain_urls and url not in circuit_error_map]
+            for url in render_urls:
+                self.rate_limiter.acquire(url)
+            response_map = dict(zip(render_urls, self.headless_browser.make_requests(render_urls))) if render_urls else {}
+            rendered_results: list[tuple[str, str, Optional[Headers]]] = []
+            for url in urls:
+                if url in circuit_error_map:
+                    rendered_results.append(("", circuit_error_map[url], {}))
+                    continue
+                response = response_map.get(url, "")
+                if response:
+                    self.host_health.record_success(url)
+                    self._probe_plain_fetch(url, response)
+                    rendered_results.append((response, "", None))
+                elif url in plain_urls or self.num_retries > 1:
+                    rendered_results.append(self.run(url))
+                else:
+                    rendered_results.append(("", "", {}))
+            return rendered_results
+        if self.render_js or self.method != Method.GET:
+            return [self.run(url, download_file=download_file) for url, download_file in zip(urls, download_files)]
+
+        self._try_login()
+        client = AsyncRequestsClient(dir_path=self.dir_path, headers=dict(self.headers), timeout=self.timeout, encoding=self.encoding, verify_ssl=self.verify_ssl, host_health=self.host_health, site_session_store=self.site_session_store, max_concurrency=max_concurrency)
+        results: list[tuple[str, str, Optional[Headers]]] = []
+        for url, download_file, (response, error, headers, status_code) in zip(urls, download_files, client.fetch_many(urls, download_files)):
+            if response:
+                results.append((response, "", None))
+            elif self.num_retries > 1 and RetryPolicy.is_retryable(status_code):
+                results.append(self.run(url, download_file=download_file))
+            else:
+                results.append(("", error, headers))
+        return results
+
+    def _can_skip_rendering(self, download_file: Optional[Path] = None, data: Any = None) -> bool:
+        # 브라우저에서 스크립트를 실행해야 하는 옵션이 없고 추출 결과로 비교할 수 있을 때만 렌더링 없이 받아 봄
+        if not self.render_js or self.method != Method.GET or download_file or data or self.content_extractor is None:
+            return False
+        return not (self.copy_images_from_canvas or self.simulate_scrolling or self.blob_to_dataurl)
+
+    def _fetch_plain(self, url: str) -> str:
+        # render_js 피드의 URL을 headless browser 없이 받음 (Cookie 헤더가 브라우저 쪽 헤더에 섞이지 않도록 헤더를 복사해서 사용)
+        if self._plain_client is None:
+            self._plain_client = RequestsClient(dir_path=self.dir_path, method=Method.GET, headers=dict(self.headers), timeout=self.timeout, encoding=self.encoding, verify_ssl=self.verify_ssl, host_health=self.host_health, site_session_store=self.site_session_store)
+        if self.host_health.check(url, probe_timeout=self.timeout):
+            return ""
+        extra_headers: Optional[Headers] = None
+        browser_cookies = self.headless_browser.get_cookies(url)
+        if browser_cookies:
+            # 브라우저가 받은 로그인 쿠키와 통과 토큰을 함께 보냄 (이름이 같으면 브라우저 쪽 값을 사용)
+            self._plain_client.read_cookies_from_file(url)
+            cookies = {**self._plain_client.cookies, **browser_cookies}
+            extra_headers = {"Cookie": "; ".join(f"{name}={value}" for name, value in cookies.items())}
+        self.rate_limiter.acquire(url)
+        try:
+            response, error, _, _ = self._plain_client.make_request(url, extra_headers=extra_headers)
+        except requests.exceptions.ReadTimeout:
+            return ""
+        return "" if error else response
+
+    def _try_plain_fetch(self, url: str) -> str:
+        # 렌더링 없이도 된다고 기록된 피드는 먼저 HTTP로 받아 보고, 추출한 내용이 기록과 맞지 않으면 기록을 지우고 렌더링함
+        if not self.fetch_strategy.is_plain_preferred(url) or self.content_extractor is None:
+            return ""
+        response = self._fetch_plain(url)
+        plain_content = self.content_extractor(url, response) if response else ""
+        if not self.fetch_strategy.matches_plain_content(url, plain_content or ""):
+            self.fetch_strategy.record_plain_result(url, False)
+            return ""
+        if self.fetch_strategy.is_verify_due():
+            # 가끔은 렌더링해서 렌더링한 결과와 다시 비교함 (사이트가 바뀌어 내용 일부만 받고 있는 경우를 찾음)
+            LOGGER.debug("verifying '%s' against the rendered page", url)
+            self._plain_content_to_verify[url] = plain_content or ""
+            return ""
+        LOGGER.debug("got '%s' without rendering", url)
+        return response
+
+    def _probe_plain_fetch(self, url: str, rendered_html: str) -> None:
+        # 기록이 없거나 만료되었거나 다시 비교할 차례인 피드는 렌더링한 결과와 HTTP로 받은 결과의 추출 내용을 비교해서 기록함
+        plain_content = self._plain_content_to_verify.pop(url, None)
+        if not self._can_skip_rendering() or self.content_extractor is None:
+            return
+        if plain_content is None and not self.fetch_strategy.is_plain_probe_due(url):
+            return
+        rendered_content = self.content_extractor(url, rendered_html)
+        if not rendered_content:
+            return
+        if plain_content is None:
+            plain_html = self._fetch_plain(url)
+            plain_content = self.content_extractor(url, plain_html) if plain_html else ""
+        self.fetch_strategy.record_plain_result(url, FetchStrategy.is_equivalent_content(plain_content or "", rendered_content), rendered_content)
+
+    def run(self, url: str, data: Any = None, download_file: Optional[Path] = None, allow_redirects: bool = True, extra_headers: Optional[Headers] = None) -> tuple[str, str, Optional[Headers]]:
+        LOGGER.debug(f"# run(url={url}, data={data!r}, download_file={download_file}, allow_redirects={allow_redirects}, extra_headers={extra_headers!r})")
         self._try_login()
         error: str = ""
         headers: Headers = {}
+        started_at = time.monotonic()
         for i in range(self.num_retries):
+            status_code: Optional[int] = None
             if self.render_js:
+                if i == 0 and self._can_skip_rendering(download_file, data):
+                    response = self._try_plain_fetch(url)
+                    if response:
+                        return response, "", None
+                circuit_error = self.host_health.check(url, probe_timeout=self.timeout)
+                if circuit_error:
+                    LOGGER.warning("Warning: %s", circuit_error)
+                    return "", circuit_error, {}
+                self.rate_limiter.acquire(url)
                 response = self.headless_browser.make_request(url, download_file=download_file)
                 if response:
+                    # 렌더링에 성공했으면 호스트는 살아 있음 (시험 요청이었으면 서킷을 닫음)
+                    self.host_health.record_success(url)
+                    if self._can_skip_rendering(download_file, data):
+                        self._probe_plain_fetch(url, response)
                     return response, "", None
-                if i < self.num_retries - 1:
-                    LOGGER.debug(f"wait for seconds and retry (#{i})")
-                    time.sleep(self.retry_sleep)
             else:
+                use_cache = self.response_cache is not None and self.method == Method.GET and not download_file and not data
+                # 로그인 여부에 따라 응답이 달라지므로 이번 요청에 보낼 쿠키까지 캐시 키에 포함함
+                cache_headers = {**self.headers, "Cookie": self.requests_client.get_cookie_header(url)} if use_cache else self.headers
+                if use_cache and self.response_cache and i == 0:
+                    cached = self.response_cache.get(url, cache_headers, self.encoding, self.cache_ttl)
+                    if cached:
+                        self.last_status_code = 200
+                        self.last_response_headers = cached[1]
+                        return cached[0], "", None
+                circuit_error = self.host_health.check(url, probe_timeout=self.timeout)
+                if circuit_error:
+                    LOGGER.warning("Warning: %s", circuit_error)
+                    self.last_status_code = None
+                    return "", circuit_error, {}
+                self.rate_limiter.acquire(url)
                 try:
-                    response, error, headers, status_code = self.requests_client.make_request(url, download_file=download_file, data=data, allow_redirects=allow_redirects)
+                    response, error, headers, status_code = self.requests_client.make_request(url, download_file=download_file, data=data, allow_redirects=allow_redirects, extra_headers=extra_headers)
+                    self.last_status_code = status_code
+                    self.last_response_headers = headers
                     if response:
+                        if use_cache and self.response_cache and status_code == 200:
+                            self.response_cache.put(url, response, headers, cache_headers, self.encoding)
                         return response, "", None
                 except requests.exceptions.ReadTimeout as e:
                     raise Crawler.ReadTimeoutException from e
 
-                if status_code in (401, 403, 404, 405, 410):
-                    # no retry in case of
-                    #   401 Unauthorized
-                    #   403 Forbidden
-                    #   404 Not Found
-                    #   405 Method Not Allowed
-                    #   410 Gone
-                    break
-                LOGGER.debug(f"wait for seconds and retry (#{i})")
-                time.sleep(self.retry_sleep)
+            # 304, 404 같은 영구 오류, 마지막 시도, 마감 시간을 넘기는 경우에는 재시도하지 않음
+            delay = self.retry_policy.get_next_delay(i, started_at, status_code, headers)
+            if delay is None:
+                break
+            LOGGER.debug("wait for %.1f seconds and retry (#%d)", delay, i)
+            time.sleep(delay)
 
         return "", error, headers
 
@@ -532,6 +1529,9 @@ def print_usage() -> None:
     print("\t--simulate-scrolling=true/false\t\tsimulate scrolling (in headless browser)")
     print("\t--disable-headless=true/false\t\tshow browser (in headless browser)")
     print("\t--blob-to-dataurl=true/false\t\tconvert blob to data URL (in headless browser)")
+    print("\t--blocked-resource-types=<type,...>\tdon't load these resource types, e.g. image,font,media (in headless browser)")
+    print("\t--blocked-domains=<domain,...>\tdon't load resources from these domains and subdomains (in headless browser)")
+    print("\t--scroll-timeout=<seconds>\tmax time to simulate scrolling (in headless browser)")
     print("\t--download=<file>\t\tdownload as a file, instead of stdout")
     print("\t--header=<header string>\tspecify header string")
     print("\t--encoding=<encoding>\t\tspecify encoding of content")
@@ -539,6 +1539,7 @@ def print_usage() -> None:
     print("\t--referer=<referer>")
     print("\t--retry=<# of retries>")
     print("\t--retry-sleep=<seconds between retries>")
+    print("\t--cache-ttl=<seconds to reuse cached responses>")
 
 
 def main() -> int:
@@ -558,13 +1559,17 @@ def main() -> int:
     disable_headless: bool = False
     blob_to_dataurl: bool = False
     wait_until: str = "domcontentloaded"
+    cache_ttl: int = 0
+    blocked_resource_types: list[str] = []
+    blocked_domains: list[str] = []
+    scroll_timeout: int = 0
 
     if len(sys.argv) == 1:
         print_usage()
         sys.exit(-1)
 
     try:
-        opts, args = getopt.getopt(sys.argv[1:], "hf:", ["spider", "render-js=", "verify-ssl=", "copy-images-from-canvas=", "simulate-scrolling=", "disable-headless=", "blob-to-dataurl=", "wait-until=", "download=", "encoding=", "user-agent=", "referer=", "header=", "timeout=", "retry=", "retry-sleep="])
+        opts, args = getopt.getopt(sys.argv[1:], "hf:", ["spider", "render-js=", "verify-ssl=", "copy-images-from-canvas=", "simulate-scrolling=", "disable-headless=", "blob-to-dataurl=", "wait-until=", "blocked-resource-types=", "blocked-domains=", "scroll-timeout=", "download=", "encoding=", "user-agent=", "referer=", "header=", "timeout=", "retry=", "retry-sleep=", "cache-ttl="])
     except getopt.GetoptError:
         print_usage()
         sys.exit(-1)
@@ -596,6 +1601,12 @@ def main() -> int:
                 blob_to_dataurl = a == "true"
             case "--wait-until":
                 wait_until = a
+            case "--blocked-resource-types":
+                blocked_resource_types = [t for t in a.split(",") if t]
+            case "--blocked-domains":
+                blocked_domains = [d for d in a.split(",") if d]
+            case "--scroll-timeout":
+                scroll_timeout = int(a)
             case "--header":
                 if m := re.search(r"^(?P<key>[^:]+)\s*:\s*(?P<value>.+)\s*$", a):
                     key = m.group("key")
@@ -607,6 +1618,8 @@ def main() -> int:
                 num_retries = int(a)
             case "--retry-sleep":
                 retry_sleep = int(a)
+            case "--cache-ttl":
+                cache_ttl = int(a)
             case "--download":
                 download_file = Path(a)
             case "--encoding":
@@ -629,6 +1642,10 @@ def main() -> int:
         disable_headless=disable_headless,
         blob_to_dataurl=blob_to_dataurl,
         wait_until=wait_until,
+        cache_ttl=cache_ttl,
+        blocked_resource_types=blocked_resource_types,
+        blocked_domains=blocked_domains,
+        scroll_timeout=scroll_timeout,
     )
     response, error, _ = crawler.run(url, download_file=download_file)
     if not response:
@@ -2,19 +2,25 @@
 
 
 import re
+import json
 import shlex
+import hashlib
 import time
+import threading
 import logging.config
 from pathlib import Path
-from typing import Any, Callable, Optional, TypeVar, Protocol
+from typing import Any, Iterator, Optional, TypeVar
 from shutil import which
 from datetime import datetime, timedelta
-from contextlib import suppress
+from contextlib import closing, suppress
+from collections import deque
+from itertools import islice
+from functools import cmp_to_key
+from concurrent.futures import Future, ThreadPoolExecutor
 import dateutil.parser
 from dateutil.parser import isoparser
 import PyRSS2Gen
-from ordered_set import OrderedSet
-from bin.crawler import Crawler, Method
+from bin.crawler import Crawler, Method, CookieStore
 from bin.extractor import Extractor
 from bin.feed_maker_util import Config, URL, Datetime, Process, Data, PathUtil, FileManager, header_str, NotFoundConfigItemError, Env
 from bin.new_list_collector import NewlistCollector
@@ -27,10 +33,22 @@ SECONDS_PER_DAY = 60 * 60 * 24
 T = TypeVar("T")
 
 
-class Comparable(Protocol):
-    def __lt__(self, other: Any) -> bool: ...
-    def __gt__(self, other: Any) -> bool: ...
-    def __eq__(self, other: Any) -> bool: ...
+class HostPacer:
+    # 같은 호스트에 대한 요청 시작 간격을 interval초 이상으로 유지 (스레드 간 공유)
+    def __init__(self, interval: float) -> None:
+        self.interval = interval
+        self.next_ts_map: dict[str, float] = {}
+        self.lock = threading.Lock()
+
+    def wait(self, url: str) -> None:
+        host = URL.get_url_domain(url).lower()
+        with self.lock:
+            now = time.time()
+            start_ts = max(now, self.next_ts_map.get(host, 0.0))
+            self.next_ts_map[host] = start_ts + self.interval
+        if start_ts > now:
+            LOGGER.debug("pacing requests to '%s' for %.1f seconds", host, start_ts - now)
+            time.sleep(start_ts - now)
 
 
 class FeedMaker:
@@ -38,6 +56,12 @@ class FeedMaker:
     MAX_NUM_DAYS = 7
     DEFAULT_WINDOW_SIZE = 5
     IMAGE_TAG_FMT_STR = "<img src='%s/1x1.jpg?feed=%s&item=%s'/>"
+    # 완료된 피드의 정렬 결과를 저장하는 파일 (newlist 디렉토리 안, '.'으로 시작해서 리스트 파일로 읽히지 않음)
+    SORTED_ORDER_FILE_NAME = ".sorted_order.json"
+    # 정렬 방식이 바뀌면 올려서 예전 방식으로 저장된 순서를 쓰지 않게 함
+    SORTED_ORDER_VERSION = 2
+    # force_sleep_between_articles 설정 시 같은 호스트의 기사 요청 간 최소 간격
+    ARTICLE_PACING_INTERVAL_SEC = 2.0
 
     def __init__(self, *, feed_dir_path: Path, do_collect_by_force: bool, do_collect_only: bool, rss_file_path: Path, window_size: int = DEFAULT_WINDOW_SIZE, do_extract_only: bool = False) -> None:
         LOGGER.debug("# FeedMaker(feed_dir_path=%s, do_collect_by_force=%s, do_collect_only=%s, do_extract_only=%s, rss_file_path=%s)", PathUtil.short_path(feed_dir_path), do_collect_by_force, do_collect_only, do_extract_only, PathUtil.short_path(rss_file_path))
@@ -63,9 +87,16 @@ class FeedMaker:
 
         # 실패 URL 캐시 파일 추가
         self.failed_urls_cache_file = self.feed_dir_path / ".failed_urls_cache"
+        self.failed_urls_lock = threading.RLock()
+        # 실패 URL 캐시는 처음 조회할 때 한 번만 읽어서 URL -> 만료 시각 dict로 유지
+        self.failed_url_map: Optional[dict[str, datetime]] = None
+        self.num_stale_failed_url_lines = 0
         self.isoparser = isoparser()
-        # 만료된 실패 URL 캐시 정리
-        self._cleanup_expired_failed_urls()
+        # 기사 생성을 병렬로 수행할 때 공유하는 상태
+        self.host_pacer = HostPacer(FeedMaker.ARTICLE_PACING_INTERVAL_SEC)
+        self.incomplete_image_lock = threading.Lock()
+        # render_js 피드에서 페이지 풀로 미리 렌더링해 둔 기사 HTML (URL -> HTML)
+        self.prefetched_html_map: dict[str, str] = {}
 
     def __del__(self) -> None:
         del self.collection_conf
@@ -108,50 +139,100 @@ class FeedMaker:
         return list_dir / f"{date_str}.txt"
 
     @staticmethod
-    def _cmp_int_or_str(a: dict[str, str], b: dict[str, str]) -> int:
-        m1 = re.search(r"^\d+$", a["sf"])
-        m2 = re.search(r"^\d+$", b["sf"])
-
-        if m1 and m2:
-            ret = int(a["sf"]) - int(b["sf"])
-        else:
-            if a["sf"] < b["sf"]:
-                ret = -1
-            elif a["sf"] > b["sf"]:
-                ret = 1
-            else:
-                ret = 0
-        return ret
+    def _get_sort_key(sort_field: str) -> tuple[bool, int, str]:
+        # 비교할 때마다 정규식을 돌리지 않도록 항목마다 한 번만 (숫자인지, 정수값, 문자열)을 계산함
+        if re.fullmatch(r"\d+", sort_field):
+            return True, int(sort_field), sort_field
+        return False, 0, sort_field
 
     @staticmethod
-    def _cmp_to_key(mycmp: Callable[[dict[str, str], dict[str, str]], int]) -> Callable[[dict[str, Any]], Comparable]:
-        class K:
-            def __init__(self, obj: dict[str, Any], *_: Any) -> None:
-                self.obj = obj
+    def _compare_sort_keys(a: tuple[bool, int, str], b: tuple[bool, int, str]) -> int:
+        # 둘 다 숫자이면 정수로, 하나라도 숫자가 아니면 문자열로 비교함
+        if a[0] and b[0]:
+            return a[1] - b[1]
+        if a[2] < b[2]:
+            return -1
+        if a[2] > b[2]:
+            return 1
+        return 0
 
-            def __lt__(self, other: "K") -> bool:
-                return mycmp(self.obj, other.obj) < 0
-
-            def __gt__(self, other: "K") -> bool:
-                return mycmp(self.obj, other.obj) > 0
-
-            def __eq__(self, other: object) -> bool:
-                if not isinstance(other, K):
-                    return NotImplemented
-                return mycmp(self.obj, other.obj) == 0
-
-            def __le__(self, other: "K") -> bool:
-                return mycmp(self.obj, other.obj) <= 0
+    @staticmethod
+    def _sort_by_sort_key(sort_key_link_list: list[tuple[tuple[bool, int, str], str]]) -> None:
+        # 정렬키가 같은 항목은 원래 순서를 유지함 (stable sort)
+        numeric_flag_set = {sort_key[0] for sort_key, _ in sort_key_link_list}
+        if numeric_flag_set == {True}:
+            sort_key_link_list.sort(key=lambda entry: entry[0][1])
+        elif numeric_flag_set == {False}:
+            sort_key_link_list.sort(key=lambda entry: entry[0][2])
+        else:
+            # 숫자와 문자열이 섞이면 전순서가 아니므로 비교 함수로 정렬해야 예전과 같은 순서가 나옴
+            sort_key_link_list.sort(key=cmp_to_key(lambda x, y: FeedMaker._compare_sort_keys(x[0], y[0])))
+
+    def _get_list_files_fingerprint(self, sort_field_pattern: str) -> str:
+        # 리스트 파일의 이름/수정시각/크기와 정렬 패턴이 같으면 정렬 결과도 같음
+        stat_list: list[tuple[str, int, int]] = []
+        for entry in self.list_dir.iterdir():
+            if entry.name.startswith(".") or not entry.is_file():
+                continue
+            st = entry.stat()
+            stat_list.append((entry.name, st.st_mtime_ns, st.st_size))
+        stat_list.sort()
+        return hashlib.md5(json.dumps([FeedMaker.SORTED_ORDER_VERSION, sort_field_pattern, stat_list]).encode("utf-8"), usedforsecurity=False).hexdigest()
+
+    def _load_sorted_link_list(self, fingerprint: str) -> Optional[list[str]]:
+        sorted_order_file_path = self.list_dir / FeedMaker.SORTED_ORDER_FILE_NAME
+        try:
+            with sorted_order_file_path.open("r", encoding="utf-8") as infile:
+                data = json.load(infile)
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError) as e:
+            LOGGER.warning("Warning: can't read '%s', %r", PathUtil.short_path(sorted_order_file_path), e)
+            return None
+        if not isinstance(data, dict) or data.get("fingerprint") != fingerprint or not isinstance(data.get("links"), list):
+            return None
+        return data["links"]
+
+    def _save_sorted_link_list(self, fingerprint: str, sorted_link_list: list[str]) -> None:
+        sorted_order_file_path = self.list_dir / FeedMaker.SORTED_ORDER_FILE_NAME
+        temp_file_path = sorted_order_file_path.with_suffix(".tmp")
+        try:
+            with temp_file_path.open("w", encoding="utf-8") as outfile:
+                json.dump({"fingerprint": fingerprint, "links": sorted_link_list}, outfile, ensure_ascii=False)
+            temp_file_path.replace(sorted_order_file_path)
+        except OSError as e:
+            LOGGER.warning("Warning: can't write '%s', %r", PathUtil.short_path(sorted_order_file_path), e)
+            temp_file_path.unlink(missing_ok=True)
+
+    def _sort_old_feed_list(self, old_feed_list: list[tuple[str, str, list[str]]], sort_field_pattern: str) -> list[str]:
+        LOGGER.debug("# _sort_old_feed_list(sort_field_pattern=%s)", sort_field_pattern)
+        # 오름차순 정렬
+        sort_key_link_list: list[tuple[tuple[bool, int, str], str]] = []
+        feed_item_existence_set: set[str] = set()
 
-            def __ge__(self, other: "K") -> bool:
-                return mycmp(self.obj, other.obj) >= 0
+        matched_count = 0
+        for item in old_feed_list:
+            link, title, _ = item
+            if m := re.search(sort_field_pattern, link + "\t" + title):
+                sort_field = m.group(1)
+                with suppress(IndexError):
+                    if m.group(2):
+                        sort_field += " " + m.group(2)
+                matched_count += 1
+            else:
+                sort_field = "999999999"
 
-            def __ne__(self, other: object) -> bool:
-                if not isinstance(other, K):
-                    return NotImplemented
-                return mycmp(self.obj, other.obj) != 0
+            if link not in feed_item_existence_set:
+                # 링크별 정렬키를 저장해둠
+                feed_item_existence_set.add(link)
+                sort_key_link_list.append((FeedMaker._get_sort_key(sort_field), link))
 
-        return K
+        # 전체 리스트 중 절반 이상의 정렬필드를 검출하지 못하면 경고
+        if matched_count > len(old_feed_list) / 2:
+            FeedMaker._sort_by_sort_key(sort_key_link_list)
+        else:
+            LOGGER.warning(f"Warning: can't match the pattern /{sort_field_pattern}/")
+        return [link for _, link in sort_key_link_list]
 
     def _read_old_feed_list_from_file(self) -> list[tuple[str, str, list[str]]]:
         LOGGER.debug("# _read_old_feed_list_from_file()")
@@ -197,6 +278,57 @@ class FeedMaker:
 
         return Data.remove_duplicates(feed_list)
 
+    def _create_item_crawler(self, conf: dict[str, Any]) -> Crawler:
+        crawler = Crawler(
+            dir_path=self.feed_dir_path,
+            render_js=conf.get("render_js", False),
+            method=Method.GET,
+            # 워커 스레드마다 Crawler가 헤더(User-Agent, Cookie, Referer)를 바꾸므로 설정의 dict를 공유하지 않고 복사함
+            headers=dict(conf.get("headers") or {}),
+            timeout=conf.get("timeout", 60),
+            num_retries=conf.get("num_retries", 1),
+            retry_sleep=conf.get("retry_sleep", 5),
+            encoding=conf.get("encoding", "utf-8"),
+            verify_ssl=conf.get("verify_ssl", True),
+            copy_images_from_canvas=conf.get("copy_images_from_canvas", False),
+            simulate_scrolling=conf.get("simulate_scrolling", False),
+            disable_headless=conf.get("disable_headless", False),
+            blob_to_dataurl=conf.get("blob_to_dataurl", False),
+            wait_until=conf.get("wait_until", "domcontentloaded"),
+            cache_ttl=conf.get("cache_ttl", 0),
+            blocked_resource_types=conf.get("blocked_resource_types", []),
+            blocked_domains=conf.get("blocked_domains", []),
+            scroll_timeout=conf.get("scroll_timeout", 0),
+        )
+        if conf.get("render_js", False) and not conf.get("bypass_element_extraction", False):
+            # 렌더링 없이 받은 결과에도 추출할 내용이 있는지 같은 추출 설정으로 검사함
+            crawler.content_extractor = lambda url, html: Extractor.extract_content(conf, url, input_data=html)
+        return crawler
+
+    def _prefetch_rendered_html(self, item_list: list[tuple[str, str]]) -> None:
+        # 아직 만들지 않은 기사들을 한 브라우저의 페이지 풀에서 한꺼번에 렌더링해 두고, _make_html_file()에서 꺼내 씀
+        # (실패한 항목은 비워 두면 _make_html_file()이 평소처럼 crawler.run()으로 다시 받음)
+        LOGGER.debug("# _prefetch_rendered_html(num_items=%d)", len(item_list))
+        template_size = FeedMaker.get_size_of_template_with_image_tag(Env.get("WEB_SERVICE_IMAGE_URL_PREFIX"), self.rss_file_path.name)
+        url_list: list[str] = []
+        for link, _ in item_list:
+            html_file_path = FeedMaker._get_html_file_path(self.html_dir, link)
+            if html_file_path.is_file() and html_file_path.stat().st_size > template_size:
+                continue
+            if link in self.prefetched_html_map or self._is_url_recently_failed(link):
+                continue
+            url_list.append(link)
+        if len(url_list) <= 1:
+            return
+        try:
+            crawler = self._create_item_crawler(self.extraction_conf)
+            for link, (result, _, _) in zip(url_list, crawler.fetch_many(url_list)):
+                if result:
+                    self.prefetched_html_map[link] = result
+        except (OSError, Crawler.ReadTimeoutException) as e:
+            # 브라우저 오류는 make_requests()가 처리하므로 여기서는 I/O 오류만 받고 코드 오류는 그대로 올려보냄
+            LOGGER.warning("Warning: can't prefetch rendered pages, falling back to sequential rendering, %r", e)
+
     def _make_html_file(self, item_url: str, title: str) -> bool:
         if not self.extraction_conf:
             LOGGER.error("ERROR: can't get extraction configuration")
@@ -230,27 +362,18 @@ class FeedMaker:
                 ret = False
         else:
             # 파일이 존재하지 않거나 크기가 작으니 다시 생성 시도
-            crawler = Crawler(
-                dir_path=self.feed_dir_path,
-                render_js=conf.get("render_js", False),
-                method=Method.GET,
-                headers=conf.get("headers", None),
-                timeout=conf.get("timeout", 60),
-                num_retries=conf.get("num_retries", 1),
-                retry_sleep=conf.get("retry_sleep", 5),
-                encoding=conf.get("encoding", "utf-8"),
-                verify_ssl=conf.get("verify_ssl", True),
-                copy_images_from_canvas=conf.get("copy_images_from_canvas", False),
-                simulate_scrolling=conf.get("simulate_scrolling", False),
-                disable_headless=conf.get("disable_headless", False),
-                blob_to_dataurl=conf.get("blob_to_dataurl", False),
-                wait_until=conf.get("wait_until", "domcontentloaded"),
-            )
+            crawler = self._create_item_crawler(conf)
             option_str = Crawler.get_option_str(conf)
             crawler_cmd = f"crawler.py -f '{self.feed_dir_path}' {option_str} '{item_url}'"
             LOGGER.debug(f"cmd={crawler_cmd}")
+            if conf.get("force_sleep_between_articles", False):
+                self.host_pacer.wait(item_url)
             try:
-                result, error, _ = crawler.run(item_url)
+                prefetched_html = self.prefetched_html_map.pop(item_url, "")
+                if prefetched_html:
+                    result, error = prefetched_html, ""
+                else:
+                    result, error, _ = crawler.run(item_url)
                 if not result or error:
                     LOGGER.error("Error: %s", error)
                     self._add_failed_url(item_url, f"Crawler error: {error}")
@@ -285,9 +408,6 @@ class FeedMaker:
                 with html_file_path.open("w", encoding="utf-8") as outfile:
                     outfile.write(str(content))
 
-                if conf.get("force_sleep_between_articles", False):
-                    time.sleep(2)
-
                 if html_file_path.is_file():
                     size = html_file_path.stat().st_size
                 else:
@@ -315,12 +435,13 @@ class FeedMaker:
 
         threshold_to_remove_html_with_incomplete_image = conf.get("threshold_to_remove_html_with_incomplete_image", 0)
         if threshold_to_remove_html_with_incomplete_image > 0:
-            incomplete_image_list = FileManager.get_incomplete_image_list(html_file_path)
-            if threshold_to_remove_html_with_incomplete_image < len(incomplete_image_list):
-                feed_img_dir_path = self.img_dir_path / self.feed_dir_path.name
-                FileManager.remove_image_files_with_zero_size(feed_img_dir_path)
-                FileManager.remove_html_file_without_cached_image_files(html_file_path)
-                ret = False
+            with self.incomplete_image_lock:
+                incomplete_image_list = FileManager.get_incomplete_image_list(html_file_path)
+                if threshold_to_remove_html_with_incomplete_image < len(incomplete_image_list):
+                    feed_img_dir_path = self.img_dir_path / self.feed_dir_path.name
+                    FileManager.remove_image_files_with_zero_size(feed_img_dir_path)
+                    FileManager.remove_html_file_without_cached_image_files(html_file_path)
+                    ret = False
 
         return ret
 
@@ -364,49 +485,30 @@ class FeedMaker:
 
     def _fetch_old_feed_list_window(self, old_feed_list: list[tuple[str, str, list[str]]]) -> Optional[list[tuple[str, str, list[str]]]]:
         LOGGER.debug(f"# _fetch_old_feed_list_window(old_feed_list={old_feed_list}")
-        # 오름차순 정렬
-        feed_id_sort_field_list: list[dict[str, Any]] = []
-        feed_item_existence_set: OrderedSet[str] = OrderedSet([])
-
-        matched_count = 0
         sort_field_pattern = self.collection_conf.get("sort_field_pattern", "")
         if not sort_field_pattern:
             raise NotFoundConfigItemError("can't get configuration item 'collection.sort_field_pattern'")
 
-        for i, item in enumerate(old_feed_list):
-            link, title, _ = item
-            if m := re.search(sort_field_pattern, link + "\t" + title):
-                sort_field = m.group(1)
-                with suppress(IndexError):
-                    if m.group(2):
-                        sort_field += " " + m.group(2)
-                matched_count += 1
-            else:
-                sort_field = "999999999"
-
-            if link not in feed_item_existence_set:
-                # 번호 to 기준필드 정보를 저장해둠
-                feed_id_sort_field = {"id": i, "sf": sort_field}
-                feed_item_existence_set.add(link)
-                feed_id_sort_field_list.append(feed_id_sort_field)
+        link_item_map: dict[str, tuple[str, str, list[str]]] = {}
+        for item in old_feed_list:
+            link_item_map.setdefault(item[0], item)
 
-        # 전체 리스트 중 절반 이상의 정렬필드를 검출하지 못하면 경고
-        if matched_count > len(old_feed_list) / 2:
-            sorted_feed_list: list[dict[str, Any]] = sorted(feed_id_sort_field_list, key=self._cmp_to_key(self._cmp_int_or_str))
+        # 리스트 파일이 바뀌지 않았으면 저장해둔 정렬 결과를 그대로 사용함
+        fingerprint = self._get_list_files_fingerprint(sort_field_pattern)
+        sorted_link_list = self._load_sorted_link_list(fingerprint)
+        if sorted_link_list is None or len(sorted_link_list) != len(link_item_map) or not all(link in link_item_map for link in sorted_link_list):
+            sorted_link_list = self._sort_old_feed_list(old_feed_list, sort_field_pattern)
+            self._save_sorted_link_list(fingerprint, sorted_link_list)
         else:
-            LOGGER.warning(f"Warning: can't match the pattern /{self.collection_conf['sort_field_pattern']}/")
-            sorted_feed_list = feed_id_sort_field_list
+            LOGGER.debug("reusing sorted order of %d items", len(sorted_link_list))
 
         start_index, end_index, mtime = self._get_index_data()
         if not mtime:
             LOGGER.error("ERROR: can't read start_idx.txt file")
             return None
         LOGGER.info(f"start index: {start_index}, end index: {end_index}, last modified time: {mtime}")
-        result_feed_list: list[tuple[str, str, list[str]]] = []
-        for i, feed in enumerate(sorted_feed_list):
-            feed_id: int = feed.get("id", 0)
-            if start_index <= i + 1 < end_index:
-                result_feed_list.append(old_feed_list[feed_id])
+        # 1부터 시작하는 [start_index, end_index) 구간만 잘라냄
+        result_feed_list = [link_item_map[link] for link in sorted_link_list[max(start_index - 1, 0):max(end_index - 1, 0)]]
 
         next_start_index, current_time_str = self._write_index_data(start_index, mtime)
         if current_time_str:
@@ -439,17 +541,66 @@ class FeedMaker:
         new_feed_list = self._get_new_feeds(recent_feed_list, old_feed_list)
         # collect items to be generated as RSS feed
         LOGGER.info(f"Appending {len(new_feed_list)} new items to the feed list")
-        merged_feed_list: list[tuple[str, str, list[str]]] = []
-        for link, title, _ in new_feed_list:
-            if self._make_html_file(link, title):
-                merged_feed_list.append((link, title, []))
-
         LOGGER.info(f"Appending {len(old_feed_list)} old items to the feed list")
-        for link, title, _ in old_feed_list:
-            if self._make_html_file(link, title):
-                merged_feed_list.append((link, title, []))
+        item_list = [(link, title) for link, title, _ in new_feed_list] + [(link, title) for link, title, _ in old_feed_list]
+        with closing(self._iter_made_items(item_list)) as made_items:
+            if self.extraction_conf.get("make_all_items", False):
+                # 기존 동작: 윈도우 밖의 항목까지 모두 생성
+                made_item_list = list(made_items)
+            else:
+                # window_size개가 만들어지면 나머지 항목은 크롤링/추출/후처리하지 않음
+                made_item_list = list(islice(made_items, self.window_size))
+        merged_feed_list: list[tuple[str, str, list[str]]] = [(link, title, []) for link, title in made_item_list]
         return merged_feed_list[: self.window_size]
 
+    def _get_max_concurrency(self) -> int:
+        max_concurrency = self.extraction_conf.get("max_concurrency", 1)
+        if max_concurrency > 1 and self.extraction_conf.get("render_js", False):
+            # headless browser 세션은 스레드 간에 공유할 수 없으므로 순차 처리 (대신 페이지 풀로 묶어서 렌더링)
+            LOGGER.info("rendering %d pages at a time in one browser instead of threads for render_js feed", max_concurrency)
+            return 1
+        return max(1, max_concurrency)
+
+    def _get_render_batch_size(self) -> int:
+        # render_js 피드의 max_concurrency는 스레드 대신 한 브라우저 안에서 동시에 렌더링할 페이지 수로 사용
+        # (기사 사이에 간격을 둬야 하는 피드는 미리 렌더링하지 않음)
+        conf = self.extraction_conf
+        if not conf.get("render_js", False) or conf.get("force_sleep_between_articles", False):
+            return 1
+        return max(1, conf.get("max_concurrency", 1))
+
+    def _iter_made_items(self, item_list: list[tuple[str, str]]) -> Iterator[tuple[str, str]]:
+        # html 파일 생성에 성공한 항목을 입력 순서대로 하나씩 돌려줌 (소비하는 만큼만 생성)
+        max_concurrency = min(self._get_max_concurrency(), len(item_list))
+        if max_concurrency <= 1:
+            batch_size = self._get_render_batch_size()
+            for i, (link, title) in enumerate(item_list):
+                if batch_size > 1 and i % batch_size == 0:
+                    self._prefetch_rendered_html(item_list[i : i + batch_size])
+                if self._make_html_file(link, title):
+                    yield link, title
+            return
+
+        LOGGER.info("Making html files with %d threads", max_concurrency)
+        executor = ThreadPoolExecutor(max_workers=max_concurrency)
+        pending: deque[tuple[str, str, Future[bool]]] = deque()
+        item_iter = iter(item_list)
+        try:
+            for link, title in islice(item_iter, max_concurrency):
+                pending.append((link, title, executor.submit(self._make_html_file, link, title)))
+            while pending:
+                link, title, future = pending.popleft()
+                is_made = future.result()
+                # 결과를 하나 받을 때마다 다음 항목을 투입해서 동시 실행 수를 유지
+                for next_link, next_title in islice(item_iter, 1):
+                    pending.append((next_link, next_title, executor.submit(self._make_html_file, next_link, next_title)))
+                if is_made:
+                    yield link, title
+        finally:
+            for _, _, future in pending:
+                future.cancel()
+            executor.shutdown(wait=True)
+
     def _generate_rss_feed(self, merged_feed_list: list[tuple[str, str, list[str]]]) -> bool:
         LOGGER.debug("# generate_rss_feed()")
 
@@ -532,6 +683,13 @@ class FeedMaker:
         return True
 
     def make(self) -> bool:
+        try:
+            return self._make()
+        finally:
+            # 메모리에만 반영된 쿠키 변경분을 피드가 끝날 때 파일로 기록
+            CookieStore.flush_all()
+
+    def _make(self) -> bool:
         LOGGER.debug("# make()")
         LOGGER.info("=========================================================")
         LOGGER.info("%s", PathUtil.short_path(self.feed_dir_path))
@@ -599,24 +757,72 @@ class FeedMaker:
 
         return True
 
+    def _load_failed_urls(self) -> dict[str, datetime]:
+        with self.failed_urls_lock:
+            if self.failed_url_map is not None:
+                return self.failed_url_map
+
+            now = Datetime.get_current_time()
+            failed_url_map: dict[str, datetime] = {}
+            # 만료됐거나 중복되거나 잘못된 줄의 수 (있을 때만 파일을 다시 씀)
+            num_stale_lines = 0
+            if self.failed_urls_cache_file.exists():
+                try:
+                    with self.failed_urls_cache_file.open("r", encoding="utf-8") as f:
+                        for line in f:
+                            if not line.strip():
+                                continue
+                            try:
+                                cached_url, expiry_str = line.strip().split("\t")
+                                expiry_dt = self.isoparser.isoparse(expiry_str)
+                            except ValueError:
+                                LOGGER.warning("Skipping invalid line in .failed_urls_cache: %s", line.strip())
+                                num_stale_lines += 1
+                                continue
+                            if now >= expiry_dt:
+                                num_stale_lines += 1
+                                continue
+                            if cached_url in failed_url_map:
+                                num_stale_lines += 1
+                                expiry_dt = max(expiry_dt, failed_url_map[cached_url])
+                            failed_url_map[cached_url] = expiry_dt
+                except OSError as e:
+                    # 읽지 못한 파일은 다시 쓰지 않음
+                    LOGGER.warning("Warning: can't read '%s', %r", PathUtil.short_path(self.failed_urls_cache_file), e)
+                    num_stale_lines = 0
+            self.failed_url_map = failed_url_map
+            self.num_stale_failed_url_lines = num_stale_lines
+
+            if num_stale_lines > 0:
+                self._compact_failed_urls()
+            return failed_url_map
+
+    def _compact_failed_urls(self) -> None:
+        with self.failed_urls_lock:
+            failed_url_map = self.failed_url_map if self.failed_url_map is not None else {}
+            now = Datetime.get_current_time()
+            # 곧 만료될 항목이 앞에 오도록 만료 시각 순으로 기록
+            entry_list = sorted(((expiry_dt, url) for url, expiry_dt in failed_url_map.items() if now < expiry_dt), key=lambda entry: entry[0])
+            LOGGER.debug("compacting .failed_urls_cache: %d entries, %d stale lines", len(entry_list), self.num_stale_failed_url_lines)
+            temp_file_path = self.failed_urls_cache_file.with_suffix(".tmp")
+            try:
+                with temp_file_path.open("w", encoding="utf-8") as f:
+                    for expiry_dt, url in entry_list:
+                        f.write(f"{url}\t{expiry_dt.isoformat()}\n")
+                temp_file_path.replace(self.failed_urls_cache_file)
+            except OSError as e:
+                # 정리하지 못해도 기존 파일과 메모리의 목록은 그대로 사용할 수 있음
+                LOGGER.warning("Warning: can't compact '%s', %r", PathUtil.short_path(self.failed_urls_cache_file), e)
+                temp_file_path.unlink(missing_ok=True)
+                return
+            self.failed_url_map = {url: expiry_dt for expiry_dt, url in entry_list}
+            self.num_stale_failed_url_lines = 0
+
     def _is_url_recently_failed(self, url: str) -> bool:
-        if not self.failed_urls_cache_file.exists():
+        expiry_dt = self._load_failed_urls().get(url)
+        if expiry_dt is None:
             return False
-
-        now = Datetime.get_current_time()
-        with self.failed_urls_cache_file.open("r", encoding="utf-8") as f:
-            for line in f:
-                if not line.strip():
-                    continue
-                cached_url, expiry_str = line.strip().split("\t")
-                if cached_url == url:
-                    try:
-                        expiry_dt = self.isoparser.isoparse(expiry_str)
-                        if now < expiry_dt:
-                            return True
-                    except ValueError:
-                        LOGGER.warning("Invalid timestamp in .failed_urls_cache: %s", expiry_str)
-        return False
+        return Datetime.get_current_time() < expiry_dt
 
     def _add_failed_url(self, url: str, error_msg: str = "") -> None:
         expiration_dt = self._get_expiration_from_config()
@@ -624,30 +830,16 @@ class FeedMaker:
             return
 
         LOGGER.info("Adding failed URL %s to cache, expires at %s. Reason: %s", url, expiration_dt.isoformat(), error_msg)
-        with self.failed_urls_cache_file.open("a", encoding="utf-8") as f:
-            f.write(f"{url}\t{expiration_dt.isoformat()}\n")
-
-    def _cleanup_expired_failed_urls(self) -> None:
-        if not self.failed_urls_cache_file.exists():
-            return
-
-        now = Datetime.get_current_time()
-        valid_entries = []
-        with self.failed_urls_cache_file.open("r", encoding="utf-8") as f:
-            for line in f:
-                if not line.strip():
-                    continue
-                try:
-                    _, expiry_str = line.strip().split("\t")
-                    expiry_dt = self.isoparser.isoparse(expiry_str)
-                    if now < expiry_dt:
-                        valid_entries.append(line)
-                except ValueError:
-                    LOGGER.warning("Skipping invalid line in .failed_urls_cache: %s", line.strip())
-
-        with self.failed_urls_cache_file.open("w", encoding="utf-8") as f:
-            for entry in valid_entries:
-                f.write(entry)
+        with self.failed_urls_lock:
+            failed_url_map = self._load_failed_urls()
+            if url in failed_url_map:
+                self.num_stale_failed_url_lines += 1
+            failed_url_map[url] = expiration_dt
+            try:
+                with self.failed_urls_cache_file.open("a", encoding="utf-8") as f:
+                    f.write(f"{url}\t{expiration_dt.isoformat()}\n")
+            except OSError as e:
+                LOGGER.warning("Warning: can't write '%s', %r", PathUtil.short_path(self.failed_urls_cache_file), e)
 
     def _get_expiration_from_config(self) -> Optional[datetime]:
         """
@@ -5,6 +5,7 @@
 import os
 import sys
 import re
+import time
 import subprocess
 import shlex
 import socket
@@ -12,6 +13,7 @@ import ipaddress
 import hashlib
 import json
 import base64
+import threading
 import logging.config
 from datetime import datetime, timezone
 from pathlib import Path
@@ -380,6 +382,11 @@ def redact_headers(headers: Optional[dict[str, str]]) -> dict[str, str]:
 
 class URLSafety:
     _ALLOWED_SCHEMES = {"http", "https"}
+    DEFAULT_DNS_CACHE_TTL = 300
+
+    # 호스트별 DNS 조회 결과와 판정 캐시: host -> (만료 시각, 판정, 사유, 검사한 주소 목록)
+    _dns_cache: dict[str, tuple[float, bool, str, tuple[str, ...]]] = {}
+    _dns_cache_lock = threading.Lock()
 
     @staticmethod
     def _parse_allowed_hosts(raw: str) -> tuple[set[str], set[str]]:
@@ -443,22 +450,72 @@ class URLSafety:
         except ValueError:
             pass
 
+        return URLSafety._check_resolved_host(host)
+
+    @staticmethod
+    def _get_dns_cache_ttl() -> int:
+        try:
+            return max(0, int(Env.get("FM_DNS_CACHE_TTL", str(URLSafety.DEFAULT_DNS_CACHE_TTL)) or URLSafety.DEFAULT_DNS_CACHE_TTL))
+        except ValueError:
+            return URLSafety.DEFAULT_DNS_CACHE_TTL
+
+    @staticmethod
+    def _check_resolved_host(host: str) -> tuple[bool, str]:
+        now = time.time()
+        with URLSafety._dns_cache_lock:
+            entry = URLSafety._dns_cache.get(host)
+        if entry and now < entry[0]:
+            return entry[1], entry[2]
+
         # Resolve DNS and block if any address is non-global
         try:
             infos = socket.getaddrinfo(host, None)
         except socket.gaierror as e:
+            # 일시적인 조회 실패는 캐시하지 않음
             return False, f"DNS resolution failed for {host}: {e}"
 
+        is_ok, reason = True, ""
+        addr_list: list[str] = []
         for info in infos:
-            addr = info[4][0]
+            addr = str(info[4][0])
             try:
                 ip = ipaddress.ip_address(addr)
             except ValueError:
-                return False, f"Invalid resolved IP: {addr}"
+                is_ok, reason = False, f"Invalid resolved IP: {addr}"
+                break
             if not URLSafety._is_global_ip(ip):
-                return False, f"Blocked IP: {ip}"
+                is_ok, reason = False, f"Blocked IP: {ip}"
+                break
+            if addr not in addr_list:
+                addr_list.append(addr)
+
+        ttl = URLSafety._get_dns_cache_ttl()
+        if ttl > 0:
+            with URLSafety._dns_cache_lock:
+                URLSafety._dns_cache[host] = (now + ttl, is_ok, reason, tuple(addr_list) if is_ok else ())
+        return is_ok, reason
+
+    @staticmethod
+    def get_pinned_addresses(host: str) -> tuple[str, ...]:
+        """check_url이 안전하다고 판정한 주소 목록 (연결할 때 다시 DNS를 조회하지 않고 이 주소로 고정)"""
+        with URLSafety._dns_cache_lock:
+            entry = URLSafety._dns_cache.get(host.lower())
+        if entry and entry[1]:
+            return entry[3]
+        return ()
+
+    @staticmethod
+    def clear_dns_cache() -> None:
+        with URLSafety._dns_cache_lock:
+            URLSafety._dns_cache.clear()
+
+    @staticmethod
+    def _reset_after_fork() -> None:
+        # 캐시 내용은 그대로 쓰고, fork 시점에 잡혀 있었을 수 있는 락만 새로 만듦
+        URLSafety._dns_cache_lock = threading.Lock()
+
 
-        return True, ""
+os.register_at_fork(after_in_child=URLSafety._reset_after_fork)
 
 
 class NotFoundConfigFileError(Exception):
@@ -567,6 +624,9 @@ class Config:
                     "disable_headless": Config._get_bool_config_value(collection_conf, "disable_headless", False),
                     "blob_to_dataurl": Config._get_bool_config_value(collection_conf, "blob_to_dataurl", False),
                     "wait_until": Config._get_str_config_value(collection_conf, "wait_until", "domcontentloaded"),
+                    "blocked_resource_types": Config._get_list_config_value(collection_conf, "blocked_resource_types", []),
+                    "blocked_domains": Config._get_list_config_value(collection_conf, "blocked_domains", []),
+                    "scroll_timeout": Config._get_int_config_value(collection_conf, "scroll_timeout", 0),
                     "item_capture_script": Config._get_str_config_value(collection_conf, "item_capture_script", "./capture_item_link_title.py"),
                     "sort_field_pattern": Config._get_str_config_value(collection_conf, "sort_field_pattern"),
                     "user_agent": Config._get_str_config_value(collection_conf, "user_agent"),
@@ -576,6 +636,7 @@ class Config:
                     "unit_size_per_day": Config._get_float_config_value(collection_conf, "unit_size_per_day", 1),
                     "num_retries": Config._get_int_config_value(collection_conf, "num_retries", 1),
                     "retry_sleep": Config._get_int_config_value(collection_conf, "retry_sleep", 5),
+                    "cache_ttl": Config._get_int_config_value(collection_conf, "cache_ttl", 0),
                     "window_size": Config._get_int_config_value(collection_conf, "window_size", 5),
                     "list_url_list": Config._get_list_config_value(collection_conf, "list_url_list", []),
                     "post_process_script_list": Config._get_list_config_value(collection_conf, "post_process_script_list", []),
@@ -600,6 +661,9 @@ class Config:
                     "disable_headless": Config._get_bool_config_value(extraction_conf, "disable_headless", False),
                     "blob_to_dataurl": Config._get_bool_config_value(extraction_conf, "blob_to_dataurl", False),
                     "wait_until": Config._get_str_config_value(extraction_conf, "wait_until", "domcontentloaded"),
+                    "blocked_resource_types": Config._get_list_config_value(extraction_conf, "blocked_resource_types", []),
+                    "blocked_domains": Config._get_list_config_value(extraction_conf, "blocked_domains", []),
+                    "scroll_timeout": Config._get_int_config_value(extraction_conf, "scroll_timeout", 0),
                     "user_agent": Config._get_str_config_value(extraction_conf, "user_agent"),
                     "encoding": Config._get_str_config_value(extraction_conf, "encoding", "utf-8"),
                     "referer": Config._get_str_config_value(extraction_conf, "referer"),
@@ -607,6 +671,9 @@ class Config:
                     "timeout": Config._get_int_config_value(extraction_conf, "timeout", 60),
                     "num_retries": Config._get_int_config_value(extraction_conf, "num_retries", 1),
                     "retry_sleep": Config._get_int_config_value(extraction_conf, "retry_sleep", 5),
+                    "cache_ttl": Config._get_int_config_value(extraction_conf, "cache_ttl", 0),
+                    "max_concurrency": Config._get_int_config_value(extraction_conf, "max_concurrency", 1),
+                    "make_all_items": Config._get_bool_config_value(extraction_conf, "make_all_items", False),
                     "element_id_list": Config._get_list_config_value(extraction_conf, "element_id_list", []),
                     "element_class_list": Config._get_list_config_value(extraction_conf, "element_class_list", []),
                     "element_path_list": Config._get_list_config_value(extraction_conf, "element_path_list", []),
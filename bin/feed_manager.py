@@ -22,7 +22,7 @@ LOGGER = logging.getLogger()
 # 파일시스템 스캔 시 피드로 취급하지 않는 디렉터리.
 # 파이썬/개발 도구가 자동 생성하는 캐시, VCS 메타, 테스트용 디렉터리가
 # feed_info 테이블에 피드로 적재되면 안 된다.
-NON_FEED_DIR_NAMES = frozenset({".git", "test", ".mypy_cache", ".ruff_cache", ".pytest_cache", "__pycache__"})
+NON_FEED_DIR_NAMES = frozenset({".git", "test", ".mypy_cache", ".ruff_cache", ".pytest_cache", "__pycache__", ".response_cache", ".rate_limit", ".host_health", ".site_sessions", ".fetch_strategy"})
 
 
 def normalize_feed_identity(group_name: str, feed_name: str) -> Optional[tuple[str, str, bool]]:
@@ -0,0 +1,167 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+
+import os
+import json
+import time
+import fcntl
+import hashlib
+import logging.config
+from pathlib import Path
+from typing import Any, Optional
+from urllib.parse import urlsplit
+
+from bin.feed_maker_util import Env, PathUtil
+
+logging.config.fileConfig(Path(__file__).parent.parent / "logging.conf")
+LOGGER = logging.getLogger()
+
+
+class FetchStrategy:
+    """가장 싸게 동작하는 수집 방법을 기록 (FM_WORK_DIR 아래 상태 파일을 flock으로 잠가서 모든 프로세스가 같은 기록을 공유)
+
+    render_js 피드라도 HTTP로 받은 결과에 렌더링한 결과만큼의 추출 내용이 있으면 브라우저를 띄우지 않음. 이 기록은
+    같은 호스트라도 피드마다 추출 설정이 다르므로 피드(scope)와 호스트별로 따로 두고, 렌더링 없이 받을 때마다 처음 비교한
+    내용의 특징(이미지 유무)과 맞는지 검사하며, FM_FETCH_STRATEGY_VERIFY_INTERVAL번마다 한 번은 다시 렌더링해서 비교함.
+    headless browser 엔진 중에서 마지막으로 성공한 엔진은 호스트별로 기록해서 먼저 시도함. 기록은
+    FM_FETCH_STRATEGY_REPROBE_INTERVAL초가 지나면 만료되어 다시 시험하고, 0이면 사용하지 않음
+    """
+
+    STATE_DIR_NAME = ".fetch_strategy"
+    STATE_FILE_SUFFIX = ".json"
+    DEFAULT_REPROBE_INTERVAL_SEC = 24 * 60 * 60
+    DEFAULT_VERIFY_INTERVAL = 10
+    # HTTP로 받은 추출 결과가 렌더링한 추출 결과의 이 비율 이상이어야 같은 내용으로 봄
+    MIN_CONTENT_RATIO = 0.9
+
+    def __init__(self, state_dir_path: Optional[Path] = None, reprobe_interval: Optional[float] = None, scope: str = "", verify_interval: Optional[int] = None) -> None:
+        self.state_dir_path: Path = state_dir_path if state_dir_path else Path(Env.get("FM_WORK_DIR")) / FetchStrategy.STATE_DIR_NAME
+        if reprobe_interval is None:
+            try:
+                reprobe_interval = float(Env.get("FM_FETCH_STRATEGY_REPROBE_INTERVAL", str(FetchStrategy.DEFAULT_REPROBE_INTERVAL_SEC)) or FetchStrategy.DEFAULT_REPROBE_INTERVAL_SEC)
+            except ValueError:
+                reprobe_interval = FetchStrategy.DEFAULT_REPROBE_INTERVAL_SEC
+        self.reprobe_interval: float = reprobe_interval
+        if verify_interval is None:
+            try:
+                verify_interval = int(Env.get("FM_FETCH_STRATEGY_VERIFY_INTERVAL", str(FetchStrategy.DEFAULT_VERIFY_INTERVAL)) or FetchStrategy.DEFAULT_VERIFY_INTERVAL)
+            except ValueError:
+                verify_interval = FetchStrategy.DEFAULT_VERIFY_INTERVAL
+        self.verify_interval: int = verify_interval
+        # 렌더링 여부 기록을 나누는 단위 (Crawler가 피드 디렉토리를 넘겨줌, 비었으면 호스트 단위)
+        self.scope: str = scope
+        self.num_plain_fetches: int = 0
+
+    @property
+    def is_enabled(self) -> bool:
+        # 작업 디렉토리를 알 수 없으면(FM_WORK_DIR가 비었거나 상대 경로) 엉뚱한 곳에 기록하지 않도록 사용하지 않음
+        return self.reprobe_interval > 0 and self.state_dir_path.is_absolute() and self.state_dir_path.parent.is_dir()
+
+    @staticmethod
+    def _get_host(url: str) -> str:
+        return (urlsplit(url).hostname or "").lower()
+
+    def _get_scoped_name(self, host: str) -> str:
+        # 호스트 이름에는 '@'가 없으므로 피드별 상태 파일과 호스트별 상태 파일의 이름이 겹치지 않음
+        if not self.scope:
+            return host
+        return host + "@" + hashlib.md5(self.scope.encode("utf-8"), usedforsecurity=False).hexdigest()[:12]
+
+    @staticmethod
+    def is_equivalent_content(plain_content: str, rendered_content: str) -> bool:
+        # 렌더링 없이 추출한 내용이 렌더링한 내용과 거의 같은 크기이고 이미지가 빠지지 않았으면 같은 내용으로 봄
+        if not plain_content or not rendered_content:
+            return False
+        return len(plain_content) >= len(rendered_content) * FetchStrategy.MIN_CONTENT_RATIO and plain_content.count("<img") >= rendered_content.count("<img")
+
+    def _load_state(self, host: str) -> dict[str, Any]:
+        state_file_path = self.state_dir_path / (host + FetchStrategy.STATE_FILE_SUFFIX)
+        if not state_file_path.is_file():
+            return {}
+        fd = os.open(state_file_path, os.O_RDONLY)
+        try:
+            fcntl.flock(fd, fcntl.LOCK_SH)
+            try:
+                state = json.loads(os.read(fd, 4096).decode("utf-8") or "{}")
+            except ValueError:
+                state = {}
+        finally:
+            os.close(fd)
+        return state if isinstance(state, dict) else {}
+
+    def _update_state(self, host: str, key: str, value: dict[str, Any]) -> None:
+        # 상태 파일을 잠근 채로 읽고 key 항목만 바꿔서 기록
+        state_file_path = self.state_dir_path / (host + FetchStrategy.STATE_FILE_SUFFIX)
+        self.state_dir_path.mkdir(parents=True, exist_ok=True)
+        fd = os.open(state_file_path, os.O_RDWR | os.O_CREAT, 0o644)
+        try:
+            fcntl.flock(fd, fcntl.LOCK_EX)
+            try:
+                state = json.loads(os.read(fd, 4096).decode("utf-8") or "{}")
+            except ValueError:
+                state = {}
+            if not isinstance(state, dict):
+                state = {}
+            state[key] = value
+            os.lseek(fd, 0, os.SEEK_SET)
+            os.ftruncate(fd, 0)
+            os.write(fd, json.dumps(state).encode("utf-8"))
+        finally:
+            os.close(fd)
+
+    def _get_fresh_record(self, url: str, key: str, is_scoped: bool = False) -> Optional[dict[str, Any]]:
+        # 만료되지 않은 기록만 돌려줌 (만료된 기록은 다시 시험해야 함)
+        host = FetchStrategy._get_host(url)
+        if not host or not self.is_enabled:
+            return None
+        try:
+            record = self._load_state(self._get_scoped_name(host) if is_scoped else host).get(key)
+        except OSError as e:
+            LOGGER.warning("Warning: can't use fetch strategy state in '%s', %r", PathUtil.short_path(self.state_dir_path), e)
+            return None
+        if not isinstance(record, dict) or float(record.get("at", 0) or 0) + self.reprobe_interval <= time.time():
+            return None
+        return record
+
+    def _record(self, url: str, key: str, value: dict[str, Any], is_scoped: bool = False) -> None:
+        host = FetchStrategy._get_host(url)
+        if not host or not self.is_enabled:
+            return
+        try:
+            self._update_state(self._get_scoped_name(host) if is_scoped else host, key, {**value, "at": time.time()})
+        except OSError as e:
+            LOGGER.warning("Warning: can't use fetch strategy state in '%s', %r", PathUtil.short_path(self.state_dir_path), e)
+
+    def is_plain_preferred(self, url: str) -> bool:
+        """렌더링 없이 받은 결과로 충분하다고 기록되어 있으면 True"""
+        record = self._get_fresh_record(url, "plain", is_scoped=True)
+        return bool(record and record.get("ok"))
+
+    def is_plain_probe_due(self, url: str) -> bool:
+        """렌더링 없이 받아도 되는지 아직 모르거나 기록이 만료되었으면 True"""
+        return self.is_enabled and self._get_fresh_record(url, "plain", is_scoped=True) is None
+
+    def matches_plain_content(self, url: str, plain_content: str) -> bool:
+        """렌더링 없이 추출한 내용이 렌더링 결과와 비교해서 기록한 내용의 특징과 맞으면 True (렌더링 결과에 이미지가 있었으면 이미지가 있어야 함)"""
+        record = self._get_fresh_record(url, "plain", is_scoped=True)
+        if not record or not record.get("ok") or not plain_content:
+            return False
+        return not int(record.get("num_images", 0) or 0) or "<img" in plain_content
+
+    def is_verify_due(self) -> bool:
+        """렌더링 없이 받은 결과를 이번에는 렌더링한 결과와 다시 비교해야 하면 True (verify_interval번마다 한 번)"""
+        self.num_plain_fetches += 1
+        return self.verify_interval > 0 and self.num_plain_fetches % self.verify_interval == 0
+
+    def record_plain_result(self, url: str, ok: bool, rendered_content: str = "") -> None:
+        LOGGER.info("%s '%s' without rendering", "can fetch" if ok else "can't fetch", url)
+        self._record(url, "plain", {"ok": ok, "num_images": rendered_content.count("<img")}, is_scoped=True)
+
+    def get_engine(self, url: str) -> str:
+        """마지막으로 성공한 headless browser 엔진 이름 (기록이 없거나 만료되었으면 빈 문자열)"""
+        record = self._get_fresh_record(url, "engine")
+        return str(record.get("name", "")) if record else ""
+
+    def record_engine(self, url: str, name: str) -> None:
+        self._record(url, "engine", {"name": name})
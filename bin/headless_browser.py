@@ -1,6 +1,8 @@
 #!/usr/bin/env python
 
 import atexit
+import base64
+import binascii
 import hashlib
 import json
 import logging.config
@@ -11,10 +13,17 @@ import sys
 import tempfile
 import threading
 import time
+import weakref
 from pathlib import Path
+from collections.abc import Callable
 from typing import Any, Optional
+from urllib.parse import urlsplit
 
-from bin.feed_maker_util import Env, PathUtil, URLSafety
+import psutil
+
+from bin.feed_maker_util import Env, FileManager, PathUtil, URLSafety
+from bin.site_session_store import SiteSessionStore
+from bin.fetch_strategy import FetchStrategy
 
 try:
     from playwright.sync_api import Error as PlaywrightError
@@ -30,6 +39,116 @@ logging.config.fileConfig(Path(__file__).parent.parent / "logging.conf")
 LOGGER = logging.getLogger()
 
 
+class PagePool:
+    """한 번 띄운 브라우저 안에서 여러 페이지를 빌려 쓰고 돌려받는 풀
+
+    playwright sync API는 브라우저를 띄운 스레드에서만 쓸 수 있으므로 풀도 세션과 같이 스레드마다 하나씩 둠.
+    페이지를 만들고 닫는 방법은 엔진이 정함 (camoufox는 페이지마다 별도 context를 만들어 localStorage까지 분리)
+    """
+
+    def __init__(self, create_page: Callable[[], Page], close_page: Callable[[Page], None], max_size: int) -> None:
+        self.create_page = create_page
+        self.close_page = close_page
+        self.max_size: int = max(1, max_size)
+        self.idle_pages: list[Page] = []
+        self.num_checked_out: int = 0
+
+    def checkout(self) -> Page:
+        if self.num_checked_out >= self.max_size:
+            raise RuntimeError(f"all {self.max_size} pages in the pool are in use")
+        page = self.idle_pages.pop() if self.idle_pages else self.create_page()
+        self.num_checked_out += 1
+        return page
+
+    def checkin(self, page: Page, reusable: bool = True) -> None:
+        # 다음 요청에 이전 페이지의 상태가 남지 않도록 저장소를 비우고 빈 페이지로 돌려놓음 (실패하면 버림)
+        self.num_checked_out = max(0, self.num_checked_out - 1)
+        if reusable:
+            try:
+                page.evaluate("window.localStorage.clear(); window.sessionStorage.clear();")
+            except Exception:
+                pass
+            try:
+                page.goto("about:blank", wait_until="commit", timeout=5000)
+                self.idle_pages.append(page)
+                return
+            except Exception:
+                LOGGER.warning("pooled page is no longer responsive, discarding it")
+        try:
+            self.close_page(page)
+        except Exception:
+            pass
+
+    def close(self) -> None:
+        for page in self.idle_pages:
+            try:
+                self.close_page(page)
+            except Exception:
+                pass
+        self.idle_pages.clear()
+
+
+class SessionRecyclePolicy:
+    """피드가 끝날 때 스레드에 캐시된 headless browser 세션을 닫을지 정하는 정책
+
+    세션이 FM_HEADLESS_RECYCLE_AFTER_FEEDS개의 피드나 FM_HEADLESS_RECYCLE_AFTER_PAGES개의 페이지를 처리했거나,
+    브라우저 프로세스들의 RSS 합이 FM_HEADLESS_RECYCLE_MAX_RSS_MB를 넘었거나, 브라우저가 죽었으면 닫음 (0이면 그 기준을 쓰지 않음).
+    그 외에는 다음 피드가 같은 세션을 그대로 이어 써서 브라우저를 다시 띄우는 시간을 아낌
+    """
+
+    DEFAULT_MAX_FEEDS = 10
+    DEFAULT_MAX_PAGES = 200
+    DEFAULT_MAX_RSS_MB = 1024
+
+    def __init__(self, max_feeds: Optional[int] = None, max_pages: Optional[int] = None, max_rss_mb: Optional[int] = None) -> None:
+        self.max_feeds: int = max_feeds if max_feeds is not None else SessionRecyclePolicy._get_env_int("FM_HEADLESS_RECYCLE_AFTER_FEEDS", SessionRecyclePolicy.DEFAULT_MAX_FEEDS)
+        self.max_pages: int = max_pages if max_pages is not None else SessionRecyclePolicy._get_env_int("FM_HEADLESS_RECYCLE_AFTER_PAGES", SessionRecyclePolicy.DEFAULT_MAX_PAGES)
+        self.max_rss_mb: int = max_rss_mb if max_rss_mb is not None else SessionRecyclePolicy._get_env_int("FM_HEADLESS_RECYCLE_MAX_RSS_MB", SessionRecyclePolicy.DEFAULT_MAX_RSS_MB)
+
+    @staticmethod
+    def _get_env_int(name: str, default: int) -> int:
+        try:
+            return int(Env.get(name, str(default)) or default)
+        except ValueError:
+            return default
+
+    @staticmethod
+    def get_browser_rss_mb() -> int:
+        # playwright driver와 브라우저(렌더러 포함)는 모두 이 프로세스의 자식 프로세스
+        try:
+            procs = psutil.Process().children(recursive=True)
+        except psutil.Error:
+            return 0
+        rss = 0
+        for proc in procs:
+            try:
+                rss += proc.memory_info().rss
+            except psutil.Error:
+                continue
+        return rss // (1024 * 1024)
+
+    def get_recycle_reason(self, num_feeds: int, num_pages: int, is_alive: bool, rss_mb: int) -> str:
+        if not is_alive:
+            return "browser crashed"
+        if 0 < self.max_feeds <= num_feeds:
+            return f"used for {num_feeds} feeds"
+        if 0 < self.max_pages <= num_pages:
+            return f"rendered {num_pages} pages"
+        if 0 < self.max_rss_mb <= rss_mb:
+            return f"browser processes use {rss_mb} MB"
+        return ""
+
+
+# 브라우저를 띄운 횟수와 피드가 끝난 뒤 세션을 이어 써서 띄우지 않은 횟수 (모든 엔진 합산)
+_session_stats: dict[str, int] = {"launches": 0, "reuses": 0}
+_session_stats_lock = threading.Lock()
+
+
+def _count_session_stat(key: str) -> None:
+    with _session_stats_lock:
+        _session_stats[key] += 1
+
+
 class HeadlessBrowserBase:
     ID_OF_RENDERING_COMPLETION_IN_CONVERTING_CANVAS = "rendering_completed_in_converting_canvas"
     ID_OF_RENDERING_COMPLETION_IN_SCROLLING = "rendering_completed_in_scrolling"
@@ -46,6 +165,11 @@ class HeadlessBrowserBase:
     _thread_local = threading.local()
     _all_profile_dirs: set[str] = set()
 
+    # make_requests()가 한 브라우저 안에서 동시에 여는 페이지 수 (FM_HEADLESS_PAGE_POOL_SIZE)
+    DEFAULT_PAGE_POOL_SIZE = 4
+    # blocked_resource_types로 막을 수 있는 Playwright 리소스 종류 (본문인 document는 막지 않음)
+    BLOCKABLE_RESOURCE_TYPES = ("stylesheet", "image", "media", "font", "script", "texttrack", "xhr", "fetch", "eventsource", "websocket", "manifest", "other")
+
     GETTING_METADATA_SCRIPT = """
         var metas = document.getElementsByTagName("meta");
         var has_og_url_property = false;
@@ -83,10 +207,94 @@ class HeadlessBrowserBase:
         """
         % ID_OF_RENDERING_COMPLETION_IN_CONVERTING_CANVAS
     )
+    # canvas/blob에서 만든 data URL 이미지를 HTML에 넣는 대신 이미지 캐시 파일로 기록하고, 이 속성에 캐시 URL을 넣었다가 HTML을 꺼낸 뒤 src로 바꿈
+    # (src를 바로 바꾸면 브라우저가 캐시 URL을 다시 받으려고 함)
+    CAPTURED_IMAGE_SRC_ATTR = "data-fm-cached-src"
+    CAPTURED_IMAGE_SUFFIXES: dict[str, str] = {"png": ".png", "jpeg": ".jpeg", "jpg": ".jpg", "webp": ".webp"}
+    LISTING_DATA_URL_IMAGES_SCRIPT = """
+        () => {
+            window.__fmDataUrlImages = Array.from(document.getElementsByTagName("img")).filter((img) => /^data:image\\/(png|jpeg|jpg|webp);base64,/.test(img.getAttribute("src") || ""));
+            return window.__fmDataUrlImages.length;
+        }
+    """
+    GETTING_DATA_URL_IMAGE_SCRIPT = "(i) => window.__fmDataUrlImages[i].getAttribute('src')"
+    REPLACING_DATA_URL_IMAGE_SCRIPT = """
+        ([i, attr, url]) => {
+            const img = window.__fmDataUrlImages[i];
+            img.removeAttribute("src");
+            img.setAttribute(attr, url);
+        }
+    """
     _SCROLL_DOWN_STEP = 349
     _SCROLL_UP_STEP = 683
-    _SCROLL_STEP_MS = 200
-    _MAX_SCROLL_SECS = 5
+    # 스크롤할 때마다 고정 시간 동안 자는 대신, 새 콘텐츠가 다 로딩될 때까지만 기다림
+    # (DOM/높이 변화가 _SCROLL_QUIET_MS 동안 없고, 화면 근처의 이미지와 진행 중인 요청이 모두 끝나면 다음으로 넘어감)
+    _SCROLL_QUIET_MS = 150
+    _SCROLL_POLL_MS = 50
+    # 한 번 스크롤한 뒤 기다리는 최대 시간 (계속 바뀌는 광고나 long polling 요청이 있어도 진행되도록)
+    _SCROLL_STEP_MAX_MS = 600
+    # 직전 스크롤에서 안정되지 않았으면 예전의 고정 간격만큼만 기다림 (끝내 안정되지 않는 페이지도 예전보다 느리지 않게)
+    _SCROLL_BUSY_STEP_MAX_MS = 200
+    # 스크롤 전체에 쓰는 최대 시간 (피드별로 scroll_timeout으로 바꿀 수 있음)
+    _MAX_SCROLL_SECS = 10
+    # 로딩이 끝나기를 기다릴 요청 종류 (이번 스크롤 이후에 시작된 요청만 기다림)
+    _SCROLL_TRACKED_RESOURCE_TYPES = ("image", "media", "fetch", "xhr")
+    SCROLL_OBSERVER_SCRIPT = """
+        (function() {
+            if (window.__fmScrollState) return null;
+            const state = {changedAt: performance.now(), height: 0, visibleImages: new Set()};
+            // 화면 근처에 들어온 이미지를 추적 (lazy loading 이미지가 로딩을 마쳤는지 확인하기 위해)
+            const intersectionObserver = new IntersectionObserver((entries) => {
+                for (const entry of entries) {
+                    if (entry.isIntersecting) {
+                        state.visibleImages.add(entry.target);
+                    } else {
+                        state.visibleImages.delete(entry.target);
+                    }
+                }
+            }, {rootMargin: "200px 0px"});
+            const observeImages = (node) => {
+                if (node.tagName === "IMG") intersectionObserver.observe(node);
+                if (node.querySelectorAll) node.querySelectorAll("img").forEach((img) => intersectionObserver.observe(img));
+            };
+            observeImages(document.documentElement);
+            // 화면에서 먼 곳(광고 회전, 티커 등)의 변화는 지금 스크롤한 위치의 로딩과 무관함
+            const isNearViewport = (node) => {
+                const element = node.nodeType === 1 ? node : node.parentElement;
+                if (!element || !element.isConnected) return false;
+                const rect = element.getBoundingClientRect();
+                if (rect.width === 0 && rect.height === 0) return false;
+                return rect.bottom >= -200 && rect.top <= window.innerHeight + 200;
+            };
+            // 화면 근처에 노드가 추가되거나 이미지 주소가 바뀌면 아직 로딩 중인 것으로 봄
+            new MutationObserver((mutations) => {
+                for (const mutation of mutations) {
+                    mutation.addedNodes.forEach((node) => { if (node.nodeType === 1) observeImages(node); });
+                    const nodes = mutation.addedNodes.length > 0 ? Array.from(mutation.addedNodes) : [mutation.target];
+                    if (nodes.some(isNearViewport)) state.changedAt = performance.now();
+                }
+            }).observe(document.documentElement, {childList: true, subtree: true, attributes: true, attributeFilter: ["src", "srcset"]});
+            window.__fmScrollState = state;
+            return null;
+        })()
+    """
+    SCROLL_SETTLED_PREDICATE = """
+        (quietMs) => {
+            const state = window.__fmScrollState;
+            if (!state) return true;
+            const now = performance.now();
+            const height = document.body ? document.body.scrollHeight : 0;
+            if (height !== state.height) {
+                state.height = height;
+                state.changedAt = now;
+            }
+            if (now - state.changedAt < quietMs) return false;
+            for (const img of state.visibleImages) {
+                if (img.isConnected && !img.complete) return false;
+            }
+            return true;
+        }
+    """
     BLOB_INTERCEPTOR_INIT_SCRIPT = """
         (function() {
             if (window._blobInterceptorInstalled) return;
@@ -168,9 +376,24 @@ class HeadlessBrowserBase:
         % ID_OF_RENDERING_COMPLETION_IN_CONVERTING_BLOB
     )
 
-    def __init__(self, *, dir_path: Path = Path.cwd(), headers: Optional[dict[str, str]] = None, copy_images_from_canvas: bool = False, simulate_scrolling: bool = False, disable_headless: bool = False, blob_to_dataurl: bool = False, timeout: int = 60, wait_until: str = "domcontentloaded") -> None:
+    def __init__(
+        self,
+        *,
+        dir_path: Path = Path.cwd(),
+        headers: Optional[dict[str, str]] = None,
+        copy_images_from_canvas: bool = False,
+        simulate_scrolling: bool = False,
+        disable_headless: bool = False,
+        blob_to_dataurl: bool = False,
+        timeout: int = 60,
+        wait_until: str = "domcontentloaded",
+        blocked_resource_types: Optional[list[str]] = None,
+        blocked_domains: Optional[list[str]] = None,
+        scroll_timeout: Optional[float] = None,
+        site_session_store: Optional[SiteSessionStore] = None,
+    ) -> None:
         LOGGER.debug(
-            "# HeadlessBrowserCloak(dir_path=%s, headers=%r, copy_images_from_canvas=%s, simulate_scrolling=%s, disable_headless=%s, blob_to_dataurl=%s, timeout=%d, wait_until=%s)",
+            "# HeadlessBrowserCloak(dir_path=%s, headers=%r, copy_images_from_canvas=%s, simulate_scrolling=%s, disable_headless=%s, blob_to_dataurl=%s, timeout=%d, wait_until=%s, blocked_resource_types=%r, blocked_domains=%r, scroll_timeout=%s)",
             PathUtil.short_path(dir_path),
             headers,
             copy_images_from_canvas,
@@ -179,6 +402,9 @@ class HeadlessBrowserBase:
             blob_to_dataurl,
             timeout,
             wait_until,
+            blocked_resource_types,
+            blocked_domains,
+            scroll_timeout,
         )
         self.dir_path: Path = dir_path
         self.headers: dict[str, str] = headers if headers is not None else {}
@@ -190,7 +416,15 @@ class HeadlessBrowserBase:
         self.blob_to_dataurl: bool = blob_to_dataurl
         self.timeout: int = timeout
         self.wait_until: str = wait_until
+        self.scroll_timeout: float = scroll_timeout if scroll_timeout and scroll_timeout > 0 else self._MAX_SCROLL_SECS
+        self.blocked_resource_types: set[str] = self._get_blocked_resource_types(blocked_resource_types or [])
+        # 도메인을 지정하면 그 하위 도메인도 함께 막음
+        self.blocked_domains: set[str] = {d.strip().lower().lstrip(".") for d in blocked_domains or [] if d.strip().lstrip(".")}
         self._cookie_dir: Optional[Path] = None
+        # 같은 사이트의 피드들이 로그인 쿠키와 Cloudflare 통과 토큰을 나눠 쓰는 저장소 (Crawler가 공유 인스턴스를 넘겨줌)
+        self.site_session_store: Optional[SiteSessionStore] = site_session_store
+        # 컨텍스트별로 사이트마다 마지막에 넣어 둔 사이트 세션의 상태 파일 수정 시각
+        self._site_cookie_stamps: weakref.WeakKeyDictionary[Any, dict[str, int]] = weakref.WeakKeyDictionary()
         self.allow_private_ips = Env.get("FM_CRAWLER_ALLOW_PRIVATE_IPS", "false").strip().lower() in ("1", "true", "yes", "on")
         self.allowed_hosts_raw = Env.get("FM_CRAWLER_ALLOWED_HOSTS", "")
         self._profile_dir: Optional[str] = None
@@ -227,7 +461,57 @@ class HeadlessBrowserBase:
         return hashlib.md5(options_str.encode(), usedforsecurity=False).hexdigest()
 
     def _build_session_options(self) -> dict[str, Any]:
-        return {"headless": not self.disable_headless, "user_agent": self.headers["User-Agent"], "blob_to_dataurl": self.blob_to_dataurl, "copy_images_from_canvas": self.copy_images_from_canvas, "simulate_scrolling": self.simulate_scrolling, "group_key": str(self.dir_path.parent)}
+        return {
+            "headless": not self.disable_headless,
+            "user_agent": self.headers["User-Agent"],
+            "blob_to_dataurl": self.blob_to_dataurl,
+            "copy_images_from_canvas": self.copy_images_from_canvas,
+            "simulate_scrolling": self.simulate_scrolling,
+            "group_key": str(self.dir_path.parent),
+            "blocked_resource_types": sorted(self.blocked_resource_types),
+            "blocked_domains": sorted(self.blocked_domains),
+        }
+
+    def _get_blocked_resource_types(self, resource_type_list: list[str]) -> set[str]:
+        blocked_resource_types: set[str] = set()
+        for resource_type in (t.strip().lower() for t in resource_type_list):
+            if resource_type in self.BLOCKABLE_RESOURCE_TYPES:
+                blocked_resource_types.add(resource_type)
+            elif resource_type:
+                LOGGER.warning("Warning: ignoring unknown resource type '%s' in blocked_resource_types", resource_type)
+        if "image" in blocked_resource_types and (self.copy_images_from_canvas or self.blob_to_dataurl):
+            # canvas/blob 이미지를 캡처하려면 이미지를 받아야 함
+            LOGGER.debug("allowing images for canvas/blob capture")
+            blocked_resource_types.discard("image")
+        return blocked_resource_types
+
+    def _is_blocked_request(self, request: Any) -> bool:
+        # 페이지 자체(main frame의 문서 요청)는 막지 않고, 광고 iframe 같은 하위 frame의 문서는 도메인으로 막음
+        if request.is_navigation_request() and request.frame.parent_frame is None:
+            return False
+        if request.resource_type in self.blocked_resource_types:
+            return True
+        if self.blocked_domains:
+            host = (urlsplit(request.url).hostname or "").lower()
+            return any(host == domain or host.endswith("." + domain) for domain in self.blocked_domains)
+        return False
+
+    def _route_request(self, route: Any, request: Any) -> None:
+        try:
+            if self._is_blocked_request(request):
+                route.abort("blockedbyclient")
+            else:
+                route.continue_()
+        except PlaywrightError as e:
+            # 페이지가 닫히는 도중에 들어온 요청 등은 이미 처리된 상태일 수 있음
+            LOGGER.debug("can't route request '%s', %r", request.url, e)
+
+    def _install_request_routing(self, context: BrowserContext) -> None:
+        # context 단위로 등록해서 풀의 페이지와 팝업까지 같은 규칙을 적용 (막을 것이 없으면 route 비용을 치르지 않음)
+        if not self.blocked_resource_types and not self.blocked_domains:
+            return
+        LOGGER.debug("blocking resource types %r and domains %r", sorted(self.blocked_resource_types), sorted(self.blocked_domains))
+        context.route("**/*", self._route_request)
 
     @classmethod
     def _get_cached_session(cls, options: dict[str, Any]) -> Optional[dict[str, Any]]:
@@ -252,11 +536,45 @@ class HeadlessBrowserBase:
     def _set_cached_session(cls, session: dict[str, Any], options: dict[str, Any]) -> None:
         cls._thread_local._session_cache = session
         cls._thread_local._session_options_hash = cls._get_options_hash(options)
+        # 재활용 정책이 참고하는 사용량
+        cls._thread_local._num_feeds = 0
+        cls._thread_local._num_pages = 0
+        cls._thread_local._is_kept_after_feed = False
+
+    @classmethod
+    def _count_pages(cls, num_pages: int = 1) -> None:
+        cls._thread_local._num_pages = getattr(cls._thread_local, "_num_pages", 0) + num_pages
+
+    @staticmethod
+    def _is_session_alive(cache: dict[str, Any]) -> bool:
+        try:
+            if cache["page"].is_closed():
+                return False
+            browser = cache["context"].browser
+            return browser is None or browser.is_connected()
+        except Exception:
+            return False
+
+    @classmethod
+    def recycle_session_by_policy(cls, policy: SessionRecyclePolicy, rss_mb: int = 0) -> str:
+        """피드 하나가 끝날 때 호출: 정책에 따라 세션을 닫고 그 이유를 돌려줌 (이어 쓰면 빈 문자열)"""
+        cache = getattr(cls._thread_local, "_session_cache", None)
+        if not cache:
+            return ""
+        cls._thread_local._num_feeds = getattr(cls._thread_local, "_num_feeds", 0) + 1
+        reason = policy.get_recycle_reason(cls._thread_local._num_feeds, getattr(cls._thread_local, "_num_pages", 0), cls._is_session_alive(cache), rss_mb)
+        if reason:
+            cls._cleanup_cached_session()
+            return reason
+        cls._thread_local._is_kept_after_feed = True
+        return ""
 
     @classmethod
     def _cleanup_cached_session(cls) -> None:
         cache = getattr(cls._thread_local, "_session_cache", None)
         if cache:
+            if cache.get("page_pool"):
+                cache["page_pool"].close()
             cls._close_session(cache)
             cls._thread_local._session_cache = None
             cls._thread_local._session_options_hash = None
@@ -318,13 +636,57 @@ class HeadlessBrowserBase:
             except Exception:
                 self._cleanup_cached_session()
                 session = None
+        if session is not None and getattr(self._thread_local, "_is_kept_after_feed", False):
+            # 이전 피드의 세션을 이어 써서 브라우저를 띄우지 않음 (같은 그룹이라도 피드마다 쿠키 파일이 다르므로
+            # 이전 피드의 쿠키를 지우고 이 피드의 쿠키 파일을 읽어서, 이 피드의 쿠키 파일에 이전 피드의 쿠키가 기록되지 않게 함)
+            self._thread_local._is_kept_after_feed = False
+            try:
+                session["context"].clear_cookies()
+                self._read_cookies_from_file(session["context"])
+            except PlaywrightError as e:
+                LOGGER.warning("Warning: can't reset cookies of the kept headless browser session, %r", e)
+                self._cleanup_cached_session()
+                session = None
+            else:
+                _count_session_stat("reuses")
         if session is not None:
             return session, False
 
         session = self._launch_session()
+        _count_session_stat("launches")
+        try:
+            self._install_request_routing(session["context"])
+        except Exception:
+            self._close_session(session)
+            raise
         self._set_cached_session(session, options)
         return session, True
 
+    def _get_page_pool_size(self) -> int:
+        try:
+            return max(1, int(Env.get("FM_HEADLESS_PAGE_POOL_SIZE", str(self.DEFAULT_PAGE_POOL_SIZE)) or self.DEFAULT_PAGE_POOL_SIZE))
+        except ValueError:
+            return self.DEFAULT_PAGE_POOL_SIZE
+
+    def _get_page_pool(self, session: dict[str, Any]) -> PagePool:
+        pool: Optional[PagePool] = session.get("page_pool")
+        if pool is None:
+            pool = PagePool(lambda: self._new_pool_page(session), self._close_pool_page, self._get_page_pool_size())
+            session["page_pool"] = pool
+        return pool
+
+    def _new_pool_page(self, session: dict[str, Any]) -> Page:
+        # 기본: 세션의 context에 페이지를 추가 (persistent context는 context를 더 만들 수 없으므로 저장소는 반납할 때 비움)
+        page = session["context"].new_page()
+        page.set_default_timeout(self.timeout * 1000)
+        page.set_default_navigation_timeout(self.timeout * 1000)
+        self._register_dialog_handlers(page)
+        return page
+
+    @staticmethod
+    def _close_pool_page(page: Page) -> None:
+        page.close()
+
     # __cf_bm (bot-management, ~30 min) and the __cf_chl*/cf_chl*/__cfwaitingroom challenge
     # cookies are short-lived and bound to an in-flight challenge, so persisting them only
     # replays junk. cf_clearance is different: it is the actual clearance token with a
@@ -339,17 +701,50 @@ class HeadlessBrowserBase:
     def _is_persistable_cookie(cls, name: str) -> bool:
         return not any(name.startswith(prefix) for prefix in cls._NON_PERSISTENT_COOKIE_PREFIXES)
 
-    def _write_cookies_to_file(self, context: BrowserContext) -> None:
+    def _write_cookies_to_file(self, context: BrowserContext, url: str = "") -> None:
         cookies = [c for c in context.cookies() if self._is_persistable_cookie(c.get("name", ""))]
         cookie_file = self._get_cookie_dir() / self.COOKIE_FILE
         with cookie_file.open("w", encoding="utf-8") as f:
             json.dump(cookies, f, indent=2, ensure_ascii=False)
+        if self.site_session_store is not None and url and cookies:
+            # url이 속한 사이트의 쿠키만 사이트 세션 저장소에 병합해서 같은 사이트의 다른 피드가 사용하게 함
+            self.site_session_store.save_cookies(url, cookies)  # type: ignore[arg-type]
 
-    def _discard_persisted_cookies(self) -> None:
+    def _discard_persisted_cookies(self, url: str = "") -> None:
         # Drop the saved cookie jar so a stale/rejected Cloudflare clearance token isn't
         # replayed on the next attempt or run; all cookies are re-minted on a clean pass.
         cookie_file = self._get_cookie_dir() / self.COOKIE_FILE
         cookie_file.unlink(missing_ok=True)
+        if self.site_session_store is not None and url:
+            # 공유하는 통과 토큰만 지우고 같은 사이트의 로그인 쿠키는 남겨 둠
+            self.site_session_store.discard_cookies(url, ("cf_clearance",))
+
+    def _apply_site_cookies(self, context: BrowserContext, url: str) -> None:
+        # 같은 사이트의 다른 피드가 받은 로그인 쿠키와 통과 토큰을 탐색 전에 넣어 둠 (상태 파일이 바뀐 경우에만 다시 읽음)
+        if self.site_session_store is None:
+            return
+        stamp = self.site_session_store.get_stamp(url)
+        site = self.site_session_store.get_site(url)
+        stamp_map = self._site_cookie_stamps.setdefault(context, {})
+        if stamp is None or stamp_map.get(site) == stamp:
+            return
+        stamp_map[site] = stamp
+        cookies = self.site_session_store.load_cookies(url)
+        if cookies and self.site_session_store.keeps_own_cookies:
+            # 자체 로그인 설정이 있는 피드는 브라우저에 있는 자기 쿠키를 덮어쓰지 않음
+            try:
+                own_cookie_names = {c.get("name") for c in context.cookies()}
+            except PlaywrightError as e:
+                LOGGER.warning("Warning: can't read cookies of browser context, %r", e)
+                return
+            cookies = [c for c in cookies if c.get("name") not in own_cookie_names]
+        if not cookies:
+            return
+        LOGGER.debug("applying %d shared cookies of '%s'", len(cookies), site)
+        try:
+            context.add_cookies(cookies)  # type: ignore[arg-type]
+        except PlaywrightError as e:
+            LOGGER.warning("Warning: can't apply shared cookies of '%s', %r", site, e)
 
     def _read_cookies_from_file(self, context: BrowserContext) -> None:
         cookie_file = self._get_cookie_dir() / self.COOKIE_FILE
@@ -374,6 +769,33 @@ class HeadlessBrowserBase:
             cookie_file.unlink(missing_ok=True)
             self._read_cookies_from_file(context)
 
+    def get_cookies(self, url: str) -> dict[str, str]:
+        """브라우저가 저장한 쿠키 중에서 url로 요청할 때 보낼 쿠키 (렌더링 없이 받을 때도 로그인 상태와 통과 토큰을 유지)"""
+        cookie_file = self._get_cookie_dir() / self.COOKIE_FILE
+        if not cookie_file.is_file():
+            return {}
+        try:
+            with cookie_file.open("r", encoding="utf-8") as f:
+                cookies = json.load(f)
+        except (json.JSONDecodeError, OSError) as e:
+            LOGGER.warning("Warning: can't read '%s', %r", PathUtil.short_path(cookie_file), e)
+            return {}
+        if not isinstance(cookies, list):
+            return {}
+        now = time.time()
+        matched_cookies: list[dict[str, Any]] = []
+        for cookie in cookies:
+            if not isinstance(cookie, dict) or not cookie.get("name") or cookie.get("value") is None:
+                continue
+            expires = cookie.get("expires", cookie.get("expiry"))
+            if isinstance(expires, (int, float)) and 0 < expires <= now:
+                continue
+            if SiteSessionStore.is_cookie_for_url(cookie, url):
+                matched_cookies.append(cookie)
+        # 이름이 같으면 경로가 더 긴 쿠키의 값을 사용
+        matched_cookies.sort(key=lambda c: len(str(c.get("path") or "/")))
+        return {str(c["name"]): str(c["value"]) for c in matched_cookies}
+
     @staticmethod
     def _quote_attr(value: str) -> str:
         return value.replace("\\", "\\\\").replace('"', '\\"')
@@ -418,6 +840,51 @@ class HeadlessBrowserBase:
             LOGGER.warning("Cloudflare challenge did not clear within %ds", self._CLOUDFLARE_CHALLENGE_TIMEOUT_SEC)
             return False
 
+    def _get_image_cache_dir(self) -> Optional[tuple[Path, str]]:
+        # download_image.py와 같은 피드별 이미지 캐시 디렉토리와 URL -> (디렉토리, URL prefix), 설정되지 않았으면 None
+        if Env.get("FM_HEADLESS_CAPTURE_IMAGES_TO_FILES", "true").strip().lower() in ("0", "false", "no", "off"):
+            return None
+        img_dir_prefix = Env.get("WEB_SERVICE_IMAGE_DIR_PREFIX")
+        img_url_prefix = Env.get("WEB_SERVICE_IMAGE_URL_PREFIX")
+        if not img_dir_prefix or not img_url_prefix or not Path(img_dir_prefix).is_dir():
+            return None
+        feed_img_dir_path = Path(img_dir_prefix) / self.dir_path.name
+        feed_img_dir_path.mkdir(exist_ok=True)
+        return feed_img_dir_path, img_url_prefix + "/" + self.dir_path.name
+
+    def _capture_images_to_files(self, page: Page) -> int:
+        # data URL 이미지를 하나씩 꺼내 이미지 캐시에 기록하고 캐시 URL로 바꿈 (HTML과 이후 단계가 수 MB의 base64 문자열을 다루지 않도록)
+        image_cache_dir = self._get_image_cache_dir()
+        if image_cache_dir is None:
+            return 0
+        feed_img_dir_path, feed_img_url_prefix = image_cache_dir
+        num_images = page.evaluate(self.LISTING_DATA_URL_IMAGES_SCRIPT)
+        if not isinstance(num_images, int) or num_images <= 0:
+            return 0
+        num_captured = 0
+        for i in range(num_images):
+            data_url = page.evaluate(self.GETTING_DATA_URL_IMAGE_SCRIPT, i)
+            if not isinstance(data_url, str):
+                continue
+            header, _, data = data_url.partition(",")
+            suffix = self.CAPTURED_IMAGE_SUFFIXES.get(header[len("data:image/") :].partition(";")[0].lower())
+            if not suffix:
+                continue
+            # download_image.py가 같은 data URL에 붙이는 이름과 같게 만들어서 그대로 변환해 쓰도록 함
+            cache_file_path = FileManager.get_cache_file_path(feed_img_dir_path, data_url, suffix=suffix)
+            try:
+                if not cache_file_path.is_file() or cache_file_path.stat().st_size == 0:
+                    temp_file_path = cache_file_path.with_name(cache_file_path.name + f".{os.getpid()}.tmp")
+                    temp_file_path.write_bytes(base64.b64decode(data))
+                    temp_file_path.replace(cache_file_path)
+            except (OSError, binascii.Error, ValueError) as e:
+                LOGGER.warning("Warning: can't write captured image to '%s', %r", PathUtil.short_path(cache_file_path), e)
+                continue
+            page.evaluate(self.REPLACING_DATA_URL_IMAGE_SCRIPT, [i, self.CAPTURED_IMAGE_SRC_ATTR, FileManager.get_cache_url(feed_img_url_prefix, data_url, suffix=suffix)])
+            num_captured += 1
+        LOGGER.debug("captured %d images to '%s'", num_captured, PathUtil.short_path(feed_img_dir_path))
+        return num_captured
+
     def _wait_for_marker(self, page: Page, marker_id: str) -> None:
         try:
             page.wait_for_selector(f"#{marker_id}", state="attached", timeout=self.timeout * 1000)
@@ -425,25 +892,66 @@ class HeadlessBrowserBase:
         except PlaywrightTimeoutError:
             LOGGER.warning("Timeout waiting for completion marker: %s", marker_id)
 
+    def _wait_for_scroll_settle(self, page: Page, inflight_requests: dict[Any, float], deadline: float, since: float = 0.0, step_max_ms: Optional[int] = None) -> bool:
+        # 새 콘텐츠가 안정될 때까지 기다림 (한 번에 step_max_ms, 전체 deadline을 넘지 않음)
+        # since 이후에 시작된 요청만 기다림 (그 전부터 열려 있는 long polling 요청 등은 지금 위치와 무관함)
+        # 안정되면 True, 시간이 다 되어 그냥 넘어가면 False
+        step_deadline = min(deadline, time.monotonic() + (step_max_ms or self._SCROLL_STEP_MAX_MS) / 1000)
+        while True:
+            remaining_ms = (step_deadline - time.monotonic()) * 1000
+            if remaining_ms <= 0:
+                return False
+            try:
+                page.wait_for_function(self.SCROLL_SETTLED_PREDICATE, arg=self._SCROLL_QUIET_MS, polling=self._SCROLL_POLL_MS, timeout=remaining_ms)
+            except PlaywrightTimeoutError:
+                return False
+            if not any(started_at >= since for started_at in list(inflight_requests.values())):
+                return True
+            # 진행 중인 요청의 이벤트가 처리되도록 잠깐 양보하고 다시 확인
+            page.wait_for_timeout(self._SCROLL_POLL_MS)
+
     def _run_scrolling_script(self, page: Page) -> None:
         marker_id = self.ID_OF_RENDERING_COMPLETION_IN_SCROLLING
         # Use a wrapper that explicitly returns null so Playwright never waits
         # on a Promise — xtoon and similar sites override window.scrollTo with
         # an async function, which would cause page.evaluate() to hang forever.
-        _SCROLL_JS = "(function(y) {{ window.scrollTo(0, y); return null; }})({pos})"
+        # 스크롤한 시각을 기록해서 lazy loading 스크립트가 반응할 시간을 줌
+        _SCROLL_JS = "(function(y) {{ window.scrollTo(0, y); if (window.__fmScrollState) window.__fmScrollState.changedAt = performance.now(); return null; }})({pos})"
+        # 이미지/XHR 요청이 끝나지 않았으면 아직 로딩 중 (network idle)
+        # (요청 -> 시작 시각)
+        inflight_requests: dict[Any, float] = {}
+
+        def on_request(request: Any) -> None:
+            if request.resource_type in self._SCROLL_TRACKED_RESOURCE_TYPES:
+                inflight_requests[request] = time.monotonic()
+
+        def on_request_done(request: Any) -> None:
+            inflight_requests.pop(request, None)
+
+        listeners = (("request", on_request), ("requestfinished", on_request_done), ("requestfailed", on_request_done))
+        deadline = time.monotonic() + self.scroll_timeout
         try:
-            time.sleep(1)
+            for event, listener in listeners:
+                page.on(event, listener)
+            try:
+                page.evaluate(self.SCROLL_OBSERVER_SCRIPT)
+            except Exception as e:
+                # observer를 설치할 수 없으면 진행 중인 요청만 보고 판단
+                LOGGER.debug("can't install scroll observers, %r", e)
+            self._wait_for_scroll_settle(page, inflight_requests, deadline)
 
-            start = time.monotonic()
             pos = 0
             try:
                 bottom = int(page.evaluate("document.body.scrollHeight") or 0)
             except (TypeError, ValueError):
                 bottom = 0
 
-            while pos < bottom and time.monotonic() - start < self._MAX_SCROLL_SECS:
+            step_max_ms = self._SCROLL_STEP_MAX_MS
+            while pos < bottom and time.monotonic() < deadline:
+                step_started = time.monotonic()
                 page.evaluate(_SCROLL_JS.format(pos=pos))
-                time.sleep(self._SCROLL_STEP_MS / 1000)
+                settled = self._wait_for_scroll_settle(page, inflight_requests, deadline, since=step_started, step_max_ms=step_max_ms)
+                step_max_ms = self._SCROLL_STEP_MAX_MS if settled else self._SCROLL_BUSY_STEP_MAX_MS
                 pos += self._SCROLL_DOWN_STEP
                 try:
                     bottom = int(page.evaluate("document.body.scrollHeight") or 0)
@@ -451,16 +959,20 @@ class HeadlessBrowserBase:
                     break
 
             if pos > 0:
-                start = time.monotonic()
-                while pos >= 0 and time.monotonic() - start < self._MAX_SCROLL_SECS:
+                # 위쪽의 콘텐츠는 이미 로딩했으므로 기다리지 않고 올라감
+                step_started = time.monotonic()
+                while pos >= 0:
                     page.evaluate(_SCROLL_JS.format(pos=pos))
-                    time.sleep(self._SCROLL_STEP_MS / 1000)
                     pos -= self._SCROLL_UP_STEP
-
-            time.sleep(1)
+                self._wait_for_scroll_settle(page, inflight_requests, deadline, since=step_started)
         except (PlaywrightError, PlaywrightTimeoutError) as e:
             LOGGER.warning("Scrolling interrupted: %s", e)
         finally:
+            for event, listener in listeners:
+                try:
+                    page.remove_listener(event, listener)
+                except Exception:
+                    pass
             try:
                 page.evaluate(f'if (!document.getElementById("{marker_id}")) {{ const d = document.createElement("div"); d.id = "{marker_id}"; document.body.appendChild(d); }}')
             except Exception:
@@ -472,9 +984,11 @@ class HeadlessBrowserBase:
 
         try:
             session, _ = self._get_or_create_session()
+            self._count_pages()
             page: Page = session["page"]
             context: BrowserContext = session["context"]
 
+            self._apply_site_cookies(context, login_url)
             page.goto(login_url, wait_until=self.wait_until, timeout=self.timeout * 1000)  # type: ignore[arg-type]
 
             id_field = config.get("id_field", "")
@@ -510,7 +1024,7 @@ class HeadlessBrowserBase:
 
             cookies = context.cookies()
             if cookies:
-                self._write_cookies_to_file(context)
+                self._write_cookies_to_file(context, login_url)
                 LOGGER.info("HeadlessBrowserCloak login successful for '%s'", login_url)
                 return True
 
@@ -521,6 +1035,58 @@ class HeadlessBrowserBase:
             LOGGER.warning("HeadlessBrowserCloak login error: %s", e)
             return False
 
+    def _render_loaded_page(self, page: Page, context: BrowserContext, url: str) -> tuple[str, bool]:
+        # 탐색이 끝난 페이지에서 Cloudflare 대기, 메타데이터/canvas/스크롤/blob 스크립트를 실행하고 HTML을 돌려줌 -> (html, challenge_cleared)
+        if not self._wait_for_cloudflare(page):
+            # The challenge never cleared, so the page still holds Cloudflare's
+            # interstitial rather than the real content. Returning that HTML would make
+            # the caller treat a block page as a successful fetch and skip its retry —
+            # capture then extracts nothing. Discard the persisted clearance (so a
+            # rejected/stale token isn't replayed), let the caller tear the session
+            # down, and return "" so crawler.run()'s num_retries re-attempts on
+            # a fresh browser session.
+            self._discard_persisted_cookies(url)
+            LOGGER.warning("Cloudflare challenge unresolved for '%s'; returning empty to trigger retry", url)
+            return "", False
+
+        # navigator.plugins / navigator.languages spoofing is intentionally removed:
+        # cloakbrowser sets these at the C++ binary level. A JS-level override here
+        # would replace the natural values with an Object.defineProperty signature
+        # that fingerprinting scripts can detect.
+        self._write_cookies_to_file(context, url)
+
+        LOGGER.debug("executing a script for metadata")
+        page.evaluate(self.GETTING_METADATA_SCRIPT)
+
+        if self.copy_images_from_canvas:
+            LOGGER.debug("converting canvas to images")
+            page.evaluate(self.CONVERTING_CANVAS_TO_IMAGES_SCRIPT)
+
+        if self.simulate_scrolling:
+            LOGGER.debug("simulating scrolling")
+            try:
+                self._run_scrolling_script(page)
+            except PlaywrightTimeoutError:
+                LOGGER.warning("Scrolling script timed out, continuing...")
+
+        if self.blob_to_dataurl:
+            LOGGER.debug("converting blob to dataurl")
+            page.evaluate(self.CONVERTING_BLOB_TO_DATAURL_SCRIPT)
+
+        for option, waiting_div_id in ((self.copy_images_from_canvas, self.ID_OF_RENDERING_COMPLETION_IN_CONVERTING_CANVAS), (self.simulate_scrolling, self.ID_OF_RENDERING_COMPLETION_IN_SCROLLING), (self.blob_to_dataurl, self.ID_OF_RENDERING_COMPLETION_IN_CONVERTING_BLOB)):
+            if option:
+                self._wait_for_marker(page, waiting_div_id)
+
+        num_captured_images = 0
+        if self.copy_images_from_canvas or self.blob_to_dataurl:
+            num_captured_images = self._capture_images_to_files(page)
+
+        LOGGER.debug("getting inner html")
+        html = page.evaluate("document.documentElement.outerHTML")
+        if html and num_captured_images:
+            html = html.replace(f' {self.CAPTURED_IMAGE_SRC_ATTR}="', ' src="')
+        return (f"<!DOCTYPE html>{html}" if html else ""), True
+
     def make_request(self, url: str, download_file: Optional[Path] = None) -> str:
         LOGGER.debug("# HeadlessBrowserCloak.make_request(url=%s, download_file=%s)", url, download_file)
         is_ok, reason = URLSafety.check_url(url, allow_private=self.allow_private_ips, allowed_hosts_raw=self.allowed_hosts_raw)
@@ -533,6 +1099,7 @@ class HeadlessBrowserBase:
 
         try:
             session, _ = self._get_or_create_session()
+            self._count_pages()
             page: Page = session["page"]
             context: BrowserContext = session["context"]
 
@@ -543,11 +1110,13 @@ class HeadlessBrowserBase:
                     LOGGER.warning("Blocked referer URL: %s (%s)", referer, reason)
                     return ""
                 LOGGER.debug("visiting referer page '%s'", referer)
+                self._apply_site_cookies(context, referer)
                 page.goto(referer, wait_until=self.wait_until, timeout=self.timeout * 1000)  # type: ignore[arg-type]
                 self._wait_for_cloudflare(page)
-                self._write_cookies_to_file(context)
+                self._write_cookies_to_file(context, referer)
 
             LOGGER.debug("getting the page '%s'", url)
+            self._apply_site_cookies(context, url)
             try:
                 page.goto(url, wait_until=self.wait_until, timeout=self.timeout * 1000)  # type: ignore[arg-type]
             except PlaywrightTimeoutError as e:
@@ -563,50 +1132,8 @@ class HeadlessBrowserBase:
                 LOGGER.warning("<!-- %r -->", e)
                 return ""
 
-            if not self._wait_for_cloudflare(page):
-                # The challenge never cleared, so the page still holds Cloudflare's
-                # interstitial rather than the real content. Returning that HTML would make
-                # the caller treat a block page as a successful fetch and skip its retry —
-                # capture then extracts nothing. Discard the persisted clearance (so a
-                # rejected/stale token isn't replayed), mark the session for teardown in the
-                # finally block, and return "" so crawler.run()'s num_retries re-attempts on
-                # a fresh browser session.
-                challenge_cleared = False
-                self._discard_persisted_cookies()
-                LOGGER.warning("Cloudflare challenge unresolved for '%s'; returning empty to trigger retry", url)
-                return ""
-
-            # navigator.plugins / navigator.languages spoofing is intentionally removed:
-            # cloakbrowser sets these at the C++ binary level. A JS-level override here
-            # would replace the natural values with an Object.defineProperty signature
-            # that fingerprinting scripts can detect.
-            self._write_cookies_to_file(context)
-
-            LOGGER.debug("executing a script for metadata")
-            page.evaluate(self.GETTING_METADATA_SCRIPT)
-
-            if self.copy_images_from_canvas:
-                LOGGER.debug("converting canvas to images")
-                page.evaluate(self.CONVERTING_CANVAS_TO_IMAGES_SCRIPT)
-
-            if self.simulate_scrolling:
-                LOGGER.debug("simulating scrolling")
-                try:
-                    self._run_scrolling_script(page)
-                except PlaywrightTimeoutError:
-                    LOGGER.warning("Scrolling script timed out, continuing...")
-
-            if self.blob_to_dataurl:
-                LOGGER.debug("converting blob to dataurl")
-                page.evaluate(self.CONVERTING_BLOB_TO_DATAURL_SCRIPT)
-
-            for option, waiting_div_id in ((self.copy_images_from_canvas, self.ID_OF_RENDERING_COMPLETION_IN_CONVERTING_CANVAS), (self.simulate_scrolling, self.ID_OF_RENDERING_COMPLETION_IN_SCROLLING), (self.blob_to_dataurl, self.ID_OF_RENDERING_COMPLETION_IN_CONVERTING_BLOB)):
-                if option:
-                    self._wait_for_marker(page, waiting_div_id)
-
-            LOGGER.debug("getting inner html")
-            html = page.evaluate("document.documentElement.outerHTML")
-            return f"<!DOCTYPE html>{html}" if html else ""
+            html, challenge_cleared = self._render_loaded_page(page, context, url)
+            return html
 
         except (PlaywrightError, PlaywrightTimeoutError) as e:
             # A renderer crash (TargetClosedError, "Target crashed") raised after
@@ -650,6 +1177,91 @@ class HeadlessBrowserBase:
                         LOGGER.warning("Headless browser session is dead, invalidating cache")
                         self._cleanup_cached_session()
 
+    def make_requests(self, url_list: list[str]) -> list[str]:
+        """여러 페이지를 한 브라우저의 페이지 풀에서 동시에 불러와 make_request()와 같은 HTML을 순서대로 돌려줌
+
+        풀 크기만큼 페이지를 빌려 탐색을 한꺼번에 시작해 두고(응답이 오기 시작하면 바로 다음 페이지로 넘어감),
+        앞에서부터 로딩 완료를 기다린 뒤 스크립트를 실행하므로 뒤 페이지들은 그동안 브라우저 안에서 계속 로딩됨
+        """
+        LOGGER.debug("# HeadlessBrowserCloak.make_requests(num_urls=%d)", len(url_list))
+        results: list[str] = [""] * len(url_list)
+        index_list: list[int] = []
+        for i, url in enumerate(url_list):
+            is_ok, reason = URLSafety.check_url(url, allow_private=self.allow_private_ips, allowed_hosts_raw=self.allowed_hosts_raw)
+            if is_ok:
+                index_list.append(i)
+            else:
+                LOGGER.warning("Blocked URL: %s (%s)", url, reason)
+        if not index_list:
+            return results
+
+        try:
+            session, _ = self._get_or_create_session()
+            self._count_pages(len(index_list))
+            referer = self.headers.get("Referer", "")
+            if referer:
+                # Referer 페이지는 배치마다 한 번만 방문
+                is_ok, reason = URLSafety.check_url(referer, allow_private=self.allow_private_ips, allowed_hosts_raw=self.allowed_hosts_raw)
+                if not is_ok:
+                    LOGGER.warning("Blocked referer URL: %s (%s)", referer, reason)
+                    return results
+                LOGGER.debug("visiting referer page '%s'", referer)
+                self._apply_site_cookies(session["context"], referer)
+                session["page"].goto(referer, wait_until=self.wait_until, timeout=self.timeout * 1000)  # type: ignore[arg-type]
+                self._wait_for_cloudflare(session["page"])
+                self._write_cookies_to_file(session["context"], referer)
+        except (PlaywrightError, PlaywrightTimeoutError, OSError) as e:
+            LOGGER.warning("<!-- Warning: can't start headless browser session, %r -->", e)
+            return results
+
+        pool = self._get_page_pool(session)
+        challenge_cleared = True
+        for batch_start in range(0, len(index_list), pool.max_size):
+            started: list[tuple[int, Page]] = []
+            # 아직 풀에 돌려주지 않은 페이지 (오류가 나면 이 페이지들만 버림)
+            checked_out_pages: list[Page] = []
+            try:
+                for i in index_list[batch_start : batch_start + pool.max_size]:
+                    page = pool.checkout()
+                    checked_out_pages.append(page)
+                    try:
+                        LOGGER.debug("starting to load the page '%s'", url_list[i])
+                        self._apply_site_cookies(page.context, url_list[i])
+                        page.goto(url_list[i], wait_until="commit", timeout=self.timeout * 1000)
+                        started.append((i, page))
+                    except (PlaywrightError, PlaywrightTimeoutError) as e:
+                        LOGGER.warning("<!-- Warning: can't connect to '%s' for temporary network error -->", url_list[i])
+                        LOGGER.warning("<!-- %r -->", e)
+                        checked_out_pages.remove(page)
+                        pool.checkin(page)
+
+                for i, page in started:
+                    reusable = True
+                    try:
+                        if self.wait_until != "commit":
+                            page.wait_for_load_state(self.wait_until, timeout=self.timeout * 1000)  # type: ignore[arg-type]
+                        results[i], cleared = self._render_loaded_page(page, page.context, url_list[i])
+                        challenge_cleared = challenge_cleared and cleared
+                    except (PlaywrightError, PlaywrightTimeoutError) as e:
+                        LOGGER.warning("<!-- Warning: can't get result from web page '%s' for renderer crash or error -->", url_list[i])
+                        LOGGER.warning("<!-- %r -->", e)
+                        reusable = False
+                    finally:
+                        checked_out_pages.remove(page)
+                        pool.checkin(page, reusable=reusable)
+            except (PlaywrightError, PlaywrightTimeoutError, OSError) as e:
+                # 페이지를 새로 만들거나 풀을 다루다가 브라우저가 죽은 경우 (코드 오류는 그대로 올려보냄)
+                # 이미 돌려준 페이지를 다시 돌려주면 닫힌 페이지가 풀에 남으므로 아직 빌린 페이지만 버림
+                LOGGER.error("Unexpected error in make_requests: %s", e)
+                for page in checked_out_pages:
+                    pool.checkin(page, reusable=False)
+                break
+            if not challenge_cleared:
+                # 같은 세션으로는 통과하기 어려우므로 세션을 닫고 나머지는 호출한 쪽의 재시도에 맡김
+                self._cleanup_cached_session()
+                break
+        return results
+
 
 # ---------------------------------------------------------------------------
 # Engine selection & fallback facade
@@ -718,6 +1330,8 @@ class HeadlessBrowser:
     COOKIE_FILE: str = ENGINE_COOKIE_FILES[_resolve_engine_order()[0]]
 
     def __init__(self, **kwargs: Any) -> None:
+        # 호스트별로 마지막에 성공한 엔진을 먼저 시도하기 위한 기록 (엔진에는 넘기지 않음)
+        self._fetch_strategy: Optional[FetchStrategy] = kwargs.pop("fetch_strategy", None)
         self._kwargs = kwargs
         self._engine_order = _resolve_engine_order()
         self._engines: dict[str, HeadlessBrowserBase] = {}
@@ -747,8 +1361,19 @@ class HeadlessBrowser:
                 return engine
         raise ImportError("no headless browser engine is available (install camoufox or cloakbrowser)")
 
-    def make_request(self, url: str, download_file: Optional[Path] = None) -> str:
+    def _get_engine_order(self, url: str) -> tuple[list[str], str]:
+        # 사용할 수 있는 엔진을 시도할 순서대로 돌려줌 -> (엔진 이름 목록, 이 호스트에서 마지막으로 성공한 엔진)
+        # 마지막으로 성공한 엔진을 먼저 시도해서 실패하는 우선 엔진의 타임아웃을 매번 기다리지 않음 (기록이 만료되면 원래 순서로 다시 시험)
         available = [n for n in self._engine_order if _load_engine_class(n) is not None]
+        learned = self._fetch_strategy.get_engine(url) if self._fetch_strategy else ""
+        if learned in available and learned != available[0]:
+            LOGGER.debug("trying headless engine '%s' first, which succeeded for '%s' last time", learned, url)
+            available.remove(learned)
+            available.insert(0, learned)
+        return available, learned
+
+    def make_request(self, url: str, download_file: Optional[Path] = None) -> str:
+        available, learned = self._get_engine_order(url)
         result = ""
         for i, name in enumerate(available):
             engine = self._engine(name)
@@ -756,6 +1381,8 @@ class HeadlessBrowser:
                 continue
             result = engine.make_request(url, download_file=download_file)
             if result:
+                if self._fetch_strategy and name != learned:
+                    self._fetch_strategy.record_engine(url, name)
                 return result
             if i < len(available) - 1:
                 # Tear down this engine's cached session before trying the next one. Both
@@ -768,9 +1395,21 @@ class HeadlessBrowser:
                 LOGGER.warning("headless engine '%s' returned empty for '%s'; falling back to '%s'", name, url, available[i + 1])
         return result
 
+    def make_requests(self, url_list: list[str]) -> list[str]:
+        # 페이지 풀은 첫 URL의 호스트에서 먼저 시도할 엔진에서만 사용하고, 빈 결과는 호출한 쪽에서 make_request()로 재시도함 (엔진 fallback 포함)
+        available, _ = self._get_engine_order(url_list[0]) if url_list else ([], "")
+        engine = self._engine(available[0]) if available else None
+        return (engine or self._primary).make_requests(url_list)
+
     def login(self, config: dict[str, str]) -> bool:
         return self._primary.login(config)
 
+    def get_cookies(self, url: str) -> dict[str, str]:
+        # 이 호스트에서 먼저 시도할 엔진의 쿠키를 사용
+        available, _ = self._get_engine_order(url)
+        engine = self._engine(available[0]) if available else None
+        return (engine or self._primary).get_cookies(url)
+
     def _get_cookie_dir(self) -> Path:
         return self._primary._get_cookie_dir()
 
@@ -784,6 +1423,30 @@ class HeadlessBrowser:
             if engine_cls is not None:
                 engine_cls.recycle_session()
 
+    @classmethod
+    def recycle_session_by_policy(cls, policy: Optional[SessionRecyclePolicy] = None) -> None:
+        # 피드가 끝날 때마다 recycle_session() 대신 호출: 정책에 걸린 엔진의 세션만 닫음
+        policy = policy if policy is not None else SessionRecyclePolicy()
+        rss_mb = SessionRecyclePolicy.get_browser_rss_mb() if policy.max_rss_mb > 0 else 0
+        for name in _ENGINE_NAMES:
+            engine_cls = _load_engine_class(name)
+            if engine_cls is not None:
+                reason = engine_cls.recycle_session_by_policy(policy, rss_mb)
+                if reason:
+                    LOGGER.info("recycling headless browser session of '%s' (%s)", name, reason)
+
+    @staticmethod
+    def get_session_stats() -> dict[str, int]:
+        with _session_stats_lock:
+            return dict(_session_stats)
+
+    @staticmethod
+    def add_session_stats(stats: dict[str, int]) -> None:
+        # 다른 프로세스(-j의 워커)에서 센 세션 통계를 더함
+        with _session_stats_lock:
+            for key in _session_stats:
+                _session_stats[key] += int(stats.get(key, 0) or 0)
+
     @classmethod
     def cleanup_all_sessions(cls) -> None:
         for name in _ENGINE_NAMES:
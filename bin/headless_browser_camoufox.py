@@ -4,7 +4,7 @@ import threading
 from typing import Any
 
 from bin.feed_maker_util import Env
-from bin.headless_browser import ENGINE_COOKIE_FILES, LOGGER, HeadlessBrowserBase
+from bin.headless_browser import ENGINE_COOKIE_FILES, LOGGER, HeadlessBrowserBase, Page
 
 try:
     from camoufox.sync_api import Camoufox
@@ -60,6 +60,24 @@ class HeadlessBrowserCamoufox(HeadlessBrowserBase):
         # camoufox _close_session below stops it. Keeps the same dict shape as the other engine.
         return {"playwright": cam, "context": context, "page": page}
 
+    def _new_pool_page(self, session: dict[str, Any]) -> Page:
+        # browser.new_page()는 페이지마다 별도 context를 만들므로 풀의 페이지끼리 쿠키/localStorage가 섞이지 않음
+        # (쿠키는 세션과 같은 쿠키 파일에서 읽어 옴)
+        page = session["context"].browser.new_page(no_viewport=True)
+        context = page.context
+        context.set_default_timeout(self.timeout * 1000)
+        context.set_default_navigation_timeout(self.timeout * 1000)
+        self._read_cookies_from_file(context)
+        if self.blob_to_dataurl:
+            context.add_init_script(self.BLOB_INTERCEPTOR_INIT_SCRIPT)
+        self._install_request_routing(context)
+        self._register_dialog_handlers(page)
+        return page
+
+    @staticmethod
+    def _close_pool_page(page: Page) -> None:
+        page.context.close()
+
     @staticmethod
     def _stop_camoufox(cam: Any) -> None:
         # Camoufox subclasses playwright's sync PlaywrightContextManager: .start() is
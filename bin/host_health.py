@@ -0,0 +1,148 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+
+import os
+import json
+import time
+import fcntl
+import logging.config
+from pathlib import Path
+from typing import Any, Optional
+from urllib.parse import urlsplit
+
+from bin.feed_maker_util import Env, PathUtil
+
+logging.config.fileConfig(Path(__file__).parent.parent / "logging.conf")
+LOGGER = logging.getLogger()
+
+
+class HostHealth:
+    """호스트별 서킷 브레이커 (FM_WORK_DIR 아래 호스트별 상태 파일을 flock으로 잠가서 모든 프로세스가 같은 상태를 공유)
+
+    연결 실패나 타임아웃이 FM_CRAWLER_CIRCUIT_FAILURE_THRESHOLD번 연속되면 서킷을 열고 FM_CRAWLER_CIRCUIT_COOL_DOWN초 동안
+    그 호스트로의 요청을 바로 실패시킴. 대기 시간이 지나면 한 요청만 시험 삼아 보내고, 성공하면 닫고 실패하면 다시 엶
+    """
+
+    STATE_DIR_NAME = ".host_health"
+    STATE_FILE_SUFFIX = ".json"
+    DEFAULT_FAILURE_THRESHOLD = 3
+    DEFAULT_COOL_DOWN_SEC = 300
+    # 시험 요청의 결과를 기다리는 최대 시간 (이 시간이 지나도 결과가 없으면 다른 요청이 다시 시험함)
+    DEFAULT_PROBE_TIMEOUT_SEC = 60
+
+    def __init__(self, state_dir_path: Optional[Path] = None, failure_threshold: Optional[int] = None, cool_down: Optional[float] = None) -> None:
+        self.state_dir_path: Path = state_dir_path if state_dir_path else Path(Env.get("FM_WORK_DIR")) / HostHealth.STATE_DIR_NAME
+        if failure_threshold is None:
+            try:
+                failure_threshold = int(Env.get("FM_CRAWLER_CIRCUIT_FAILURE_THRESHOLD", str(HostHealth.DEFAULT_FAILURE_THRESHOLD)) or HostHealth.DEFAULT_FAILURE_THRESHOLD)
+            except ValueError:
+                failure_threshold = HostHealth.DEFAULT_FAILURE_THRESHOLD
+        if cool_down is None:
+            try:
+                cool_down = float(Env.get("FM_CRAWLER_CIRCUIT_COOL_DOWN", str(HostHealth.DEFAULT_COOL_DOWN_SEC)) or HostHealth.DEFAULT_COOL_DOWN_SEC)
+            except ValueError:
+                cool_down = HostHealth.DEFAULT_COOL_DOWN_SEC
+        # 0 이하이면 서킷 브레이커를 사용하지 않음
+        self.failure_threshold: int = failure_threshold
+        self.cool_down: float = cool_down
+
+    @property
+    def is_enabled(self) -> bool:
+        return self.failure_threshold > 0 and self.cool_down > 0
+
+    @staticmethod
+    def _get_host(url: str) -> str:
+        return (urlsplit(url).hostname or "").lower()
+
+    def _get_state_file_path(self, host: str) -> Path:
+        return self.state_dir_path / (host + HostHealth.STATE_FILE_SUFFIX)
+
+    def _has_state(self, host: str) -> bool:
+        # 기록이 없거나 빈 상태 파일이면 정상 호스트이므로 잠그지 않고 넘어감
+        try:
+            return self._get_state_file_path(host).stat().st_size > 0
+        except OSError:
+            return False
+
+    def _update_state(self, host: str, update: Any) -> Any:
+        # 상태 파일을 잠근 채로 읽고, update(state)가 돌려준 새 상태를 기록 (None이면 파일을 비움)
+        # 파일을 지우면 이미 그 경로를 연 다른 프로세스가 연결이 끊어진 파일을 잠그고 기록해서 실패 횟수를 잃으므로 같은 파일을 비우기만 함
+        state_file_path = self._get_state_file_path(host)
+        self.state_dir_path.mkdir(parents=True, exist_ok=True)
+        fd = os.open(state_file_path, os.O_RDWR | os.O_CREAT, 0o644)
+        try:
+            fcntl.flock(fd, fcntl.LOCK_EX)
+            try:
+                state = json.loads(os.read(fd, 4096).decode("utf-8") or "{}")
+            except ValueError:
+                state = {}
+            if not isinstance(state, dict):
+                state = {}
+            new_state, result = update(state)
+            os.lseek(fd, 0, os.SEEK_SET)
+            os.ftruncate(fd, 0)
+            if new_state:
+                os.write(fd, json.dumps(new_state).encode("utf-8"))
+        finally:
+            os.close(fd)
+        return result
+
+    def check(self, url: str, probe_timeout: Optional[float] = None) -> str:
+        """요청을 보내도 되면 빈 문자열, 서킷이 열려 있으면 오류 메시지를 돌려줌"""
+        host = HostHealth._get_host(url)
+        if not host or not self.is_enabled:
+            return ""
+        if not self._has_state(host):
+            return ""
+        probe_timeout = probe_timeout or HostHealth.DEFAULT_PROBE_TIMEOUT_SEC
+
+        def update(state: dict[str, Any]) -> tuple[Optional[dict[str, Any]], str]:
+            opened_at = float(state.get("opened_at", 0) or 0)
+            if not opened_at:
+                return state, ""
+            now = time.time()
+            if now < opened_at + self.cool_down:
+                return state, f"circuit open for '{host}' after {state.get('failures', 0)} consecutive failures, retry after {opened_at + self.cool_down - now:.0f} seconds"
+            if now < float(state.get("probe_until", 0) or 0):
+                return state, f"circuit open for '{host}', waiting for the probe request"
+            # 대기 시간이 지났으므로 이 요청 하나만 시험 삼아 보냄
+            LOGGER.info("probing '%s' after circuit cool-down", host)
+            return {**state, "probe_until": now + probe_timeout}, ""
+
+        try:
+            return self._update_state(host, update)
+        except OSError as e:
+            LOGGER.warning("Warning: can't use host health state in '%s', %r", PathUtil.short_path(self.state_dir_path), e)
+            return ""
+
+    def record_success(self, url: str) -> None:
+        host = HostHealth._get_host(url)
+        if not host or not self.is_enabled:
+            return
+        if not self._has_state(host):
+            return
+        try:
+            self._update_state(host, lambda state: (None, None))
+        except OSError as e:
+            LOGGER.warning("Warning: can't use host health state in '%s', %r", PathUtil.short_path(self.state_dir_path), e)
+
+    def record_failure(self, url: str) -> None:
+        # 연결 실패와 타임아웃만 기록함 (HTTP 오류 응답은 호스트가 살아 있다는 뜻)
+        host = HostHealth._get_host(url)
+        if not host or not self.is_enabled:
+            return
+
+        def update(state: dict[str, Any]) -> tuple[dict[str, Any], None]:
+            failures = int(state.get("failures", 0) or 0) + 1
+            new_state: dict[str, Any] = {"failures": failures}
+            if failures >= self.failure_threshold:
+                if not state.get("opened_at") or state.get("probe_until"):
+                    LOGGER.warning("Warning: opening circuit for '%s' after %d consecutive failures", host, failures)
+                new_state["opened_at"] = time.time()
+            return new_state, None
+
+        try:
+            self._update_state(host, update)
+        except OSError as e:
+            LOGGER.warning("Warning: can't use host health state in '%s', %r", PathUtil.short_path(self.state_dir_path), e)
@@ -4,6 +4,8 @@
 
 import re
 import sys
+import json
+import hashlib
 import logging.config
 from pathlib import Path
 from typing import Any
@@ -17,6 +19,8 @@ LOGGER = logging.getLogger()
 
 
 class NewlistCollector:
+    CONDITIONAL_GET_CACHE_FILE = "list_conditional_get_cache.json"
+
     def __init__(self, feed_dir_path: Path, collection_conf: dict[str, Any], new_list_file_path: Path) -> None:
         LOGGER.debug("# NewlistCollector(feed_dir_path=%s, collection_conf=%r, new_list_file_path=%s", PathUtil.short_path(feed_dir_path), collection_conf, PathUtil.short_path(new_list_file_path))
         self.feed_dir_path: Path = feed_dir_path
@@ -50,6 +54,61 @@ class NewlistCollector:
             result_list.append((link, title, metadata))
         return result_list
 
+    def _get_conf_fingerprint(self) -> str:
+        # 수집 설정(item_capture_script, post_process_script_list 등)이 바뀌면 저장된 항목을 재사용하지 않음
+        conf_str = json.dumps(self.collection_conf, sort_keys=True, ensure_ascii=False, default=str)
+        return hashlib.md5(conf_str.encode("utf-8"), usedforsecurity=False).hexdigest()
+
+    def _load_conditional_get_cache(self) -> dict[str, dict[str, Any]]:
+        cache_file_path = self.feed_dir_path / NewlistCollector.CONDITIONAL_GET_CACHE_FILE
+        if not cache_file_path.is_file():
+            return {}
+        try:
+            with cache_file_path.open("r", encoding="utf-8") as infile:
+                cache = json.load(infile)
+        except (IOError, json.JSONDecodeError) as e:
+            LOGGER.warning("Warning: can't read conditional GET cache file '%s', %r", PathUtil.short_path(cache_file_path), e)
+            return {}
+        if not isinstance(cache, dict) or cache.get("fingerprint") != self._get_conf_fingerprint():
+            return {}
+        return cache.get("urls", {})
+
+    def _save_conditional_get_cache(self, url_cache: dict[str, dict[str, Any]]) -> None:
+        cache_file_path = self.feed_dir_path / NewlistCollector.CONDITIONAL_GET_CACHE_FILE
+        if not url_cache:
+            cache_file_path.unlink(missing_ok=True)
+            return
+        temp_file_path = cache_file_path.with_suffix(".tmp")
+        try:
+            with temp_file_path.open("w", encoding="utf-8") as outfile:
+                json.dump({"fingerprint": self._get_conf_fingerprint(), "urls": url_cache}, outfile, ensure_ascii=False)
+            temp_file_path.replace(cache_file_path)
+        except IOError as e:
+            LOGGER.warning("Warning: can't write conditional GET cache file '%s', %r", PathUtil.short_path(cache_file_path), e)
+            temp_file_path.unlink(missing_ok=True)
+
+    @staticmethod
+    def _get_validators(headers: Any) -> dict[str, str]:
+        validators: dict[str, str] = {}
+        if not isinstance(headers, dict):
+            return validators
+        for k, v in headers.items():
+            if isinstance(k, str) and isinstance(v, str) and v:
+                if k.lower() == "etag":
+                    validators["etag"] = v
+                elif k.lower() == "last-modified":
+                    validators["last_modified"] = v
+        return validators
+
+    @staticmethod
+    def _get_conditional_headers(cached: dict[str, Any]) -> dict[str, str]:
+        conditional_headers: dict[str, str] = {}
+        if cached.get("etag"):
+            conditional_headers["If-None-Match"] = cached["etag"]
+        if cached.get("last_modified"):
+            conditional_headers["If-Modified-Since"] = cached["last_modified"]
+        return conditional_headers
+
     def _compose_url_list(self) -> list[tuple[str, str, list[str]]]:
         LOGGER.debug("# compose_url_list()")
 
@@ -73,15 +132,32 @@ class NewlistCollector:
             disable_headless=conf.get("disable_headless", False),
             blob_to_dataurl=conf.get("blob_to_dataurl", False),
             wait_until=conf.get("wait_until", "domcontentloaded"),
+            cache_ttl=conf.get("cache_ttl", 0),
+            blocked_resource_types=conf.get("blocked_resource_types", []),
+            blocked_domains=conf.get("blocked_domains", []),
+            scroll_timeout=conf.get("scroll_timeout", 0),
         )
         option_str = Crawler.get_option_str(self.collection_conf)
+        # headless browser는 상태 코드를 알 수 없으므로 requests 기반 수집에서만 conditional GET 사용
+        use_conditional_get = not conf.get("render_js", False)
+        url_cache = self._load_conditional_get_cache() if use_conditional_get else {}
+        new_url_cache: dict[str, dict[str, Any]] = {}
         for url in conf.get("list_url_list", []):
             crawler_cmd = f"crawler.py -f '{self.feed_dir_path}' {option_str} '{url}'"
             LOGGER.debug("cmd=%s", crawler_cmd)
+            cached = url_cache.get(url, {})
             try:
-                result, error, _ = crawler.run(url)
+                result, error, _ = crawler.run(url, extra_headers=self._get_conditional_headers(cached) or None)
+                if not result and cached and crawler.last_status_code == 304:
+                    # 변경되지 않은 목록 페이지는 item_capture_script와 후처리 없이 지난 결과를 재사용
+                    LOGGER.info("list page '%s' not modified, reusing %d items", url, len(cached["items"]))
+                    result_list.extend((link, title, metadata) for link, title, metadata in cached["items"])
+                    new_url_cache[url] = cached
+                    continue
                 if not result:
                     LOGGER.error("Warning: can't get result from web page '%s', %s", url, error)
+                    if cached:
+                        new_url_cache[url] = cached
                     continue
             except UnicodeDecodeError as e:
                 LOGGER.error(e)
@@ -116,6 +192,13 @@ class NewlistCollector:
             url_list = self.split_result_into_items(result)
             result_list.extend(url_list)
 
+            validators = self._get_validators(crawler.last_response_headers) if use_conditional_get else {}
+            if validators and url_list:
+                new_url_cache[url] = {**validators, "items": url_list}
+
+        if use_conditional_get:
+            self._save_conditional_get_cache(new_url_cache)
+
         if not result_list:
             LOGGER.error("Error: Can't get new list from '%r'", conf.get("list_url_list", []))
             return []
@@ -0,0 +1,118 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+
+import os
+import time
+import fcntl
+import logging.config
+from pathlib import Path
+from typing import Optional
+from urllib.parse import urlsplit
+
+from bin.feed_maker_util import Env, PathUtil
+
+logging.config.fileConfig(Path(__file__).parent.parent / "logging.conf")
+LOGGER = logging.getLogger()
+
+
+class RateLimiter:
+    """호스트별 토큰 버킷 요청 제한기 (FM_WORK_DIR 아래 호스트별 상태 파일을 flock으로 잠가서 모든 프로세스가 같은 예산을 공유)
+
+    FM_RATE_LIMITS="comic.naver.com=2:5,.example.com=0.5" 형식으로 도메인별 초당 요청 수와 버스트 크기를 지정하고
+    ('.'으로 시작하면 하위 도메인 포함), 지정하지 않은 호스트는 FM_RATE_LIMIT_DEFAULT를 따름 (비어 있으면 제한 없음)
+    """
+
+    STATE_DIR_NAME = ".rate_limit"
+    STATE_FILE_SUFFIX = ".tat"
+    DEFAULT_BURST = 1
+
+    def __init__(self, state_dir_path: Optional[Path] = None, rate_limits_raw: Optional[str] = None, default_rate_limit_raw: Optional[str] = None) -> None:
+        self.state_dir_path: Path = state_dir_path if state_dir_path else Path(Env.get("FM_WORK_DIR")) / RateLimiter.STATE_DIR_NAME
+        self.exact_map, self.suffix_map = RateLimiter.parse_rate_limits(Env.get("FM_RATE_LIMITS", "") if rate_limits_raw is None else rate_limits_raw)
+        self.default_rate_limit: Optional[tuple[float, int]] = RateLimiter.parse_rate_limit(Env.get("FM_RATE_LIMIT_DEFAULT", "") if default_rate_limit_raw is None else default_rate_limit_raw)
+
+    @staticmethod
+    def parse_rate_limit(spec: str) -> Optional[tuple[float, int]]:
+        # "초당 요청 수[:버스트]", 0 이하이거나 잘못된 값이면 제한하지 않음
+        rate_str, _, burst_str = spec.strip().partition(":")
+        try:
+            rate = float(rate_str)
+            burst = int(burst_str) if burst_str else RateLimiter.DEFAULT_BURST
+        except ValueError:
+            return None
+        if rate <= 0:
+            return None
+        return rate, max(burst, 1)
+
+    @staticmethod
+    def parse_rate_limits(raw: str) -> tuple[dict[str, Optional[tuple[float, int]]], dict[str, Optional[tuple[float, int]]]]:
+        exact_map: dict[str, Optional[tuple[float, int]]] = {}
+        suffix_map: dict[str, Optional[tuple[float, int]]] = {}
+        for token in (t.strip() for t in raw.split(",")):
+            host, sep, spec = token.partition("=")
+            host = host.strip().lower()
+            if not sep or not host:
+                continue
+            rate_limit = RateLimiter.parse_rate_limit(spec)
+            if rate_limit is None and spec.strip() not in ("0", ""):
+                LOGGER.warning("Warning: invalid rate limit '%s' for '%s' in FM_RATE_LIMITS", spec, host)
+            if host.startswith("."):
+                suffix_map[host] = rate_limit
+            else:
+                exact_map[host] = rate_limit
+        return exact_map, suffix_map
+
+    def get_rate_limit(self, host: str) -> Optional[tuple[float, int]]:
+        host = host.lower()
+        if host in self.exact_map:
+            return self.exact_map[host]
+        # 가장 구체적인(긴) 접미사를 우선 적용
+        for suffix in sorted(self.suffix_map, key=len, reverse=True):
+            if host.endswith(suffix) or host == suffix[1:]:
+                return self.suffix_map[suffix]
+        return self.default_rate_limit
+
+    def _reserve(self, host: str, rate: float, burst: int) -> float:
+        # GCRA 방식의 토큰 버킷: 파일에는 다음 요청의 이론적 도착 시각(TAT)만 기록하고, 예약한 만큼 대기 시간을 돌려줌
+        interval = 1.0 / rate
+        state_file_path = self.state_dir_path / (host + RateLimiter.STATE_FILE_SUFFIX)
+        self.state_dir_path.mkdir(parents=True, exist_ok=True)
+        fd = os.open(state_file_path, os.O_RDWR | os.O_CREAT, 0o644)
+        try:
+            fcntl.flock(fd, fcntl.LOCK_EX)
+            try:
+                tat = float(os.read(fd, 64).decode("ascii") or 0)
+            except ValueError:
+                tat = 0.0
+            now = time.time()
+            tat = max(tat, now)
+            wait = max(0.0, tat - (burst - 1) * interval - now)
+            new_tat = tat + interval
+            os.lseek(fd, 0, os.SEEK_SET)
+            os.ftruncate(fd, 0)
+            os.write(fd, repr(new_tat).encode("ascii"))
+        finally:
+            os.close(fd)
+        return wait
+
+    def reserve(self, url: str) -> float:
+        # 요청 한 건의 순서를 예약하고 대기해야 할 시간을 돌려줌 (asyncio에서는 직접 기다림)
+        host = (urlsplit(url).hostname or "").lower()
+        rate_limit = self.get_rate_limit(host) if host else None
+        if rate_limit is None:
+            return 0.0
+        try:
+            wait = self._reserve(host, *rate_limit)
+        except OSError as e:
+            LOGGER.warning("Warning: can't use rate limit state in '%s', %r", PathUtil.short_path(self.state_dir_path), e)
+            return 0.0
+        if wait > 0:
+            LOGGER.debug("rate limiting requests to '%s' for %.2f seconds", host, wait)
+        return wait
+
+    def acquire(self, url: str) -> float:
+        wait = self.reserve(url)
+        if wait > 0:
+            time.sleep(wait)
+        return wait
@@ -0,0 +1,151 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+
+import os
+import gzip
+import json
+import time
+import hashlib
+import tempfile
+import threading
+import logging.config
+from pathlib import Path
+from typing import Any, Optional
+from urllib.parse import urlsplit, urlunsplit, parse_qsl, urlencode
+
+from bin.feed_maker_util import Env, PathUtil
+
+logging.config.fileConfig(Path(__file__).parent.parent / "logging.conf")
+LOGGER = logging.getLogger()
+
+
+class ResponseCache:
+    """FM_WORK_DIR 아래에 gzip으로 저장하는 피드 공용 HTTP 응답 캐시 (TTL은 조회 시 지정, 크기 초과 시 LRU 삭제)"""
+
+    CACHE_DIR_NAME = ".response_cache"
+    ENTRY_SUFFIX = ".json.gz"
+    DEFAULT_MAX_SIZE_MB = 512
+    # 삭제할 때는 한도의 90%까지 줄여서 매 저장마다 삭제가 일어나지 않게 함
+    EVICTION_TARGET_RATIO = 0.9
+    # 요청마다 바뀌거나 본문과 무관한 헤더는 키에서 제외 (Referer는 요청 중에 percent-encode되어 바뀔 수 있음)
+    # Cookie는 로그인 여부에 따라 본문이 달라지므로 키에 포함해서 다른 쿠키로 받은 응답을 다른 피드에 주지 않음
+    IGNORED_HEADERS = frozenset(("referer", "if-none-match", "if-modified-since"))
+
+    # 캐시 디렉토리별 추정 크기 (프로세스 안에서 매번 디렉토리를 훑지 않도록)
+    _size_map: dict[Path, int] = {}
+    _lock = threading.Lock()
+
+    def __init__(self, cache_dir_path: Optional[Path] = None, max_size_mb: Optional[int] = None) -> None:
+        self.cache_dir_path: Path = cache_dir_path if cache_dir_path else Path(Env.get("FM_WORK_DIR")) / ResponseCache.CACHE_DIR_NAME
+        if max_size_mb is None:
+            try:
+                max_size_mb = int(Env.get("FM_RESPONSE_CACHE_MAX_SIZE_MB", str(ResponseCache.DEFAULT_MAX_SIZE_MB)) or ResponseCache.DEFAULT_MAX_SIZE_MB)
+            except ValueError:
+                max_size_mb = ResponseCache.DEFAULT_MAX_SIZE_MB
+        self.max_size: int = max_size_mb * 1024 * 1024
+
+    @staticmethod
+    def normalize_url(url: str) -> str:
+        parts = urlsplit(url.strip())
+        scheme = parts.scheme.lower()
+        netloc = (parts.hostname or "").lower()
+        if parts.port and not ((scheme == "http" and parts.port == 80) or (scheme == "https" and parts.port == 443)):
+            netloc += f":{parts.port}"
+        if parts.username:
+            netloc = f"{parts.username}{':' + parts.password if parts.password else ''}@{netloc}"
+        query = urlencode(sorted(parse_qsl(parts.query, keep_blank_values=True)))
+        return urlunsplit((scheme, netloc, parts.path or "/", query, ""))
+
+    @staticmethod
+    def get_key(url: str, headers: Optional[dict[str, str]] = None, encoding: str = "") -> str:
+        # 값이 빈 헤더(보낼 쿠키가 없는 경우 등)는 헤더가 없는 것과 같음
+        header_items = sorted((k.lower(), str(v)) for k, v in (headers or {}).items() if k.lower() not in ResponseCache.IGNORED_HEADERS and str(v))
+        key_str = json.dumps([ResponseCache.normalize_url(url), header_items, encoding.lower()], ensure_ascii=False)
+        return hashlib.sha256(key_str.encode("utf-8")).hexdigest()
+
+    def _get_entry_path(self, key: str) -> Path:
+        return self.cache_dir_path / key[:2] / (key + ResponseCache.ENTRY_SUFFIX)
+
+    def get(self, url: str, headers: Optional[dict[str, str]] = None, encoding: str = "", ttl: int = 0) -> Optional[tuple[str, dict[str, str]]]:
+        if ttl <= 0:
+            return None
+        entry_path = self._get_entry_path(ResponseCache.get_key(url, headers, encoding))
+        try:
+            with gzip.open(entry_path, "rt", encoding="utf-8") as infile:
+                entry: dict[str, Any] = json.load(infile)
+        except FileNotFoundError:
+            return None
+        except (OSError, EOFError, json.JSONDecodeError) as e:
+            LOGGER.warning("Warning: removing broken response cache entry '%s', %r", PathUtil.short_path(entry_path), e)
+            entry_path.unlink(missing_ok=True)
+            return None
+
+        if time.time() - entry.get("stored_at", 0) > ttl:
+            return None
+        # 최근 사용 시각을 mtime으로 기록해서 LRU 삭제에 사용
+        try:
+            os.utime(entry_path)
+        except OSError:
+            pass
+        LOGGER.debug("response cache hit for '%s'", url)
+        return entry.get("body", ""), entry.get("headers", {})
+
+    def put(self, url: str, body: str, response_headers: Optional[dict[str, str]] = None, headers: Optional[dict[str, str]] = None, encoding: str = "") -> None:
+        entry_path = self._get_entry_path(ResponseCache.get_key(url, headers, encoding))
+        entry = {"url": url, "stored_at": time.time(), "headers": dict(response_headers or {}), "body": body}
+        try:
+            entry_path.parent.mkdir(parents=True, exist_ok=True)
+            old_size = entry_path.stat().st_size if entry_path.is_file() else 0
+            fd, temp_file_name = tempfile.mkstemp(dir=entry_path.parent, suffix=".tmp")
+            try:
+                with os.fdopen(fd, "wb") as outfile:
+                    outfile.write(gzip.compress(json.dumps(entry, ensure_ascii=False).encode("utf-8")))
+                os.replace(temp_file_name, entry_path)
+            except BaseException:
+                Path(temp_file_name).unlink(missing_ok=True)
+                raise
+            new_size = entry_path.stat().st_size
+        except OSError as e:
+            LOGGER.warning("Warning: can't write response cache entry for '%s', %r", url, e)
+            return
+
+        with ResponseCache._lock:
+            if self.cache_dir_path not in ResponseCache._size_map:
+                ResponseCache._size_map[self.cache_dir_path] = self._scan_total_size()
+            else:
+                ResponseCache._size_map[self.cache_dir_path] += new_size - old_size
+            if ResponseCache._size_map[self.cache_dir_path] > self.max_size:
+                ResponseCache._size_map[self.cache_dir_path] = self._evict(int(self.max_size * ResponseCache.EVICTION_TARGET_RATIO))
+
+    def _list_entries(self) -> list[tuple[float, int, Path]]:
+        entries: list[tuple[float, int, Path]] = []
+        for entry_path in self.cache_dir_path.glob("*/*" + ResponseCache.ENTRY_SUFFIX):
+            try:
+                st = entry_path.stat()
+            except OSError:
+                continue
+            entries.append((st.st_mtime, st.st_size, entry_path))
+        return entries
+
+    def _scan_total_size(self) -> int:
+        return sum(size for _, size, _ in self._list_entries())
+
+    def _evict(self, target_size: int) -> int:
+        entries = sorted(self._list_entries())
+        total_size = sum(size for _, size, _ in entries)
+        num_removed = 0
+        for _, size, entry_path in entries:
+            if total_size <= target_size:
+                break
+            entry_path.unlink(missing_ok=True)
+            total_size -= size
+            num_removed += 1
+        LOGGER.info("Evicted %d response cache entries, %d bytes left in '%s'", num_removed, total_size, PathUtil.short_path(self.cache_dir_path))
+        return total_size
+
+    def clear(self) -> None:
+        for _, _, entry_path in self._list_entries():
+            entry_path.unlink(missing_ok=True)
+        with ResponseCache._lock:
+            ResponseCache._size_map.pop(self.cache_dir_path, None)
@@ -1,15 +1,22 @@
 #!/usr/bin/env python
 
 
+import os
 import sys
+import json
+import time
 from datetime import datetime, timedelta, timezone
 import random
 import logging.config
 import getopt
+import multiprocessing
+from multiprocessing.connection import wait
+from multiprocessing.process import BaseProcess
 from pathlib import Path
 from typing import Any, Optional
+import psutil
 from filelock import FileLock, Timeout
-from bin.feed_maker_util import Config, PathUtil, FileManager, NotFoundConfigItemError, Env
+from bin.feed_maker_util import Config, PathUtil, FileManager, NotFoundConfigItemError, NotFoundConfigFileError, InvalidConfigFileError, Env, URL
 from bin.headless_browser import HeadlessBrowser
 from bin.notification import Notification
 from bin.feed_maker import FeedMaker
@@ -20,6 +27,13 @@ LOGGER = logging.getLogger()
 
 
 class FeedMakerRunner:
+    # 병렬 실행 시 워커 종료/제한 초과를 확인하는 주기
+    WORKER_POLL_INTERVAL_SEC = 1.0
+    SITE_CONF_FILE = "site_config.json"
+    # 같은 호스트를 대상으로 동시에 실행할 수 있는 피드 수의 기본값.
+    # 그룹의 site_config.json "max_feeds_per_host" 또는 FM_RUNNER_MAX_FEEDS_PER_HOST로 변경
+    DEFAULT_MAX_FEEDS_PER_HOST = 2
+
     def __init__(self, html_archiving_period: int, list_archiving_period: int) -> None:
         LOGGER.debug(f"# FeedMakerRunner(html_archiving_period={html_archiving_period}, list_archiving_period={list_archiving_period})")
         self.html_archiving_period = html_archiving_period
@@ -74,13 +88,20 @@ class FeedMakerRunner:
                 # make_feed.py 실행하여 feed 파일 생성
                 LOGGER.info("* making feed file '%s'", PathUtil.short_path(rss_file_path))
                 feed_maker = FeedMaker(feed_dir_path=feed_dir_path, do_collect_by_force=force_collection_opt, do_collect_only=collect_only_opt, rss_file_path=rss_file_path, window_size=window_size, do_extract_only=extract_only_opt)
+                is_made = False
                 try:
                     result = feed_maker.make()
+                    is_made = True
                 finally:
-                    # 피드 단위로 Chromium 세션을 재활용 — 같은 피드그룹 안에서 자원이 누적되어
+                    # 피드마다 브라우저를 다시 띄우지 않도록 세션을 이어 쓰되, 일정 수의 피드/페이지를 처리했거나
+                    # 메모리를 많이 쓰거나 브라우저가 죽었으면 재활용 — 같은 피드그룹 안에서 자원이 누적되어
                     # N번째 피드부터 page.evaluate/page.goto가 무한 대기에 빠지는 현상을 차단.
+                    # 피드가 예외로 끝나면 세션 상태를 믿을 수 없으므로 바로 재활용.
                     # user_data_dir은 보존되어 로그인 상태/쿠키는 유지됨.
-                    HeadlessBrowser.recycle_session()
+                    if is_made:
+                        HeadlessBrowser.recycle_session_by_policy()
+                    else:
+                        HeadlessBrowser.recycle_session()
 
                 # 불필요한 파일 삭제
                 FileManager.remove_temporary_files(feed_dir_path)
@@ -96,9 +117,193 @@ class FeedMakerRunner:
 
         return result
 
+    def _make_feed(self, feed_dir_path: Path) -> bool:
+        # 완결 피드는 강제 수집(-c)으로 한 번 더 돌린 뒤 일반 모드로 실행
+        feed_name = feed_dir_path.name
+        config = Config(feed_dir_path=feed_dir_path)
+        try:
+            collection_conf = config.get_collection_configs()
+        except NotFoundConfigItemError as e:
+            LOGGER.error(e)
+            return False
+
+        if collection_conf.get("is_completed", False):
+            result = self.make_single_feed(feed_dir_path, options={"force_collection_opt": "-c"})
+            if not result:
+                LOGGER.warning(f"Warning: can't make a feed '{feed_name} with all completed articles, {result}")
+                return False
+
+        result = self.make_single_feed(feed_dir_path, options={})
+        if not result:
+            LOGGER.warning(f"Warning: can't make a feed '{feed_name}' with recent articles, {result}")
+            return False
+        return True
+
+    def _run_feed_in_worker(self, feed_dir_path: Path, stats_queue: Optional[Any] = None) -> None:
+        # 워커 프로세스의 진입점. 종료 코드로 성공(0)/실패(1)를 부모에게 전달한다.
+        session_stats_before = HeadlessBrowser.get_session_stats()
+        result = self._make_feed(feed_dir_path)
+        # 워커는 atexit 정리 없이 종료되므로 이어 쓰려고 남겨 둔 브라우저 세션을 직접 닫음
+        HeadlessBrowser.recycle_session()
+        if stats_queue is not None:
+            # 이 워커에서 센 브라우저 세션 통계를 부모에게 보냄 (fork로 물려받은 값은 빼고)
+            session_stats = HeadlessBrowser.get_session_stats()
+            stats_queue.put({key: value - session_stats_before.get(key, 0) for key, value in session_stats.items()})
+        sys.exit(0 if result else 1)
+
+    @staticmethod
+    def _collect_session_stats(stats_queue: Any) -> None:
+        # 워커가 보낸 브라우저 세션 통계를 부모의 통계에 더함 (워커가 파이프가 차서 멈추지 않도록 매번 비움)
+        while not stats_queue.empty():
+            HeadlessBrowser.add_session_stats(stats_queue.get())
+
+    @staticmethod
+    def _get_process_tree_rss(pid: int) -> int:
+        # 워커가 띄운 headless browser, post-process 스크립트 등 자식 프로세스까지 합산
+        try:
+            proc = psutil.Process(pid)
+            procs = [proc] + proc.children(recursive=True)
+        except psutil.NoSuchProcess:
+            return 0
+        rss = 0
+        for p in procs:
+            try:
+                rss += p.memory_info().rss
+            except (psutil.NoSuchProcess, psutil.AccessDenied):
+                continue
+        return rss
+
+    @staticmethod
+    def _kill_worker(proc: BaseProcess) -> None:
+        # 워커 자신은 multiprocessing이 reap해야 하므로 psutil로 기다리지 않고 join으로 회수
+        try:
+            children = psutil.Process(proc.pid).children(recursive=True)
+        except psutil.NoSuchProcess:
+            children = []
+        for child in children:
+            try:
+                child.kill()
+            except psutil.NoSuchProcess:
+                pass
+        proc.kill()
+        proc.join()
+        psutil.wait_procs(children, timeout=5)
+
+    @staticmethod
+    def _get_feed_hosts(feed_dir_path: Path) -> list[str]:
+        try:
+            collection_conf = Config(feed_dir_path=feed_dir_path).get_collection_configs()
+        except (NotFoundConfigFileError, InvalidConfigFileError, NotFoundConfigItemError, json.JSONDecodeError):
+            return []
+        hosts: list[str] = []
+        for url in collection_conf.get("list_url_list", []) or []:
+            host = URL.get_url_domain(url).lower()
+            if host and host not in hosts:
+                hosts.append(host)
+        return hosts
+
+    def _get_max_feeds_per_host(self, group_dir_path: Path) -> int:
+        max_feeds_per_host = int(Env.get("FM_RUNNER_MAX_FEEDS_PER_HOST", str(self.DEFAULT_MAX_FEEDS_PER_HOST)) or self.DEFAULT_MAX_FEEDS_PER_HOST)
+        site_conf_file_path = group_dir_path / self.SITE_CONF_FILE
+        if site_conf_file_path.is_file():
+            try:
+                with site_conf_file_path.open("r", encoding="utf-8") as infile:
+                    site_conf = json.load(infile)
+                if "max_feeds_per_host" in site_conf:
+                    max_feeds_per_host = int(site_conf["max_feeds_per_host"])
+            except (json.JSONDecodeError, TypeError, ValueError, OSError) as e:
+                LOGGER.warning("Warning: can't read 'max_feeds_per_host' from '%s', %s", PathUtil.short_path(site_conf_file_path), e)
+        return max(max_feeds_per_host, 1)
+
+    @staticmethod
+    def _interleave_by_host(feed_dir_path_list: list[Path], feed_hosts_map: dict[Path, list[str]]) -> list[Path]:
+        # 대표 호스트별로 묶은 뒤 라운드로빈으로 섞어서 한 호스트의 피드가 연달아 대기하지 않도록 함.
+        # 피드가 많은 호스트부터 꺼내 배치 후반에 한 호스트만 남는 꼬리를 줄인다.
+        host_feeds_map: dict[str, list[Path]] = {}
+        for feed_dir_path in feed_dir_path_list:
+            hosts = feed_hosts_map.get(feed_dir_path, [])
+            host_feeds_map.setdefault(hosts[0] if hosts else "", []).append(feed_dir_path)
+        queues = sorted(host_feeds_map.values(), key=len, reverse=True)
+        result: list[Path] = []
+        for i in range(max((len(q) for q in queues), default=0)):
+            for queue in queues:
+                if i < len(queue):
+                    result.append(queue[i])
+        return result
+
+    def _make_feeds_in_parallel(self, feed_dir_path_list: list[Path], num_workers: int, feed_timeout: int, feed_max_rss_mb: int) -> list[Path]:
+        LOGGER.debug("# _make_feeds_in_parallel(num_feeds=%d, num_workers=%d, feed_timeout=%d, feed_max_rss_mb=%d)", len(feed_dir_path_list), num_workers, feed_timeout, feed_max_rss_mb)
+        # fork: 워커가 부모의 설정/로깅 상태를 그대로 물려받고, 종료 시 atexit 정리
+        # (headless 프로필 디렉토리 삭제)를 거치지 않아 같은 그룹의 다른 워커에 영향을 주지 않음
+        ctx = multiprocessing.get_context("fork")
+
+        # 호스트별 동시 실행 피드 수 제한. 여러 그룹이 같은 호스트를 쓰면 가장 작은 값을 적용
+        feed_hosts_map: dict[Path, list[str]] = {}
+        host_max_feeds_map: dict[str, int] = {}
+        group_max_feeds_map: dict[Path, int] = {}
+        for feed_dir_path in feed_dir_path_list:
+            feed_hosts_map[feed_dir_path] = self._get_feed_hosts(feed_dir_path)
+            group_dir_path = feed_dir_path.parent
+            if group_dir_path not in group_max_feeds_map:
+                group_max_feeds_map[group_dir_path] = self._get_max_feeds_per_host(group_dir_path)
+            for host in feed_hosts_map[feed_dir_path]:
+                host_max_feeds_map[host] = min(host_max_feeds_map.get(host, group_max_feeds_map[group_dir_path]), group_max_feeds_map[group_dir_path])
+        host_running_count_map: dict[str, int] = {}
+
+        pending = self._interleave_by_host(feed_dir_path_list, feed_hosts_map)
+        running: dict[BaseProcess, tuple[Path, float]] = {}
+        stats_queue = ctx.SimpleQueue()
+        failed_feed_dir_path_list: list[Path] = []
+
+        while pending or running:
+            while pending and len(running) < num_workers:
+                # 모든 대상 호스트에 여유가 있는 첫 번째 피드를 실행
+                index = next((i for i, p in enumerate(pending) if all(host_running_count_map.get(h, 0) < host_max_feeds_map[h] for h in feed_hosts_map[p])), -1)
+                if index < 0:
+                    break
+                feed_dir_path = pending.pop(index)
+                for host in feed_hosts_map[feed_dir_path]:
+                    host_running_count_map[host] = host_running_count_map.get(host, 0) + 1
+                proc = ctx.Process(target=self._run_feed_in_worker, args=(feed_dir_path, stats_queue), name=f"feed-{feed_dir_path.name}")
+                proc.start()
+                running[proc] = (feed_dir_path, time.monotonic())
+
+            wait([proc.sentinel for proc in running], timeout=self.WORKER_POLL_INTERVAL_SEC)
+            self._collect_session_stats(stats_queue)
+
+            for proc, (feed_dir_path, start_time) in list(running.items()):
+                if proc.is_alive():
+                    elapsed = time.monotonic() - start_time
+                    if feed_timeout > 0 and elapsed > feed_timeout:
+                        LOGGER.error("Error: killing feed '%s' after %d seconds (timeout %d seconds)", PathUtil.short_path(feed_dir_path), elapsed, feed_timeout)
+                        self._kill_worker(proc)
+                    elif feed_max_rss_mb > 0:
+                        rss_mb = self._get_process_tree_rss(proc.pid) // (1024 * 1024)
+                        if rss_mb > feed_max_rss_mb:
+                            LOGGER.error("Error: killing feed '%s' using %d MB of memory (limit %d MB)", PathUtil.short_path(feed_dir_path), rss_mb, feed_max_rss_mb)
+                            self._kill_worker(proc)
+                    if proc.is_alive():
+                        continue
+
+                proc.join()
+                if proc.exitcode != 0:
+                    LOGGER.warning("Warning: feed '%s' finished with exit code %r", PathUtil.short_path(feed_dir_path), proc.exitcode)
+                    failed_feed_dir_path_list.append(feed_dir_path)
+                proc.close()
+                del running[proc]
+                for host in feed_hosts_map[feed_dir_path]:
+                    host_running_count_map[host] -= 1
+
+        self._collect_session_stats(stats_queue)
+        stats_queue.close()
+        return failed_feed_dir_path_list
+
     def make_all_feeds(self, options: dict[str, Any]) -> bool:
         LOGGER.debug("# make_all_feeds()")
         num_feeds = options.get("num_feeds", 0)
+        num_workers = options.get("num_workers", 1)
+        if num_workers == 0:
+            num_workers = os.cpu_count() or 1
 
         start_time = datetime.now(timezone.utc)
 
@@ -116,34 +321,28 @@ class FeedMakerRunner:
             feed_dir_path_list = feed_dir_path_list[:num_feeds]
 
         failed_feed_list: list[str] = []
-        for feed_dir_path in feed_dir_path_list:
-            print(feed_dir_path)
-            feed_name = feed_dir_path.name
-            config = Config(feed_dir_path=feed_dir_path)
-            try:
-                collection_conf = config.get_collection_configs()
-            except NotFoundConfigItemError as e:
-                LOGGER.error(e)
-                failed_feed_list.append(feed_dir_path.parent.name + "/" + feed_name)
-                continue
-
-            if collection_conf.get("is_completed", False):
-                result = self.make_single_feed(feed_dir_path, options={"force_collection_opt": "-c"})
-                if not result:
-                    LOGGER.warning(f"Warning: can't make a feed '{feed_name} with all completed articles, {result}")
-                    failed_feed_list.append(feed_dir_path.parent.name + "/" + feed_name)
-                    continue
-
-            result = self.make_single_feed(feed_dir_path, options={})
-            if not result:
-                LOGGER.warning(f"Warning: can't make a feed '{feed_name}' with recent articles, {result}")
-                failed_feed_list.append(feed_dir_path.parent.name + "/" + feed_name)
+        if num_workers > 1:
+            feed_timeout = int(Env.get("FM_RUNNER_FEED_TIMEOUT", "0") or 0)
+            feed_max_rss_mb = int(Env.get("FM_RUNNER_FEED_MAX_RSS_MB", "0") or 0)
+            LOGGER.info("* running %d workers (feed timeout: %d sec, feed max rss: %d MB)", num_workers, feed_timeout, feed_max_rss_mb)
+            # 피드마다 워커 프로세스가 따로 뜨므로 헤드리스 브라우저 세션은 피드 사이에 이어 쓰지 않음 (재활용 정책은 직렬 실행에만 적용)
+            LOGGER.info("* headless browser sessions are not kept across feeds with workers, the recycling policy applies only to serial runs")
+            for feed_dir_path in self._make_feeds_in_parallel(feed_dir_path_list, num_workers, feed_timeout, feed_max_rss_mb):
+                failed_feed_list.append(feed_dir_path.parent.name + "/" + feed_dir_path.name)
+        else:
+            for feed_dir_path in feed_dir_path_list:
+                print(feed_dir_path)
+                if not self._make_feed(feed_dir_path):
+                    failed_feed_list.append(feed_dir_path.parent.name + "/" + feed_dir_path.name)
 
         end_time = datetime.now(timezone.utc)
         LOGGER.info("# Running time analysis")
         LOGGER.info(f"* Start time: {start_time.isoformat(timespec='seconds')}")
         LOGGER.info(f"* End time: {end_time.isoformat(timespec='seconds')}")
         LOGGER.info(f"* Elapsed time: {(end_time - start_time).total_seconds()}")
+        session_stats = HeadlessBrowser.get_session_stats()
+        if session_stats["launches"] or session_stats["reuses"]:
+            LOGGER.info("* Headless browser launches: %d (%d launches saved by reusing sessions)", session_stats["launches"], session_stats["reuses"])
 
         if failed_feed_list:
             notification = Notification()
@@ -168,8 +367,9 @@ class FeedMakerRunner:
 
 def print_usage() -> None:
     print("Usage:\t%s [-h] [-r] [-c] [ <feed path> ]")
-    print("\t\t[-a]")
+    print("\t\t[-a] [-j <# of workers>]")
     print("\t\t-a: make all feeds")
+    print("\t\t-j: make feeds with <# of workers> processes concurrently (with -a, 0 for # of cpu cores)")
     print("\t\t-h: print usage")
     print("\t\t-r: remove all files and execute clearly")
     print("\t\t-c: collection forcibly")
@@ -184,9 +384,10 @@ def determine_options() -> tuple[dict[str, Any], list[str]]:
     collect_only_opt = ""
     extract_only_opt = ""
     num_feeds = 0
+    num_workers = 1
     window_size = FeedMaker.DEFAULT_WINDOW_SIZE
 
-    optlist, args = getopt.getopt(sys.argv[1:], "ahrceln:w:")
+    optlist, args = getopt.getopt(sys.argv[1:], "ahrceln:w:j:")
     for o, a in optlist:
         match o:
             case "-a":
@@ -206,8 +407,10 @@ def determine_options() -> tuple[dict[str, Any], list[str]]:
                 num_feeds = int(a)
             case "-w":
                 window_size = int(a)
+            case "-j":
+                num_workers = int(a)
 
-    options = {"do_make_all_feeds": do_make_all_feeds, "do_remove_all_files": do_remove_all_files, "force_collection_opt": force_collection_opt, "collect_only_opt": collect_only_opt, "extract_only_opt": extract_only_opt, "num_feeds": num_feeds, "window_size": window_size}
+    options = {"do_make_all_feeds": do_make_all_feeds, "do_remove_all_files": do_remove_all_files, "force_collection_opt": force_collection_opt, "collect_only_opt": collect_only_opt, "extract_only_opt": extract_only_opt, "num_feeds": num_feeds, "num_workers": num_workers, "window_size": window_size}
     return options, args
 
 
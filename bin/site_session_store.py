@@ -0,0 +1,232 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+
+import os
+import json
+import time
+import fcntl
+import logging.config
+import http.cookiejar
+from pathlib import Path
+from collections.abc import Iterable
+from typing import Any, Optional
+from urllib.parse import urlsplit
+
+from bin.feed_maker_util import Env, PathUtil
+
+logging.config.fileConfig(Path(__file__).parent.parent / "logging.conf")
+LOGGER = logging.getLogger()
+
+
+class SiteSessionStore:
+    """사이트별로 공유하는 세션 저장소 (FM_WORK_DIR 아래 사이트별 상태 파일을 flock으로 잠가서 모든 프로세스가 같은 세션을 공유)
+
+    피드 또는 피드 그룹의 site_config.json "shared_session_sites"에 지정한 사이트(example.co.kr 등)에서만
+    그 사이트와 하위 도메인의 피드들이 쿠키와 Cloudflare 통과 토큰(cf_clearance)을 만료 시각과 함께 나눠 써서
+    피드마다 challenge를 기다리지 않게 함. 쿠키는 http.cookiejar와 같은 도메인/경로 규칙으로 골라서 보내고,
+    만료 시각이 없는 세션 쿠키는 FM_SITE_SESSION_TTL초 동안만 유효함. FM_SITE_SESSION_STORE=false이면 사용하지 않음
+    """
+
+    STATE_DIR_NAME = ".site_sessions"
+    STATE_FILE_SUFFIX = ".json"
+    DEFAULT_SESSION_TTL_SEC = 12 * 60 * 60
+    SITE_CONF_FILE = "site_config.json"
+
+    def __init__(self, state_dir_path: Optional[Path] = None, session_ttl: Optional[float] = None, sites: Optional[Iterable[str]] = None, keeps_own_cookies: bool = False) -> None:
+        self.state_dir_path: Path = state_dir_path if state_dir_path else Path(Env.get("FM_WORK_DIR")) / SiteSessionStore.STATE_DIR_NAME
+        if session_ttl is None:
+            try:
+                session_ttl = float(Env.get("FM_SITE_SESSION_TTL", str(SiteSessionStore.DEFAULT_SESSION_TTL_SEC)) or SiteSessionStore.DEFAULT_SESSION_TTL_SEC)
+            except ValueError:
+                session_ttl = SiteSessionStore.DEFAULT_SESSION_TTL_SEC
+        self.session_ttl: float = session_ttl
+        # 세션을 공유할 사이트 (등록 도메인을 추측하지 않고 피드 설정에 지정한 것만 사용)
+        self.sites: frozenset[str] = frozenset(site.strip().lstrip(".").lower() for site in (sites or []) if site.strip().lstrip("."))
+        # 피드에 자체 로그인 설정(.login.json)이 있으면 피드가 받은 쿠키를 공유 쿠키로 덮어쓰지 않음
+        self.keeps_own_cookies: bool = keeps_own_cookies
+        # 작업 디렉토리를 알 수 없으면(FM_WORK_DIR가 비었거나 상대 경로) 엉뚱한 곳에 기록하지 않도록 사용하지 않음
+        self.is_enabled: bool = bool(self.sites) and Env.get("FM_SITE_SESSION_STORE", "true").strip().lower() not in ("0", "false", "no", "off") and self.state_dir_path.is_absolute() and self.state_dir_path.parent.is_dir()
+
+    @staticmethod
+    def load_sites(dir_path: Path) -> frozenset[str]:
+        # 피드 디렉토리 또는 피드 그룹 디렉토리의 site_config.json에서 읽음
+        for site_conf_file_path in (dir_path / SiteSessionStore.SITE_CONF_FILE, dir_path.parent / SiteSessionStore.SITE_CONF_FILE):
+            if not site_conf_file_path.is_file():
+                continue
+            try:
+                with site_conf_file_path.open("r", encoding="utf-8") as infile:
+                    site_conf = json.load(infile)
+                sites = site_conf.get("shared_session_sites", []) if isinstance(site_conf, dict) else []
+                if isinstance(sites, str):
+                    sites = sites.split(",")
+                return frozenset(str(site).strip().lstrip(".").lower() for site in sites if str(site).strip().lstrip("."))
+            except (json.JSONDecodeError, TypeError, OSError) as e:
+                LOGGER.warning("Warning: can't read 'shared_session_sites' from '%s', %s", PathUtil.short_path(site_conf_file_path), e)
+        return frozenset()
+
+    def get_site(self, url_or_domain: str) -> str:
+        # URL 또는 쿠키 도메인이 속한 공유 사이트 (지정한 사이트가 아니면 빈 문자열, 여러 개면 가장 긴 것)
+        if "://" in url_or_domain:
+            host = (urlsplit(url_or_domain).hostname or "").lower()
+        else:
+            host = url_or_domain.strip().lstrip(".").lower()
+        if not host:
+            return ""
+        matched_sites = [site for site in self.sites if host == site or host.endswith("." + site)]
+        return max(matched_sites, key=len) if matched_sites else ""
+
+    @staticmethod
+    def is_cookie_for_url(cookie: dict[str, Any], url: str) -> bool:
+        """url로 요청할 때 보낼 쿠키인지 판단 (http.cookiejar처럼 도메인 쿠키는 하위 도메인까지, 호스트 쿠키는 같은 호스트만, 경로는 경로 단위 접두어)"""
+        parts = urlsplit(url)
+        host = (parts.hostname or "").lower()
+        domain = str(cookie.get("domain") or "").lower()
+        if domain.startswith("."):
+            if host != domain[1:] and not http.cookiejar.domain_match(host, domain):
+                return False
+        elif host != domain:
+            return False
+        cookie_path = str(cookie.get("path") or "/")
+        path = parts.path or "/"
+        if path != cookie_path and not path.startswith(cookie_path if cookie_path.endswith("/") else cookie_path + "/"):
+            return False
+        return not cookie.get("secure") or parts.scheme == "https"
+
+    def _get_state_file_path(self, site: str) -> Path:
+        return self.state_dir_path / (site + SiteSessionStore.STATE_FILE_SUFFIX)
+
+    @staticmethod
+    def _read_state(fd: int) -> dict[str, Any]:
+        chunks: list[bytes] = []
+        while True:
+            chunk = os.read(fd, 65536)
+            if not chunk:
+                break
+            chunks.append(chunk)
+        try:
+            state = json.loads(b"".join(chunks).decode("utf-8") or "{}")
+        except ValueError:
+            state = {}
+        return state if isinstance(state, dict) else {}
+
+    def _is_alive(self, cookie: dict[str, Any], now: float) -> bool:
+        expires = cookie.get("expires")
+        if isinstance(expires, (int, float)) and expires > 0:
+            return expires > now
+        # 세션 쿠키는 저장한 뒤 session_ttl 동안만 사용
+        return float(cookie.get("saved_at", 0) or 0) + self.session_ttl > now
+
+    def _has_state(self, site: str) -> bool:
+        # 기록이 없거나 빈 상태 파일이면 공유할 세션이 없으므로 잠그지 않고 넘어감
+        try:
+            return self._get_state_file_path(site).stat().st_size > 0
+        except OSError:
+            return False
+
+    def _load_state(self, site: str) -> dict[str, Any]:
+        state_file_path = self._get_state_file_path(site)
+        if not self._has_state(site):
+            return {}
+        fd = os.open(state_file_path, os.O_RDONLY)
+        try:
+            fcntl.flock(fd, fcntl.LOCK_SH)
+            return SiteSessionStore._read_state(fd)
+        finally:
+            os.close(fd)
+
+    def _update_state(self, site: str, update: Any) -> Any:
+        # 상태 파일을 잠근 채로 읽고, update(state)가 돌려준 새 상태를 기록 (None이면 파일을 비움)
+        # 파일을 지우면 이미 그 경로를 연 다른 프로세스가 연결이 끊어진 파일을 잠그고 기록해서 쿠키를 잃으므로 같은 파일을 비우기만 함
+        state_file_path = self._get_state_file_path(site)
+        self.state_dir_path.mkdir(parents=True, exist_ok=True)
+        fd = os.open(state_file_path, os.O_RDWR | os.O_CREAT, 0o644)
+        try:
+            fcntl.flock(fd, fcntl.LOCK_EX)
+            new_state, result = update(SiteSessionStore._read_state(fd))
+            os.lseek(fd, 0, os.SEEK_SET)
+            os.ftruncate(fd, 0)
+            if new_state:
+                os.write(fd, json.dumps(new_state, ensure_ascii=False).encode("utf-8"))
+        finally:
+            os.close(fd)
+        return result
+
+    def get_stamp(self, url: str) -> Optional[int]:
+        # 사이트 상태 파일의 수정 시각 (바뀌지 않았으면 다시 읽을 필요가 없음)
+        site = self.get_site(url)
+        if not site or not self.is_enabled:
+            return None
+        try:
+            stat = self._get_state_file_path(site).stat()
+        except OSError:
+            return None
+        return stat.st_mtime_ns if stat.st_size > 0 else None
+
+    def load_cookies(self, url: str) -> list[dict[str, Any]]:
+        """url이 속한 사이트의 만료되지 않은 쿠키를 Playwright 쿠키 형식(name, value, domain, path, expires 등)으로 돌려줌"""
+        site = self.get_site(url)
+        if not site or not self.is_enabled:
+            return []
+        try:
+            state = self._load_state(site)
+        except OSError as e:
+            LOGGER.warning("Warning: can't use site session state in '%s', %r", PathUtil.short_path(self.state_dir_path), e)
+            return []
+        now = time.time()
+        cookies: list[dict[str, Any]] = []
+        for cookie in state.get("cookies", []):
+            if isinstance(cookie, dict) and cookie.get("name") and self._is_alive(cookie, now):
+                cookies.append({k: v for k, v in cookie.items() if k != "saved_at"})
+        return cookies
+
+    def get_cookies_for_url(self, url: str) -> dict[str, str]:
+        """url로 요청할 때 보낼 공유 쿠키 (이름이 같으면 경로가 더 긴 쿠키의 값을 사용)"""
+        cookies = [c for c in self.load_cookies(url) if SiteSessionStore.is_cookie_for_url(c, url)]
+        cookies.sort(key=lambda c: len(str(c.get("path") or "/")))
+        return {str(c["name"]): str(c["value"]) for c in cookies}
+
+    def save_cookies(self, url: str, cookies: list[dict[str, Any]]) -> None:
+        """url이 속한 사이트의 쿠키를 (이름, 도메인, 경로)별로 병합해서 기록함 (다른 사이트의 쿠키와 만료된 쿠키는 버림)"""
+        site = self.get_site(url)
+        if not site or not self.is_enabled:
+            return
+        host = (urlsplit(url).hostname or "").lower() if "://" in url else site
+        now = time.time()
+        new_cookies: list[dict[str, Any]] = []
+        for cookie in cookies:
+            if not cookie.get("name") or cookie.get("value") is None:
+                continue
+            cookie = {**cookie, "domain": cookie.get("domain") or host, "path": cookie.get("path") or "/", "saved_at": now}
+            if self.get_site(cookie["domain"]) == site:
+                new_cookies.append(cookie)
+        if not new_cookies:
+            return
+
+        def update(state: dict[str, Any]) -> tuple[dict[str, Any], None]:
+            cookie_map: dict[tuple[str, str, str], dict[str, Any]] = {}
+            for cookie in state.get("cookies", []) + new_cookies:
+                if isinstance(cookie, dict) and cookie.get("name"):
+                    cookie_map[(cookie["name"], cookie.get("domain", ""), cookie.get("path", "/"))] = cookie
+            alive_cookies = [c for c in cookie_map.values() if self._is_alive(c, now)]
+            return {**state, "cookies": alive_cookies, "updated_at": now}, None
+
+        try:
+            self._update_state(site, update)
+        except OSError as e:
+            LOGGER.warning("Warning: can't use site session state in '%s', %r", PathUtil.short_path(self.state_dir_path), e)
+
+    def discard_cookies(self, url: str, name_prefixes: tuple[str, ...]) -> None:
+        # 거부된 통과 토큰 등 이름이 name_prefixes로 시작하는 쿠키만 지움 (같은 사이트의 로그인 쿠키는 유지)
+        site = self.get_site(url)
+        if not site or not self.is_enabled or not self._has_state(site):
+            return
+
+        def update(state: dict[str, Any]) -> tuple[Optional[dict[str, Any]], None]:
+            cookies = [c for c in state.get("cookies", []) if isinstance(c, dict) and not str(c.get("name", "")).startswith(name_prefixes)]
+            return ({**state, "cookies": cookies} if cookies else None), None
+
+        try:
+            self._update_state(site, update)
+        except OSError as e:
+            LOGGER.warning("Warning: can't use site session state in '%s', %r", PathUtil.short_path(self.state_dir_path), e)
@@ -5,11 +5,21 @@ import io
 import logging
 import os
 import re
+import ssl
+import time
+import shutil
+import socket
+import subprocess
+import socketserver
 import unittest
 from pathlib import Path
+from typing import Optional
 from unittest.mock import patch, MagicMock
 
+import httpx
 import requests
+import urllib3
+from requests.adapters import HTTPAdapter
 
 from bin.crawler import Crawler, Method, print_usage, RequestsClient
 import tempfile
@@ -19,8 +29,9 @@ from bin.crawler import main
 from pathlib import Path as _Path
 import json
 import threading
-from http.server import HTTPServer, BaseHTTPRequestHandler
-from bin.crawler import LoginManager, to_latin1_safe_url
+from http.server import HTTPServer, ThreadingHTTPServer, BaseHTTPRequestHandler
+from bin.crawler import AsyncRequestsClient, CookieStore, Http2Adapter, LoginManager, RetryPolicy, SessionPool, to_latin1_safe_url, _is_h2_available
+from bin.feed_maker_util import URLSafety
 
 # Setup logging
 logging.basicConfig(level=logging.INFO)
@@ -59,7 +70,7 @@ class TestCrawler(unittest.TestCase):
     def setUp(self) -> None:
         # 각 테스트마다 requests, time.sleep 등 patch
         self.patcher_sleep = patch("time.sleep")
-        self.patcher_requests = patch("requests.get")
+        self.patcher_requests = patch("requests.Session.get")
         self.mock_sleep = self.patcher_sleep.start()
         self.mock_requests = self.patcher_requests.start()
 
@@ -90,6 +101,12 @@ class TestCrawler(unittest.TestCase):
         actual = Crawler.get_option_str(options)
         self.assertNotIn("--wait-until", actual)
 
+    def test_get_option_str_with_blocked_resources(self) -> None:
+        options = {"render_js": True, "blocked_resource_types": ["image", "font"], "blocked_domains": ["ads.example.com"]}
+        actual = Crawler.get_option_str(options)
+        self.assertIn("--blocked-resource-types=image,font --blocked-domains=ads.example.com", actual)
+        self.assertNotIn("--blocked", Crawler.get_option_str({"render_js": True, "blocked_resource_types": [], "blocked_domains": []}))
+
     def test_crawler_wait_until_default(self) -> None:
         crawler = Crawler()
         self.assertEqual(crawler.wait_until, "domcontentloaded")
@@ -128,7 +145,7 @@ class TestCrawler(unittest.TestCase):
         url = "http://test.com/test.html"
         actual, _, _ = crawler.run(url)
         self.assertIn("Test", actual)
-        mock_make_request.assert_called_once_with(url, download_file=None, data=None, allow_redirects=True)
+        mock_make_request.assert_called_once_with(url, download_file=None, data=None, allow_redirects=True, extra_headers=None)
 
     @patch("bin.crawler.HeadlessBrowser.make_request")
     def test_crawler_with_render_js(self, mock_make_request: MagicMock) -> None:
@@ -207,7 +224,7 @@ class TestRequestsClientRefererErrors(unittest.TestCase):
         self.client.headers["Referer"] = "http://example.com/ref"
 
     @patch("bin.crawler.URLSafety.check_url", return_value=(True, ""))
-    @patch("requests.get", side_effect=requests.exceptions.ConnectionError("conn err"))
+    @patch("requests.Session.get", side_effect=requests.exceptions.ConnectionError("conn err"))
     def test_referer_connection_error(self, mock_get, mock_check):
         result, error, headers, status = self.client.make_request("http://example.com/page")
         self.assertEqual(result, "")
@@ -215,7 +232,7 @@ class TestRequestsClientRefererErrors(unittest.TestCase):
         self.assertIsNone(status)
 
     @patch("bin.crawler.URLSafety.check_url", return_value=(True, ""))
-    @patch("requests.get", side_effect=requests.exceptions.ReadTimeout("timeout"))
+    @patch("requests.Session.get", side_effect=requests.exceptions.ReadTimeout("timeout"))
     def test_referer_read_timeout(self, mock_get, mock_check):
         result, error, headers, status = self.client.make_request("http://example.com/page")
         self.assertEqual(result, "")
@@ -232,7 +249,7 @@ class TestRequestsClientMethods(unittest.TestCase):
         self.client = RequestsClient(dir_path=Path(self.tmp))
 
     @patch("bin.crawler.URLSafety.check_url", return_value=(True, ""))
-    @patch("requests.post")
+    @patch("requests.Session.post")
     def test_post_method(self, mock_post, mock_check):
         mock_resp = MagicMock()
         mock_resp.status_code = 200
@@ -249,7 +266,7 @@ class TestRequestsClientMethods(unittest.TestCase):
         mock_post.assert_called_once()
 
     @patch("bin.crawler.URLSafety.check_url", return_value=(True, ""))
-    @patch("requests.head")
+    @patch("requests.Session.head")
     def test_head_method(self, mock_head, mock_check):
         mock_resp = MagicMock()
         mock_resp.status_code = 200
@@ -271,7 +288,7 @@ class TestRequestsClientNon200AndNone(unittest.TestCase):
         self.client = RequestsClient(dir_path=Path(tempfile.mkdtemp()))
 
     @patch("bin.crawler.URLSafety.check_url", return_value=(True, ""))
-    @patch("requests.get")
+    @patch("requests.Session.get")
     def test_non_200_status(self, mock_get, mock_check):
         mock_resp = MagicMock()
         mock_resp.status_code = 403
@@ -285,7 +302,23 @@ class TestRequestsClientNon200AndNone(unittest.TestCase):
         self.assertEqual(status, 403)
 
     @patch("bin.crawler.URLSafety.check_url", return_value=(True, ""))
-    @patch("requests.get", side_effect=requests.exceptions.ConnectionError("fail"))
+    @patch("requests.Session.get")
+    def test_extra_headers_are_not_kept(self, mock_get, mock_check):
+        mock_resp = MagicMock()
+        mock_resp.status_code = 304
+        mock_resp.cookies = RequestsCookieJar()
+        mock_resp.headers = {"ETag": '"v1"'}
+        mock_get.return_value = mock_resp
+
+        result, error, headers, status = self.client.make_request("http://example.com/list", extra_headers={"If-None-Match": '"v1"'})
+        self.assertEqual(result, "")
+        self.assertEqual(status, 304)
+        self.assertEqual(headers, {"ETag": '"v1"'})
+        self.assertEqual(mock_get.call_args.kwargs["headers"]["If-None-Match"], '"v1"')
+        self.assertNotIn("If-None-Match", self.client.headers)
+
+    @patch("bin.crawler.URLSafety.check_url", return_value=(True, ""))
+    @patch("requests.Session.get", side_effect=requests.exceptions.ConnectionError("fail"))
     def test_response_connection_error(self, mock_get, mock_check):
         result, error, headers, status = self.client.make_request("http://example.com/page")
         self.assertEqual(result, "")
@@ -293,22 +326,80 @@ class TestRequestsClientNon200AndNone(unittest.TestCase):
         self.assertIsNone(status)
 
     @patch("bin.crawler.URLSafety.check_url", return_value=(True, ""))
-    @patch("requests.get")
+    @patch("requests.Session.get")
     def test_download_file(self, mock_get, mock_check):
         mock_resp = MagicMock()
         mock_resp.status_code = 200
         mock_resp.cookies = RequestsCookieJar()
-        mock_resp.raw = MagicMock()
-        mock_resp.__iter__ = MagicMock(return_value=iter([b"data"]))
+        mock_resp.headers = {"Content-Length": "8"}
+        mock_resp.iter_content.return_value = iter([b"data", b"more"])
         mock_get.return_value = mock_resp
 
         dl_path = Path(tempfile.mkdtemp()) / "downloaded.bin"
         result, error, headers, status = self.client.make_request("http://example.com/file.bin", download_file=dl_path)
         self.assertEqual(result, "200")
         self.assertEqual(status, 200)
-        self.assertTrue(dl_path.exists())
+        self.assertEqual(dl_path.read_bytes(), b"datamore")
+        self.assertTrue(mock_get.call_args.kwargs["stream"])
+        mock_resp.iter_content.assert_called_once_with(chunk_size=self.client.download_chunk_size)
+        mock_resp.close.assert_called_once()
+        # 임시 파일은 남지 않음
+        self.assertEqual([p.name for p in dl_path.parent.iterdir()], ["downloaded.bin"])
         dl_path.unlink(missing_ok=True)
 
+    @patch("bin.crawler.URLSafety.check_url", return_value=(True, ""))
+    @patch("requests.Session.get")
+    def test_download_aborts_on_content_length_over_cap(self, mock_get, mock_check):
+        mock_resp = MagicMock()
+        mock_resp.status_code = 200
+        mock_resp.cookies = RequestsCookieJar()
+        mock_resp.headers = {"Content-Length": str(self.client.max_download_size + 1)}
+        mock_get.return_value = mock_resp
+
+        dl_path = Path(tempfile.mkdtemp()) / "downloaded.bin"
+        result, error, headers, status = self.client.make_request("http://example.com/file.bin", download_file=dl_path)
+        self.assertEqual(result, "")
+        self.assertIn("maximum download size", error)
+        mock_resp.iter_content.assert_not_called()
+        mock_resp.close.assert_called_once()
+        self.assertEqual(list(dl_path.parent.iterdir()), [])
+
+    @patch("bin.crawler.URLSafety.check_url", return_value=(True, ""))
+    @patch("requests.Session.get")
+    def test_download_aborts_when_stream_exceeds_cap(self, mock_get, mock_check):
+        self.client.max_download_size = 10
+        mock_resp = MagicMock()
+        mock_resp.status_code = 200
+        mock_resp.cookies = RequestsCookieJar()
+        mock_resp.headers = {}
+        mock_resp.iter_content.return_value = iter([b"123456", b"789012", b"never read"])
+        mock_get.return_value = mock_resp
+
+        dl_dir = Path(tempfile.mkdtemp())
+        dl_path = dl_dir / "downloaded.bin"
+        dl_path.write_bytes(b"old")
+        result, error, headers, status = self.client.make_request("http://example.com/file.bin", download_file=dl_path)
+        self.assertEqual(result, "")
+        self.assertIn("maximum download size", error)
+        # 기존 파일은 그대로 두고 임시 파일은 삭제
+        self.assertEqual(dl_path.read_bytes(), b"old")
+        self.assertEqual([p.name for p in dl_dir.iterdir()], ["downloaded.bin"])
+
+    @patch("bin.crawler.URLSafety.check_url", return_value=(True, ""))
+    @patch("requests.Session.get")
+    def test_download_non_200_closes_stream(self, mock_get, mock_check):
+        mock_resp = MagicMock()
+        mock_resp.status_code = 404
+        mock_resp.cookies = RequestsCookieJar()
+        mock_resp.headers = {}
+        mock_get.return_value = mock_resp
+
+        dl_path = Path(tempfile.mkdtemp()) / "downloaded.bin"
+        result, error, headers, status = self.client.make_request("http://example.com/file.bin", download_file=dl_path)
+        self.assertEqual(status, 404)
+        mock_resp.close.assert_called_once()
+        self.assertFalse(dl_path.exists())
+
 
 class TestRequestsClientCookiesAndOgUrl(unittest.TestCase):
     """Cookies from referer, og:url injection"""
@@ -319,7 +410,7 @@ class TestRequestsClientCookiesAndOgUrl(unittest.TestCase):
         self.client = RequestsClient(dir_path=Path(self.tmp))
 
     @patch("bin.crawler.URLSafety.check_url", return_value=(True, ""))
-    @patch("requests.get")
+    @patch("requests.Session.get")
     def test_cookies_from_referer(self, mock_get, mock_check):
         # referer response with cookies
         referer_resp = MagicMock()
@@ -343,7 +434,7 @@ class TestRequestsClientCookiesAndOgUrl(unittest.TestCase):
         self.assertEqual(result.count("og:url"), 1)
 
     @patch("bin.crawler.URLSafety.check_url", return_value=(True, ""))
-    @patch("requests.get")
+    @patch("requests.Session.get")
     def test_og_url_injection(self, mock_get, mock_check):
         mock_resp = MagicMock()
         mock_resp.status_code = 200
@@ -358,6 +449,84 @@ class TestRequestsClientCookiesAndOgUrl(unittest.TestCase):
         self.assertIn("http://example.com/page", result)
 
 
+class TestRequestsClientRefererVisit(unittest.TestCase):
+    """Referer 페이지는 TTL 안에서는 다시 방문하지 않음"""
+
+    @patch("bin.crawler.Env.get", return_value="false")
+    def setUp(self, mock_env):
+        self.tmp = tempfile.mkdtemp()
+        self.client = RequestsClient(dir_path=Path(self.tmp))
+        self.client.headers["Referer"] = "http://example.com/ref"
+
+    @staticmethod
+    def _make_response(status_code: int = 200, cookies: Optional[dict[str, str]] = None) -> MagicMock:
+        resp = MagicMock()
+        resp.status_code = status_code
+        resp.ok = status_code < 400
+        resp.cookies = RequestsCookieJar()
+        for name, value in (cookies or {}).items():
+            resp.cookies.set(name, value)
+        resp.text = "<html><head></head><body>ok</body></html>"
+        resp.request = MagicMock(url="http://example.com/page")
+        return resp
+
+    def _get_urls(self, mock_get: MagicMock) -> list[str]:
+        return [c.args[0] for c in mock_get.call_args_list]
+
+    @patch("bin.crawler.URLSafety.check_url", return_value=(True, ""))
+    @patch("requests.Session.get")
+    def test_referer_is_visited_once_within_ttl(self, mock_get, mock_check):
+        mock_get.side_effect = lambda url, **kwargs: self._make_response(cookies={"sid": "1"} if url.endswith("/ref") else None)
+        for i in range(3):
+            self.client.make_request(f"http://example.com/page{i}")
+        self.assertEqual(self._get_urls(mock_get), ["http://example.com/ref", "http://example.com/page0", "http://example.com/page1", "http://example.com/page2"])
+
+        # 다른 RequestsClient(같은 피드의 다음 기사)도 방문 기록을 공유
+        with patch("bin.crawler.Env.get", return_value="false"):
+            other_client = RequestsClient(dir_path=Path(self.tmp), headers={"Referer": "http://example.com/ref"})
+        other_client.make_request("http://example.com/page3")
+        self.assertEqual(self._get_urls(mock_get)[-1], "http://example.com/page3")
+
+    @patch("bin.crawler.URLSafety.check_url", return_value=(True, ""))
+    @patch("requests.Session.get")
+    def test_referer_is_revisited_after_ttl(self, mock_get, mock_check):
+        mock_get.side_effect = lambda url, **kwargs: self._make_response()
+        self.client.make_request("http://example.com/page0")
+        with patch("bin.crawler.time.time", return_value=time.time() + self.client.referer_visit_ttl + 1):
+            self.client.make_request("http://example.com/page1")
+        self.assertEqual(self._get_urls(mock_get).count("http://example.com/ref"), 2)
+
+    @patch("bin.crawler.URLSafety.check_url", return_value=(True, ""))
+    @patch("requests.Session.get")
+    def test_referer_is_revisited_when_cookies_are_gone(self, mock_get, mock_check):
+        mock_get.side_effect = lambda url, **kwargs: self._make_response(cookies={"sid": "1"} if url.endswith("/ref") else None)
+        self.client.make_request("http://example.com/page0")
+        # 다른 프로세스가 쿠키 파일을 비움
+        cookie_file = Path(self.tmp) / RequestsClient.COOKIE_FILE
+        cookie_file.write_text("[]", encoding="utf-8")
+        os.utime(cookie_file, ns=(time.time_ns() + 10**9, time.time_ns() + 10**9))
+        self.client._get_cookie_store().dirty_cookies.clear()
+        self.client.make_request("http://example.com/page1")
+        self.assertEqual(self._get_urls(mock_get).count("http://example.com/ref"), 2)
+
+    @patch("bin.crawler.URLSafety.check_url", return_value=(True, ""))
+    @patch("requests.Session.get")
+    def test_referer_is_revisited_after_forbidden(self, mock_get, mock_check):
+        mock_get.side_effect = lambda url, **kwargs: self._make_response(403 if url.endswith("/page0") else 200)
+        self.client.make_request("http://example.com/page0")
+        self.client.make_request("http://example.com/page1")
+        self.assertEqual(self._get_urls(mock_get).count("http://example.com/ref"), 2)
+
+    @patch("bin.crawler.URLSafety.check_url", return_value=(True, ""))
+    @patch("requests.Session.get")
+    def test_ttl_zero_always_visits(self, mock_get, mock_check):
+        mock_get.side_effect = lambda url, **kwargs: self._make_response()
+        self.client.referer_visit_ttl = 0
+        self.client.make_request("http://example.com/page0")
+        self.client.make_request("http://example.com/page1")
+        self.assertEqual(self._get_urls(mock_get).count("http://example.com/ref"), 2)
+
+
 class TestRequestsClientCookieDir(unittest.TestCase):
     """_get_cookie_dir with non-writable directory"""
 
@@ -428,6 +597,103 @@ class TestRequestsClientCookieFiles(unittest.TestCase):
         cookie_file.unlink(missing_ok=True)
 
 
+class TestCookieStore(unittest.TestCase):
+    """CookieStore: 쿠키 디렉토리별 메모리 쿠키 저장소와 write-behind 기록"""
+
+    def setUp(self):
+        self.tmp = Path(tempfile.mkdtemp())
+        self.cookie_file = self.tmp / RequestsClient.COOKIE_FILE
+        self.store = CookieStore(self.cookie_file)
+        self.store.flush_interval = 60
+
+    def _read_file(self) -> dict[str, str]:
+        return {c["name"]: c["value"] for c in json.loads(self.cookie_file.read_text(encoding="utf-8"))}
+
+    def test_first_change_is_flushed_and_later_changes_are_deferred(self):
+        self.store.update({"sid": "1"}, RequestsClient.MAX_COOKIE_HEADER_SIZE)
+        self.assertEqual(self._read_file(), {"sid": "1"})
+
+        self.store.update({"track": "2"}, RequestsClient.MAX_COOKIE_HEADER_SIZE)
+        self.assertEqual(self._read_file(), {"sid": "1"})
+        self.assertEqual(self.store.get_cookies(), {"sid": "1", "track": "2"})
+
+        self.store.flush()
+        self.assertEqual(self._read_file(), {"sid": "1", "track": "2"})
+        self.assertEqual([p.name for p in self.tmp.iterdir()], [RequestsClient.COOKIE_FILE])
+
+    def test_file_is_read_once(self):
+        self.cookie_file.write_text(json.dumps([{"name": "sid", "value": "1"}]), encoding="utf-8")
+        with patch("bin.crawler.json.load", wraps=json.load) as mock_load:
+            for _ in range(5):
+                self.assertEqual(self.store.get_cookies(), {"sid": "1"})
+            self.assertEqual(mock_load.call_count, 1)
+
+    def test_external_change_is_merged_with_pending_changes(self):
+        self.store.update({"sid": "1"}, RequestsClient.MAX_COOKIE_HEADER_SIZE)
+        self.store.update({"pending": "x"}, RequestsClient.MAX_COOKIE_HEADER_SIZE)
+        # 다른 프로세스가 파일을 갱신
+        self.cookie_file.write_text(json.dumps([{"name": "sid", "value": "1"}, {"name": "other", "value": "y"}, {"name": "padding", "value": "z" * 10}]), encoding="utf-8")
+
+        self.assertEqual(self.store.get_cookies(), {"sid": "1", "other": "y", "padding": "z" * 10, "pending": "x"})
+        self.store.flush()
+        self.assertEqual(self._read_file(), {"sid": "1", "other": "y", "padding": "z" * 10, "pending": "x"})
+
+    def test_update_trims_to_max_size(self):
+        self.store.update({"PHPSESSID": "sess"}, 30)
+        self.store.update({f"market-{i}": "1" for i in range(10)}, 30)
+        cookies = self.store.get_cookies()
+        self.assertEqual(next(iter(cookies)), "PHPSESSID")
+        self.assertLessEqual(len("; ".join(f"{k}={v}" for k, v in cookies.items())), 30)
+        self.assertTrue(all(k in cookies for k in self.store.dirty_cookies))
+
+    def test_flush_all_and_shared_store_per_dir(self):
+        with patch("bin.crawler.Env.get", return_value="false"):
+            client1 = RequestsClient(dir_path=self.tmp)
+            client2 = RequestsClient(dir_path=self.tmp)
+        self.assertIs(client1._get_cookie_store(), client2._get_cookie_store())
+        store = client1._get_cookie_store()
+        store.flush_interval = 60
+
+        jar = RequestsCookieJar()
+        jar.set("a", "1")
+        client1.write_cookies_to_file(jar)
+        jar = RequestsCookieJar()
+        jar.set("b", "2")
+        client1.write_cookies_to_file(jar)
+        client2.read_cookies_from_file()
+        self.assertEqual(client2.cookies, {"a": "1", "b": "2"})
+        self.assertEqual(self._read_file(), {"a": "1"})
+
+        CookieStore.flush_all()
+        self.assertEqual(self._read_file(), {"a": "1", "b": "2"})
+
+
+class TestPinnedConnection(unittest.TestCase):
+    """URLSafety.check_url이 검사한 주소로만 연결"""
+
+    def setUp(self):
+        URLSafety.clear_dns_cache()
+
+    def tearDown(self):
+        URLSafety.clear_dns_cache()
+
+    def test_connects_to_checked_addresses(self):
+        infos = [(socket.AF_INET, socket.SOCK_STREAM, 0, "", ("93.184.216.34", 0)), (socket.AF_INET, socket.SOCK_STREAM, 0, "", ("93.184.216.35", 0))]
+        with patch("socket.getaddrinfo", return_value=infos):
+            self.assertTrue(URLSafety.check_url("https://pinned.com/", allow_private=False)[0])
+
+        sock = MagicMock()
+        with patch("bin.crawler._original_create_connection", side_effect=[OSError("unreachable"), sock]) as mock_create:
+            self.assertIs(urllib3.util.connection.create_connection(("pinned.com", 443), 3), sock)
+        self.assertEqual([c.args for c in mock_create.call_args_list], [(("93.184.216.34", 443), 3), (("93.184.216.35", 443), 3)])
+
+    def test_unchecked_host_is_resolved_normally(self):
+        sock = MagicMock()
+        with patch("bin.crawler._original_create_connection", return_value=sock) as mock_create:
+            self.assertIs(urllib3.util.connection.create_connection(("unchecked.com", 80), 3), sock)
+        mock_create.assert_called_once_with(("unchecked.com", 80), 3)
+
+
 class TestCrawlerRunRenderJS(unittest.TestCase):
     """run with render_js=True (mock HeadlessBrowser)"""
 
@@ -513,6 +779,20 @@ class TestCrawlerRunRetryStatusCodes(unittest.TestCase):
         result, error, headers = crawler.run("http://example.com/page")
         self.assertEqual(mock_rc.make_request.call_count, 1)
 
+    @patch("bin.crawler.RequestsClient")
+    def test_no_retry_on_304(self, mock_rc_cls):
+        mock_rc = MagicMock()
+        mock_rc.make_request.return_value = ("", "not modified", {"ETag": '"v1"'}, 304)
+        mock_rc_cls.return_value = mock_rc
+
+        crawler = Crawler(num_retries=3)
+        crawler.requests_client = mock_rc
+        result, error, headers = crawler.run("http://example.com/page", extra_headers={"If-None-Match": '"v1"'})
+        self.assertEqual(mock_rc.make_request.call_count, 1)
+        self.assertEqual(mock_rc.make_request.call_args.kwargs["extra_headers"], {"If-None-Match": '"v1"'})
+        self.assertEqual(crawler.last_status_code, 304)
+        self.assertEqual(crawler.last_response_headers, {"ETag": '"v1"'})
+
     @patch("time.sleep")
     @patch("bin.crawler.RequestsClient")
     def test_retry_on_500(self, mock_rc_cls, mock_sleep):
@@ -525,7 +805,47 @@ class TestCrawlerRunRetryStatusCodes(unittest.TestCase):
         result, error, headers = crawler.run("http://example.com/page")
         self.assertEqual(result, "")
         self.assertEqual(mock_rc.make_request.call_count, 3)
-        self.assertEqual(mock_sleep.call_count, 3)
+        # 마지막 시도 뒤에는 대기하지 않음
+        self.assertEqual(mock_sleep.call_count, 2)
+
+    @patch("time.sleep")
+    @patch("bin.crawler.RequestsClient")
+    def test_no_retry_on_400(self, mock_rc_cls, mock_sleep):
+        mock_rc = MagicMock()
+        mock_rc.make_request.return_value = ("", "bad request", {}, 400)
+        mock_rc_cls.return_value = mock_rc
+
+        crawler = Crawler(num_retries=3)
+        crawler.requests_client = mock_rc
+        crawler.run("http://example.com/page")
+        self.assertEqual(mock_rc.make_request.call_count, 1)
+        mock_sleep.assert_not_called()
+
+    @patch("time.sleep")
+    @patch("bin.crawler.RequestsClient")
+    def test_retry_after_on_429(self, mock_rc_cls, mock_sleep):
+        mock_rc = MagicMock()
+        mock_rc.make_request.side_effect = [("", "too many requests", {"retry-after": "7"}, 429), ("<html>ok</html>", "", {}, 200)]
+        mock_rc_cls.return_value = mock_rc
+
+        crawler = Crawler(num_retries=3, retry_sleep=1)
+        crawler.requests_client = mock_rc
+        result, _, _ = crawler.run("http://example.com/page")
+        self.assertEqual(result, "<html>ok</html>")
+        mock_sleep.assert_called_once_with(7.0)
+
+    @patch("time.sleep")
+    @patch("bin.crawler.RequestsClient")
+    def test_retry_after_beyond_deadline_gives_up(self, mock_rc_cls, mock_sleep):
+        mock_rc = MagicMock()
+        mock_rc.make_request.return_value = ("", "unavailable", {"Retry-After": "3600"}, 503)
+        mock_rc_cls.return_value = mock_rc
+
+        crawler = Crawler(num_retries=3)
+        crawler.requests_client = mock_rc
+        crawler.run("http://example.com/page")
+        self.assertEqual(mock_rc.make_request.call_count, 1)
+        mock_sleep.assert_not_called()
 
     @patch("bin.crawler.RequestsClient")
     def test_read_timeout_exception(self, mock_rc_cls):
@@ -539,6 +859,47 @@ class TestCrawlerRunRetryStatusCodes(unittest.TestCase):
             crawler.run("http://example.com/page")
 
 
+class TestRetryPolicy(unittest.TestCase):
+    def test_is_retryable(self):
+        self.assertTrue(RetryPolicy.is_retryable(None))
+        self.assertTrue(RetryPolicy.is_retryable(500))
+        self.assertTrue(RetryPolicy.is_retryable(503))
+        self.assertTrue(RetryPolicy.is_retryable(429))
+        self.assertTrue(RetryPolicy.is_retryable(408))
+        for status_code in (301, 304, 400, 401, 403, 404, 405, 410):
+            self.assertFalse(RetryPolicy.is_retryable(status_code), status_code)
+
+    def test_parse_retry_after(self):
+        self.assertEqual(RetryPolicy.parse_retry_after(" 120 "), 120.0)
+        with patch("bin.crawler.time.time", return_value=1445412480.0):
+            self.assertEqual(RetryPolicy.parse_retry_after("Wed, 21 Oct 2015 07:30:00 GMT"), 120.0)
+            self.assertEqual(RetryPolicy.parse_retry_after("Wed, 21 Oct 2015 07:00:00 GMT"), 0.0)
+        self.assertIsNone(RetryPolicy.parse_retry_after("soon"))
+
+    def test_exponential_backoff_with_jitter(self):
+        policy = RetryPolicy(10, 2, max_delay=20, deadline=1000)
+        for attempt, full_delay in enumerate([2, 4, 8, 16, 20, 20]):
+            for _ in range(20):
+                delay = policy.get_delay(attempt)
+                self.assertGreaterEqual(delay, full_delay / 2)
+                self.assertLessEqual(delay, full_delay)
+
+    def test_retry_after_only_for_429_and_503(self):
+        policy = RetryPolicy(3, 0, max_delay=10, deadline=1000)
+        self.assertEqual(policy.get_delay(0, 503, {"Retry-After": "30"}), 30.0)
+        self.assertEqual(policy.get_delay(0, 500, {"Retry-After": "30"}), 0.0)
+
+    def test_get_next_delay(self):
+        policy = RetryPolicy(3, 10, max_delay=60, deadline=25)
+        started_at = time.monotonic()
+        self.assertIsNotNone(policy.get_next_delay(0, started_at, 500))
+        self.assertIsNone(policy.get_next_delay(0, started_at, 404))
+        # 마지막 시도
+        self.assertIsNone(policy.get_next_delay(2, started_at, 500))
+        # 마감 시간을 넘김
+        self.assertIsNone(policy.get_next_delay(1, started_at - 20, 500))
+
+
 class TestCrawlerGetOptionStr(unittest.TestCase):
     """get_option_str with various option combinations"""
 
@@ -798,6 +1159,27 @@ class TestCrawlerMain(unittest.TestCase):
         call_kwargs = mock_crawler_cls.call_args
         self.assertEqual(call_kwargs.kwargs.get("wait_until") or call_kwargs[1].get("wait_until"), "domcontentloaded")
 
+    @patch("bin.crawler.Crawler")
+    def test_main_with_blocked_resources(self, mock_crawler_cls: MagicMock) -> None:
+        mock_crawler_cls.return_value.run.return_value = ("ok", "", {})
+
+        with patch.object(_sys, "argv", ["crawler.py", "--blocked-resource-types=image,media", "--blocked-domains=ads.com,tracker.net", "https://example.com"]):
+            main()
+
+        self.assertEqual(mock_crawler_cls.call_args.kwargs["blocked_resource_types"], ["image", "media"])
+        self.assertEqual(mock_crawler_cls.call_args.kwargs["blocked_domains"], ["ads.com", "tracker.net"])
+
+    @patch("bin.crawler.Crawler")
+    def test_main_with_scroll_timeout(self, mock_crawler_cls: MagicMock) -> None:
+        mock_crawler_cls.return_value.run.return_value = ("ok", "", {})
+
+        with patch.object(_sys, "argv", ["crawler.py", "--simulate-scrolling=true", "--scroll-timeout=30", "https://example.com"]):
+            main()
+
+        self.assertEqual(mock_crawler_cls.call_args.kwargs["scroll_timeout"], 30)
+        self.assertIn("--scroll-timeout=30", Crawler.get_option_str({"simulate_scrolling": True, "scroll_timeout": 30}))
+        self.assertNotIn("--scroll-timeout", Crawler.get_option_str({"simulate_scrolling": True, "scroll_timeout": 0}))
+
     @patch("bin.crawler.Crawler")
     def test_main_wait_until_default(self, mock_crawler_cls: MagicMock) -> None:
         mock_instance = mock_crawler_cls.return_value
@@ -819,7 +1201,7 @@ class TestRequestsClientReadTimeoutOnMainRequest(unittest.TestCase):
         self.client = RequestsClient(dir_path=Path(tempfile.mkdtemp()))
 
     @patch("bin.crawler.URLSafety.check_url", return_value=(True, ""))
-    @patch("requests.get", side_effect=requests.exceptions.ReadTimeout("read timed out"))
+    @patch("requests.Session.get", side_effect=requests.exceptions.ReadTimeout("read timed out"))
     def test_read_timeout_on_main_request(self, mock_get, mock_check):
         result, error, headers, status = self.client.make_request("http://example.com/slow")
         self.assertEqual(result, "")
@@ -929,7 +1311,7 @@ class TestRequestsClientNoEncoding(unittest.TestCase):
         self.client = RequestsClient(dir_path=Path(tempfile.mkdtemp()), encoding="")
 
     @patch("bin.crawler.URLSafety.check_url", return_value=(True, ""))
-    @patch("requests.get")
+    @patch("requests.Session.get")
     def test_no_encoding_defaults_utf8(self, mock_get, mock_check):
         mock_resp = MagicMock()
         mock_resp.status_code = 200
@@ -943,7 +1325,7 @@ class TestRequestsClientNoEncoding(unittest.TestCase):
         self.assertEqual(mock_resp.encoding, "utf-8")
 
     @patch("bin.crawler.URLSafety.check_url", return_value=(True, ""))
-    @patch("requests.get")
+    @patch("requests.Session.get")
     def test_falsy_encoding_hits_else_branch(self, mock_get, mock_check):
         """encoding이 falsy일 때 else 분기(L161) 커버"""
         self.client.encoding = ""  # 직접 falsy로 설정
@@ -1048,6 +1430,380 @@ class _LoginTestHandler(BaseHTTPRequestHandler):
             self.end_headers()
 
 
+class _AsyncFetchTestServer(ThreadingHTTPServer):
+    # 동시 연결이 listen backlog(기본 5)를 넘어 SYN 재전송으로 지연되지 않도록 함
+    request_queue_size = 64
+    daemon_threads = True
+
+
+class _AsyncFetchTestHandler(BaseHTTPRequestHandler):
+    """fetch_many 테스트용 HTTP 핸들러 (요청마다 일정 시간 지연)"""
+
+    DELAY = 0.2
+
+    def log_message(self, format, *args):
+        pass  # suppress log output
+
+    def do_GET(self):
+        time.sleep(self.DELAY)
+        if self.path.startswith("/page/"):
+            self.send_response(200)
+            self.send_header("Content-Type", "text/html; charset=utf-8")
+            self.send_header("Set-Cookie", "sid=abc; Path=/")
+            self.end_headers()
+            self.wfile.write(f"<html><head></head><body>{self.path} 본문 {self.headers.get('Cookie', '')}</body></html>".encode())
+        elif self.path == "/redirect":
+            self.send_response(302)
+            self.send_header("Location", "/page/redirected")
+            self.end_headers()
+        elif self.path == "/redirect-to-localhost":
+            self.send_response(302)
+            self.send_header("Location", f"http://localhost:{self.server.server_port}/page/x")
+            self.end_headers()
+        elif self.path == "/file":
+            self.send_response(200)
+            self.send_header("Content-Type", "application/octet-stream")
+            self.end_headers()
+            self.wfile.write(b"x" * 3000)
+        else:
+            self.send_response(404)
+            self.end_headers()
+
+
+class TestAsyncRequestsClient(unittest.TestCase):
+    """AsyncRequestsClient.fetch_many() - 실제 HTTP 서버 기반 통합 테스트"""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.port = _find_free_port()
+        cls.server = _AsyncFetchTestServer(("127.0.0.1", cls.port), _AsyncFetchTestHandler)
+        cls.server_thread = threading.Thread(target=cls.server.serve_forever, daemon=True)
+        cls.server_thread.start()
+        cls.base_url = f"http://127.0.0.1:{cls.port}"
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.shutdown()
+        cls.server.server_close()
+
+    def setUp(self):
+        self.tmp = Path(tempfile.mkdtemp())
+
+    def _make_client(self, max_concurrency: int) -> AsyncRequestsClient:
+        with patch("bin.crawler.Env.get", return_value="true"):
+            return AsyncRequestsClient(dir_path=self.tmp, max_concurrency=max_concurrency)
+
+    def test_fetch_many_is_concurrent_and_ordered(self):
+        urls = [f"{self.base_url}/page/{i}" for i in range(8)]
+        start = time.monotonic()
+        results = self._make_client(max_concurrency=8).fetch_many(urls)
+        elapsed = time.monotonic() - start
+        # 순차로 받으면 8 * 0.2초 이상 걸림
+        self.assertLess(elapsed, 8 * _AsyncFetchTestHandler.DELAY / 2)
+        self.assertEqual(len(results), 8)
+        for i, (text, error, _, status_code) in enumerate(results):
+            self.assertEqual(error, "")
+            self.assertEqual(status_code, 200)
+            self.assertIn(f"/page/{i} 본문", text)
+            self.assertIn(f'<meta property="og:url" content="{self.base_url}/page/{i}"/>', text)
+
+    def test_concurrency_is_bounded(self):
+        urls = [f"{self.base_url}/page/{i}" for i in range(4)]
+        start = time.monotonic()
+        self._make_client(max_concurrency=2).fetch_many(urls)
+        self.assertGreaterEqual(time.monotonic() - start, 2 * _AsyncFetchTestHandler.DELAY)
+
+    def test_cookies_are_shared_with_cookie_store(self):
+        client = self._make_client(max_concurrency=2)
+        client.fetch_many([f"{self.base_url}/page/0"])
+        self.assertEqual(client._get_cookie_store().get_cookies().get("sid"), "abc")
+        text = client.fetch_many([f"{self.base_url}/page/1"])[0][0]
+        self.assertIn("sid=abc", text)
+
+    def test_redirects_are_checked(self):
+        results = self._make_client(max_concurrency=2).fetch_many([f"{self.base_url}/redirect", f"{self.base_url}/redirect-to-localhost", f"{self.base_url}/missing"])
+        self.assertIn("/page/redirected 본문", results[0][0])
+        self.assertIn(f'content="{self.base_url}/page/redirected"', results[0][0])
+        self.assertEqual(results[1][0], "")
+        self.assertIn("blocked url", results[1][1])
+        self.assertEqual(results[2][3], 404)
+
+    def test_download_files(self):
+        download_file = self.tmp / "file.bin"
+        client = self._make_client(max_concurrency=2)
+        results = client.fetch_many([f"{self.base_url}/file"], [download_file])
+        self.assertEqual(results[0][:2], ("200", ""))
+        self.assertEqual(download_file.read_bytes(), b"x" * 3000)
+
+        client.max_download_size = 1000
+        results = client.fetch_many([f"{self.base_url}/file"], [self.tmp / "big.bin"])
+        self.assertIn("exceeds the maximum download size", results[0][1])
+        self.assertEqual(sorted(p.name for p in self.tmp.iterdir() if p.name.endswith(".bin") or p.name.endswith(".tmp")), ["file.bin"])
+
+    def test_thread_fallback_without_httpx(self):
+        client = self._make_client(max_concurrency=4)
+        with patch("bin.crawler.httpx", None), patch.object(AsyncRequestsClient, "_is_thread_fallback_logged", False), patch.object(client, "make_request", return_value=("<html>ok</html>", "", {}, 200)) as mock_make_request, patch("bin.crawler.LOGGER.info") as mock_info:
+            results = client.fetch_many(["https://example.com/a", "https://example.com/b"])
+            client.fetch_many(["https://example.com/c"])
+        self.assertEqual([r[0] for r in results], ["<html>ok</html>"] * 2)
+        self.assertEqual(mock_make_request.call_count, 3)
+        # 스레드로 받는다는 안내는 한 번만 남김
+        self.assertEqual(sum(1 for c in mock_info.call_args_list if "httpx is not installed" in c.args[0]), 1)
+
+
+class TestHttp2Adapter(unittest.TestCase):
+    """site_config.json의 http2_hosts로 선택되는 HTTP/2 어댑터 (h2 대신 HTTP/1.1 httpx 클라이언트로 변환 경로를 검증)"""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.port = _find_free_port()
+        cls.server = _AsyncFetchTestServer(("127.0.0.1", cls.port), _AsyncFetchTestHandler)
+        cls.server_thread = threading.Thread(target=cls.server.serve_forever, daemon=True)
+        cls.server_thread.start()
+        cls.base_url = f"http://127.0.0.1:{cls.port}"
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.shutdown()
+        cls.server.server_close()
+
+    def setUp(self):
+        SessionPool.close_all()
+        self.group_dir = Path(tempfile.mkdtemp())
+        self.feed_dir = self.group_dir / "feed"
+        self.feed_dir.mkdir()
+        (self.group_dir / "site_config.json").write_text(json.dumps({"http2_hosts": ["127.0.0.1", ".cdn.example.net"]}))
+
+    def tearDown(self):
+        SessionPool.close_all()
+
+    def _make_client(self) -> RequestsClient:
+        with patch("bin.crawler.Env.get", return_value="true"):
+            return RequestsClient(dir_path=self.feed_dir)
+
+    @staticmethod
+    def _create_http1_client(adapter, verify):
+        return httpx.Client(follow_redirects=False)
+
+    def test_http2_hosts_from_site_config(self):
+        client = self._make_client()
+        self.assertTrue(client.is_http2_host("https://img.cdn.example.net/a.jpg"))
+        self.assertTrue(client.is_http2_host("https://cdn.example.net/a.jpg"))
+        self.assertFalse(client.is_http2_host("https://example.net/a.jpg"))
+        self.assertIsInstance(client._get_session("https://img.cdn.example.net/a.jpg").get_adapter("https://img.cdn.example.net/"), Http2Adapter)
+        self.assertIsInstance(client._get_session("https://example.net/a.jpg").get_adapter("https://example.net/"), HTTPAdapter)
+
+    def test_site_config_without_http2_hosts(self):
+        (self.group_dir / "site_config.json").write_text("{broken")
+        self.assertEqual(RequestsClient.load_http2_hosts(self.feed_dir), frozenset())
+        self.assertEqual(RequestsClient.load_http2_hosts(Path(tempfile.mkdtemp())), frozenset())
+
+    @patch("bin.crawler._is_h2_available", return_value=False)
+    def test_falls_back_to_http1_without_h2(self, mock_h2):
+        with patch.object(Http2Adapter, "_create_client") as mock_create_client:
+            text, error, _, status_code = self._make_client().make_request(f"{self.base_url}/page/1")
+        self.assertEqual((error, status_code), ("", 200))
+        self.assertIn("/page/1 본문", text)
+        mock_create_client.assert_not_called()
+
+    @patch("bin.crawler._is_h2_available", return_value=True)
+    def test_requests_go_through_httpx_client(self, mock_h2):
+        with patch.object(Http2Adapter, "_create_client", self._create_http1_client):
+            client = self._make_client()
+            text, error, _, status_code = client.make_request(f"{self.base_url}/redirect")
+            self.assertEqual((error, status_code), ("", 200))
+            self.assertIn("/page/redirected 본문", text)
+            self.assertIn(f'<meta property="og:url" content="{self.base_url}/page/redirected"/>', text)
+            self.assertEqual(client._get_cookie_store().get_cookies().get("sid"), "abc")
+
+            download_file = self.feed_dir / "file.bin"
+            self.assertEqual(client.make_request(f"{self.base_url}/file", download_file=download_file)[:2], ("200", ""))
+            self.assertEqual(download_file.read_bytes(), b"x" * 3000)
+
+            adapter = client._get_session(self.base_url).get_adapter(self.base_url)
+            self.assertEqual(len(adapter.clients), 1)
+
+    @patch("bin.crawler._is_h2_available", return_value=True)
+    def test_protocol_error_falls_back_to_http1(self, mock_h2):
+        mock_httpx_client = MagicMock()
+        mock_httpx_client.send.side_effect = httpx.RemoteProtocolError("bad h2 frame")
+        with patch.object(Http2Adapter, "_create_client", return_value=mock_httpx_client):
+            client = self._make_client()
+            text, error, _, status_code = client.make_request(f"{self.base_url}/page/2")
+            self.assertEqual((error, status_code), ("", 200))
+            self.assertIn("/page/2 본문", text)
+            adapter = client._get_session(self.base_url).get_adapter(self.base_url)
+            self.assertEqual(adapter.http1_hosts, {"127.0.0.1"})
+            # 이후 요청은 바로 HTTP/1.1로 보냄
+            client.make_request(f"{self.base_url}/page/3")
+        self.assertEqual(mock_httpx_client.send.call_count, 1)
+
+    @patch("bin.crawler._is_h2_available", return_value=True)
+    def test_transport_errors_map_to_requests_errors(self, mock_h2):
+        mock_httpx_client = MagicMock()
+        with patch.object(Http2Adapter, "_create_client", return_value=mock_httpx_client):
+            client = self._make_client()
+            mock_httpx_client.send.side_effect = httpx.ReadTimeout("timeout")
+            self.assertIn("for timeout", client.make_request(f"{self.base_url}/page/4")[1])
+            mock_httpx_client.send.side_effect = httpx.ConnectError("refused")
+            self.assertIn("temporary network error", client.make_request(f"{self.base_url}/page/5")[1])
+
+
+def _can_import_h2() -> bool:
+    try:
+        import h2  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+
+class _TlsTestServer(socketserver.ThreadingTCPServer):
+    """ALPN으로 h2 또는 http/1.1을 협상하는 TLS 테스트 서버 (협상된 프로토콜을 기록함)"""
+
+    daemon_threads = True
+    allow_reuse_address = True
+
+    def __init__(self, server_address, ssl_context: ssl.SSLContext) -> None:
+        super().__init__(server_address, _TlsTestHandler)
+        self.ssl_context = ssl_context
+        self.protocols: list[str] = []
+
+
+class _TlsTestHandler(socketserver.BaseRequestHandler):
+    BODY = b"<html><head></head><body>tls body</body></html>"
+
+    def handle(self):
+        sock = self.server.ssl_context.wrap_socket(self.request, server_side=True)
+        protocol = sock.selected_alpn_protocol() or "http/1.1"
+        self.server.protocols.append(protocol)
+        if protocol == "h2":
+            self._handle_h2(sock)
+        else:
+            self._handle_http1(sock)
+        sock.close()
+
+    def _handle_http1(self, sock):
+        data = b""
+        while b"\r\n\r\n" not in data:
+            chunk = sock.recv(65535)
+            if not chunk:
+                return
+            data += chunk
+        sock.sendall(b"HTTP/1.1 200 OK\r\nContent-Type: text/html; charset=utf-8\r\nContent-Length: %d\r\nConnection: close\r\n\r\n" % len(self.BODY) + self.BODY)
+
+    def _handle_h2(self, sock):
+        import h2.config
+        import h2.connection
+        import h2.events
+
+        conn = h2.connection.H2Connection(config=h2.config.H2Configuration(client_side=False))
+        conn.initiate_connection()
+        sock.sendall(conn.data_to_send())
+        while True:
+            data = sock.recv(65535)
+            if not data:
+                return
+            for event in conn.receive_data(data):
+                if isinstance(event, h2.events.RequestReceived):
+                    conn.send_headers(event.stream_id, [(":status", "200"), ("content-type", "text/html; charset=utf-8"), ("content-length", str(len(self.BODY)))])
+                    conn.send_data(event.stream_id, self.BODY, end_stream=True)
+                elif isinstance(event, h2.events.ConnectionTerminated):
+                    return
+            sock.sendall(conn.data_to_send())
+
+
+@unittest.skipUnless(_can_import_h2() and shutil.which("openssl"), "h2 or openssl not available")
+class TestHttp2Negotiation(unittest.TestCase):
+    """실제 TLS 서버와 ALPN으로 HTTP/2를 협상하고, h2가 없으면 HTTP/1.1로 요청하는지 확인"""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.cert_dir = Path(tempfile.mkdtemp())
+        cls.cert_file_path = cls.cert_dir / "cert.pem"
+        key_file_path = cls.cert_dir / "key.pem"
+        subprocess.run(["openssl", "req", "-x509", "-newkey", "rsa:2048", "-nodes", "-days", "1", "-subj", "/CN=127.0.0.1", "-addext", "subjectAltName=IP:127.0.0.1", "-keyout", str(key_file_path), "-out", str(cls.cert_file_path)], check=True, capture_output=True)
+        ssl_context = ssl.create_default_context(ssl.Purpose.CLIENT_AUTH)
+        ssl_context.load_cert_chain(cls.cert_file_path, key_file_path)
+        ssl_context.set_alpn_protocols(["h2", "http/1.1"])
+        cls.port = _find_free_port()
+        cls.server = _TlsTestServer(("127.0.0.1", cls.port), ssl_context)
+        cls.server_thread = threading.Thread(target=cls.server.serve_forever, daemon=True)
+        cls.server_thread.start()
+        cls.url = f"https://127.0.0.1:{cls.port}/page"
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.shutdown()
+        cls.server.server_close()
+        shutil.rmtree(cls.cert_dir, ignore_errors=True)
+
+    def setUp(self):
+        SessionPool.close_all()
+        _is_h2_available.cache_clear()
+        self.server.protocols.clear()
+        self.feed_dir = Path(tempfile.mkdtemp())
+        (self.feed_dir / "site_config.json").write_text(json.dumps({"http2_hosts": ["127.0.0.1"]}))
+
+    def tearDown(self):
+        SessionPool.close_all()
+        _is_h2_available.cache_clear()
+        shutil.rmtree(self.feed_dir, ignore_errors=True)
+
+    def _make_request(self) -> tuple[str, str, dict, Optional[int]]:
+        with patch("bin.crawler.Env.get", return_value="true"):
+            client = RequestsClient(dir_path=self.feed_dir)
+        # requests가 verify=True 대신 이 CA 파일 경로를 어댑터에 넘김
+        with patch.dict(os.environ, {"REQUESTS_CA_BUNDLE": str(self.cert_file_path)}):
+            return client.make_request(self.url)
+
+    def test_http2_is_negotiated(self):
+        text, error, _, status_code = self._make_request()
+        self.assertEqual((error, status_code), ("", 200))
+        self.assertIn("tls body", text)
+        self.assertEqual(self.server.protocols, ["h2"])
+
+    def test_falls_back_to_http1_when_h2_is_not_installed(self):
+        with patch.dict(_sys.modules, {"h2": None}):
+            self.assertFalse(_is_h2_available())
+            text, error, _, status_code = self._make_request()
+        self.assertEqual((error, status_code), ("", 200))
+        self.assertIn("tls body", text)
+        self.assertEqual(self.server.protocols, ["http/1.1"])
+
+
+class TestCrawlerFetchMany(unittest.TestCase):
+    def setUp(self):
+        self.tmp = Path(tempfile.mkdtemp())
+
+    def test_retryable_failures_go_through_run(self):
+        crawler = Crawler(dir_path=self.tmp, num_retries=2, retry_sleep=0)
+        with patch("bin.crawler.AsyncRequestsClient.fetch_many", return_value=[("<html>a</html>", "", {}, 200), ("", "error", {}, 503), ("", "not found", {}, 404)]), patch.object(crawler, "run", return_value=("<html>b</html>", "", None)) as mock_run:
+            results = crawler.fetch_many(["https://example.com/a", "https://example.com/b", "https://example.com/c"])
+        self.assertEqual(results, [("<html>a</html>", "", None), ("<html>b</html>", "", None), ("", "not found", {})])
+        mock_run.assert_called_once_with("https://example.com/b", download_file=None)
+
+    def test_render_js_uses_page_pool(self):
+        with patch("bin.crawler.HeadlessBrowser"):
+            crawler = Crawler(dir_path=self.tmp, render_js=True, num_retries=2)
+        crawler.rate_limiter = MagicMock()
+        crawler.headless_browser.make_requests.return_value = ["<html>a</html>", ""]
+        with patch.object(crawler, "run", return_value=("<html>b</html>", "", None)) as mock_run:
+            results = crawler.fetch_many(["https://example.com/a", "https://example.com/b"])
+        self.assertEqual(results, [("<html>a</html>", "", None), ("<html>b</html>", "", None)])
+        crawler.headless_browser.make_requests.assert_called_once_with(["https://example.com/a", "https://example.com/b"])
+        # 빈 결과만 run()으로 다시 시도 (다른 엔진으로의 fallback 포함)
+        mock_run.assert_called_once_with("https://example.com/b")
+        self.assertEqual(crawler.rate_limiter.acquire.call_count, 2)
+
+    def test_render_js_downloads_fall_back_to_run(self):
+        with patch("bin.crawler.HeadlessBrowser"):
+            crawler = Crawler(dir_path=self.tmp, render_js=True)
+        with patch.object(crawler, "run", return_value=("<html>ok</html>", "", None)) as mock_run:
+            self.assertEqual(crawler.fetch_many(["https://example.com/a", "https://example.com/b"], [self.tmp / "a", None]), [("<html>ok</html>", "", None)] * 2)
+        self.assertEqual(mock_run.call_count, 2)
+        crawler.headless_browser.make_requests.assert_not_called()
+
+
 class TestLoginManagerLoadConfig(unittest.TestCase):
     """LoginManager.load_login_config() - 실제 파일 I/O 테스트"""
 
@@ -1245,8 +2001,8 @@ class TestRequestsClientLoginMocked(unittest.TestCase):
         self.tmp = Path(tempfile.mkdtemp())
         self.client = RequestsClient(dir_path=self.tmp)
 
-    @patch("requests.post")
-    @patch("requests.get")
+    @patch("requests.Session.post")
+    @patch("requests.Session.get")
     def test_login_returns_false_when_fields_cannot_be_determined(self, mock_get, mock_post):
         mock_resp = MagicMock()
         mock_resp.text = "<html><body><form></form></body></html>"
@@ -1257,8 +2013,8 @@ class TestRequestsClientLoginMocked(unittest.TestCase):
         self.assertFalse(result)
         mock_post.assert_not_called()
 
-    @patch("requests.post", side_effect=requests.exceptions.ConnectionError("boom"))
-    @patch("requests.get")
+    @patch("requests.Session.post", side_effect=requests.exceptions.ConnectionError("boom"))
+    @patch("requests.Session.get")
     def test_login_post_uses_cookie_header_and_handles_exception(self, mock_get, mock_post):
         login_page_resp = MagicMock()
         login_page_resp.text = LOGIN_FORM_HTML
@@ -1271,7 +2027,7 @@ class TestRequestsClientLoginMocked(unittest.TestCase):
             result = self.client.login({"login_url": "http://example.com/login", "id": "user", "password": "pass", "id_field": "username", "password_field": "passwd"})
 
         self.assertFalse(result)
-        mock_write.assert_called_once_with(login_page_resp.cookies)
+        mock_write.assert_called_once_with(login_page_resp.cookies, "http://example.com/login")
         mock_post.assert_called_once()
         self.assertIn("Cookie", mock_post.call_args.kwargs["headers"])
         self.assertIn("saved=cookie", mock_post.call_args.kwargs["headers"]["Cookie"])
@@ -1405,7 +2161,7 @@ class TestRequestsClientPersistsResponseCookies(unittest.TestCase):
         self.client = RequestsClient(dir_path=self.tmp)
 
     @patch("bin.crawler.URLSafety.check_url", return_value=(True, ""))
-    @patch("requests.get")
+    @patch("requests.Session.get")
     def test_response_cookies_are_written_to_jar(self, mock_get, mock_check):
         mock_resp = MagicMock()
         mock_resp.status_code = 200
@@ -1426,7 +2182,7 @@ class TestRequestsClientPersistsResponseCookies(unittest.TestCase):
         self.assertEqual(saved["sid"], "from-main-response")
 
     @patch("bin.crawler.URLSafety.check_url", return_value=(True, ""))
-    @patch("requests.get")
+    @patch("requests.Session.get")
     def test_no_jar_is_written_when_response_has_no_cookies(self, mock_get, mock_check):
         mock_resp = MagicMock()
         mock_resp.status_code = 200
@@ -1441,6 +2197,58 @@ class TestRequestsClientPersistsResponseCookies(unittest.TestCase):
         self.assertFalse((self.tmp / RequestsClient.COOKIE_FILE).is_file())
 
 
+class TestSessionPool(unittest.TestCase):
+    """SessionPool: host/verify_ssl/헤더 프로필별 requests.Session 재사용"""
+
+    def setUp(self):
+        SessionPool.close_all()
+
+    def tearDown(self):
+        SessionPool.close_all()
+
+    def test_same_key_reuses_session(self):
+        headers = {"User-Agent": "UA"}
+        s1 = SessionPool.get_session("https://example.com/a", headers=headers)
+        s2 = SessionPool.get_session("https://EXAMPLE.com/b?x=1", headers=dict(headers, Referer="https://example.com/", Cookie="a=b"))
+        self.assertIs(s1, s2)
+
+    def test_different_key_uses_different_session(self):
+        base = SessionPool.get_session("https://example.com/", headers={"User-Agent": "UA"})
+        self.assertIsNot(base, SessionPool.get_session("https://other.com/", headers={"User-Agent": "UA"}))
+        self.assertIsNot(base, SessionPool.get_session("https://example.com/", verify_ssl=False, headers={"User-Agent": "UA"}))
+        self.assertIsNot(base, SessionPool.get_session("https://example.com/", headers={"User-Agent": "Other"}))
+
+    @patch("bin.crawler.Env.get", side_effect=lambda k, d="": {"FM_CRAWLER_POOL_MAXSIZE": "3"}.get(k, d))
+    def test_pool_size_from_env(self, mock_env):
+        session = SessionPool.get_session("https://example.com/")
+        adapter = session.get_adapter("https://example.com/")
+        self.assertEqual(adapter._pool_maxsize, 3)
+        self.assertEqual(adapter._pool_connections, SessionPool.DEFAULT_POOL_CONNECTIONS)
+
+    def test_session_does_not_persist_cookies(self):
+        port = _find_free_port()
+        server = HTTPServer(("127.0.0.1", port), _LoginTestHandler)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        try:
+            session = SessionPool.get_session(f"http://127.0.0.1:{port}/")
+            login_response = session.post(f"http://127.0.0.1:{port}/do_login", data={"username": "testuser", "passwd": "testpass"}, timeout=5)
+            self.assertIn("session_id", login_response.cookies)
+            # 쿠키는 RequestsClient가 파일로 관리하므로 세션이 대신 보내지 않아야 함
+            self.assertEqual(session.get(f"http://127.0.0.1:{port}/protected", timeout=5).status_code, 403)
+            self.assertEqual(session.get(f"http://127.0.0.1:{port}/protected", headers={"Cookie": "session_id=x"}, timeout=5).status_code, 200)
+        finally:
+            server.shutdown()
+            server.server_close()
+
+    @patch("bin.crawler.URLSafety.check_url", return_value=(True, ""))
+    @patch("bin.crawler.Env.get", return_value="false")
+    def test_crawlers_share_session(self, mock_env, mock_check):
+        tmp = Path(tempfile.mkdtemp())
+        c1 = Crawler(dir_path=tmp, headers={"Referer": "https://example.com/list"})
+        c2 = Crawler(dir_path=tmp)
+        self.assertIs(c1.requests_client._get_session("https://example.com/1"), c2.requests_client._get_session("https://example.com/2"))
+
+
 class TestGetOptionStrRetryOptions(unittest.TestCase):
     """get_option_str builds the crawler.py command line used by feed_maker."""
 
@@ -151,28 +151,6 @@ class TestFileLock(unittest.TestCase):
                 lock2.acquire(timeout=0.1)
 
 
-# ---------------------------------------------------------------------------
-# 4. OrderedSet
-# ---------------------------------------------------------------------------
-class TestOrderedSet(unittest.TestCase):
-    def test_creation_and_order(self) -> None:
-        from ordered_set import OrderedSet
-
-        s = OrderedSet([3, 1, 2, 1, 3])
-        self.assertEqual(list(s), [3, 1, 2])
-
-    def test_add_and_membership(self) -> None:
-        from ordered_set import OrderedSet
-
-        s = OrderedSet()
-        s.add("a")
-        s.add("b")
-        s.add("a")
-        self.assertIn("a", s)
-        self.assertEqual(len(s), 2)
-        self.assertEqual(list(s), ["a", "b"])
-
-
 # ---------------------------------------------------------------------------
 # 5. pdf2image
 # ---------------------------------------------------------------------------
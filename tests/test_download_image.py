@@ -25,11 +25,14 @@ class TestDownloadImage(unittest.TestCase):
         mock_config_instance = MagicMock()
         mock_config_instance.get_extraction_configs.return_value = {"user_agent": "", "exclude_ad_images": False}
         self._patcher_config = patch("utils.download_image.Config", return_value=mock_config_instance)
+        self._patcher_prefetch = patch("utils.image_downloader.ImageDownloader.prefetch_images", return_value=0)
         self._patcher_is_dir.start()
         self._patcher_mkdir.start()
         self._patcher_config.start()
+        self.mock_prefetch = self._patcher_prefetch.start()
 
     def tearDown(self) -> None:
+        self._patcher_prefetch.stop()
         self._patcher_config.stop()
         self._patcher_mkdir.stop()
         self._patcher_is_dir.stop()
@@ -46,6 +49,18 @@ class TestDownloadImage(unittest.TestCase):
             utils.download_image.main()
             self.assertEqual(mock_stdout.getvalue(), expected_output)
 
+    @patch("utils.image_downloader.ImageDownloader.download_image")
+    def test_images_are_prefetched_before_replacement(self, mock_download: MagicMock) -> None:
+        mock_download.return_value = (True, f"{Env.get('WEB_SERVICE_IMAGE_URL_PREFIX')}/one_second/753d4f8.webp")
+
+        test_input = "<img src='https://image-comic.pstatic.net/a.jpg'>\n<img src='https://image-comic.pstatic.net/b.jpg'>\n"
+
+        with patch("sys.argv", self.fake_argv), patch("sys.stdin", new=io.StringIO(test_input)), patch("sys.stdout", new_callable=io.StringIO):
+            utils.download_image.main()
+        self.mock_prefetch.assert_called_once()
+        self.assertEqual(self.mock_prefetch.call_args.args[2], ["https://image-comic.pstatic.net/a.jpg", "https://image-comic.pstatic.net/b.jpg"])
+        self.assertEqual(mock_download.call_count, 2)
+
     @patch("utils.image_downloader.ImageDownloader.download_image")
     def test_download_image_with_double_quote(self, mock_download: MagicMock) -> None:
         # Mock image download operations
@@ -410,11 +425,14 @@ class TestNewOptions(unittest.TestCase):
         mock_cfg = MagicMock()
         mock_cfg.get_extraction_configs.return_value = {"user_agent": "", "exclude_ad_images": False}
         self._patcher_config = patch("utils.download_image.Config", return_value=mock_cfg)
+        self._patcher_prefetch = patch("utils.image_downloader.ImageDownloader.prefetch_images", return_value=0)
         self._patcher_is_dir.start()
         self._patcher_mkdir.start()
         self._patcher_config.start()
+        self.mock_prefetch = self._patcher_prefetch.start()
 
     def tearDown(self) -> None:
+        self._patcher_prefetch.stop()
         self._patcher_config.stop()
         self._patcher_mkdir.stop()
         self._patcher_is_dir.stop()
@@ -11,6 +11,7 @@ from unittest.mock import patch, Mock
 from xml.dom.minidom import parse
 
 from bin.feed_maker import FeedMaker
+from bin.crawler import Crawler
 from bin.feed_maker_util import Config, Datetime, PathUtil, Env, header_str
 import tempfile
 from unittest.mock import MagicMock  # noqa: F401
@@ -169,35 +170,28 @@ class TestFeedMaker(unittest.TestCase):
         expected = self.list_file1_path
         self.assertEqual(expected, actual)
 
-    def test_cmp_int_or_str(self) -> None:
-        a = {"sf": "1"}
-        b = {"sf": "2"}
-        actual = FeedMaker._cmp_int_or_str(a, b)
+    def test_compare_sort_keys(self) -> None:
+        actual = FeedMaker._compare_sort_keys(FeedMaker._get_sort_key("1"), FeedMaker._get_sort_key("2"))
         expected = -1
         self.assertEqual(expected, actual)
 
-        a = {"sf": "10"}
-        b = {"sf": "1"}
-        actual = FeedMaker._cmp_int_or_str(a, b)
+        actual = FeedMaker._compare_sort_keys(FeedMaker._get_sort_key("10"), FeedMaker._get_sort_key("1"))
         expected = 9
         self.assertEqual(expected, actual)
 
-        a = {"sf": "hello"}
-        b = {"sf": "hell"}
-        actual = FeedMaker._cmp_int_or_str(a, b)
+        actual = FeedMaker._compare_sort_keys(FeedMaker._get_sort_key("hello"), FeedMaker._get_sort_key("hell"))
         expected = 1
         self.assertEqual(expected, actual)
 
-        a = {"sf": "hello"}
-        b = {"sf": "world"}
-        actual = FeedMaker._cmp_int_or_str(a, b)
+        actual = FeedMaker._compare_sort_keys(FeedMaker._get_sort_key("hello"), FeedMaker._get_sort_key("world"))
         expected = -1
         self.assertEqual(expected, actual)
 
-    def test_cmp_to_key(self) -> None:
-        data_list = [{"id": 1, "sf": "399"}, {"id": 2, "sf": "400"}, {"id": 3, "sf": "398"}]
-        actual = sorted(data_list, key=FeedMaker._cmp_to_key(FeedMaker._cmp_int_or_str))
-        expected = [{"id": 3, "sf": "398"}, {"id": 1, "sf": "399"}, {"id": 2, "sf": "400"}]
+    def test_sort_by_sort_key(self) -> None:
+        data_list = [(FeedMaker._get_sort_key(sf), str(i)) for i, sf in enumerate(["399", "400", "398"], start=1)]
+        FeedMaker._sort_by_sort_key(data_list)
+        actual = [link for _, link in data_list]
+        expected = ["3", "1", "2"]
         self.assertEqual(expected, actual)
 
     def test_make_html_file(self) -> None:
@@ -407,8 +401,8 @@ class TestFeedMaker(unittest.TestCase):
         self.assertTrue(self.maker.failed_urls_cache_file.exists())
         self.assertTrue(self.maker._is_url_recently_failed(failed_url))
 
-        # 만료되지 않았으므로 정리되지 않아야 함
-        self.maker._cleanup_expired_failed_urls()
+        # 만료되지 않았으므로 파일을 다시 읽어도 남아 있어야 함
+        self.maker.failed_url_map = None
         self.assertTrue(self.maker._is_url_recently_failed(failed_url))
 
         # 시나리오 2: ignore_broken_link = "" (기본값)
@@ -432,7 +426,7 @@ class TestFeedMaker(unittest.TestCase):
         self.assertFalse(self.maker._is_url_recently_failed(expired_url))
 
         # 정리 작업 후에는 파일에서 삭제되어야 함
-        self.maker._cleanup_expired_failed_urls()
+        self.maker._compact_failed_urls()
         with self.maker.failed_urls_cache_file.open("r", encoding="utf-8") as f:
             content = f.read()
             self.assertNotIn(expired_url, content)
@@ -480,70 +474,58 @@ class TestFeedMaker(unittest.TestCase):
                         self.assertGreater(expiry_dt, now, f"Expiry date should be in the future for case: {case}")
 
 
-class TestCmpIntOrStr(unittest.TestCase):
+class TestCompareSortKeys(unittest.TestCase):
+    @staticmethod
+    def _compare(a: str, b: str) -> int:
+        return FeedMaker._compare_sort_keys(FeedMaker._get_sort_key(a), FeedMaker._get_sort_key(b))
+
     def test_both_numeric(self) -> None:
-        a = {"sf": "10"}
-        b = {"sf": "3"}
-        self.assertGreater(FeedMaker._cmp_int_or_str(a, b), 0)
+        self.assertGreater(self._compare("10", "3"), 0)
 
     def test_both_numeric_equal(self) -> None:
-        a = {"sf": "5"}
-        b = {"sf": "5"}
-        self.assertEqual(FeedMaker._cmp_int_or_str(a, b), 0)
+        self.assertEqual(self._compare("5", "5"), 0)
+        self.assertEqual(self._compare("007", "7"), 0)
 
     def test_both_numeric_less(self) -> None:
-        a = {"sf": "2"}
-        b = {"sf": "10"}
-        self.assertLess(FeedMaker._cmp_int_or_str(a, b), 0)
+        self.assertLess(self._compare("2", "10"), 0)
 
     def test_both_string_less(self) -> None:
-        a = {"sf": "apple"}
-        b = {"sf": "banana"}
-        self.assertLess(FeedMaker._cmp_int_or_str(a, b), 0)
+        self.assertLess(self._compare("apple", "banana"), 0)
 
     def test_both_string_greater(self) -> None:
-        a = {"sf": "banana"}
-        b = {"sf": "apple"}
-        self.assertGreater(FeedMaker._cmp_int_or_str(a, b), 0)
+        self.assertGreater(self._compare("banana", "apple"), 0)
 
     def test_both_string_equal(self) -> None:
-        a = {"sf": "same"}
-        b = {"sf": "same"}
-        self.assertEqual(FeedMaker._cmp_int_or_str(a, b), 0)
+        self.assertEqual(self._compare("same", "same"), 0)
 
     def test_mixed_numeric_and_string(self) -> None:
         # One numeric, one string -> string comparison
-        a = {"sf": "10"}
-        b = {"sf": "abc"}
-        result = FeedMaker._cmp_int_or_str(a, b)
-        self.assertIsInstance(result, int)
-
-
-class TestCmpToKey(unittest.TestCase):
-    def test_sorting_with_cmp_to_key(self) -> None:
-        items = [{"sf": "10"}, {"sf": "2"}, {"sf": "5"}]
-        key_func = FeedMaker._cmp_to_key(FeedMaker._cmp_int_or_str)
-        sorted_items = sorted(items, key=key_func)
-        self.assertEqual([d["sf"] for d in sorted_items], ["2", "5", "10"])
-
-    def test_comparator_lt_gt_eq(self) -> None:
-        key_func = FeedMaker._cmp_to_key(FeedMaker._cmp_int_or_str)
-        k1 = key_func({"sf": "1"})
-        k2 = key_func({"sf": "2"})
-        k3 = key_func({"sf": "2"})
-
-        self.assertTrue(k1 < k2)
-        self.assertTrue(k2 > k1)
-        self.assertTrue(k2 == k3)
-        self.assertTrue(k1 <= k2)
-        self.assertTrue(k2 >= k1)
-        self.assertTrue(k1 != k2)
-
-    def test_eq_with_non_k_type(self) -> None:
-        key_func = FeedMaker._cmp_to_key(FeedMaker._cmp_int_or_str)
-        k1 = key_func({"sf": "1"})
-        self.assertEqual(k1.__eq__("not_a_K"), NotImplemented)
-        self.assertEqual(k1.__ne__("not_a_K"), NotImplemented)
+        self.assertLess(self._compare("10", "1a"), 0)
+        self.assertLess(self._compare("1a", "9"), 0)
+
+
+class TestSortBySortKey(unittest.TestCase):
+    @staticmethod
+    def _sort(sort_field_list: list[str]) -> list[str]:
+        sort_key_link_list = [(FeedMaker._get_sort_key(sf), sf) for sf in sort_field_list]
+        FeedMaker._sort_by_sort_key(sort_key_link_list)
+        return [sf for _, sf in sort_key_link_list]
+
+    def test_numeric_only(self) -> None:
+        self.assertEqual(self._sort(["10", "2", "5", "007", "7"]), ["2", "5", "007", "7", "10"])
+
+    def test_string_only(self) -> None:
+        self.assertEqual(self._sort(["b", "a 2", "a 10", "c"]), ["a 10", "a 2", "b", "c"])
+
+    def test_mixed_keeps_previous_order(self) -> None:
+        # 숫자와 문자열이 섞인 정렬필드는 예전 비교 함수(_cmp_int_or_str)로 정렬한 순서와 같아야 함
+        # (완료된 피드의 start_index 창이 옮겨지지 않도록)
+        actual = self._sort(["10", "9", "1a", "2", "abc", "100", "10 2", "007", "7", "999999999"])
+        expected = ["1a", "2", "007", "7", "9", "10", "10 2", "100", "999999999", "abc"]
+        self.assertEqual(expected, actual)
+
+    def test_empty(self) -> None:
+        self.assertEqual(self._sort([]), [])
 
 
 class TestGetImageTagStr(unittest.TestCase):
@@ -739,6 +721,27 @@ class TestReadOldFeedListFromFile(unittest.TestCase):
 # ────────────────────────────────────────────────────────
 # From test_final_gaps.py: feed_maker 추가 테스트
 # ────────────────────────────────────────────────────────
+class TestFeedMakerFlushesCookies(unittest.TestCase):
+    """make() flushes write-behind cookies when the feed ends, even on errors."""
+
+    @patch("bin.feed_maker.Env")
+    def test_make_flushes_cookie_store(self, mock_env):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            mock_env.get.side_effect = lambda k, d="": {"FM_WORK_DIR": tmpdir, "WEB_SERVICE_IMAGE_DIR_PREFIX": tmpdir, "WEB_SERVICE_IMAGE_URL_PREFIX": "http://img"}.get(k, d)
+            feed_dir = Path(tmpdir) / "testfeed"
+            feed_dir.mkdir()
+            fm = FeedMaker(feed_dir_path=feed_dir, do_collect_by_force=False, do_collect_only=False, rss_file_path=feed_dir / "testfeed.xml")
+
+            with patch.object(fm, "_make", return_value=True), patch("bin.feed_maker.CookieStore.flush_all") as mock_flush:
+                self.assertTrue(fm.make())
+                mock_flush.assert_called_once()
+
+            with patch.object(fm, "_make", side_effect=NotFoundConfigItemError("no collection")), patch("bin.feed_maker.CookieStore.flush_all") as mock_flush:
+                with self.assertRaises(NotFoundConfigItemError):
+                    fm.make()
+                mock_flush.assert_called_once()
+
+
 class TestFeedMakerIsUrlRecentlyFailed(unittest.TestCase):
     """Lines 206-207: _is_url_recently_failed returns True."""
 
@@ -1038,6 +1041,54 @@ class TestMakeHtmlFileCrawlerFails(FeedMakerMakeTestBase):
             self.assertFalse(result)
 
 
+class TestPrefetchRenderedHtml(FeedMakerMakeTestBase):
+    """render_js feeds render a batch of articles through Crawler.fetch_many() and reuse the HTML."""
+
+    def test_prefetched_html_is_used_instead_of_crawling(self) -> None:
+        self.maker.extraction_conf["render_js"] = True
+        self.maker.extraction_conf["bypass_element_extraction"] = True
+        self.maker.extraction_conf["force_sleep_between_articles"] = False
+        made_url = "http://example.com/page/made"
+        image_tag = FeedMaker.get_image_tag_str(self.img_url_prefix, self.rss_file_path.name, made_url)
+        FeedMaker._get_html_file_path(self.html_dir, made_url).write_text(header_str + "\n" + image_tag + "\n" + "A" * 500, encoding="utf-8")
+        item_list = [(made_url, "Made"), ("http://example.com/page/1", "One"), ("http://example.com/page/2", "Two")]
+
+        with patch("bin.feed_maker.Crawler") as mock_crawler_cls:
+            mock_crawler_cls.get_option_str.return_value = ""
+            inst = mock_crawler_cls.return_value
+            inst.fetch_many.return_value = [(header_str + "\n" + "C" * 500, "", None), ("", "", {})]
+            inst.run.return_value = (header_str + "\n" + "D" * 500, "", None)
+
+            self.maker._prefetch_rendered_html(item_list)
+            # 이미 만들어진 기사는 다시 렌더링하지 않음
+            inst.fetch_many.assert_called_once_with(["http://example.com/page/1", "http://example.com/page/2"])
+            self.assertEqual(list(self.maker.prefetched_html_map), ["http://example.com/page/1"])
+
+            self.assertTrue(self.maker._make_html_file("http://example.com/page/1", "One"))
+            inst.run.assert_not_called()
+            # 미리 렌더링하지 못한 기사는 평소처럼 crawler.run()으로 받음
+            self.assertTrue(self.maker._make_html_file("http://example.com/page/2", "Two"))
+            inst.run.assert_called_once_with("http://example.com/page/2")
+        self.assertEqual(self.maker.prefetched_html_map, {})
+
+    def test_prefetch_failure_is_ignored(self) -> None:
+        self.maker.extraction_conf["render_js"] = True
+        with patch("bin.feed_maker.Crawler") as mock_crawler_cls:
+            mock_crawler_cls.ReadTimeoutException = Crawler.ReadTimeoutException
+            mock_crawler_cls.return_value.fetch_many.side_effect = OSError("no space left on device")
+            self.maker._prefetch_rendered_html([("http://example.com/page/1", "One"), ("http://example.com/page/2", "Two")])
+        self.assertEqual(self.maker.prefetched_html_map, {})
+
+    def test_prefetch_programming_error_is_raised(self) -> None:
+        # 코드 오류를 렌더링 실패로 숨기지 않음
+        self.maker.extraction_conf["render_js"] = True
+        with patch("bin.feed_maker.Crawler") as mock_crawler_cls:
+            mock_crawler_cls.ReadTimeoutException = Crawler.ReadTimeoutException
+            mock_crawler_cls.return_value.fetch_many.side_effect = TypeError("unexpected argument")
+            with self.assertRaises(TypeError):
+                self.maker._prefetch_rendered_html([("http://example.com/page/1", "One"), ("http://example.com/page/2", "Two")])
+
+
 class TestMakeHtmlFileExtractorFails(FeedMakerMakeTestBase):
     """Extractor returns empty content -> returns False."""
 
@@ -1337,6 +1388,54 @@ class TestFetchOldFeedListWindowNoSortFieldPattern(FeedMakerMakeTestBase):
             self.maker._fetch_old_feed_list_window([("http://a.com/1", "T", [])])
 
 
+class TestFetchOldFeedListWindowSortedOrder(FeedMakerMakeTestBase):
+    """Sorted order is computed once and persisted until the list files change."""
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.maker.collection_conf["sort_field_pattern"] = r"example.com/(\d+)"
+        self.maker.window_size = 2
+        self.maker.start_index_file_path.unlink(missing_ok=True)
+        self.list_file_path = self.list_dir / "20240101.txt"
+        self.list_file_path.write_text("".join(f"http://example.com/{i}\tTitle{i}\n" for i in (10, 2, 33, 2, 1)), encoding="utf-8")
+
+    def _fetch(self) -> list:
+        old_list = [("http://example.com/10", "Title10", []), ("http://example.com/2", "Title2", []), ("http://example.com/33", "Title33", []), ("http://example.com/2", "Title2", []), ("http://example.com/1", "Title1", [])]
+        result = self.maker._fetch_old_feed_list_window(old_list)
+        self.assertIsNotNone(result)
+        return result
+
+    def test_get_sort_key(self) -> None:
+        self.assertEqual(FeedMaker._get_sort_key("10"), (True, 10, "10"))
+        self.assertEqual(FeedMaker._get_sort_key("10 2"), (False, 0, "10 2"))
+
+    def test_sorted_order_is_persisted(self) -> None:
+        self.assertEqual([link for link, _, _ in self._fetch()], ["http://example.com/1", "http://example.com/2"])
+        sorted_order_file_path = self.list_dir / FeedMaker.SORTED_ORDER_FILE_NAME
+        self.assertTrue(sorted_order_file_path.is_file())
+
+        with patch.object(self.maker, "_sort_old_feed_list") as mock_sort:
+            self.assertEqual([link for link, _, _ in self._fetch()], ["http://example.com/1", "http://example.com/2"])
+            mock_sort.assert_not_called()
+
+        # 저장된 정렬 파일은 리스트 파일로 읽히지 않음
+        self.maker.collection_conf["is_completed"] = True
+        self.assertEqual(len(self.maker._read_old_feed_list_from_file()), 4)
+
+    def test_sorted_order_is_rebuilt_when_list_files_change(self) -> None:
+        self._fetch()
+        (self.list_dir / "20240102.txt").write_text("http://example.com/0\tTitle0\n", encoding="utf-8")
+        with patch.object(self.maker, "_sort_old_feed_list", wraps=self.maker._sort_old_feed_list) as mock_sort:
+            self._fetch()
+            mock_sort.assert_called_once()
+
+    def test_stale_sorted_order_is_not_used(self) -> None:
+        self._fetch()
+        # 리스트 파일과 다른 항목이 전달되면 다시 정렬함
+        result = self.maker._fetch_old_feed_list_window([("http://example.com/5", "Title5", []), ("http://example.com/4", "Title4", [])])
+        self.assertEqual([link for link, _, _ in result], ["http://example.com/4", "http://example.com/5"])
+
+
 # ---------------------------------------------------------------------------
 # _get_recent_feed_list tests
 # ---------------------------------------------------------------------------
@@ -1399,6 +1498,145 @@ class TestDiffFeedsHtmlFailure(FeedMakerMakeTestBase):
             self.assertEqual(result, [])
 
 
+class TestDiffFeedsWithMaxConcurrency(FeedMakerMakeTestBase):
+    """extraction.max_concurrency: bounded thread pool keeps merged_feed_list order."""
+
+    def _run_with_tracking(self, recent: list, old: list) -> tuple[list, int]:
+        import random
+        import threading
+        import time as _time
+
+        lock = threading.Lock()
+        state = {"running": 0, "peak": 0}
+
+        def fake_make_html_file(link: str, title: str) -> bool:
+            with lock:
+                state["running"] += 1
+                state["peak"] = max(state["peak"], state["running"])
+            _time.sleep(random.uniform(0.01, 0.05))
+            with lock:
+                state["running"] -= 1
+            return not link.endswith("/fail")
+
+        with patch.object(self.maker, "_make_html_file", side_effect=fake_make_html_file):
+            result = self.maker._diff_feeds_and_make_htmls(recent, old)
+        return result, state["peak"]
+
+    def test_order_is_preserved(self) -> None:
+        self.maker.window_size = 100
+        self.maker.extraction_conf["max_concurrency"] = 4
+        recent = [(f"http://a.com/{i}", f"T{i}", []) for i in range(10)] + [("http://a.com/fail", "F", [])]
+        old = [(f"http://a.com/old{i}", f"O{i}", []) for i in range(5)]
+
+        result, peak = self._run_with_tracking(recent, old)
+
+        expected = [(f"http://a.com/{i}", f"T{i}", []) for i in range(10)] + [(f"http://a.com/old{i}", f"O{i}", []) for i in range(5)]
+        self.assertEqual(result, expected)
+        self.assertGreater(peak, 1)
+        self.assertLessEqual(peak, 4)
+
+    def test_render_js_runs_sequentially(self) -> None:
+        self.maker.window_size = 100
+        self.maker.extraction_conf["max_concurrency"] = 4
+        self.maker.extraction_conf["render_js"] = True
+        self.maker.extraction_conf["force_sleep_between_articles"] = False
+        recent = [(f"http://a.com/{i}", f"T{i}", []) for i in range(5)]
+
+        with patch.object(self.maker, "_prefetch_rendered_html") as mock_prefetch:
+            result, peak = self._run_with_tracking(recent, [])
+
+        self.assertEqual(len(result), 5)
+        self.assertEqual(peak, 1)
+        # 스레드 대신 max_concurrency개씩 묶어서 한 브라우저에서 미리 렌더링
+        self.assertEqual([len(c.args[0]) for c in mock_prefetch.call_args_list], [4, 1])
+
+    def test_render_js_with_force_sleep_does_not_prefetch(self) -> None:
+        self.maker.window_size = 100
+        self.maker.extraction_conf["max_concurrency"] = 4
+        self.maker.extraction_conf["render_js"] = True
+        self.maker.extraction_conf["force_sleep_between_articles"] = True
+
+        with patch.object(self.maker, "_prefetch_rendered_html") as mock_prefetch:
+            self._run_with_tracking([(f"http://a.com/{i}", f"T{i}", []) for i in range(5)], [])
+
+        mock_prefetch.assert_not_called()
+
+    def test_item_crawlers_do_not_share_headers(self) -> None:
+        # 스레드마다 만드는 Crawler가 설정의 헤더 dict를 고치면 다른 스레드의 반복이 깨짐
+        conf = {"headers": {"Referer": "http://a.com/"}}
+        crawler1 = self.maker._create_item_crawler(conf)
+        crawler2 = self.maker._create_item_crawler(conf)
+        self.assertIsNot(crawler1.headers, crawler2.headers)
+        crawler1.headers["Cookie"] = "a=1"
+        self.assertNotIn("Cookie", crawler2.headers)
+        self.assertEqual(conf["headers"], {"Referer": "http://a.com/"})
+        self.assertNotIn("Referer", self.maker._create_item_crawler({"headers": None}).headers)
+
+    def test_default_is_sequential(self) -> None:
+        self.maker.window_size = 100
+        result, peak = self._run_with_tracking([(f"http://a.com/{i}", f"T{i}", []) for i in range(5)], [])
+        self.assertEqual(len(result), 5)
+        self.assertEqual(peak, 1)
+
+
+class TestDiffFeedsStopsAtWindowSize(FeedMakerMakeTestBase):
+    """Items beyond window_size are not generated unless extraction.make_all_items is set."""
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.maker.window_size = 3
+        self.recent = [("http://a.com/fail", "F", [])] + [(f"http://a.com/{i}", f"T{i}", []) for i in range(5)]
+        self.old = [(f"http://a.com/old{i}", f"O{i}", []) for i in range(10)]
+
+    def test_sequential_stops_after_window_size_successes(self) -> None:
+        with patch.object(self.maker, "_make_html_file", side_effect=lambda link, title: not link.endswith("/fail")) as mock_make:
+            result = self.maker._diff_feeds_and_make_htmls(self.recent, self.old)
+        self.assertEqual(result, [("http://a.com/0", "T0", []), ("http://a.com/1", "T1", []), ("http://a.com/2", "T2", [])])
+        self.assertEqual(mock_make.call_count, 4)
+
+    def test_make_all_items_keeps_old_behaviour(self) -> None:
+        self.maker.extraction_conf["make_all_items"] = True
+        with patch.object(self.maker, "_make_html_file", side_effect=lambda link, title: not link.endswith("/fail")) as mock_make:
+            result = self.maker._diff_feeds_and_make_htmls(self.recent, self.old)
+        self.assertEqual(len(result), 3)
+        self.assertEqual(mock_make.call_count, len(self.recent) + len(self.old))
+
+    def test_concurrent_stops_with_bounded_overshoot(self) -> None:
+        self.maker.extraction_conf["max_concurrency"] = 2
+        with patch.object(self.maker, "_make_html_file", side_effect=lambda link, title: not link.endswith("/fail")) as mock_make:
+            result = self.maker._diff_feeds_and_make_htmls(self.recent, self.old)
+        self.assertEqual(result, [("http://a.com/0", "T0", []), ("http://a.com/1", "T1", []), ("http://a.com/2", "T2", [])])
+        # 윈도우가 찬 시점에 이미 실행 중이던 항목(최대 max_concurrency - 1개)만 추가로 생성될 수 있음
+        self.assertLessEqual(mock_make.call_count, 4 + 1)
+
+
+class TestHostPacer(unittest.TestCase):
+    """force_sleep_between_articles is enforced per host instead of a blanket sleep."""
+
+    def test_same_host_is_paced(self) -> None:
+        from bin.feed_maker import HostPacer
+
+        pacer = HostPacer(2.0)
+        with patch("bin.feed_maker.time.time", return_value=1000.0), patch("bin.feed_maker.time.sleep") as mock_sleep:
+            pacer.wait("https://a.com/1")
+            mock_sleep.assert_not_called()
+            pacer.wait("https://b.com/1")
+            mock_sleep.assert_not_called()
+            pacer.wait("https://A.com/2")
+            mock_sleep.assert_called_once_with(2.0)
+            pacer.wait("https://a.com/3")
+            self.assertEqual(mock_sleep.call_args, ((4.0,),))
+
+    def test_no_wait_after_interval(self) -> None:
+        from bin.feed_maker import HostPacer
+
+        pacer = HostPacer(2.0)
+        with patch("bin.feed_maker.time.time", side_effect=[1000.0, 1003.0]), patch("bin.feed_maker.time.sleep") as mock_sleep:
+            pacer.wait("https://a.com/1")
+            pacer.wait("https://a.com/2")
+            mock_sleep.assert_not_called()
+
+
 # ---------------------------------------------------------------------------
 # _generate_rss_feed tests
 # ---------------------------------------------------------------------------
@@ -1604,12 +1842,55 @@ class TestFailedUrlCacheEdgeCases(FeedMakerMakeTestBase):
         cache = self.maker.failed_urls_cache_file
         cache.write_text("\n\nhttp://bad.com/page\tINVALID\nhttp://good.com/page\t9999-12-31T23:59:59+00:00\n\n")
 
-        self.maker._cleanup_expired_failed_urls()
+        # 잘못된 줄이 있으면 읽을 때 정리됨
+        self.maker._load_failed_urls()
         content = cache.read_text()
         self.assertNotIn("INVALID", content)
         self.assertIn("http://good.com/page", content)
 
 
+class TestFailedUrlCacheIndex(FeedMakerMakeTestBase):
+    """The failed URL cache is loaded once into a dict and compacted only when it has stale lines."""
+
+    def test_lookups_read_file_once(self) -> None:
+        self.maker.failed_urls_cache_file.write_text("".join(f"http://a.com/{i}\t9999-12-31T23:59:59+00:00\n" for i in range(100)))
+        with patch.object(Path, "open", autospec=True, side_effect=Path.open) as mock_open:
+            for i in range(200):
+                self.assertEqual(self.maker._is_url_recently_failed(f"http://a.com/{i}"), i < 100)
+            self.assertEqual(mock_open.call_count, 1)
+
+    def test_no_rewrite_without_stale_lines(self) -> None:
+        cache = self.maker.failed_urls_cache_file
+        cache.write_text("http://a.com/1\t9999-12-31T23:59:59+00:00\n")
+        os.utime(cache, (1000000000, 1000000000))
+        maker = FeedMaker(feed_dir_path=self.feed_dir_path, do_collect_by_force=False, do_collect_only=False, rss_file_path=self.rss_file_path)
+        self.assertTrue(maker._is_url_recently_failed("http://a.com/1"))
+        self.assertEqual(cache.stat().st_mtime, 1000000000)
+
+    def test_compact_failure_keeps_file_and_index(self) -> None:
+        cache = self.maker.failed_urls_cache_file
+        cache.write_text("http://a.com/1\t9999-12-31T23:59:59+00:00\nhttp://a.com/expired\t2000-01-01T00:00:00+00:00\n")
+        with patch.object(Path, "replace", side_effect=OSError("read-only")):
+            self.assertTrue(self.maker._is_url_recently_failed("http://a.com/1"))
+        self.assertIn("http://a.com/expired", cache.read_text())
+        self.assertFalse(cache.with_suffix(".tmp").exists())
+        self.assertTrue(self.maker._is_url_recently_failed("http://a.com/1"))
+
+    def test_stale_lines_are_compacted_in_expiry_order(self) -> None:
+        cache = self.maker.failed_urls_cache_file
+        cache.write_text("http://a.com/late\t9999-12-31T23:59:59+00:00\nhttp://a.com/expired\t2000-01-01T00:00:00+00:00\nhttp://a.com/soon\t9000-01-01T00:00:00+00:00\nhttp://a.com/soon\t8000-01-01T00:00:00+00:00\n")
+        self.assertTrue(self.maker._is_url_recently_failed("http://a.com/soon"))
+        self.assertFalse(self.maker._is_url_recently_failed("http://a.com/expired"))
+        self.assertEqual(cache.read_text().splitlines(), ["http://a.com/soon\t9000-01-01T00:00:00+00:00", "http://a.com/late\t9999-12-31T23:59:59+00:00"])
+
+    def test_added_url_is_visible_without_reload(self) -> None:
+        self.maker.rss_conf["ignore_broken_link"] = "always"
+        self.assertFalse(self.maker._is_url_recently_failed("http://a.com/new"))
+        self.maker._add_failed_url("http://a.com/new", "boom")
+        self.assertTrue(self.maker._is_url_recently_failed("http://a.com/new"))
+        self.assertIn("http://a.com/new", self.maker.failed_urls_cache_file.read_text())
+
+
 class TestGetExpirationFromConfigEdgeCases(FeedMakerMakeTestBase):
     """_get_expiration_from_config: invalid pattern → covers L654,672"""
 
@@ -5,6 +5,7 @@ import io
 import json
 import os
 import sys
+import time
 import unittest
 from pathlib import Path
 from unittest.mock import patch, MagicMock
@@ -529,6 +530,12 @@ class TestIOReadStdinAsLineList(unittest.TestCase):
 class TestURLSafetyCheckUrl(unittest.TestCase):
     """URLSafety.check_url: lines 399-400, 407, 414, 438-439, 441"""
 
+    def setUp(self) -> None:
+        URLSafety.clear_dns_cache()
+
+    def tearDown(self) -> None:
+        URLSafety.clear_dns_cache()
+
     def test_invalid_url_scheme(self) -> None:
         ok, msg = URLSafety.check_url("ftp://example.com", allow_private=False)
         self.assertFalse(ok)
@@ -610,6 +617,52 @@ class TestURLSafetyCheckUrl(unittest.TestCase):
         self.assertEqual({"host1", "host2"}, exact)
 
 
+class TestURLSafetyDnsCache(unittest.TestCase):
+    PUBLIC_INFOS = [(socket.AF_INET, socket.SOCK_STREAM, 0, "", ("93.184.216.34", 0)), (socket.AF_INET, socket.SOCK_DGRAM, 0, "", ("93.184.216.34", 0)), (socket.AF_INET6, socket.SOCK_STREAM, 0, "", ("2606:2800:220:1::1", 0, 0, 0))]
+
+    def setUp(self) -> None:
+        URLSafety.clear_dns_cache()
+
+    def tearDown(self) -> None:
+        URLSafety.clear_dns_cache()
+
+    def test_verdict_is_cached_per_host(self) -> None:
+        with patch("socket.getaddrinfo", return_value=self.PUBLIC_INFOS) as mock_getaddrinfo:
+            self.assertEqual(URLSafety.check_url("http://cached-host.com/a", allow_private=False), (True, ""))
+            self.assertEqual(URLSafety.check_url("https://CACHED-HOST.com/b?c=d", allow_private=False), (True, ""))
+            mock_getaddrinfo.assert_called_once()
+        self.assertEqual(URLSafety.get_pinned_addresses("cached-host.com"), ("93.184.216.34", "2606:2800:220:1::1"))
+
+    def test_blocked_verdict_is_cached(self) -> None:
+        with patch("socket.getaddrinfo", return_value=[(socket.AF_INET, socket.SOCK_STREAM, 0, "", ("10.0.0.1", 0))]) as mock_getaddrinfo:
+            self.assertFalse(URLSafety.check_url("http://rebind.com/", allow_private=False)[0])
+            ok, msg = URLSafety.check_url("http://rebind.com/", allow_private=False)
+            self.assertFalse(ok)
+            self.assertIn("Blocked IP", msg)
+            mock_getaddrinfo.assert_called_once()
+        self.assertEqual(URLSafety.get_pinned_addresses("rebind.com"), ())
+
+    def test_dns_failure_is_not_cached(self) -> None:
+        with patch("socket.getaddrinfo", side_effect=socket.gaierror("DNS failed")) as mock_getaddrinfo:
+            URLSafety.check_url("http://flaky.com/", allow_private=False)
+            URLSafety.check_url("http://flaky.com/", allow_private=False)
+            self.assertEqual(mock_getaddrinfo.call_count, 2)
+
+    def test_expired_entry_is_resolved_again(self) -> None:
+        with patch("socket.getaddrinfo", return_value=self.PUBLIC_INFOS) as mock_getaddrinfo:
+            URLSafety.check_url("http://cached-host.com/", allow_private=False)
+            with patch("bin.feed_maker_util.time.time", return_value=time.time() + URLSafety.DEFAULT_DNS_CACHE_TTL + 1):
+                URLSafety.check_url("http://cached-host.com/", allow_private=False)
+            self.assertEqual(mock_getaddrinfo.call_count, 2)
+
+    def test_cache_disabled_by_env(self) -> None:
+        with patch.dict(os.environ, {"FM_DNS_CACHE_TTL": "0"}), patch("socket.getaddrinfo", return_value=self.PUBLIC_INFOS) as mock_getaddrinfo:
+            URLSafety.check_url("http://cached-host.com/", allow_private=False)
+            URLSafety.check_url("http://cached-host.com/", allow_private=False)
+            self.assertEqual(mock_getaddrinfo.call_count, 2)
+        self.assertEqual(URLSafety.get_pinned_addresses("cached-host.com"), ())
+
+
 class TestFileManagerRemoveHtmlFilesWithoutCachedImageFiles(unittest.TestCase):
     """FileManager.remove_html_files_without_cached_image_files: lines 786->exit, 788->787, 790->787"""
 
@@ -0,0 +1,218 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+
+import time
+import shutil
+import tempfile
+import unittest
+import logging.config
+from pathlib import Path
+from unittest.mock import patch, MagicMock
+
+from bin.crawler import Crawler
+from bin.fetch_strategy import FetchStrategy
+
+logging.config.fileConfig(Path(__file__).parent.parent / "logging.conf")
+LOGGER = logging.getLogger()
+
+
+class FetchStrategyTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self.tmp = Path(tempfile.mkdtemp())
+        self.state_dir_path = self.tmp / FetchStrategy.STATE_DIR_NAME
+
+    def tearDown(self) -> None:
+        shutil.rmtree(self.tmp, ignore_errors=True)
+
+    def _make_fetch_strategy(self, reprobe_interval: float = 3600) -> FetchStrategy:
+        return FetchStrategy(state_dir_path=self.state_dir_path, reprobe_interval=reprobe_interval)
+
+    def test_plain_result_expires(self) -> None:
+        fetch_strategy = self._make_fetch_strategy()
+        now = time.time()
+        self.assertTrue(fetch_strategy.is_plain_probe_due("https://example.com/a"))
+        self.assertFalse(fetch_strategy.is_plain_preferred("https://example.com/a"))
+        with patch("bin.fetch_strategy.time.time", return_value=now):
+            fetch_strategy.record_plain_result("https://example.com/a", True)
+            self.assertTrue(self._make_fetch_strategy().is_plain_preferred("https://example.com/b"))
+            self.assertFalse(fetch_strategy.is_plain_probe_due("https://example.com/b"))
+            # 다른 호스트는 따로 기록
+            self.assertTrue(fetch_strategy.is_plain_probe_due("https://other.com/"))
+        with patch("bin.fetch_strategy.time.time", return_value=now + 3601):
+            # 기록이 만료되면 다시 시험
+            self.assertFalse(fetch_strategy.is_plain_preferred("https://example.com/b"))
+            self.assertTrue(fetch_strategy.is_plain_probe_due("https://example.com/b"))
+
+    def test_engine_is_kept_with_plain_result(self) -> None:
+        fetch_strategy = self._make_fetch_strategy()
+        self.assertEqual(fetch_strategy.get_engine("https://example.com/a"), "")
+        fetch_strategy.record_plain_result("https://example.com/a", False)
+        fetch_strategy.record_engine("https://example.com/a", "cloakbrowser")
+        self.assertEqual(fetch_strategy.get_engine("https://example.com/b"), "cloakbrowser")
+        self.assertFalse(fetch_strategy.is_plain_preferred("https://example.com/b"))
+        self.assertFalse(fetch_strategy.is_plain_probe_due("https://example.com/b"))
+
+    def test_plain_result_is_kept_per_feed(self) -> None:
+        feed1 = FetchStrategy(state_dir_path=self.state_dir_path, reprobe_interval=3600, scope="/feeds/group/feed1")
+        feed2 = FetchStrategy(state_dir_path=self.state_dir_path, reprobe_interval=3600, scope="/feeds/group/feed2")
+        feed1.record_plain_result("https://example.com/a", True)
+        self.assertTrue(FetchStrategy(state_dir_path=self.state_dir_path, reprobe_interval=3600, scope="/feeds/group/feed1").is_plain_preferred("https://example.com/b"))
+        # 같은 호스트라도 추출 설정이 다른 피드는 따로 시험함
+        self.assertFalse(feed2.is_plain_preferred("https://example.com/b"))
+        self.assertTrue(feed2.is_plain_probe_due("https://example.com/b"))
+        # 엔진 기록은 호스트별로 공유함
+        feed1.record_engine("https://example.com/a", "cloakbrowser")
+        self.assertEqual(feed2.get_engine("https://example.com/b"), "cloakbrowser")
+
+    def test_matches_plain_content(self) -> None:
+        fetch_strategy = self._make_fetch_strategy()
+        self.assertFalse(fetch_strategy.matches_plain_content("https://example.com/a", "<div>text</div>"))
+        fetch_strategy.record_plain_result("https://example.com/a", True, "<div>text<img src='1.jpg'></div>")
+        self.assertTrue(fetch_strategy.matches_plain_content("https://example.com/b", "<div>other<img src='2.jpg'></div>"))
+        # 렌더링 결과에 있던 이미지가 빠지면 렌더링해야 함
+        self.assertFalse(fetch_strategy.matches_plain_content("https://example.com/b", "<div>other</div>"))
+        self.assertFalse(fetch_strategy.matches_plain_content("https://example.com/b", ""))
+        fetch_strategy.record_plain_result("https://example.com/a", True, "<div>text only</div>")
+        self.assertTrue(fetch_strategy.matches_plain_content("https://example.com/b", "<div>other</div>"))
+
+    def test_is_verify_due(self) -> None:
+        fetch_strategy = FetchStrategy(state_dir_path=self.state_dir_path, reprobe_interval=3600, verify_interval=3)
+        self.assertEqual([fetch_strategy.is_verify_due() for _ in range(6)], [False, False, True, False, False, True])
+        fetch_strategy = FetchStrategy(state_dir_path=self.state_dir_path, reprobe_interval=3600, verify_interval=0)
+        self.assertFalse(any(fetch_strategy.is_verify_due() for _ in range(6)))
+
+    def test_is_equivalent_content(self) -> None:
+        rendered = "<div>" + "text " * 20 + "<img src='1.jpg'><img src='2.jpg'></div>"
+        self.assertTrue(FetchStrategy.is_equivalent_content(rendered, rendered))
+        self.assertFalse(FetchStrategy.is_equivalent_content(rendered.replace("<img src='2.jpg'>", ""), rendered))
+        self.assertFalse(FetchStrategy.is_equivalent_content("<div>loading...</div>", rendered))
+        self.assertFalse(FetchStrategy.is_equivalent_content("", rendered))
+
+    def test_disabled(self) -> None:
+        fetch_strategy = self._make_fetch_strategy(reprobe_interval=0)
+        fetch_strategy.record_plain_result("https://example.com/a", True)
+        self.assertFalse(fetch_strategy.is_plain_preferred("https://example.com/a"))
+        self.assertFalse(fetch_strategy.is_plain_probe_due("https://example.com/a"))
+        self.assertFalse(self.state_dir_path.exists())
+
+    def test_broken_state_file_is_reset(self) -> None:
+        self.state_dir_path.mkdir()
+        (self.state_dir_path / ("example.com" + FetchStrategy.STATE_FILE_SUFFIX)).write_text("garbage")
+        fetch_strategy = self._make_fetch_strategy()
+        self.assertTrue(fetch_strategy.is_plain_probe_due("https://example.com/a"))
+        fetch_strategy.record_engine("https://example.com/a", "camoufox")
+        self.assertEqual(fetch_strategy.get_engine("https://example.com/a"), "camoufox")
+
+
+class CrawlerFetchStrategyTest(unittest.TestCase):
+    RENDERED_HTML = "<html><div id='content'>" + "text " * 20 + "<img src='1.jpg'></div></html>"
+
+    def setUp(self) -> None:
+        self.tmp = Path(tempfile.mkdtemp())
+
+    def tearDown(self) -> None:
+        shutil.rmtree(self.tmp, ignore_errors=True)
+
+    def _make_crawler(self) -> Crawler:
+        with patch("bin.crawler.HeadlessBrowser"):
+            crawler = Crawler(dir_path=self.tmp, render_js=True)
+        crawler.fetch_strategy = FetchStrategy(state_dir_path=self.tmp / FetchStrategy.STATE_DIR_NAME, reprobe_interval=3600)
+        crawler.rate_limiter = MagicMock()
+        crawler.headless_browser = MagicMock()
+        crawler.headless_browser.make_request.return_value = self.RENDERED_HTML
+        crawler.content_extractor = lambda url, html: html[html.find("<div"):html.find("</div>") + 6] if "<div id='content'>" in html else None
+        return crawler
+
+    def test_probe_then_skip_rendering(self) -> None:
+        crawler = self._make_crawler()
+        with patch.object(crawler, "_fetch_plain", return_value=self.RENDERED_HTML) as mock_fetch_plain:
+            self.assertEqual(crawler.run("https://example.com/1")[0], self.RENDERED_HTML)
+            self.assertEqual(crawler.headless_browser.make_request.call_count, 1)
+            mock_fetch_plain.assert_called_once_with("https://example.com/1")
+            self.assertTrue(crawler.fetch_strategy.is_plain_preferred("https://example.com/2"))
+
+            # 기록된 호스트는 브라우저를 띄우지 않음
+            self.assertEqual(crawler.run("https://example.com/2")[0], self.RENDERED_HTML)
+            self.assertEqual(crawler.headless_browser.make_request.call_count, 1)
+
+    def test_incomplete_plain_html_keeps_rendering(self) -> None:
+        crawler = self._make_crawler()
+        with patch.object(crawler, "_fetch_plain", return_value="<html><div id='app'></div></html>") as mock_fetch_plain:
+            crawler.run("https://example.com/1")
+            crawler.run("https://example.com/2")
+        # 한 번만 비교하고 이후에는 렌더링만 함
+        self.assertEqual(mock_fetch_plain.call_count, 1)
+        self.assertEqual(crawler.headless_browser.make_request.call_count, 2)
+        self.assertFalse(crawler.fetch_strategy.is_plain_preferred("https://example.com/3"))
+
+    def test_plain_failure_falls_back_to_rendering(self) -> None:
+        crawler = self._make_crawler()
+        crawler.fetch_strategy.record_plain_result("https://example.com/1", True)
+        with patch.object(crawler, "_fetch_plain", return_value="<html>blocked</html>"):
+            self.assertEqual(crawler.run("https://example.com/1")[0], self.RENDERED_HTML)
+        crawler.headless_browser.make_request.assert_called_once()
+        self.assertFalse(crawler.fetch_strategy.is_plain_preferred("https://example.com/2"))
+
+    def test_plain_result_without_images_falls_back_to_rendering(self) -> None:
+        crawler = self._make_crawler()
+        crawler.fetch_strategy.record_plain_result("https://example.com/1", True, self.RENDERED_HTML)
+        with patch.object(crawler, "_fetch_plain", return_value="<html><div id='content'>" + "text " * 20 + "</div></html>"):
+            self.assertEqual(crawler.run("https://example.com/1")[0], self.RENDERED_HTML)
+        crawler.headless_browser.make_request.assert_called_once()
+        self.assertFalse(crawler.fetch_strategy.is_plain_preferred("https://example.com/2"))
+
+    def test_plain_result_is_verified_periodically(self) -> None:
+        crawler = self._make_crawler()
+        crawler.fetch_strategy.verify_interval = 2
+        crawler.fetch_strategy.record_plain_result("https://example.com/1", True, self.RENDERED_HTML)
+        partial_html = "<html><div id='content'>text<img src='1.jpg'></div></html>"
+        with patch.object(crawler, "_fetch_plain", return_value=partial_html) as mock_fetch_plain:
+            self.assertEqual(crawler.run("https://example.com/1")[0], partial_html)
+            crawler.headless_browser.make_request.assert_not_called()
+            # 두 번째에는 렌더링해서 비교하고, 내용 일부만 받고 있으면 기록을 지움
+            self.assertEqual(crawler.run("https://example.com/2")[0], self.RENDERED_HTML)
+        crawler.headless_browser.make_request.assert_called_once()
+        self.assertEqual(mock_fetch_plain.call_count, 2)
+        self.assertFalse(crawler.fetch_strategy.is_plain_preferred("https://example.com/3"))
+
+    def test_fetch_plain_sends_browser_cookies(self) -> None:
+        crawler = self._make_crawler()
+        crawler.host_health = MagicMock()
+        crawler.host_health.check.return_value = ""
+        crawler._plain_client = MagicMock()
+        crawler._plain_client.cookies = {"visited": "1", "sid": "old"}
+        crawler._plain_client.make_request.return_value = (self.RENDERED_HTML, "", {}, 200)
+        crawler.headless_browser.get_cookies.return_value = {"sid": "new", "cf_clearance": "x"}
+        self.assertEqual(crawler._fetch_plain("https://example.com/1"), self.RENDERED_HTML)
+        crawler.headless_browser.get_cookies.assert_called_once_with("https://example.com/1")
+        crawler._plain_client.make_request.assert_called_once_with("https://example.com/1", extra_headers={"Cookie": "visited=1; sid=new; cf_clearance=x"})
+
+    def test_crawler_keeps_plain_result_per_feed(self) -> None:
+        with patch("bin.crawler.HeadlessBrowser"):
+            crawler = Crawler(dir_path=self.tmp, render_js=True)
+        self.assertEqual(crawler.fetch_strategy.scope, str(self.tmp))
+
+    def test_browser_only_options_always_render(self) -> None:
+        crawler = self._make_crawler()
+        crawler.simulate_scrolling = True
+        crawler.fetch_strategy.record_plain_result("https://example.com/1", True)
+        with patch.object(crawler, "_fetch_plain") as mock_fetch_plain:
+            crawler.run("https://example.com/1")
+        mock_fetch_plain.assert_not_called()
+        crawler.headless_browser.make_request.assert_called_once()
+
+    def test_fetch_many_renders_only_unknown_hosts(self) -> None:
+        crawler = self._make_crawler()
+        crawler.fetch_strategy.record_plain_result("https://plain.example.com/1", True)
+        crawler.fetch_strategy.record_plain_result("https://render.example.org/1", False)
+        crawler.headless_browser.make_requests.return_value = [self.RENDERED_HTML]
+        with patch.object(crawler, "_fetch_plain", return_value=self.RENDERED_HTML) as mock_fetch_plain:
+            results = crawler.fetch_many(["https://plain.example.com/1", "https://render.example.org/1"])
+        self.assertEqual([r[0] for r in results], [self.RENDERED_HTML, self.RENDERED_HTML])
+        crawler.headless_browser.make_requests.assert_called_once_with(["https://render.example.org/1"])
+        mock_fetch_plain.assert_called_once_with("https://plain.example.com/1")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -3,11 +3,12 @@
 
 import shutil
 import tempfile
+import threading
 import unittest
 from pathlib import Path
 from unittest.mock import MagicMock, patch
 
-from bin.headless_browser import HeadlessBrowserBase
+from bin.headless_browser import HeadlessBrowser, HeadlessBrowserBase, PagePool, PlaywrightError, PlaywrightTimeoutError, SessionRecyclePolicy
 
 
 class TestHeadlessBrowserBase(unittest.TestCase):
@@ -65,6 +66,25 @@ class TestHeadlessBrowserBase(unittest.TestCase):
         browser._discard_persisted_cookies()
         self.assertFalse(cookie_file.exists())
 
+    def test_get_cookies_matches_url(self):
+        # Plain HTTP fetches of render_js feeds reuse the browser's login and clearance cookies,
+        # so only live cookies the browser itself would send to that URL may be picked.
+        browser = self._make_browser()
+        self.assertEqual(browser.get_cookies("https://a.example.com/comic/1"), {})
+        cookie_file = browser._get_cookie_dir() / browser.COOKIE_FILE
+        cookie_file.write_text(
+            '[{"name": "cf_clearance", "value": "x", "domain": ".example.com", "path": "/", "expires": -1},'
+            ' {"name": "sid", "value": "b", "domain": "b.example.com", "path": "/"},'
+            ' {"name": "pref", "value": "root", "domain": ".example.com", "path": "/"},'
+            ' {"name": "pref", "value": "comic", "domain": ".example.com", "path": "/comic"},'
+            ' {"name": "old", "value": "1", "domain": ".example.com", "path": "/", "expires": 1}]',
+            encoding="utf-8",
+        )
+        self.assertEqual(browser.get_cookies("https://a.example.com/comic/1"), {"cf_clearance": "x", "pref": "comic"})
+        self.assertEqual(browser.get_cookies("https://b.example.com/"), {"cf_clearance": "x", "sid": "b", "pref": "root"})
+        cookie_file.write_text("garbage", encoding="utf-8")
+        self.assertEqual(browser.get_cookies("https://a.example.com/"), {})
+
     @patch("bin.headless_browser.time.sleep")
     def test_run_scrolling_script_treats_non_numeric_scroll_height_as_zero(self, _mock_sleep):
         # Some pages return a non-numeric scrollHeight (overridden document.body); that must
@@ -124,5 +144,533 @@ class TestHeadlessBrowserBase(unittest.TestCase):
         browser._run_scrolling_script(page)
 
 
+class TestSessionRecyclePolicy(unittest.TestCase):
+    """A cached session survives the end of a feed until the policy says otherwise."""
+
+    class _Engine(HeadlessBrowserBase):
+        _thread_local = threading.local()
+        _all_profile_dirs: set[str] = set()
+
+    def setUp(self):
+        self.tmp = Path(tempfile.mkdtemp())
+        self.addCleanup(shutil.rmtree, self.tmp, True)
+        self.addCleanup(self._Engine._cleanup_cached_session)
+        with patch("bin.headless_browser.Env") as mock_env:
+            mock_env.get.side_effect = lambda k, d="": d
+            self.browser = self._Engine(dir_path=self.tmp, timeout=5)
+        self.launched = []
+        patcher = patch.object(self._Engine, "_launch_session", side_effect=self._launch)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def _launch(self):
+        session = {"playwright": None, "context": MagicMock(), "page": MagicMock()}
+        session["page"].is_closed.return_value = False
+        session["context"].browser = None
+        self.launched.append(session)
+        return session
+
+    def test_reasons(self):
+        policy = SessionRecyclePolicy(max_feeds=3, max_pages=100, max_rss_mb=500)
+        self.assertEqual(policy.get_recycle_reason(1, 10, True, 100), "")
+        self.assertEqual(policy.get_recycle_reason(1, 10, False, 100), "browser crashed")
+        self.assertEqual(policy.get_recycle_reason(3, 10, True, 100), "used for 3 feeds")
+        self.assertEqual(policy.get_recycle_reason(1, 100, True, 100), "rendered 100 pages")
+        self.assertEqual(policy.get_recycle_reason(1, 10, True, 600), "browser processes use 600 MB")
+        # 0 disables a criterion
+        self.assertEqual(SessionRecyclePolicy(max_feeds=0, max_pages=0, max_rss_mb=0).get_recycle_reason(99, 9999, True, 99999), "")
+
+    def test_env_configuration(self):
+        env = {"FM_HEADLESS_RECYCLE_AFTER_FEEDS": "1", "FM_HEADLESS_RECYCLE_AFTER_PAGES": "false", "FM_HEADLESS_RECYCLE_MAX_RSS_MB": ""}
+        with patch("bin.headless_browser.Env.get", side_effect=lambda k, d="": env.get(k, d)):
+            policy = SessionRecyclePolicy()
+        self.assertEqual((policy.max_feeds, policy.max_pages, policy.max_rss_mb), (1, SessionRecyclePolicy.DEFAULT_MAX_PAGES, SessionRecyclePolicy.DEFAULT_MAX_RSS_MB))
+
+    def test_session_is_kept_until_max_feeds(self):
+        policy = SessionRecyclePolicy(max_feeds=2, max_pages=0, max_rss_mb=0)
+        stats_before = HeadlessBrowser.get_session_stats()
+
+        self.browser._get_or_create_session()
+        self.assertEqual(self._Engine.recycle_session_by_policy(policy), "")
+        self.browser._get_or_create_session()
+        self.assertEqual(len(self.launched), 1)
+        self.assertEqual(self._Engine.recycle_session_by_policy(policy), "used for 2 feeds")
+        self.launched[0]["context"].close.assert_called_once()
+        self.browser._get_or_create_session()
+        self.assertEqual(len(self.launched), 2)
+
+        stats = HeadlessBrowser.get_session_stats()
+        self.assertEqual(stats["launches"] - stats_before["launches"], 2)
+        self.assertEqual(stats["reuses"] - stats_before["reuses"], 1)
+
+    def test_kept_session_loads_cookies_of_next_feed_in_group(self):
+        # Two feeds of one group share the session options, so the second feed reuses the first
+        # feed's context; it must start from its own jar and never write the first feed's cookies into it.
+        feed1_dir = self.tmp / "group" / "feed1"
+        feed2_dir = self.tmp / "group" / "feed2"
+        feed1_dir.mkdir(parents=True)
+        feed2_dir.mkdir(parents=True)
+        (feed2_dir / self._Engine.COOKIE_FILE).write_text('[{"name": "sid", "value": "feed2", "domain": ".example.com", "path": "/"}]', encoding="utf-8")
+        with patch("bin.headless_browser.Env") as mock_env:
+            mock_env.get.side_effect = lambda k, d="": d
+            browser1 = self._Engine(dir_path=feed1_dir, timeout=5)
+            browser2 = self._Engine(dir_path=feed2_dir, timeout=5)
+        policy = SessionRecyclePolicy(max_feeds=0, max_pages=0, max_rss_mb=0)
+
+        session1, is_new1 = browser1._get_or_create_session()
+        self.assertEqual(self._Engine.recycle_session_by_policy(policy), "")
+        context = session1["context"]
+        context.add_cookies.reset_mock()
+        session2, is_new2 = browser2._get_or_create_session()
+        self.assertTrue(is_new1)
+        self.assertFalse(is_new2)
+        self.assertIs(session2, session1)
+        context.clear_cookies.assert_called_once()
+        context.add_cookies.assert_called_once()
+        self.assertEqual(context.add_cookies.call_args.args[0][0]["value"], "feed2")
+        # only the first request of the next feed resets the cookies
+        browser2._get_or_create_session()
+        context.clear_cookies.assert_called_once()
+
+    def test_kept_session_is_relaunched_when_cookies_cannot_be_reset(self):
+        policy = SessionRecyclePolicy(max_feeds=0, max_pages=0, max_rss_mb=0)
+        session, _ = self.browser._get_or_create_session()
+        self._Engine.recycle_session_by_policy(policy)
+        session["context"].clear_cookies.side_effect = PlaywrightError("Target closed")
+        new_session, is_new = self.browser._get_or_create_session()
+        self.assertTrue(is_new)
+        self.assertIsNot(new_session, session)
+        self.assertEqual(len(self.launched), 2)
+
+    def test_pages_and_crash_trigger_recycling(self):
+        self.browser._get_or_create_session()
+        self.browser._count_pages(5)
+        self.assertEqual(self._Engine.recycle_session_by_policy(SessionRecyclePolicy(max_feeds=0, max_pages=5, max_rss_mb=0)), "rendered 5 pages")
+
+        session, _ = self.browser._get_or_create_session()
+        session["page"].is_closed.return_value = True
+        self.assertEqual(self._Engine.recycle_session_by_policy(SessionRecyclePolicy(max_feeds=0, max_pages=0, max_rss_mb=0)), "browser crashed")
+        # nothing cached, nothing to decide
+        self.assertEqual(self._Engine.recycle_session_by_policy(SessionRecyclePolicy(max_feeds=1)), "")
+
+    def test_facade_measures_rss_only_when_needed(self):
+        with patch("bin.headless_browser._load_engine_class", return_value=self._Engine), patch.object(SessionRecyclePolicy, "get_browser_rss_mb", return_value=2048) as mock_rss:
+            self.browser._get_or_create_session()
+            HeadlessBrowser.recycle_session_by_policy(SessionRecyclePolicy(max_feeds=0, max_pages=0, max_rss_mb=0))
+            mock_rss.assert_not_called()
+            self.assertEqual(len(self.launched), 1)
+            HeadlessBrowser.recycle_session_by_policy(SessionRecyclePolicy(max_feeds=0, max_pages=0, max_rss_mb=1024))
+        self.assertIsNone(getattr(self._Engine._thread_local, "_session_cache", None))
+
+    def test_browser_rss_sums_child_processes(self):
+        children = [MagicMock(), MagicMock()]
+        children[0].memory_info.return_value.rss = 300 * 1024 * 1024
+        children[1].memory_info.return_value.rss = 200 * 1024 * 1024
+        with patch("bin.headless_browser.psutil.Process") as mock_process:
+            mock_process.return_value.children.return_value = children
+            self.assertEqual(SessionRecyclePolicy.get_browser_rss_mb(), 500)
+
+
+class TestScrollSettle(unittest.TestCase):
+    """Scrolling waits for readiness signals (DOM quiet, visible images, in-flight requests) instead of fixed sleeps."""
+
+    def setUp(self):
+        self.tmp = Path(tempfile.mkdtemp())
+        self.addCleanup(shutil.rmtree, self.tmp, True)
+
+    def _make_browser(self, **kwargs):
+        with patch("bin.headless_browser.Env") as mock_env:
+            mock_env.get.side_effect = lambda k, d="": d
+            return HeadlessBrowserBase(dir_path=self.tmp, timeout=5, simulate_scrolling=True, **kwargs)
+
+    @staticmethod
+    def _make_page(scroll_height):
+        page = MagicMock()
+        page.listeners = {}
+        page.on.side_effect = lambda event, listener: page.listeners.setdefault(event, listener)
+        page.evaluate.side_effect = lambda script, *_a, **_kw: scroll_height if "scrollHeight" in script else None
+        return page
+
+    @patch("bin.headless_browser.time.sleep")
+    def test_scrolls_without_fixed_sleeps(self, mock_sleep):
+        browser = self._make_browser()
+        page = self._make_page(1000)
+
+        browser._run_scrolling_script(page)
+
+        mock_sleep.assert_not_called()
+        self.assertTrue(any(c.args[0] == browser.SCROLL_OBSERVER_SCRIPT for c in page.evaluate.call_args_list))
+        settle_calls = [c for c in page.wait_for_function.call_args_list if c.args[0] == browser.SCROLL_SETTLED_PREDICATE]
+        # initial settle + one per downward step (0, 349, 698, 1047 > bottom) + final settle
+        self.assertEqual(len(settle_calls), 1 + 3 + 1)
+        self.assertEqual(settle_calls[0].kwargs["arg"], browser._SCROLL_QUIET_MS)
+        # listeners are detached so later requests on a pooled/cached page don't leak into the set
+        self.assertEqual({c.args[0] for c in page.remove_listener.call_args_list}, {"request", "requestfinished", "requestfailed"})
+
+    def test_settle_waits_for_in_flight_requests(self):
+        browser = self._make_browser()
+        page = self._make_page(0)
+        image_request = MagicMock(resource_type="image")
+        inflight = {image_request: 10.0}
+        page.wait_for_timeout.side_effect = lambda _ms: inflight.pop(image_request)
+
+        self.assertTrue(browser._wait_for_scroll_settle(page, inflight, deadline=float("inf"), since=10.0))
+
+        self.assertEqual(page.wait_for_function.call_count, 2)
+        page.wait_for_timeout.assert_called_once_with(browser._SCROLL_POLL_MS)
+
+    def test_settle_ignores_requests_started_before_the_step(self):
+        browser = self._make_browser()
+        page = self._make_page(0)
+        # 스크롤하기 전부터 열려 있는 long polling 요청은 기다리지 않음
+        inflight = {MagicMock(resource_type="xhr"): 5.0}
+
+        self.assertTrue(browser._wait_for_scroll_settle(page, inflight, deadline=float("inf"), since=10.0))
+
+        page.wait_for_timeout.assert_not_called()
+
+    def test_only_tracked_requests_count(self):
+        browser = self._make_browser()
+        page = self._make_page(0)
+
+        def wait_for_function(*_args, **_kwargs):
+            listeners = page.listeners
+            listeners["request"](MagicMock(resource_type="websocket"))
+            request = MagicMock(resource_type="xhr")
+            listeners["request"](request)
+            listeners["requestfinished"](request)
+
+        page.wait_for_function.side_effect = wait_for_function
+        browser._run_scrolling_script(page)
+        # the xhr finished before the check; the websocket was never tracked
+        page.wait_for_timeout.assert_not_called()
+
+    def test_step_wait_is_bounded(self):
+        browser = self._make_browser()
+        page = self._make_page(0)
+        page.wait_for_function.side_effect = PlaywrightTimeoutError("not settled")
+
+        with patch("bin.headless_browser.time.monotonic", return_value=100.0):
+            self.assertFalse(browser._wait_for_scroll_settle(page, {}, deadline=100.25))
+        self.assertEqual(page.wait_for_function.call_args.kwargs["timeout"], 250.0)
+
+        page.wait_for_function.reset_mock()
+        with patch("bin.headless_browser.time.monotonic", return_value=100.0):
+            browser._wait_for_scroll_settle(page, {}, deadline=200.0)
+        self.assertAlmostEqual(page.wait_for_function.call_args.kwargs["timeout"], browser._SCROLL_STEP_MAX_MS)
+
+        # past the overall deadline nothing waits at all
+        page.wait_for_function.reset_mock()
+        with patch("bin.headless_browser.time.monotonic", return_value=300.0):
+            browser._wait_for_scroll_settle(page, {}, deadline=200.0)
+        page.wait_for_function.assert_not_called()
+
+    def test_never_settling_page_scrolls_at_least_as_far_as_fixed_sleeps(self):
+        browser = self._make_browser()
+        page = self._make_page(100000)
+        clock = [0.0]
+
+        def wait_for_function(*_args, **kwargs):
+            # 광고가 계속 바뀌는 페이지: 매번 timeout까지 기다린 뒤 실패
+            clock[0] += kwargs["timeout"] / 1000
+            raise PlaywrightTimeoutError("not settled")
+
+        page.wait_for_function.side_effect = wait_for_function
+        with patch("bin.headless_browser.time.monotonic", side_effect=lambda: clock[0]):
+            browser._run_scrolling_script(page)
+
+        timeouts = [c.kwargs["timeout"] for c in page.wait_for_function.call_args_list]
+        self.assertAlmostEqual(timeouts[1], browser._SCROLL_STEP_MAX_MS)
+        self.assertAlmostEqual(timeouts[2], browser._SCROLL_BUSY_STEP_MAX_MS)
+        # 예전에는 200ms씩 5초 동안 25번 스크롤했음
+        down_calls = [c for c in page.evaluate.call_args_list if "scrollTo" in c.args[0]]
+        self.assertGreaterEqual(len(down_calls), 25)
+
+    def test_scroll_timeout_is_per_feed(self):
+        self.assertEqual(self._make_browser().scroll_timeout, HeadlessBrowserBase._MAX_SCROLL_SECS)
+        self.assertEqual(self._make_browser(scroll_timeout=30).scroll_timeout, 30)
+
+        browser = self._make_browser(scroll_timeout=2)
+        page = self._make_page(100000)
+        clock = iter(range(0, 1000))
+        with patch("bin.headless_browser.time.monotonic", side_effect=lambda: next(clock)):
+            browser._run_scrolling_script(page)
+        # the endless page stops scrolling down once the 2-second budget is used up
+        down_calls = [c for c in page.evaluate.call_args_list if "scrollTo" in c.args[0]]
+        self.assertLess(len(down_calls), 5)
+
+
+class TestCaptureImagesToFiles(unittest.TestCase):
+    """Canvas/blob data URL images are written to the image cache instead of the HTML."""
+
+    PNG_DATA_URL = "data:image/png;base64,iVBORw0KGgo="
+
+    def setUp(self):
+        self.tmp = Path(tempfile.mkdtemp())
+        self.addCleanup(shutil.rmtree, self.tmp, True)
+        self.img_dir_path = self.tmp / "img"
+        self.img_dir_path.mkdir()
+        self.feed_dir_path = self.tmp / "my_feed"
+        self.feed_dir_path.mkdir()
+        self.env = {"WEB_SERVICE_IMAGE_DIR_PREFIX": str(self.img_dir_path), "WEB_SERVICE_IMAGE_URL_PREFIX": "https://example.com/img"}
+
+    def _make_browser(self):
+        with patch("bin.headless_browser.Env") as mock_env:
+            mock_env.get.side_effect = lambda k, d="": d
+            return HeadlessBrowserBase(dir_path=self.feed_dir_path, timeout=5, copy_images_from_canvas=True)
+
+    def _make_page(self, srcs):
+        # img 요소의 src 속성만 흉내 내는 페이지
+        images = [{"src": src} for src in srcs]
+        listed: list[dict[str, str]] = []
+        page = MagicMock()
+
+        def evaluate(script, arg=None):
+            if script == HeadlessBrowserBase.LISTING_DATA_URL_IMAGES_SCRIPT:
+                listed[:] = [img for img in images if img["src"].startswith("data:image/png")]
+                return len(listed)
+            if script == HeadlessBrowserBase.GETTING_DATA_URL_IMAGE_SCRIPT:
+                return listed[arg]["src"]
+            if script == HeadlessBrowserBase.REPLACING_DATA_URL_IMAGE_SCRIPT:
+                img = listed[arg[0]]
+                img[arg[1]] = arg[2]
+                img["src"] = ""
+                return None
+            if script == "document.documentElement.outerHTML":
+                return "".join("<img " + " ".join(f'{k}="{v}"' for k, v in img.items() if v) + ">" for img in images)
+            return None
+
+        page.evaluate.side_effect = evaluate
+        return page
+
+    def test_data_url_images_are_written_to_cache(self):
+        browser = self._make_browser()
+        page = self._make_page([self.PNG_DATA_URL, "https://example.com/a.jpg", self.PNG_DATA_URL])
+        with patch("bin.headless_browser.Env") as mock_env, patch.object(browser, "_wait_for_cloudflare", return_value=True), patch.object(browser, "_write_cookies_to_file"), patch.object(browser, "_wait_for_marker"):
+            mock_env.get.side_effect = lambda k, d="": self.env.get(k, d)
+            html, cleared = browser._render_loaded_page(page, MagicMock(), "https://example.com/article")
+        self.assertTrue(cleared)
+        self.assertNotIn("base64", html)
+        cache_files = list((self.img_dir_path / "my_feed").iterdir())
+        self.assertEqual(len(cache_files), 1)
+        self.assertEqual(cache_files[0].suffix, ".png")
+        self.assertEqual(cache_files[0].read_bytes()[:4], b"\x89PNG")
+        self.assertEqual(html.count(f'src="https://example.com/img/my_feed/{cache_files[0].name}"'), 2)
+        self.assertIn('src="https://example.com/a.jpg"', html)
+
+    def test_data_urls_are_kept_without_image_cache(self):
+        browser = self._make_browser()
+        page = self._make_page([self.PNG_DATA_URL])
+        with patch("bin.headless_browser.Env") as mock_env:
+            mock_env.get.side_effect = lambda k, d="": {**self.env, "FM_HEADLESS_CAPTURE_IMAGES_TO_FILES": "false"}.get(k, d)
+            self.assertEqual(browser._capture_images_to_files(page), 0)
+            mock_env.get.side_effect = lambda k, d="": d
+            self.assertEqual(browser._capture_images_to_files(page), 0)
+        page.evaluate.assert_not_called()
+
+
+class TestRequestRouting(unittest.TestCase):
+    """Per-feed resource blocking through a context-wide Playwright route."""
+
+    def setUp(self):
+        self.tmp = Path(tempfile.mkdtemp())
+        self.addCleanup(shutil.rmtree, self.tmp, True)
+
+    def _make_browser(self, **kwargs):
+        with patch("bin.headless_browser.Env") as mock_env:
+            mock_env.get.side_effect = lambda k, d="": d
+            return HeadlessBrowserBase(dir_path=self.tmp, timeout=5, **kwargs)
+
+    @staticmethod
+    def _make_request(url, resource_type, main_frame_navigation=False):
+        request = MagicMock(url=url, resource_type=resource_type)
+        request.is_navigation_request.return_value = main_frame_navigation or resource_type == "document"
+        request.frame.parent_frame = None if main_frame_navigation else MagicMock()
+        return request
+
+    def _route(self, browser, request):
+        route = MagicMock()
+        browser._route_request(route, request)
+        return "aborted" if route.abort.called else "continued"
+
+    def test_blocks_resource_types_and_domains(self):
+        browser = self._make_browser(blocked_resource_types=["Image", "font", "bogus"], blocked_domains=[".ads.com", "tracker.net"])
+        self.assertEqual(browser.blocked_resource_types, {"image", "font"})
+        self.assertEqual(self._route(browser, self._make_request("https://a.com/x.png", "image")), "aborted")
+        self.assertEqual(self._route(browser, self._make_request("https://a.com/x.woff2", "font")), "aborted")
+        self.assertEqual(self._route(browser, self._make_request("https://a.com/app.js", "script")), "continued")
+        self.assertEqual(self._route(browser, self._make_request("https://cdn.ads.com/ad.js", "script")), "aborted")
+        self.assertEqual(self._route(browser, self._make_request("https://tracker.net/pixel", "xhr")), "aborted")
+        self.assertEqual(self._route(browser, self._make_request("https://nottracker.net/x.js", "script")), "continued")
+        # ad iframes are blocked by domain, but the page being rendered never is
+        self.assertEqual(self._route(browser, self._make_request("https://ads.com/frame", "document")), "aborted")
+        self.assertEqual(self._route(browser, self._make_request("https://ads.com/article", "document", main_frame_navigation=True)), "continued")
+
+    def test_images_are_allowed_for_canvas_and_blob_capture(self):
+        for option in ("copy_images_from_canvas", "blob_to_dataurl"):
+            browser = self._make_browser(blocked_resource_types=["image", "media"], **{option: True})
+            self.assertEqual(browser.blocked_resource_types, {"media"})
+
+    def test_route_is_installed_only_when_something_is_blocked(self):
+        context = MagicMock()
+        self._make_browser()._install_request_routing(context)
+        context.route.assert_not_called()
+
+        browser = self._make_browser(blocked_domains=["ads.com"])
+        browser._install_request_routing(context)
+        context.route.assert_called_once_with("**/*", browser._route_request)
+
+    def test_blocking_rules_are_part_of_session_options(self):
+        options1 = self._make_browser(blocked_resource_types=["image"])._build_session_options()
+        options2 = self._make_browser(blocked_resource_types=["font"])._build_session_options()
+        self.assertNotEqual(HeadlessBrowserBase._get_options_hash(options1), HeadlessBrowserBase._get_options_hash(options2))
+
+    def test_new_session_gets_the_route(self):
+        browser = self._make_browser(blocked_resource_types=["media"])
+        session = {"playwright": None, "context": MagicMock(), "page": MagicMock()}
+        with patch.object(HeadlessBrowserBase, "_launch_session", return_value=session), patch.object(HeadlessBrowserBase, "_set_cached_session"), patch.object(HeadlessBrowserBase, "_get_cached_session", return_value=None):
+            self.assertEqual(browser._get_or_create_session(), (session, True))
+        session["context"].route.assert_called_once()
+
+
+class TestPagePool(unittest.TestCase):
+    """Pages are created lazily up to max_size, reset on checkin and reused."""
+
+    def test_checkout_reuses_returned_page(self):
+        created = []
+        pool = PagePool(lambda: created.append(MagicMock()) or created[-1], MagicMock(), 2)
+        page1 = pool.checkout()
+        page2 = pool.checkout()
+        with self.assertRaises(RuntimeError):
+            pool.checkout()
+
+        pool.checkin(page1)
+        self.assertIs(pool.checkout(), page1)
+        self.assertEqual(len(created), 2)
+        # storage is cleared and the page is parked on about:blank before reuse
+        self.assertIn("localStorage.clear()", page1.evaluate.call_args.args[0])
+        page1.goto.assert_called_with("about:blank", wait_until="commit", timeout=5000)
+        self.assertIsNot(page2, page1)
+
+    def test_broken_page_is_closed_instead_of_reused(self):
+        close_page = MagicMock()
+        pool = PagePool(MagicMock, close_page, 2)
+        page = pool.checkout()
+        page.goto.side_effect = PlaywrightError("Target closed")
+        pool.checkin(page)
+        close_page.assert_called_once_with(page)
+
+        crashed = pool.checkout()
+        self.assertIsNot(crashed, page)
+        pool.checkin(crashed, reusable=False)
+        close_page.assert_called_with(crashed)
+        self.assertEqual(pool.idle_pages, [])
+
+    def test_close_closes_idle_pages(self):
+        close_page = MagicMock()
+        pool = PagePool(MagicMock, close_page, 2)
+        page = pool.checkout()
+        pool.checkin(page)
+        pool.close()
+        close_page.assert_called_once_with(page)
+
+
+class TestMakeRequests(unittest.TestCase):
+    """make_requests() renders a batch of URLs concurrently in pooled pages of one session."""
+
+    def setUp(self):
+        self.tmp = Path(tempfile.mkdtemp())
+        self.addCleanup(shutil.rmtree, self.tmp, True)
+        with patch("bin.headless_browser.Env") as mock_env:
+            mock_env.get.side_effect = lambda k, d="": {"FM_CRAWLER_ALLOW_PRIVATE_IPS": "false", "FM_CRAWLER_ALLOWED_HOSTS": ""}.get(k, d)
+            self.browser = HeadlessBrowserBase(dir_path=self.tmp, timeout=5)
+        self.events: list[tuple[str, str]] = []
+        self.pages: list[MagicMock] = []
+        self.session = {"playwright": None, "context": MagicMock(), "page": MagicMock()}
+        self.session["context"].new_page.side_effect = self._new_page
+        patchers = [
+            patch.object(HeadlessBrowserBase, "_get_or_create_session", return_value=(self.session, False)),
+            patch.object(HeadlessBrowserBase, "_get_page_pool_size", return_value=2),
+            patch.object(HeadlessBrowserBase, "_wait_for_cloudflare", return_value=True),
+            patch.object(HeadlessBrowserBase, "_write_cookies_to_file"),
+            patch("bin.headless_browser.URLSafety.check_url", side_effect=lambda url, **_kw: (not url.startswith("http://10."), "private")),
+        ]
+        for patcher in patchers:
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def _new_page(self):
+        page = MagicMock()
+        state = {"url": ""}
+
+        def goto(url, **_kwargs):
+            state["url"] = url
+            if url != "about:blank":
+                self.events.append(("goto", url))
+            if "broken" in url:
+                raise PlaywrightError("net::ERR_CONNECTION_REFUSED")
+
+        def wait_for_load_state(*_args, **_kwargs):
+            self.events.append(("load", state["url"]))
+
+        def evaluate(script, *_args, **_kwargs):
+            return f"<body>{state['url']}</body>" if script == "document.documentElement.outerHTML" else None
+
+        page.goto.side_effect = goto
+        page.wait_for_load_state.side_effect = wait_for_load_state
+        page.evaluate.side_effect = evaluate
+        self.pages.append(page)
+        return page
+
+    def test_pages_load_concurrently_and_results_keep_order(self):
+        urls = ["https://a.com/1", "https://a.com/2", "https://a.com/3"]
+        results = self.browser.make_requests(urls)
+
+        self.assertEqual(results, [f"<!DOCTYPE html><body>{url}</body>" for url in urls])
+        # every navigation of a batch starts before the first page is waited on
+        self.assertEqual(self.events, [("goto", urls[0]), ("goto", urls[1]), ("load", urls[0]), ("load", urls[1]), ("goto", urls[2]), ("load", urls[2])])
+        # two pooled pages are reused for three URLs
+        self.assertEqual(len(self.pages), 2)
+        self.assertEqual(self.session["page_pool"].num_checked_out, 0)
+
+    def test_blocked_and_failed_urls_return_empty(self):
+        results = self.browser.make_requests(["http://10.0.0.1/", "https://a.com/broken", "https://a.com/ok"])
+        self.assertEqual(results, ["", "", "<!DOCTYPE html><body>https://a.com/ok</body>"])
+        self.assertNotIn(("goto", "http://10.0.0.1/"), self.events)
+
+    def test_browser_error_while_creating_page_returns_empty(self):
+        self.session["context"].new_page.side_effect = PlaywrightError("Target page, context or browser has been closed")
+        self.assertEqual(self.browser.make_requests(["https://a.com/1", "https://a.com/2"]), ["", ""])
+
+    def test_error_after_checkin_discards_only_pages_still_checked_out(self):
+        # An OSError while saving cookies of the first page ends the batch after that page was
+        # already returned to the pool; it must stay usable and only the unfinished page is dropped.
+        with patch.object(HeadlessBrowserBase, "_render_loaded_page", side_effect=OSError("disk full")):
+            results = self.browser.make_requests(["https://a.com/1", "https://a.com/2", "https://a.com/3"])
+        self.assertEqual(results, ["", "", ""])
+        pool = self.session["page_pool"]
+        self.assertEqual(pool.num_checked_out, 0)
+        self.assertEqual(pool.idle_pages, [self.pages[0]])
+        self.pages[0].close.assert_not_called()
+        self.pages[1].close.assert_called_once()
+        # the next batch gets the live page instead of a closed one
+        self.assertEqual(self.browser.make_requests(["https://a.com/4"]), ["<!DOCTYPE html><body>https://a.com/4</body>"])
+        self.assertEqual(len(self.pages), 2)
+
+    def test_programming_error_is_raised(self):
+        # 코드 오류는 렌더링 실패로 숨기지 않음
+        with patch.object(HeadlessBrowserBase, "_render_loaded_page", side_effect=TypeError("unexpected argument")):
+            with self.assertRaises(TypeError):
+                self.browser.make_requests(["https://a.com/1"])
+        self.assertEqual(self.session["page_pool"].num_checked_out, 0)
+
+    def test_unresolved_challenge_tears_down_session(self):
+        with patch.object(HeadlessBrowserBase, "_wait_for_cloudflare", return_value=False), patch.object(HeadlessBrowserBase, "_cleanup_cached_session") as mock_cleanup:
+            results = self.browser.make_requests(["https://a.com/1", "https://a.com/2", "https://a.com/3"])
+        self.assertEqual(results, ["", "", ""])
+        mock_cleanup.assert_called_once()
+        self.assertNotIn(("goto", "https://a.com/3"), self.events)
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -422,7 +422,7 @@ class TestHeadlessBrowserCloak(unittest.TestCase):
         id_locator.fill.assert_called_once_with("tester")
         pw_locator.fill.assert_called_once_with("secret")
         submit_locator.click.assert_called_once()
-        mock_write.assert_called_once_with(mock_context)
+        mock_write.assert_called_once_with(mock_context, "https://example.com/login")
 
     @patch("bin.headless_browser_cloakbrowser._cloak_launch_persistent_context")
     def test_login_success_with_named_fields_and_submit_fallback(self, mock_launch):
@@ -534,7 +534,10 @@ class TestHeadlessBrowserCloak(unittest.TestCase):
         self.assertTrue(any(browser.ID_OF_RENDERING_COMPLETION_IN_SCROLLING in str(call.args[0]) for call in mock_page.evaluate.call_args_list))
         # _wait_for_cloudflare now polls a single wait_for_function predicate per page
         # (referer + main = 2); wait_for_selector is left to the 3 completion markers.
-        self.assertEqual(mock_page.wait_for_function.call_count, 2)
+        # Scrolling waits on its own settle predicate between steps.
+        cloudflare_waits = [c for c in mock_page.wait_for_function.call_args_list if c.args[0] != browser.SCROLL_SETTLED_PREDICATE]
+        self.assertEqual(len(cloudflare_waits), 2)
+        self.assertGreater(mock_page.wait_for_function.call_count, 2)
         self.assertEqual(mock_page.wait_for_selector.call_count, 3)
         mock_context.add_init_script.assert_called_once_with(browser.BLOB_INTERCEPTOR_INIT_SCRIPT)
 
@@ -79,6 +79,31 @@ class TestHeadlessBrowserFacade(unittest.TestCase):
         # only the failed primary was torn down before falling back; the successful fallback is kept
         self.assertEqual(recycle_calls, ["camoufox"])
 
+    def test_make_request_tries_learned_engine_first(self):
+        # The engine that last succeeded for the host is tried first, so a failing primary
+        # doesn't cost a full timeout on every request; a new winner is recorded.
+        fetch_strategy = MagicMock()
+        fetch_strategy.get_engine.return_value = "cloakbrowser"
+        facade = HeadlessBrowser(dir_path=Path(tempfile.gettempdir()), timeout=5, fetch_strategy=fetch_strategy)
+        self.assertNotIn("fetch_strategy", facade._kwargs)
+        facade._engine_order = ["camoufox", "cloakbrowser"]
+        engines = {"camoufox": MagicMock(), "cloakbrowser": MagicMock()}
+        # type(engine).recycle_session() is called before falling back
+        type(engines["cloakbrowser"]).recycle_session = MagicMock()
+        engines["camoufox"].make_request.return_value = "<html>camoufox</html>"
+        engines["cloakbrowser"].make_request.return_value = "<html>cloak</html>"
+        with patch("bin.headless_browser._load_engine_class", return_value=MagicMock()), patch.object(facade, "_engine", side_effect=lambda n: engines[n]):
+            self.assertEqual(facade.make_request("https://example.com/a"), "<html>cloak</html>")
+            engines["camoufox"].make_request.assert_not_called()
+            fetch_strategy.record_engine.assert_not_called()
+
+            engines["cloakbrowser"].make_request.return_value = ""
+            self.assertEqual(facade.make_request("https://example.com/b"), "<html>camoufox</html>")
+            fetch_strategy.record_engine.assert_called_once_with("https://example.com/b", "camoufox")
+
+            facade.make_requests(["https://example.com/c"])
+            engines["cloakbrowser"].make_requests.assert_called_once_with(["https://example.com/c"])
+
     def test_make_request_returns_empty_when_no_engine_instantiates(self):
         # The engine class loads but construction yields nothing usable: the loop must skip
         # it instead of calling make_request on None, and report failure with an empty body.
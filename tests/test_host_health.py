@@ -0,0 +1,185 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+
+import time
+import shutil
+import tempfile
+import unittest
+import logging.config
+from pathlib import Path
+from unittest.mock import patch, MagicMock
+
+import requests
+
+from bin.crawler import Crawler, RequestsClient
+from bin.host_health import HostHealth
+
+logging.config.fileConfig(Path(__file__).parent.parent / "logging.conf")
+LOGGER = logging.getLogger()
+
+
+class HostHealthTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self.tmp = Path(tempfile.mkdtemp())
+        self.state_dir_path = self.tmp / HostHealth.STATE_DIR_NAME
+
+    def tearDown(self) -> None:
+        shutil.rmtree(self.tmp, ignore_errors=True)
+
+    def _make_host_health(self, failure_threshold: int = 3, cool_down: float = 60) -> HostHealth:
+        return HostHealth(state_dir_path=self.state_dir_path, failure_threshold=failure_threshold, cool_down=cool_down)
+
+    def test_opens_after_consecutive_failures(self) -> None:
+        host_health = self._make_host_health()
+        for _ in range(2):
+            host_health.record_failure("https://example.com/a")
+            self.assertEqual(host_health.check("https://example.com/b"), "")
+        host_health.record_failure("https://example.com/a")
+        self.assertIn("circuit open for 'example.com'", host_health.check("https://example.com/b"))
+        # 다른 호스트는 영향 없음
+        self.assertEqual(host_health.check("https://other.com/"), "")
+
+    def test_success_resets_failures(self) -> None:
+        host_health = self._make_host_health()
+        host_health.record_failure("https://example.com/a")
+        host_health.record_failure("https://example.com/a")
+        host_health.record_success("https://example.com/a")
+        host_health.record_failure("https://example.com/a")
+        self.assertEqual(host_health.check("https://example.com/b"), "")
+        state_file_path = self.state_dir_path / ("example.com" + HostHealth.STATE_FILE_SUFFIX)
+        inode = state_file_path.stat().st_ino
+        host_health.record_success("https://example.com/a")
+        # 파일을 지우지 않고 비워서 이미 파일을 연 다른 프로세스의 기록이 사라지지 않게 함
+        self.assertEqual(state_file_path.stat().st_ino, inode)
+        self.assertEqual(state_file_path.read_text(), "")
+        for _ in range(3):
+            host_health.record_failure("https://example.com/a")
+        self.assertEqual(state_file_path.stat().st_ino, inode)
+        self.assertIn("circuit open", host_health.check("https://example.com/b"))
+
+    def test_single_probe_after_cool_down(self) -> None:
+        host_health = self._make_host_health(failure_threshold=1, cool_down=60)
+        now = time.time()
+        with patch("bin.host_health.time.time", return_value=now):
+            host_health.record_failure("https://example.com/a")
+        with patch("bin.host_health.time.time", return_value=now + 61):
+            # 한 요청만 시험하고 나머지는 결과를 기다리는 동안 바로 실패
+            self.assertEqual(host_health.check("https://example.com/a", probe_timeout=30), "")
+            self.assertIn("waiting for the probe request", host_health.check("https://example.com/b", probe_timeout=30))
+            # 시험 요청이 실패하면 다시 대기
+            host_health.record_failure("https://example.com/a")
+        with patch("bin.host_health.time.time", return_value=now + 100):
+            self.assertIn("retry after", host_health.check("https://example.com/a"))
+        with patch("bin.host_health.time.time", return_value=now + 200):
+            self.assertEqual(host_health.check("https://example.com/a"), "")
+            host_health.record_success("https://example.com/a")
+            self.assertEqual(host_health.check("https://example.com/b"), "")
+            self.assertEqual(host_health.check("https://example.com/c"), "")
+
+    def test_stale_probe_is_retried(self) -> None:
+        host_health = self._make_host_health(failure_threshold=1, cool_down=60)
+        now = time.time()
+        with patch("bin.host_health.time.time", return_value=now):
+            host_health.record_failure("https://example.com/a")
+        with patch("bin.host_health.time.time", return_value=now + 61):
+            self.assertEqual(host_health.check("https://example.com/a", probe_timeout=30), "")
+        # 시험 요청의 결과가 오지 않으면 다른 요청이 다시 시험함
+        with patch("bin.host_health.time.time", return_value=now + 92):
+            self.assertEqual(host_health.check("https://example.com/a", probe_timeout=30), "")
+
+    def test_state_is_shared_through_state_file(self) -> None:
+        host_health1 = self._make_host_health(failure_threshold=2)
+        host_health2 = self._make_host_health(failure_threshold=2)
+        host_health1.record_failure("https://example.com/a")
+        host_health2.record_failure("https://example.com/b")
+        self.assertIn("circuit open", host_health1.check("https://example.com/c"))
+
+    def test_disabled(self) -> None:
+        host_health = self._make_host_health(failure_threshold=0)
+        for _ in range(5):
+            host_health.record_failure("https://example.com/a")
+        self.assertEqual(host_health.check("https://example.com/a"), "")
+        self.assertFalse(self.state_dir_path.exists())
+
+    def test_broken_state_file_is_reset(self) -> None:
+        self.state_dir_path.mkdir()
+        (self.state_dir_path / ("example.com" + HostHealth.STATE_FILE_SUFFIX)).write_text("garbage")
+        host_health = self._make_host_health(failure_threshold=1)
+        self.assertEqual(host_health.check("https://example.com/a"), "")
+        host_health.record_failure("https://example.com/a")
+        self.assertIn("circuit open", host_health.check("https://example.com/a"))
+
+
+class CrawlerHostHealthTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self.tmp = Path(tempfile.mkdtemp())
+
+    def tearDown(self) -> None:
+        shutil.rmtree(self.tmp, ignore_errors=True)
+
+    @patch("bin.crawler.URLSafety.check_url", return_value=(True, ""))
+    @patch("requests.Session.get", side_effect=requests.exceptions.ConnectTimeout("connect timeout"))
+    def test_dead_host_fails_fast(self, mock_get: MagicMock, mock_check: MagicMock) -> None:
+        crawler = Crawler(dir_path=self.tmp, num_retries=5, retry_sleep=0)
+        crawler.host_health = HostHealth(state_dir_path=self.tmp / HostHealth.STATE_DIR_NAME, failure_threshold=2, cool_down=60)
+        crawler.requests_client.host_health = crawler.host_health
+        with patch("bin.crawler.time.sleep"):
+            response, error, _ = crawler.run("https://dead.example.com/a")
+        self.assertEqual(response, "")
+        self.assertIn("circuit open for 'dead.example.com'", error)
+        self.assertEqual(mock_get.call_count, 2)
+
+        # 같은 호스트를 대상으로 하는 다른 요청도 바로 실패
+        with patch("bin.crawler.time.sleep") as mock_sleep:
+            self.assertIn("circuit open", crawler.run("https://dead.example.com/b")[1])
+        mock_sleep.assert_not_called()
+        self.assertEqual(mock_get.call_count, 2)
+
+    def _make_render_crawler(self) -> Crawler:
+        with patch("bin.crawler.HeadlessBrowser"):
+            crawler = Crawler(dir_path=self.tmp, render_js=True, num_retries=2, retry_sleep=0)
+        crawler.host_health = HostHealth(state_dir_path=self.tmp / HostHealth.STATE_DIR_NAME, failure_threshold=1, cool_down=60)
+        crawler.rate_limiter = MagicMock()
+        crawler.headless_browser.make_request.return_value = "<html>ok</html>"
+        crawler.headless_browser.make_requests.side_effect = lambda urls: ["<html>ok</html>"] * len(urls)
+        return crawler
+
+    def test_render_js_skips_open_circuit(self) -> None:
+        crawler = self._make_render_crawler()
+        crawler.host_health.record_failure("https://dead.example.com/")
+        response, error, _ = crawler.run("https://dead.example.com/a")
+        self.assertEqual(response, "")
+        self.assertIn("circuit open for 'dead.example.com'", error)
+        crawler.headless_browser.make_request.assert_not_called()
+
+        results = crawler.fetch_many(["https://dead.example.com/b", "https://alive.example.com/c"])
+        self.assertEqual(results[0][0], "")
+        self.assertIn("circuit open for 'dead.example.com'", results[0][1])
+        self.assertEqual(results[1], ("<html>ok</html>", "", None))
+        crawler.headless_browser.make_requests.assert_called_once_with(["https://alive.example.com/c"])
+
+    def test_render_js_probe_closes_circuit(self) -> None:
+        crawler = self._make_render_crawler()
+        now = time.time()
+        with patch("bin.host_health.time.time", return_value=now - 61):
+            crawler.host_health.record_failure("https://example.com/")
+        # 대기 시간이 지난 뒤의 렌더링 성공은 서킷을 닫음
+        self.assertEqual(crawler.run("https://example.com/a")[0], "<html>ok</html>")
+        self.assertEqual(crawler.host_health.check("https://example.com/b"), "")
+        self.assertEqual(crawler.host_health.check("https://example.com/c"), "")
+
+    @patch("bin.crawler.URLSafety.check_url", return_value=(True, ""))
+    @patch("requests.Session.get")
+    def test_connect_and_read_timeouts(self, mock_get: MagicMock, mock_check: MagicMock) -> None:
+        mock_get.return_value = MagicMock(status_code=200, text="<html></html>", cookies=None, headers={})
+        with patch("bin.crawler.Env.get", side_effect=lambda k, d="": {"FM_CRAWLER_CONNECT_TIMEOUT": "5"}.get(k, d)):
+            client = RequestsClient(dir_path=self.tmp, timeout=60)
+        client.make_request("https://example.com/a")
+        self.assertEqual(mock_get.call_args.kwargs["timeout"], (5, 60))
+        client.timeout = 3
+        self.assertEqual(client._get_timeouts(), (3, 3))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -212,6 +212,29 @@ class TestDownloadImageHTTP(unittest.TestCase):
         self.assertEqual((path, url), (None, None))
         self.assertEqual(crawler.run.call_count, 2)
 
+    @patch("utils.image_downloader.time")
+    @patch("utils.image_downloader.FileManager")
+    @patch("utils.image_downloader.Env")
+    def test_http_no_retry_on_permanent_error(self, mock_env: MagicMock, mock_fm: MagicMock, mock_time: MagicMock) -> None:
+        mock_env.get.return_value = "http://img.example.com"
+        crawler = MagicMock()
+        crawler.run.return_value = ("", "not found", None)
+        crawler.last_status_code = 404
+
+        mock_cache_path = MagicMock(spec=Path)
+        mock_cache_path.is_file.return_value = False
+        mock_webp_miss = MagicMock(spec=Path)
+        mock_webp_miss.is_file.return_value = False
+        mock_cache_path.with_suffix.return_value = mock_webp_miss
+        mock_fm.get_cache_file_path.return_value = mock_cache_path
+
+        feed_dir = MagicMock(spec=Path)
+        feed_dir.name = "feed"
+
+        self.assertEqual(ImageDownloader.download_image(crawler, feed_dir, "http://example.com/img.jpg"), (None, None))
+        self.assertEqual(crawler.run.call_count, 1)
+        mock_time.sleep.assert_not_called()
+
 
 class TestOptimizeForWebtoon(unittest.TestCase):
     def test_no_resize_needed(self) -> None:
@@ -577,6 +600,68 @@ class TestImageDownloaderWebpFallbackSave(unittest.TestCase):
             self.assertEqual(result.suffix, ".webp")
 
 
+class TestPrefetchImages(unittest.TestCase):
+    def setUp(self) -> None:
+        self.tmp = Path(tempfile.mkdtemp())
+
+    def _write_download(self, urls: list[str], paths: list[Path]) -> list[tuple[str, str, None]]:
+        results: list[tuple[str, str, None]] = []
+        for url, path in zip(urls, paths):
+            if url.endswith("missing.jpg"):
+                results.append(("", "not found", None))
+                continue
+            Image.new("RGB", (10, 10)).save(path, "PNG")
+            results.append(("200", "", None))
+        return results
+
+    @patch("utils.image_downloader.Env")
+    def test_prefetch_fetches_uncached_images_at_once(self, mock_env: MagicMock) -> None:
+        mock_env.get.return_value = "http://img.example.com"
+        crawler = MagicMock()
+        crawler.fetch_many.side_effect = self._write_download
+        urls = ["http://example.com/a.jpg", "http://example.com/missing.jpg", "http://example.com/a.jpg", "http://egloos.com/b.jpg", "data:image/png;base64,AAAA"]
+
+        self.assertEqual(ImageDownloader.prefetch_images(crawler, self.tmp, urls), 1)
+        crawler.fetch_many.assert_called_once()
+        self.assertEqual(crawler.fetch_many.call_args.args[0], ["http://example.com/a.jpg", "http://example.com/missing.jpg"])
+
+        # 미리 받아 둔 이미지는 download_image에서 다시 받지 않음
+        path, url = ImageDownloader.download_image(crawler, self.tmp, "http://example.com/a.jpg")
+        self.assertEqual(path.suffix if path else None, ".webp")
+        crawler.run.assert_not_called()
+
+        # 이미 캐시된 이미지는 다시 prefetch하지 않음
+        crawler.fetch_many.reset_mock()
+        self.assertEqual(ImageDownloader.prefetch_images(crawler, self.tmp, ["http://example.com/a.jpg"]), 0)
+        crawler.fetch_many.assert_not_called()
+
+
+class TestCapturedImages(unittest.TestCase):
+    def setUp(self) -> None:
+        self.tmp = Path(tempfile.mkdtemp())
+        self.feed_img_dir_path = self.tmp / "my_feed"
+        self.feed_img_dir_path.mkdir()
+
+    @patch("utils.image_downloader.Env")
+    def test_captured_image_is_converted_without_download(self, mock_env: MagicMock) -> None:
+        # headless browser가 캐시에 바로 기록한 canvas/blob 이미지는 받지 않고 변환만 함
+        mock_env.get.return_value = "https://example.com/img"
+        Image.new("RGB", (10, 10)).save(self.feed_img_dir_path / "abc1234.png", "PNG")
+        img_url = "https://example.com/img/my_feed/abc1234.png"
+        crawler = MagicMock()
+
+        self.assertEqual(ImageDownloader.prefetch_images(crawler, self.feed_img_dir_path, [img_url]), 0)
+        crawler.fetch_many.assert_not_called()
+        path, url = ImageDownloader.download_image(crawler, self.feed_img_dir_path, img_url)
+        self.assertEqual(path, self.feed_img_dir_path / "abc1234.webp")
+        self.assertEqual(url, "https://example.com/img/my_feed/abc1234.webp")
+        # 이미 변환된 이미지는 그대로 사용
+        self.assertEqual(ImageDownloader.download_image(crawler, self.feed_img_dir_path, img_url), (path, url))
+        crawler.run.assert_not_called()
+        # 다른 피드의 캐시 URL은 대상이 아님
+        self.assertIsNone(ImageDownloader.get_captured_image_path(self.feed_img_dir_path, "https://example.com/img/other_feed/abc1234.png"))
+
+
 # ────────────────────────────────────────────────────────
 # Branch coverage improvements
 # ────────────────────────────────────────────────────────
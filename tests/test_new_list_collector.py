@@ -290,6 +290,100 @@ class TestComposeUrlListExtended(unittest.TestCase):
         self.assertEqual(result, [])
 
 
+class TestComposeUrlListConditionalGet(unittest.TestCase):
+    """_compose_url_list: ETag/Last-Modified 기반 conditional GET"""
+
+    def setUp(self) -> None:
+        import tempfile
+
+        self.feed_dir = Path(tempfile.mkdtemp())
+        self.collection_conf = {"list_url_list": ["http://example.com/list"], "item_capture_script": "./capture.py"}
+        self.collector = NewlistCollector(self.feed_dir, self.collection_conf, self.feed_dir / "new_list.txt")
+        self.cache_file = self.feed_dir / NewlistCollector.CONDITIONAL_GET_CACHE_FILE
+
+    def tearDown(self) -> None:
+        import shutil
+
+        del self.collector
+        shutil.rmtree(self.feed_dir, ignore_errors=True)
+
+    @staticmethod
+    def _make_crawler(status_code: int, headers: dict[str, str], result: str = "") -> MagicMock:
+        instance = MagicMock()
+        instance.run.return_value = (result, "" if result else "not modified", None if result else headers)
+        instance.last_status_code = status_code
+        instance.last_response_headers = headers
+        return instance
+
+    @patch("bin.new_list_collector.Process")
+    @patch("bin.new_list_collector.Crawler")
+    def test_validators_are_saved_and_sent(self, mock_crawler_cls, mock_process) -> None:
+        instance = self._make_crawler(200, {"ETag": '"v1"', "Last-Modified": "Wed, 01 Jan 2025 00:00:00 GMT"}, "<html>ok</html>")
+        mock_crawler_cls.return_value = instance
+        mock_process.exec_cmd.return_value = ("http://example.com/1\ttitle 1\n", None)
+
+        self.assertEqual(self.collector._compose_url_list(), [("http://example.com/1", "title 1", [])])
+        instance.run.assert_called_once_with("http://example.com/list", extra_headers=None)
+        self.assertTrue(self.cache_file.is_file())
+
+        instance.run.reset_mock()
+        self.collector._compose_url_list()
+        instance.run.assert_called_once_with("http://example.com/list", extra_headers={"If-None-Match": '"v1"', "If-Modified-Since": "Wed, 01 Jan 2025 00:00:00 GMT"})
+
+    @patch("bin.new_list_collector.Process")
+    @patch("bin.new_list_collector.Crawler")
+    def test_not_modified_reuses_items_without_capture(self, mock_crawler_cls, mock_process) -> None:
+        mock_crawler_cls.return_value = self._make_crawler(200, {"etag": '"v1"'}, "<html>ok</html>")
+        mock_process.exec_cmd.return_value = ("http://example.com/1\ttitle 1\tmeta\nhttp://example.com/2\ttitle 2\n", None)
+        first = self.collector._compose_url_list()
+
+        mock_process.exec_cmd.reset_mock()
+        mock_crawler_cls.return_value = self._make_crawler(304, {"ETag": '"v1"'})
+        second = self.collector._compose_url_list()
+
+        self.assertEqual(first, second)
+        mock_process.exec_cmd.assert_not_called()
+        self.assertTrue(self.cache_file.is_file())
+
+    @patch("bin.new_list_collector.Process")
+    @patch("bin.new_list_collector.Crawler")
+    def test_conf_change_invalidates_cache(self, mock_crawler_cls, mock_process) -> None:
+        instance = self._make_crawler(200, {"ETag": '"v1"'}, "<html>ok</html>")
+        mock_crawler_cls.return_value = instance
+        mock_process.exec_cmd.return_value = ("http://example.com/1\ttitle 1\n", None)
+        self.collector._compose_url_list()
+
+        self.collection_conf["item_capture_script"] = "./other_capture.py"
+        instance.run.reset_mock()
+        self.collector._compose_url_list()
+        instance.run.assert_called_once_with("http://example.com/list", extra_headers=None)
+
+    @patch("bin.new_list_collector.Process")
+    @patch("bin.new_list_collector.Crawler")
+    def test_no_validators_no_cache(self, mock_crawler_cls, mock_process) -> None:
+        mock_crawler_cls.return_value = self._make_crawler(200, {"Content-Type": "text/html"}, "<html>ok</html>")
+        mock_process.exec_cmd.return_value = ("http://example.com/1\ttitle 1\n", None)
+        self.collector._compose_url_list()
+        self.assertFalse(self.cache_file.is_file())
+
+    @patch("bin.new_list_collector.Process")
+    @patch("bin.new_list_collector.Crawler")
+    def test_render_js_skips_conditional_get(self, mock_crawler_cls, mock_process) -> None:
+        self.collection_conf["render_js"] = True
+        self.cache_file.write_text("{broken", encoding="utf-8")
+        instance = self._make_crawler(200, {"ETag": '"v1"'}, "<html>ok</html>")
+        mock_crawler_cls.return_value = instance
+        mock_process.exec_cmd.return_value = ("http://example.com/1\ttitle 1\n", None)
+        with patch("bin.new_list_collector.HeadlessBrowser"):
+            self.collector._compose_url_list()
+        instance.run.assert_called_once_with("http://example.com/list", extra_headers=None)
+        self.assertEqual(self.cache_file.read_text(encoding="utf-8"), "{broken")
+
+    def test_invalid_cache_file_is_ignored(self) -> None:
+        self.cache_file.write_text("{broken", encoding="utf-8")
+        self.assertEqual(self.collector._load_conditional_get_cache(), {})
+
+
 class TestSaveNewListToFileExtended(unittest.TestCase):
     """_save_new_list_to_file: IOError -> line 104-106"""
 
@@ -0,0 +1,119 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+
+import time
+import shutil
+import tempfile
+import unittest
+import logging.config
+from pathlib import Path
+from unittest.mock import patch, MagicMock
+
+from bin.crawler import Crawler
+from bin.rate_limiter import RateLimiter
+
+logging.config.fileConfig(Path(__file__).parent.parent / "logging.conf")
+LOGGER = logging.getLogger()
+
+
+class RateLimiterTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self.tmp = Path(tempfile.mkdtemp())
+        self.state_dir_path = self.tmp / RateLimiter.STATE_DIR_NAME
+
+    def tearDown(self) -> None:
+        shutil.rmtree(self.tmp, ignore_errors=True)
+
+    def _make_limiter(self, rate_limits_raw: str = "", default_rate_limit_raw: str = "") -> RateLimiter:
+        return RateLimiter(state_dir_path=self.state_dir_path, rate_limits_raw=rate_limits_raw, default_rate_limit_raw=default_rate_limit_raw)
+
+    def test_parse_rate_limit(self) -> None:
+        self.assertEqual(RateLimiter.parse_rate_limit("2:5"), (2.0, 5))
+        self.assertEqual(RateLimiter.parse_rate_limit("0.5"), (0.5, 1))
+        self.assertIsNone(RateLimiter.parse_rate_limit("0"))
+        self.assertIsNone(RateLimiter.parse_rate_limit(""))
+        self.assertIsNone(RateLimiter.parse_rate_limit("false"))
+
+    def test_get_rate_limit_per_domain(self) -> None:
+        limiter = self._make_limiter("comic.naver.com=2:5, .example.com=0.5, .a.example.com=4, free.example.com=0", "1:2")
+        self.assertEqual(limiter.get_rate_limit("COMIC.naver.com"), (2.0, 5))
+        self.assertEqual(limiter.get_rate_limit("img.example.com"), (0.5, 1))
+        self.assertEqual(limiter.get_rate_limit("example.com"), (0.5, 1))
+        self.assertEqual(limiter.get_rate_limit("b.a.example.com"), (4.0, 1))
+        self.assertIsNone(limiter.get_rate_limit("free.example.com"))
+        self.assertEqual(limiter.get_rate_limit("other.com"), (1.0, 2))
+        self.assertIsNone(self._make_limiter().get_rate_limit("other.com"))
+
+    def test_unlimited_host_does_not_touch_state(self) -> None:
+        limiter = self._make_limiter("example.com=1")
+        with patch("bin.rate_limiter.time.sleep") as mock_sleep:
+            self.assertEqual(limiter.acquire("https://other.com/a"), 0.0)
+        mock_sleep.assert_not_called()
+        self.assertFalse(self.state_dir_path.exists())
+
+    def test_burst_then_paced(self) -> None:
+        limiter = self._make_limiter("example.com=2:3")
+        now = time.time()
+        with patch("bin.rate_limiter.time.time", return_value=now), patch("bin.rate_limiter.time.sleep") as mock_sleep:
+            waits = [limiter.acquire("https://example.com/a") for _ in range(5)]
+        self.assertEqual([round(w, 3) for w in waits], [0.0, 0.0, 0.0, 0.5, 1.0])
+        self.assertEqual(mock_sleep.call_count, 2)
+
+    def test_budget_is_refilled_while_idle(self) -> None:
+        limiter = self._make_limiter("example.com=1")
+        now = time.time()
+        with patch("bin.rate_limiter.time.sleep"):
+            with patch("bin.rate_limiter.time.time", return_value=now):
+                self.assertEqual(limiter.acquire("https://example.com/a"), 0.0)
+            with patch("bin.rate_limiter.time.time", return_value=now + 5):
+                self.assertEqual(limiter.acquire("https://example.com/b"), 0.0)
+
+    def test_budget_is_shared_through_state_file(self) -> None:
+        # 다른 프로세스의 제한기도 같은 상태 파일을 보고 순서를 이어감
+        limiter1 = self._make_limiter("example.com=1")
+        limiter2 = self._make_limiter("example.com=1")
+        now = time.time()
+        with patch("bin.rate_limiter.time.time", return_value=now), patch("bin.rate_limiter.time.sleep"):
+            self.assertEqual(limiter1.acquire("https://example.com/a"), 0.0)
+            self.assertAlmostEqual(limiter2.acquire("https://example.com/b"), 1.0, places=3)
+            self.assertAlmostEqual(limiter1.acquire("https://example.com/c"), 2.0, places=3)
+            # 다른 호스트는 별도 예산
+            self.assertEqual(self._make_limiter(".org=1").acquire("https://example.org/a"), 0.0)
+        self.assertEqual(sorted(p.name for p in self.state_dir_path.iterdir()), ["example.com" + RateLimiter.STATE_FILE_SUFFIX, "example.org" + RateLimiter.STATE_FILE_SUFFIX])
+
+    def test_reserve_does_not_sleep(self) -> None:
+        limiter = self._make_limiter("example.com=1")
+        now = time.time()
+        with patch("bin.rate_limiter.time.time", return_value=now), patch("bin.rate_limiter.time.sleep") as mock_sleep:
+            self.assertEqual(limiter.reserve("https://example.com/a"), 0.0)
+            self.assertAlmostEqual(limiter.reserve("https://example.com/b"), 1.0, places=3)
+        mock_sleep.assert_not_called()
+
+    def test_broken_state_file_is_reset(self) -> None:
+        self.state_dir_path.mkdir()
+        (self.state_dir_path / ("example.com" + RateLimiter.STATE_FILE_SUFFIX)).write_text("garbage")
+        with patch("bin.rate_limiter.time.sleep"):
+            self.assertEqual(self._make_limiter("example.com=1").acquire("https://example.com/a"), 0.0)
+
+
+class CrawlerRateLimiterTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self.tmp = Path(tempfile.mkdtemp())
+
+    def tearDown(self) -> None:
+        shutil.rmtree(self.tmp, ignore_errors=True)
+
+    def test_each_attempt_goes_through_limiter(self) -> None:
+        crawler = Crawler(dir_path=self.tmp, num_retries=2, retry_sleep=0)
+        crawler.rate_limiter = MagicMock()
+        mock_rc = MagicMock()
+        mock_rc.make_request.side_effect = [("", "error", {}, 500), ("<html>ok</html>", "", {}, 200)]
+        crawler.requests_client = mock_rc
+        self.assertEqual(crawler.run("https://example.com/a")[0], "<html>ok</html>")
+        self.assertEqual(crawler.rate_limiter.acquire.call_count, 2)
+        crawler.rate_limiter.acquire.assert_called_with("https://example.com/a")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,150 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+
+import os
+import time
+import shutil
+import tempfile
+import unittest
+import logging.config
+from pathlib import Path
+from unittest.mock import patch, MagicMock
+
+from bin.crawler import Crawler
+from bin.response_cache import ResponseCache
+
+logging.config.fileConfig(Path(__file__).parent.parent / "logging.conf")
+LOGGER = logging.getLogger()
+
+
+class ResponseCacheTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self.tmp = Path(tempfile.mkdtemp())
+        self.cache = ResponseCache(cache_dir_path=self.tmp / ResponseCache.CACHE_DIR_NAME, max_size_mb=1)
+
+    def tearDown(self) -> None:
+        self.cache.clear()
+        shutil.rmtree(self.tmp, ignore_errors=True)
+
+    def test_normalize_url(self) -> None:
+        self.assertEqual(ResponseCache.normalize_url("HTTPS://Example.COM:443/a?b=2&a=1#frag"), "https://example.com/a?a=1&b=2")
+        self.assertEqual(ResponseCache.normalize_url("http://example.com"), "http://example.com/")
+        self.assertEqual(ResponseCache.normalize_url("http://example.com:8080/x"), "http://example.com:8080/x")
+
+    def test_get_key(self) -> None:
+        key = ResponseCache.get_key("https://example.com/a?b=2&a=1", {"User-Agent": "UA", "Cookie": ""}, "utf-8")
+        # Referer/conditional 헤더, 빈 쿠키와 쿼리 순서는 키에 영향을 주지 않음
+        self.assertEqual(key, ResponseCache.get_key("https://EXAMPLE.com/a?a=1&b=2", {"user-agent": "UA", "Referer": "https://example.com/", "If-None-Match": '"v1"'}, "UTF-8"))
+        # 쿠키가 다르면 다른 키
+        self.assertNotEqual(key, ResponseCache.get_key("https://example.com/a?a=1&b=2", {"User-Agent": "UA", "Cookie": "sid=1"}, "utf-8"))
+        self.assertNotEqual(key, ResponseCache.get_key("https://example.com/a?a=1&b=2", {"User-Agent": "Other"}, "utf-8"))
+        self.assertNotEqual(key, ResponseCache.get_key("https://example.com/a?a=1&b=2", {"User-Agent": "UA"}, "cp949"))
+
+    def test_put_and_get(self) -> None:
+        self.cache.put("https://example.com/a", "<html>본문</html>", {"ETag": '"v1"'}, {"User-Agent": "UA"}, "utf-8")
+        self.assertEqual(self.cache.get("https://example.com/a", {"User-Agent": "UA"}, "utf-8", ttl=60), ("<html>본문</html>", {"ETag": '"v1"'}))
+        # ttl이 0이면 캐시를 사용하지 않음
+        self.assertIsNone(self.cache.get("https://example.com/a", {"User-Agent": "UA"}, "utf-8", ttl=0))
+        self.assertIsNone(self.cache.get("https://example.com/b", {"User-Agent": "UA"}, "utf-8", ttl=60))
+
+    def test_entries_are_compressed(self) -> None:
+        body = "<p>반복되는 본문</p>" * 1000
+        self.cache.put("https://example.com/a", body)
+        entry_paths = list((self.tmp / ResponseCache.CACHE_DIR_NAME).glob("*/*" + ResponseCache.ENTRY_SUFFIX))
+        self.assertEqual(len(entry_paths), 1)
+        self.assertLess(entry_paths[0].stat().st_size, len(body.encode("utf-8")) // 10)
+
+    def test_expired_entry(self) -> None:
+        self.cache.put("https://example.com/a", "old")
+        with patch("bin.response_cache.time.time", return_value=time.time() + 120):
+            self.assertIsNone(self.cache.get("https://example.com/a", ttl=60))
+            self.assertEqual(self.cache.get("https://example.com/a", ttl=600), ("old", {}))
+
+    def test_broken_entry_is_removed(self) -> None:
+        self.cache.put("https://example.com/a", "body")
+        entry_path = next((self.tmp / ResponseCache.CACHE_DIR_NAME).glob("*/*" + ResponseCache.ENTRY_SUFFIX))
+        entry_path.write_bytes(b"not gzip")
+        self.assertIsNone(self.cache.get("https://example.com/a", ttl=60))
+        self.assertFalse(entry_path.exists())
+
+    def test_lru_eviction(self) -> None:
+        # 압축 후 약 280KB인 본문 4개 -> 1MB 한도를 넘으면 가장 오래 사용하지 않은 항목부터 삭제
+        bodies = {f"https://example.com/{i}": os.urandom(250 * 1024).hex() for i in range(4)}
+        now = time.time()
+        for i, (url, body) in enumerate(list(bodies.items())[:3]):
+            self.cache.put(url, body)
+            entry_path = self.cache._get_entry_path(ResponseCache.get_key(url))
+            os.utime(entry_path, (now - 100 + i, now - 100 + i))
+        # 가장 먼저 저장한 0번을 최근에 사용
+        self.assertTrue(self.cache.get("https://example.com/0", ttl=60) is not None)
+        self.assertEqual(len(self.cache._list_entries()), 3)
+
+        self.cache.put("https://example.com/3", bodies["https://example.com/3"])
+
+        self.assertTrue(self.cache.get("https://example.com/0", ttl=60) is not None)
+        self.assertTrue(self.cache.get("https://example.com/1", ttl=60) is None)
+        self.assertTrue(self.cache.get("https://example.com/3", ttl=60) is not None)
+        self.assertLessEqual(self.cache._scan_total_size(), self.cache.max_size)
+
+
+class CrawlerResponseCacheTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self.tmp = Path(tempfile.mkdtemp())
+
+    def tearDown(self) -> None:
+        shutil.rmtree(self.tmp, ignore_errors=True)
+
+    def _make_crawler(self, cache_ttl: int) -> tuple[Crawler, MagicMock]:
+        with patch("bin.response_cache.Env.get", side_effect=lambda k, d="": {"FM_WORK_DIR": str(self.tmp)}.get(k, d)):
+            crawler = Crawler(dir_path=self.tmp, cache_ttl=cache_ttl)
+        mock_rc = MagicMock()
+        mock_rc.make_request.return_value = ("<html>ok</html>", "", {"ETag": '"v1"'}, 200)
+        mock_rc.get_cookie_header.return_value = ""
+        crawler.requests_client = mock_rc
+        return crawler, mock_rc
+
+    def test_cache_hit_skips_request(self) -> None:
+        crawler, mock_rc = self._make_crawler(cache_ttl=60)
+        self.assertEqual(crawler.run("https://example.com/a")[0], "<html>ok</html>")
+        self.assertEqual(crawler.run("https://example.com/a")[0], "<html>ok</html>")
+        self.assertEqual(mock_rc.make_request.call_count, 1)
+        self.assertEqual(crawler.last_status_code, 200)
+        self.assertEqual(crawler.last_response_headers, {"ETag": '"v1"'})
+
+        # 다른 Crawler(다른 피드)도 같은 캐시를 공유
+        other_crawler, other_mock_rc = self._make_crawler(cache_ttl=60)
+        self.assertEqual(other_crawler.run("https://example.com/a")[0], "<html>ok</html>")
+        other_mock_rc.make_request.assert_not_called()
+
+    def test_cache_is_not_shared_across_cookies(self) -> None:
+        # 로그인 쿠키로 받은 응답은 쿠키가 다르거나 없는 피드에 주지 않음
+        crawler, mock_rc = self._make_crawler(cache_ttl=60)
+        mock_rc.get_cookie_header.return_value = "sid=member"
+        crawler.run("https://example.com/a")
+        mock_rc.get_cookie_header.assert_called_with("https://example.com/a")
+
+        other_crawler, other_mock_rc = self._make_crawler(cache_ttl=60)
+        other_crawler.run("https://example.com/a")
+        other_mock_rc.make_request.assert_called_once()
+        other_mock_rc.get_cookie_header.return_value = "sid=member"
+        other_crawler.run("https://example.com/a")
+        other_mock_rc.make_request.assert_called_once()
+
+    def test_cache_disabled_by_default(self) -> None:
+        crawler, mock_rc = self._make_crawler(cache_ttl=0)
+        self.assertIsNone(crawler.response_cache)
+        crawler.run("https://example.com/a")
+        crawler.run("https://example.com/a")
+        self.assertEqual(mock_rc.make_request.call_count, 2)
+
+    def test_download_and_post_are_not_cached(self) -> None:
+        crawler, mock_rc = self._make_crawler(cache_ttl=60)
+        crawler.run("https://example.com/a", data={"q": "1"})
+        crawler.run("https://example.com/a", data={"q": "1"})
+        self.assertEqual(mock_rc.make_request.call_count, 2)
+        self.assertEqual(list((self.tmp / ResponseCache.CACHE_DIR_NAME).glob("*/*")), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -78,6 +78,24 @@ class TestDetermineOptions(unittest.TestCase):
             options, args = determine_options()
         self.assertEqual(options["window_size"], 20)
 
+    @patch("bin.run.FeedMaker")
+    def test_flag_j(self, mock_fm):
+        mock_fm.DEFAULT_WINDOW_SIZE = 5
+        from bin.run import determine_options
+
+        with patch.object(sys, "argv", ["run.py", "-a", "-j", "4"]):
+            options, args = determine_options()
+        self.assertEqual(options["num_workers"], 4)
+
+    @patch("bin.run.FeedMaker")
+    def test_flag_j_default(self, mock_fm):
+        mock_fm.DEFAULT_WINDOW_SIZE = 5
+        from bin.run import determine_options
+
+        with patch.object(sys, "argv", ["run.py", "-a"]):
+            options, args = determine_options()
+        self.assertEqual(options["num_workers"], 1)
+
     @patch("bin.run.FeedMaker")
     def test_combined_flags(self, mock_fm):
         mock_fm.DEFAULT_WINDOW_SIZE = 5
@@ -227,8 +245,7 @@ class TestFeedMakerRunnerMakeSingleFeed(unittest.TestCase):
     @patch("bin.run.FeedMaker")
     @patch("bin.run.FileLock")
     def test_recycle_session_called_after_feed_make(self, mock_filelock, mock_fm_cls, mock_file_mgr, mock_headless):
-        # 같은 피드그룹의 다음 피드가 fresh Chromium 인스턴스로 시작하도록
-        # feed_maker.make() 직후 recycle_session()이 호출되어야 한다.
+        # feed_maker.make() 직후 재활용 정책에 따라 세션을 닫거나 다음 피드에 넘겨야 한다.
         runner = self._make_runner()
         feed_dir = Path("/tmp/fm_work/group/feed")
 
@@ -240,7 +257,8 @@ class TestFeedMakerRunnerMakeSingleFeed(unittest.TestCase):
             result = runner.make_single_feed(feed_dir, options={})
 
         self.assertTrue(result)
-        mock_headless.recycle_session.assert_called_once()
+        mock_headless.recycle_session_by_policy.assert_called_once_with()
+        mock_headless.recycle_session.assert_not_called()
 
     @patch("bin.run.HeadlessBrowser")
     @patch("bin.run.FileManager")
@@ -262,6 +280,15 @@ class TestFeedMakerRunnerMakeSingleFeed(unittest.TestCase):
 
         mock_headless.recycle_session.assert_called_once()
 
+    @patch("bin.run.HeadlessBrowser")
+    def test_worker_closes_kept_session_before_exit(self, mock_headless):
+        # 워커 프로세스는 atexit 없이 끝나므로 재활용 정책이 남겨 둔 세션을 직접 닫아야 한다.
+        runner = self._make_runner()
+        with patch.object(runner, "_make_feed", return_value=True), self.assertRaises(SystemExit) as cm:
+            runner._run_feed_in_worker(Path("/tmp/fm_work/group/feed"))
+        self.assertEqual(cm.exception.code, 0)
+        mock_headless.recycle_session.assert_called_once()
+
 
 class TestFeedMakerRunnerMakeAllFeeds(unittest.TestCase):
     """make_all_feeds: iterates directories, handles errors"""
@@ -610,6 +637,206 @@ class TestMakeAllFeedsSingleFeedFails(unittest.TestCase):
         self.assertTrue(mock_make.called)
 
 
+class TestMakeAllFeedsInParallel(unittest.TestCase):
+    """make_all_feeds -j: worker processes, per-feed timeout/RSS limits"""
+
+    def _make_runner(self, tmp: Path) -> FeedMakerRunner:
+        img_dir = tmp / "img"
+        img_dir.mkdir()
+        with patch("bin.run.Env.get", side_effect=lambda k, d="": {"FM_WORK_DIR": str(tmp), "WEB_SERVICE_IMAGE_DIR_PREFIX": str(img_dir)}.get(k, d)):
+            runner = FeedMakerRunner(html_archiving_period=30, list_archiving_period=7)
+        runner.WORKER_POLL_INTERVAL_SEC = 0.05
+        return runner
+
+    def _make_feed_dirs(self, tmp: Path, count: int) -> list[Path]:
+        feed_dir_path_list = []
+        for i in range(count):
+            feed = tmp / "group1" / f"feed{i}"
+            feed.mkdir(parents=True)
+            (feed / "conf.json").write_text("{}")
+            feed_dir_path_list.append(feed)
+        return feed_dir_path_list
+
+    def test_make_all_feeds_uses_workers_and_notifies_failures(self):
+        import tempfile
+
+        tmp = Path(tempfile.mkdtemp())
+        runner = self._make_runner(tmp)
+        self._make_feed_dirs(tmp, 2)
+        failed = [tmp / "group1" / "feed1"]
+        with patch.object(runner, "_make_feeds_in_parallel", return_value=failed) as mock_parallel, patch("bin.run.Notification") as mock_notif_cls, patch("bin.run.Env.get", side_effect=lambda k, d="": {"FM_RUNNER_FEED_TIMEOUT": "600", "FM_RUNNER_FEED_MAX_RSS_MB": "2048"}.get(k, d)):
+            self.assertTrue(runner.make_all_feeds({"num_workers": 3}))
+        _, num_workers, feed_timeout, feed_max_rss_mb = mock_parallel.call_args[0]
+        self.assertEqual((num_workers, feed_timeout, feed_max_rss_mb), (3, 600, 2048))
+        mock_notif_cls.return_value.send_msg.assert_called_once()
+        self.assertEqual(mock_notif_cls.return_value.send_msg.call_args[0][0], "group1/feed1")
+        shutil.rmtree(tmp, ignore_errors=True)
+
+    def test_parallel_reports_failed_feeds_by_exit_code(self):
+        import tempfile
+
+        tmp = Path(tempfile.mkdtemp())
+        runner = self._make_runner(tmp)
+        feed_dir_path_list = self._make_feed_dirs(tmp, 4)
+        # fork된 워커는 패치된 _make_feed를 그대로 물려받는다
+        with patch.object(runner, "_make_feed", side_effect=lambda p: p.name != "feed2"):
+            failed = runner._make_feeds_in_parallel(feed_dir_path_list, 2, 0, 0)
+        self.assertEqual(failed, [tmp / "group1" / "feed2"])
+        shutil.rmtree(tmp, ignore_errors=True)
+
+    def test_parallel_collects_session_stats_from_workers(self):
+        import tempfile
+
+        from bin.headless_browser import HeadlessBrowser, _count_session_stat
+
+        tmp = Path(tempfile.mkdtemp())
+        runner = self._make_runner(tmp)
+        feed_dir_path_list = self._make_feed_dirs(tmp, 3)
+
+        def fake_make_feed(_feed_dir_path: Path) -> bool:
+            _count_session_stat("launches")
+            return True
+
+        stats_before = HeadlessBrowser.get_session_stats()
+        with patch.object(runner, "_make_feed", side_effect=fake_make_feed):
+            failed = runner._make_feeds_in_parallel(feed_dir_path_list, 2, 0, 0)
+        self.assertEqual(failed, [])
+        stats = HeadlessBrowser.get_session_stats()
+        # 워커에서 센 통계가 부모에게 모임
+        self.assertEqual(stats["launches"] - stats_before["launches"], 3)
+        self.assertEqual(stats["reuses"], stats_before["reuses"])
+        shutil.rmtree(tmp, ignore_errors=True)
+
+    def test_parallel_kills_feed_over_timeout(self):
+        import tempfile
+        import time
+
+        tmp = Path(tempfile.mkdtemp())
+        runner = self._make_runner(tmp)
+        feed_dir_path_list = self._make_feed_dirs(tmp, 2)
+
+        def fake_make_feed(feed_dir_path: Path) -> bool:
+            if feed_dir_path.name == "feed0":
+                time.sleep(30)
+            return True
+
+        start = time.monotonic()
+        with patch.object(runner, "_make_feed", side_effect=fake_make_feed):
+            failed = runner._make_feeds_in_parallel(feed_dir_path_list, 2, 1, 0)
+        self.assertLess(time.monotonic() - start, 15)
+        self.assertEqual(failed, [tmp / "group1" / "feed0"])
+        shutil.rmtree(tmp, ignore_errors=True)
+
+    def test_parallel_kills_feed_over_rss_limit(self):
+        import tempfile
+        import time
+
+        tmp = Path(tempfile.mkdtemp())
+        runner = self._make_runner(tmp)
+        feed_dir_path_list = self._make_feed_dirs(tmp, 1)
+
+        def fake_make_feed(_feed_dir_path: Path) -> bool:
+            time.sleep(30)
+            return True
+
+        with patch.object(runner, "_make_feed", side_effect=fake_make_feed), patch.object(FeedMakerRunner, "_get_process_tree_rss", return_value=512 * 1024 * 1024):
+            failed = runner._make_feeds_in_parallel(feed_dir_path_list, 1, 0, 256)
+        self.assertEqual(failed, feed_dir_path_list)
+        shutil.rmtree(tmp, ignore_errors=True)
+
+    def test_get_process_tree_rss_of_missing_process(self):
+        with patch("bin.run.psutil.Process", side_effect=__import__("psutil").NoSuchProcess(1)):
+            self.assertEqual(FeedMakerRunner._get_process_tree_rss(1), 0)
+
+
+class TestMakeAllFeedsPerHostLimit(unittest.TestCase):
+    """make_all_feeds -j: grouping feeds by list_url_list hosts and per-host caps"""
+
+    def setUp(self) -> None:
+        import tempfile
+
+        self.tmp = Path(tempfile.mkdtemp())
+        img_dir = self.tmp / "img"
+        img_dir.mkdir()
+        with patch("bin.run.Env.get", side_effect=lambda k, d="": {"FM_WORK_DIR": str(self.tmp), "WEB_SERVICE_IMAGE_DIR_PREFIX": str(img_dir)}.get(k, d)):
+            self.runner = FeedMakerRunner(html_archiving_period=30, list_archiving_period=7)
+        self.runner.WORKER_POLL_INTERVAL_SEC = 0.05
+
+    def tearDown(self) -> None:
+        shutil.rmtree(self.tmp, ignore_errors=True)
+
+    def _make_feed_dir(self, group_name: str, feed_name: str, list_url_list: list[str]) -> Path:
+        feed_dir_path = self.tmp / group_name / feed_name
+        feed_dir_path.mkdir(parents=True)
+        conf = {"configuration": {"collection": {"list_url_list": list_url_list}}}
+        (feed_dir_path / "conf.json").write_text(json.dumps(conf))
+        return feed_dir_path
+
+    def test_get_feed_hosts(self):
+        feed_dir_path = self._make_feed_dir("g", "f", ["https://A.example.com/list?page=1", "https://a.example.com/list?page=2", "http://b.example.com/"])
+        with patch.dict("os.environ", {"FM_CONF_FILE": ""}):
+            self.assertEqual(FeedMakerRunner._get_feed_hosts(feed_dir_path), ["a.example.com", "b.example.com"])
+
+    def test_get_feed_hosts_with_invalid_config(self):
+        feed_dir_path = self.tmp / "g" / "broken"
+        feed_dir_path.mkdir(parents=True)
+        (feed_dir_path / "conf.json").write_text("{}")
+        with patch.dict("os.environ", {"FM_CONF_FILE": ""}):
+            self.assertEqual(FeedMakerRunner._get_feed_hosts(feed_dir_path), [])
+
+    def test_get_max_feeds_per_host(self):
+        group_dir_path = self.tmp / "g"
+        group_dir_path.mkdir()
+        with patch("bin.run.Env.get", side_effect=lambda k, d="": d):
+            self.assertEqual(self.runner._get_max_feeds_per_host(group_dir_path), FeedMakerRunner.DEFAULT_MAX_FEEDS_PER_HOST)
+        with patch("bin.run.Env.get", side_effect=lambda k, d="": {"FM_RUNNER_MAX_FEEDS_PER_HOST": "4"}.get(k, d)):
+            self.assertEqual(self.runner._get_max_feeds_per_host(group_dir_path), 4)
+            # site_config.json이 환경변수보다 우선
+            (group_dir_path / "site_config.json").write_text(json.dumps({"url": "https://a.example.com", "max_feeds_per_host": 1}))
+            self.assertEqual(self.runner._get_max_feeds_per_host(group_dir_path), 1)
+            (group_dir_path / "site_config.json").write_text(json.dumps({"max_feeds_per_host": 0}))
+            self.assertEqual(self.runner._get_max_feeds_per_host(group_dir_path), 1)
+            (group_dir_path / "site_config.json").write_text("{invalid")
+            self.assertEqual(self.runner._get_max_feeds_per_host(group_dir_path), 4)
+
+    def test_interleave_by_host(self):
+        a1, a2, a3, b1, c1 = (Path(f"/w/g/{n}") for n in ("a1", "a2", "a3", "b1", "c1"))
+        feed_hosts_map = {a1: ["a.com"], a2: ["a.com"], a3: ["a.com"], b1: ["b.com"], c1: []}
+        self.assertEqual(FeedMakerRunner._interleave_by_host([a1, b1, a2, c1, a3], feed_hosts_map), [a1, b1, c1, a2, a3])
+
+    def test_feeds_of_same_host_never_overlap(self):
+        import time
+
+        feed_dir_path_list = [self._make_feed_dir("g", f"a{i}", ["https://a.example.com/list"]) for i in range(3)]
+        feed_dir_path_list += [self._make_feed_dir("g", f"b{i}", ["https://b.example.com/list"]) for i in range(3)]
+        (self.tmp / "g" / "site_config.json").write_text(json.dumps({"max_feeds_per_host": 1}))
+
+        def fake_make_feed(feed_dir_path: Path) -> bool:
+            start = time.time()
+            time.sleep(0.3)
+            (feed_dir_path / "span.txt").write_text(f"{start}\t{time.time()}")
+            return True
+
+        with patch.dict("os.environ", {"FM_CONF_FILE": ""}), patch.object(self.runner, "_make_feed", side_effect=fake_make_feed):
+            failed = self.runner._make_feeds_in_parallel(feed_dir_path_list, 4, 0, 0)
+        self.assertEqual(failed, [])
+
+        for host in ("a", "b"):
+            spans = sorted(tuple(map(float, (p / "span.txt").read_text().split("\t"))) for p in feed_dir_path_list if p.name.startswith(host))
+            for (_, prev_end), (next_start, _) in zip(spans, spans[1:]):
+                self.assertLessEqual(prev_end, next_start)
+        # 두 호스트는 서로 동시에 실행됨
+        a_spans = [tuple(map(float, (p / "span.txt").read_text().split("\t"))) for p in feed_dir_path_list if p.name.startswith("a")]
+        b_spans = [tuple(map(float, (p / "span.txt").read_text().split("\t"))) for p in feed_dir_path_list if p.name.startswith("b")]
+        self.assertTrue(any(a_start < b_end and b_start < a_end for a_start, a_end in a_spans for b_start, b_end in b_spans))
+
+    def test_make_all_feeds_with_zero_workers_uses_cpu_count(self):
+        self._make_feed_dir("g", "f", ["https://a.example.com/list"])
+        with patch("bin.run.os.cpu_count", return_value=6), patch.object(self.runner, "_make_feeds_in_parallel", return_value=[]) as mock_parallel, patch("bin.run.Notification"):
+            self.runner.make_all_feeds({"num_workers": 0})
+        self.assertEqual(mock_parallel.call_args[0][1], 6)
+
+
 # ────────────────────────────────────────────────────────
 # From test_remaining_gaps.py: run.py print_usage 및 main
 # ────────────────────────────────────────────────────────
@@ -0,0 +1,243 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+
+import time
+import shutil
+import tempfile
+import unittest
+import logging.config
+from pathlib import Path
+from unittest.mock import patch, MagicMock
+
+from requests.cookies import RequestsCookieJar
+
+from bin.crawler import Crawler, LoginManager, RequestsClient
+from bin.headless_browser import HeadlessBrowserBase
+from bin.site_session_store import SiteSessionStore
+
+logging.config.fileConfig(Path(__file__).parent.parent / "logging.conf")
+LOGGER = logging.getLogger()
+
+
+class SiteSessionStoreTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self.tmp = Path(tempfile.mkdtemp())
+        self.state_dir_path = self.tmp / SiteSessionStore.STATE_DIR_NAME
+
+    def tearDown(self) -> None:
+        shutil.rmtree(self.tmp, ignore_errors=True)
+
+    def _make_store(self, session_ttl: float = 3600) -> SiteSessionStore:
+        return SiteSessionStore(state_dir_path=self.state_dir_path, session_ttl=session_ttl, sites=["example.com"])
+
+    def test_get_site(self) -> None:
+        store = SiteSessionStore(state_dir_path=self.state_dir_path, sites=["example.com", ".Example.co.kr", "foo.github.io", "127.0.0.1"])
+        self.assertEqual(store.get_site("https://comic.example.com/a"), "example.com")
+        self.assertEqual(store.get_site("https://m.comic.example.co.kr/a"), "example.co.kr")
+        self.assertEqual(store.get_site(".img.example.com"), "example.com")
+        self.assertEqual(store.get_site("http://127.0.0.1:8080/a"), "127.0.0.1")
+        self.assertEqual(store.get_site("https://badexample.com/"), "")
+        self.assertEqual(store.get_site(""), "")
+        # 지정하지 않은 사이트는 등록 도메인을 추측하지 않으므로 같은 호스팅의 다른 사용자와 섞이지 않음
+        self.assertEqual(store.get_site("https://foo.github.io/a"), "foo.github.io")
+        self.assertEqual(store.get_site("https://bar.github.io/a"), "")
+        self.assertEqual(store.get_site(".github.io"), "")
+
+    def test_load_sites(self) -> None:
+        feed_dir_path = self.tmp / "group" / "feed"
+        feed_dir_path.mkdir(parents=True)
+        self.assertEqual(SiteSessionStore.load_sites(feed_dir_path), frozenset())
+        (feed_dir_path.parent / SiteSessionStore.SITE_CONF_FILE).write_text('{"shared_session_sites": ["Example.com", " comic.example.co.kr "]}')
+        self.assertEqual(SiteSessionStore.load_sites(feed_dir_path), frozenset({"example.com", "comic.example.co.kr"}))
+        # 피드 디렉토리의 설정이 우선함
+        (feed_dir_path / SiteSessionStore.SITE_CONF_FILE).write_text('{"shared_session_sites": "a.com,b.com"}')
+        self.assertEqual(SiteSessionStore.load_sites(feed_dir_path), frozenset({"a.com", "b.com"}))
+        (feed_dir_path / SiteSessionStore.SITE_CONF_FILE).write_text("garbage")
+        self.assertEqual(SiteSessionStore.load_sites(feed_dir_path), frozenset({"example.com", "comic.example.co.kr"}))
+
+    def test_is_cookie_for_url(self) -> None:
+        domain_cookie = {"name": "a", "value": "1", "domain": ".example.com", "path": "/"}
+        self.assertTrue(SiteSessionStore.is_cookie_for_url(domain_cookie, "https://example.com/"))
+        self.assertTrue(SiteSessionStore.is_cookie_for_url(domain_cookie, "https://m.comic.example.com/x"))
+        self.assertFalse(SiteSessionStore.is_cookie_for_url(domain_cookie, "https://badexample.com/"))
+        host_cookie = {"name": "a", "value": "1", "domain": "a.example.com", "path": "/"}
+        self.assertTrue(SiteSessionStore.is_cookie_for_url(host_cookie, "https://a.example.com/"))
+        self.assertFalse(SiteSessionStore.is_cookie_for_url(host_cookie, "https://b.example.com/"))
+        self.assertFalse(SiteSessionStore.is_cookie_for_url(host_cookie, "https://x.a.example.com/"))
+        path_cookie = {"name": "a", "value": "1", "domain": ".example.com", "path": "/comic"}
+        self.assertTrue(SiteSessionStore.is_cookie_for_url(path_cookie, "https://example.com/comic"))
+        self.assertTrue(SiteSessionStore.is_cookie_for_url(path_cookie, "https://example.com/comic/1"))
+        self.assertFalse(SiteSessionStore.is_cookie_for_url(path_cookie, "https://example.com/comics"))
+        self.assertFalse(SiteSessionStore.is_cookie_for_url(path_cookie, "https://example.com/"))
+        secure_cookie = {"name": "a", "value": "1", "domain": ".example.com", "path": "/", "secure": True}
+        self.assertTrue(SiteSessionStore.is_cookie_for_url(secure_cookie, "https://example.com/"))
+        self.assertFalse(SiteSessionStore.is_cookie_for_url(secure_cookie, "http://example.com/"))
+
+    def test_get_cookies_for_url(self) -> None:
+        store = self._make_store()
+        store.save_cookies("https://a.example.com/1", [
+            {"name": "cf_clearance", "value": "x", "domain": ".example.com", "path": "/"},
+            {"name": "sid", "value": "a", "domain": "a.example.com", "path": "/"},
+            {"name": "sid", "value": "b", "domain": "b.example.com", "path": "/"},
+            {"name": "pref", "value": "root", "domain": ".example.com", "path": "/"},
+            {"name": "pref", "value": "comic", "domain": ".example.com", "path": "/comic"},
+        ])
+        self.assertEqual(store.get_cookies_for_url("https://a.example.com/comic/1"), {"cf_clearance": "x", "sid": "a", "pref": "comic"})
+        self.assertEqual(store.get_cookies_for_url("https://b.example.com/"), {"cf_clearance": "x", "sid": "b", "pref": "root"})
+        self.assertEqual(store.get_cookies_for_url("https://c.example.com/"), {"cf_clearance": "x", "pref": "root"})
+
+    def test_cookies_are_shared_by_site(self) -> None:
+        store1 = self._make_store()
+        store2 = self._make_store()
+        store1.save_cookies("https://a.example.com/1", [{"name": "cf_clearance", "value": "x", "domain": ".example.com", "path": "/", "expires": time.time() + 3600}, {"name": "sid", "value": "1"}, {"name": "ad", "value": "1", "domain": ".tracker.com"}])
+        cookies = store2.load_cookies("https://b.example.com/2")
+        self.assertEqual(sorted((c["name"], c["domain"]) for c in cookies), [("cf_clearance", ".example.com"), ("sid", "a.example.com")])
+        self.assertNotIn("saved_at", cookies[0])
+        # 같은 이름, 도메인, 경로의 쿠키는 새 값으로 바뀜
+        store2.save_cookies("https://a.example.com/3", [{"name": "sid", "value": "2"}])
+        self.assertEqual({c["name"]: c["value"] for c in store1.load_cookies("https://example.com/")}, {"cf_clearance": "x", "sid": "2"})
+        self.assertEqual(store1.load_cookies("https://other.com/"), [])
+
+    def test_expired_cookies_are_dropped(self) -> None:
+        store = self._make_store(session_ttl=60)
+        now = time.time()
+        with patch("bin.site_session_store.time.time", return_value=now):
+            store.save_cookies("https://example.com/", [{"name": "old", "value": "1", "expires": now - 1}, {"name": "token", "value": "1", "expires": now + 120}, {"name": "sid", "value": "1", "expires": -1}])
+            self.assertEqual(sorted(c["name"] for c in store.load_cookies("https://example.com/")), ["sid", "token"])
+        with patch("bin.site_session_store.time.time", return_value=now + 61):
+            # 세션 쿠키는 session_ttl이 지나면 버림
+            self.assertEqual([c["name"] for c in store.load_cookies("https://example.com/")], ["token"])
+
+    def test_discard_cookies_keeps_login(self) -> None:
+        store = self._make_store()
+        store.save_cookies("https://example.com/", [{"name": "cf_clearance", "value": "x"}, {"name": "sid", "value": "1"}])
+        store.discard_cookies("https://example.com/", ("cf_clearance",))
+        self.assertEqual([c["name"] for c in store.load_cookies("https://example.com/")], ["sid"])
+        state_file_path = self.state_dir_path / ("example.com" + SiteSessionStore.STATE_FILE_SUFFIX)
+        inode = state_file_path.stat().st_ino
+        store.discard_cookies("https://example.com/", ("sid",))
+        # 다른 프로세스가 이미 연 파일에 기록한 쿠키를 잃지 않도록 파일을 지우지 않고 비움
+        self.assertEqual(state_file_path.stat().st_ino, inode)
+        self.assertEqual(state_file_path.stat().st_size, 0)
+        self.assertIsNone(store.get_stamp("https://example.com/"))
+        self.assertEqual(store.load_cookies("https://example.com/"), [])
+        store.discard_cookies("https://example.com/", ("sid",))
+        store.save_cookies("https://example.com/", [{"name": "sid", "value": "2"}])
+        self.assertEqual(state_file_path.stat().st_ino, inode)
+        self.assertIsNotNone(store.get_stamp("https://example.com/"))
+        self.assertEqual([c["value"] for c in store.load_cookies("https://example.com/")], ["2"])
+
+    def test_disabled(self) -> None:
+        with patch("bin.site_session_store.Env.get", side_effect=lambda k, d="": "false" if k == "FM_SITE_SESSION_STORE" else d):
+            store = self._make_store()
+        store.save_cookies("https://example.com/", [{"name": "sid", "value": "1"}])
+        self.assertEqual(store.load_cookies("https://example.com/"), [])
+        self.assertFalse(self.state_dir_path.exists())
+        # 작업 디렉토리가 상대 경로이면 사용하지 않음
+        self.assertFalse(SiteSessionStore(state_dir_path=Path("true") / SiteSessionStore.STATE_DIR_NAME, sites=["example.com"]).is_enabled)
+        # 공유할 사이트를 지정하지 않은 피드는 사용하지 않음
+        store = SiteSessionStore(state_dir_path=self.state_dir_path)
+        self.assertFalse(store.is_enabled)
+        store.save_cookies("https://example.com/", [{"name": "sid", "value": "1"}])
+        self.assertFalse(self.state_dir_path.exists())
+
+    def test_broken_state_file_is_reset(self) -> None:
+        self.state_dir_path.mkdir()
+        (self.state_dir_path / ("example.com" + SiteSessionStore.STATE_FILE_SUFFIX)).write_text("garbage")
+        store = self._make_store()
+        self.assertEqual(store.load_cookies("https://example.com/"), [])
+        store.save_cookies("https://example.com/", [{"name": "sid", "value": "1"}])
+        self.assertEqual([c["name"] for c in store.load_cookies("https://example.com/")], ["sid"])
+
+
+class ClientSiteSessionTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self.tmp = Path(tempfile.mkdtemp())
+        self.store = SiteSessionStore(state_dir_path=self.tmp / SiteSessionStore.STATE_DIR_NAME, sites=["example.com"])
+        self.feed_dir_path1 = self.tmp / "feed1"
+        self.feed_dir_path2 = self.tmp / "feed2"
+        self.feed_dir_path1.mkdir()
+        self.feed_dir_path2.mkdir()
+
+    def tearDown(self) -> None:
+        shutil.rmtree(self.tmp, ignore_errors=True)
+
+    def test_requests_client_uses_cookies_of_other_feed(self) -> None:
+        client1 = RequestsClient(dir_path=self.feed_dir_path1, site_session_store=self.store)
+        client2 = RequestsClient(dir_path=self.feed_dir_path2, site_session_store=self.store)
+        jar = RequestsCookieJar()
+        jar.set("cf_clearance", "token", domain=".example.com", path="/")
+        client1.write_cookies_to_file(jar, "https://a.example.com/1")
+        client2.read_cookies_from_file("https://b.example.com/2")
+        self.assertEqual(client2.cookies.get("cf_clearance"), "token")
+        # URL을 모르면 피드의 쿠키 파일만 읽음
+        client3 = RequestsClient(dir_path=self.feed_dir_path2, site_session_store=self.store)
+        client3.read_cookies_from_file()
+        self.assertNotIn("cf_clearance", client3.cookies)
+
+    def test_requests_client_keeps_own_login_cookies(self) -> None:
+        self.store.save_cookies("https://example.com/", [{"name": "sid", "value": "other", "domain": ".example.com", "path": "/"}, {"name": "cf_clearance", "value": "token", "domain": ".example.com", "path": "/"}])
+        client = RequestsClient(dir_path=self.feed_dir_path1, site_session_store=self.store)
+        client._get_cookie_store().update({"sid": "mine"}, RequestsClient.MAX_COOKIE_HEADER_SIZE)
+        client.read_cookies_from_file("https://example.com/")
+        self.assertEqual(client.cookies.get("sid"), "other")
+        # 자체 로그인 설정이 있는 피드는 자기 쿠키를 유지하고 없는 쿠키만 채움
+        self.store.keeps_own_cookies = True
+        client = RequestsClient(dir_path=self.feed_dir_path1, site_session_store=self.store)
+        client.read_cookies_from_file("https://example.com/")
+        self.assertEqual(client.cookies, {"sid": "mine", "cf_clearance": "token"})
+
+    def test_crawler_shares_session_only_for_configured_sites(self) -> None:
+        self.assertFalse(Crawler(dir_path=self.feed_dir_path1).site_session_store.sites)
+        (self.feed_dir_path1 / SiteSessionStore.SITE_CONF_FILE).write_text('{"shared_session_sites": ["example.com"]}')
+        (self.feed_dir_path1 / LoginManager.LOGIN_CONFIG_FILE).write_text('{"login_url": "https://example.com/login", "id": "user", "password": "pass"}')
+        crawler = Crawler(dir_path=self.feed_dir_path1)
+        self.assertEqual(crawler.site_session_store.sites, frozenset({"example.com"}))
+        self.assertTrue(crawler.site_session_store.keeps_own_cookies)
+
+    def test_login_is_not_skipped_when_feed_has_own_credentials(self) -> None:
+        crawler = Crawler(dir_path=self.feed_dir_path2)
+        crawler.site_session_store = self.store
+        crawler.requests_client = MagicMock()
+        crawler.requests_client._get_cookie_dir.return_value = self.feed_dir_path2
+        self.store.save_cookies("https://example.com/login", [{"name": "sid", "value": "1"}])
+        with patch("bin.crawler.LoginManager.load_login_config", return_value={"login_url": "https://example.com/login", "id": "user", "password": "pass"}):
+            crawler._try_login()
+        crawler.requests_client.login.assert_called_once()
+
+    def test_headless_browser_applies_changed_site_cookies_once(self) -> None:
+        with patch("bin.headless_browser.Env") as mock_env:
+            mock_env.get.side_effect = lambda k, d="": d
+            browser = HeadlessBrowserBase(dir_path=self.feed_dir_path1, timeout=5, site_session_store=self.store)
+        context = MagicMock()
+        browser._apply_site_cookies(context, "https://example.com/a")
+        context.add_cookies.assert_not_called()
+
+        self.store.save_cookies("https://example.com/", [{"name": "cf_clearance", "value": "x", "domain": ".example.com", "path": "/"}])
+        browser._apply_site_cookies(context, "https://example.com/a")
+        browser._apply_site_cookies(context, "https://m.example.com/b")
+        context.add_cookies.assert_called_once()
+        self.assertEqual(context.add_cookies.call_args.args[0][0]["name"], "cf_clearance")
+
+        # 브라우저가 받은 쿠키는 사이트 세션 저장소에도 기록됨
+        context.cookies.return_value = [{"name": "sid", "value": "1", "domain": "example.com", "path": "/", "expires": -1}, {"name": "__cf_bm", "value": "y", "domain": ".example.com", "path": "/"}]
+        browser._write_cookies_to_file(context, "https://example.com/a")
+        self.assertEqual(sorted(c["name"] for c in self.store.load_cookies("https://example.com/")), ["cf_clearance", "sid"])
+        browser._discard_persisted_cookies("https://example.com/a")
+        self.assertEqual([c["name"] for c in self.store.load_cookies("https://example.com/")], ["sid"])
+
+    def test_headless_browser_keeps_own_login_cookies(self) -> None:
+        self.store.keeps_own_cookies = True
+        with patch("bin.headless_browser.Env") as mock_env:
+            mock_env.get.side_effect = lambda k, d="": d
+            browser = HeadlessBrowserBase(dir_path=self.feed_dir_path1, timeout=5, site_session_store=self.store)
+        self.store.save_cookies("https://example.com/", [{"name": "sid", "value": "other", "domain": ".example.com", "path": "/"}, {"name": "cf_clearance", "value": "x", "domain": ".example.com", "path": "/"}])
+        context = MagicMock()
+        context.cookies.return_value = [{"name": "sid", "value": "mine", "domain": ".example.com", "path": "/"}]
+        browser._apply_site_cookies(context, "https://example.com/a")
+        self.assertEqual([c["name"] for c in context.add_cookies.call_args.args[0]], ["cf_clearance"])
+
+
+if __name__ == "__main__":
+    unittest.main()
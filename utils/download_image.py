@@ -137,7 +137,14 @@ def main() -> int:
             if tail:
                 print(tail)
 
-    for line in IO.read_stdin_as_line_list():
+    line_list = IO.read_stdin_as_line_list()
+    # 본문의 이미지들을 제한된 동시성으로 미리 받아 두면 아래 치환에서는 캐시를 바로 사용함
+    img_url_list = [m.group("img_url") for line in line_list for m in re.finditer(_IMG_PATTERN, line)]
+    if exclude_ad_images:
+        img_url_list = [img_url for img_url in img_url_list if _is_same_origin(page_url, img_url)]
+    ImageDownloader.prefetch_images(crawler, feed_img_dir_path, img_url_list, quality=quality)
+
+    for line in line_list:
         if keep_img_meta_only:
             if re.search(r"<(meta|style)", line):
                 print(line, end="")
@@ -11,7 +11,7 @@ import resvg_py
 import pyheif
 from PIL import Image, ImageOps, UnidentifiedImageError
 from bin.feed_maker_util import FileManager, PathUtil, Env
-from bin.crawler import Crawler
+from bin.crawler import Crawler, RetryPolicy
 
 
 LOGGER = logging.getLogger(__name__)
@@ -29,6 +29,17 @@ class ImageDownloader:
             LOGGER.warning(f"Skipping download from blocked domain: {img_url}")
             return None, None
 
+        # headless browser가 canvas/blob 이미지를 캐시에 바로 기록하고 캐시 URL로 바꿔 둔 경우에는 받지 않고 변환만 함
+        captured_file_path = ImageDownloader.get_captured_image_path(feed_img_dir_path, img_url)
+        if captured_file_path:
+            feed_img_url_prefix = img_url[: img_url.rfind("/") + 1]
+            if captured_file_path.suffix == ".webp":
+                return captured_file_path, feed_img_url_prefix + captured_file_path.name
+            new_cache_file_path = ImageDownloader.convert_image_format(captured_file_path, quality=quality)
+            if new_cache_file_path and new_cache_file_path.is_file():
+                return new_cache_file_path, feed_img_url_prefix + new_cache_file_path.name
+            return None, None
+
         cache_file_path = FileManager.get_cache_file_path(feed_img_dir_path, img_url)
         if cache_file_path.is_file() and cache_file_path.stat().st_size > 0:
             return cache_file_path, FileManager.get_cache_url(Env.get("WEB_SERVICE_IMAGE_URL_PREFIX") + "/" + feed_img_dir_path.name, img_url, suffix=cache_file_path.suffix)
@@ -61,6 +72,10 @@ class ImageDownloader:
         if img_url.startswith("http"):
             result, _, _ = crawler.run(img_url, download_file=cache_file_path)
             if not result:
+                # 404 같은 영구 오류는 다시 받아도 실패하므로 재시도하지 않음
+                status_code = crawler.last_status_code
+                if isinstance(status_code, int) and not RetryPolicy.is_retryable(status_code):
+                    return None, None
                 time.sleep(5)
                 result, _, _ = crawler.run(img_url, download_file=cache_file_path)
                 if not result:
@@ -77,6 +92,52 @@ class ImageDownloader:
 
         return None, None
 
+    @staticmethod
+    def get_captured_image_path(feed_img_dir_path: Path, img_url: str) -> Optional[Path]:
+        # 이 피드의 이미지 캐시 URL이면 캐시 파일 경로 (이미 webp로 변환되었으면 변환된 파일), 아니면 None
+        feed_img_url_prefix = Env.get("WEB_SERVICE_IMAGE_URL_PREFIX") + "/" + feed_img_dir_path.name + "/"
+        if not img_url.startswith(feed_img_url_prefix):
+            return None
+        file_name = img_url[len(feed_img_url_prefix) :]
+        if not file_name or "/" in file_name:
+            return None
+        for file_path in (feed_img_dir_path / file_name, (feed_img_dir_path / file_name).with_suffix(".webp")):
+            if file_path.is_file() and file_path.stat().st_size > 0:
+                return file_path
+        return None
+
+    @staticmethod
+    def prefetch_images(crawler: Crawler, feed_img_dir_path: Path, img_url_list: list[str], quality: int = 75) -> int:
+        # 아직 캐시에 없는 이미지를 fetch_many로 한꺼번에 받아 변환해 둠 (받지 못한 이미지는 download_image에서 다시 시도)
+        LOGGER.debug("# prefetch_images(num_img_urls=%d)", len(img_url_list))
+        url_list: list[str] = []
+        cache_file_path_list: list[Optional[Path]] = []
+        for img_url in dict.fromkeys(img_url_list):
+            if not img_url.startswith("http") or any(domain in img_url for domain in ImageDownloader.BLOCKED_DOMAINS):
+                continue
+            if ImageDownloader.get_captured_image_path(feed_img_dir_path, img_url):
+                continue
+            cache_file_path = FileManager.get_cache_file_path(feed_img_dir_path, img_url)
+            if any(path.is_file() and path.stat().st_size > 0 for path in (cache_file_path, cache_file_path.with_suffix(".webp"))):
+                continue
+            url_list.append(img_url)
+            cache_file_path_list.append(cache_file_path)
+        if not url_list:
+            return 0
+
+        num_prefetched = 0
+        for cache_file_path, (result, _, _) in zip(cache_file_path_list, crawler.fetch_many(url_list, cache_file_path_list)):
+            if not result or cache_file_path is None or not cache_file_path.is_file():
+                continue
+            try:
+                if ImageDownloader.convert_image_format(cache_file_path, quality=quality):
+                    num_prefetched += 1
+                    continue
+            except (OSError, TypeError, ValueError, RuntimeError) as e:
+                LOGGER.warning("Warning: can't convert prefetched image '%s', %r", PathUtil.short_path(cache_file_path), e)
+            cache_file_path.unlink(missing_ok=True)
+        return num_prefetched
+
     @staticmethod
     def optimize_for_webtoon(img: Image.Image, max_width: int = 1600) -> Image.Image:
         oriented_img = ImageOps.exif_transpose(img)